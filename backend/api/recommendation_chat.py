@@ -9,6 +9,8 @@ from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
 from rest_framework import status
 
+from core.services import get_shared_client, rate_limiter_registry
+from core.utils.deadline import bounded_timeout
 from films.models import WatchedFilm, Rating, Review, Mood
 from api.serializers import RecommendationChatSerializer
 
@@ -106,7 +108,9 @@ def _deepseek_chat(
         "temperature": temperature,
     }
 
-    with httpx.Client(timeout=40.0) as client:
+    client = get_shared_client()
+    limiter = rate_limiter_registry.get(chat_url)
+    with limiter.slot():
         resp = client.post(
             chat_url,
             headers={
@@ -114,7 +118,9 @@ def _deepseek_chat(
                 "Content-Type": "application/json",
             },
             json=payload,
+            timeout=bounded_timeout(40.0),
         )
+    limiter.observe(resp)
 
     return resp
 
@@ -265,6 +271,8 @@ def _get_imdb_id(obj: Any) -> str | None:
 # -----------------------------
 class RecommendationChatView(APIView):
     permission_classes = [IsAuthenticated]
+    # Up to three sequential LLM calls (moderation in, answer, moderation out).
+    request_deadline = 90
 
     @extend_schema(
         request=RecommendationChatSerializer,
@@ -7,4 +7,6 @@ pip install -r requirements.txt
 
 python manage.py collectstatic --no-input
 python manage.py migrate
+python manage.py createcachetable
+python manage.py rebuild_search_index --missing
 
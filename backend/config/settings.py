@@ -56,6 +56,7 @@ MIDDLEWARE = [
     "django.contrib.auth.middleware.AuthenticationMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.RequestDeadlineMiddleware",
 ]
 
 
@@ -166,3 +167,119 @@ WATCHMODE_API_KEY = ""
 # ----------------------------------------------------
 HTTP_TIMEOUT = 30
 HTTP_RETRIES = 3
+
+# Per-upstream resilience: retries (5xx/429/connection errors only) capped by a
+# retry budget, and a circuit breaker that fails fast while an upstream is down.
+HTTP_RETRY_BACKOFF_BASE = 0.5
+HTTP_RETRY_BACKOFF_MAX = 4.0
+HTTP_RETRY_BUDGET_RATIO = 0.2
+HTTP_RETRY_BUDGET_MAX = 10
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = 5
+CIRCUIT_BREAKER_RESET_TIMEOUT = 30.0
+HTTP_RESILIENCE_OVERRIDES = {}
+
+# Client-side rate limits per upstream host, shared by the workers on one host
+# through files in HTTP_RATE_LIMIT_STATE_DIR (default: a temp dir; "" keeps
+# them per process). "concurrency" caps in-flight calls per process. A 429
+# pauses the host for its Retry-After and halves its rate until calls succeed.
+HTTP_RATE_LIMITS = {
+    "api.imdbapi.dev": {"rate": 10, "burst": 20, "concurrency": 8},
+    "api.kinocheck.com": {"rate": 2, "burst": 4, "concurrency": 2},
+    "api.watchmode.com": {"rate": 2, "burst": 4, "concurrency": 2},
+    "api.deepseek.com": {"rate": 1, "burst": 3, "concurrency": 4},
+}
+HTTP_RATE_LIMIT_STATE_DIR = None
+HTTP_RATE_LIMIT_MAX_WAIT = 10.0
+
+# On-disk cache of upstream GETs honouring Cache-Control/ETag/Last-Modified;
+# shared by the workers on a host (default directory: under the temp dir).
+HTTP_CACHE_ENABLED = True
+HTTP_CACHE_DIR = None
+HTTP_CACHE_MAX_BYTES = 256 * 1024 * 1024
+
+# Pooled upstream HTTP clients (one keep-alive pool per base URL and process)
+HTTP_POOL_MAX_CONNECTIONS = 100
+HTTP_POOL_MAX_KEEPALIVE = 20
+HTTP_POOL_KEEPALIVE_EXPIRY = 30.0
+HTTP_HTTP2 = True
+
+# Film cache: serve stale films (up to CACHE_MAX_STALE_HOURS past expiry) while refreshing them in the background
+CACHE_TTL_HOURS = 24
+CACHE_STALE_WHILE_REVALIDATE = True
+CACHE_MAX_STALE_HOURS = 24 * 7
+FILM_REFRESH_WORKERS = 2
+# Per-section cache TTLs override FilmCacheService defaults, e.g. {"streaming": 6}
+FILM_SECTION_TTL_HOURS = {}
+# A failed section is retried after FILM_SECTION_RETRY_MINUTES, doubling per consecutive failure up to its TTL
+FILM_SECTION_RETRY_MINUTES = 15
+# Stored extended IMDb sections (/api/films/<id>/credits etc.): per-section TTL
+# overrides of IMDB_SECTIONS, e.g. {"episodes": 12}, the upstream pages walked
+# per section and the default page size served to clients.
+EXTENDED_SECTION_TTL_HOURS = {}
+EXTENDED_SECTION_MAX_PAGES = 20
+EXTENDED_SECTION_PAGE_SIZE = 50
+# Ids an upstream reported as missing are not looked up again for this long (seconds)
+NEGATIVE_CACHE_TTL = 600
+
+# Shared cache behind the in-process LRU (run `python manage.py createcachetable` once)
+CACHES = {
+    "default": {
+        "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+        "LOCATION": "django_cache",
+    }
+}
+LOCAL_CACHE_MAX_ENTRIES = 512
+LOCAL_CACHE_TTL = 30.0
+SHARED_CACHE_TTL = 3600
+
+# Film aggregation: fan out upstream sections in parallel under one deadline (seconds)
+FILM_AGGREGATOR_CONCURRENT = True
+FILM_AGGREGATOR_DEADLINE = 15.0
+# Parallel metadata-only fetches when trailer feeds resolve uncached posters
+FILM_POSTER_MAX_WORKERS = 8
+# Watchmode regions fetched with each film's streaming section and kept in
+# the streaming availability index; more can be indexed with
+# `manage.py refresh_streaming_index --region US`.
+STREAMING_REGIONS = ["TR"]
+# Film search answers from the local index over cached films and asks IMDb
+# only when fewer than SEARCH_LOCAL_MIN_RESULTS match (or for ?more=1).
+SEARCH_RESULTS_LIMIT = 10
+SEARCH_LOCAL_MIN_RESULTS = 5
+# IMDb search answers are cached by normalised query for SEARCH_CACHE_TTL seconds
+# (the most recent SEARCH_CACHE_MAX_ENTRIES also in-process); a complete answer
+# for a prefix of at least SEARCH_CACHE_MIN_PREFIX characters also answers longer queries.
+SEARCH_CACHE_TTL = 6 * 3600
+SEARCH_CACHE_MAX_ENTRIES = 2048
+SEARCH_CACHE_MIN_PREFIX = 3
+# Federated search (/api/search) waits this long (seconds) for IMDb before answering
+# with local films and users only and a page token for the late IMDb results.
+FEDERATED_SEARCH_BUDGET = 0.8
+FEDERATED_SEARCH_USERS_LIMIT = 5
+# Typeahead (/api/search/suggest) is served from an in-process title index,
+# built in the gunicorn master when preloading and shared by the workers.
+# Other workers' new films are picked up every TITLE_SUGGEST_SYNC_SECONDS;
+# popularity ranks are recomputed by a full rebuild every TITLE_SUGGEST_REBUILD_HOURS.
+TITLE_SUGGEST_PRELOAD = True
+TITLE_SUGGEST_SYNC_SECONDS = 30.0
+TITLE_SUGGEST_REBUILD_HOURS = 6.0
+TITLE_SUGGEST_MAX_RESULTS = 20
+# Materialised KinoCheck trailer feeds (rebuild with `manage.py refresh_trailer_feeds`
+# from cron); snapshots older than this are served and rebuilt in the background.
+TRAILER_FEED_TTL_HOURS = 3.0
+# KinoCheck genres kept materialised; defaults to the genres the frontend offers.
+TRAILER_FEED_GENRES = [
+    "Action", "Abenteuer", "Animation", "Komödie", "Krimi", "Drama", "Fantasy",
+    "Horror", "Mystery", "Lovestory", "Science Fiction", "Thriller", "Familie",
+]
+# Total budget for a request's upstream calls; views can override it with a
+# ``request_deadline`` class attribute.
+REQUEST_DEADLINE_SECONDS = 25.0
+# Cross-worker single-flight lock for cold film fetches (seconds)
+FILM_FETCH_LOCK_TTL = 60
+FILM_FETCH_WAIT_TIMEOUT = 20.0
+# In-process coalescing of identical IMDb searches: waiters give up after this (seconds)
+IMDB_SEARCH_WAIT_TIMEOUT = 5.0
+# Route upstream-bound film/trailer endpoints to the async views in
+# films.async_views. Only useful under ASGI, e.g.
+#   gunicorn config.asgi:application -k uvicorn.workers.UvicornWorker
+ASYNC_UPSTREAM_VIEWS = False
@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault("DJANGO_SETTINGS_MODULE", "config.settings")
 
 application = get_wsgi_application()
+
+
+# Under gunicorn --preload this module is imported once in the master, so the
+# typeahead index is built there and shared by the forked workers.
+from films.services.title_suggest import preload_title_suggestions  # noqa: E402
+
+preload_title_suggestions()
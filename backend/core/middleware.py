@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+from asgiref.sync import iscoroutinefunction, markcoroutinefunction
+from django.conf import settings
+
+from core.utils.deadline import end_deadline, start_deadline
+
+
+class RequestDeadlineMiddleware:
+    """Give every request a total time budget for its upstream calls.
+
+    The budget is ``REQUEST_DEADLINE_SECONDS`` unless the view class sets a
+    ``request_deadline`` attribute (seconds, or None for no deadline).
+    ``HttpClient`` and the DeepSeek helpers shrink their timeouts to what is
+    left and skip retries once it is spent. Works under WSGI and ASGI.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+        try:
+            return self.get_response(request)
+        finally:
+            end_deadline(getattr(request, "_deadline_token", None))
+
+    async def __acall__(self, request):
+        try:
+            return await self.get_response(request)
+        finally:
+            end_deadline(getattr(request, "_deadline_token", None))
+
+    def process_view(self, request, view_func, view_args, view_kwargs):
+        view_class = getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+        seconds = getattr(settings, "REQUEST_DEADLINE_SECONDS", 25)
+        if view_class is not None and hasattr(view_class, "request_deadline"):
+            seconds = view_class.request_deadline
+        request._deadline_token = start_deadline(seconds)
+        return None
@@ -1,15 +1,55 @@
 """Service layer package for external integrations."""
 
-from .http_client import HttpClient
-from .imdb_service import IMDbService
-from .kinocheck_service import KinoCheckService
-from .watchmode_service import WatchmodeService
+from .client_registry import (
+    AsyncHttpClientRegistry,
+    HttpClientRegistry,
+    async_http_client_registry,
+    get_shared_async_client,
+    get_shared_client,
+    http_client_registry,
+)
+from .http_cache import HttpCache, http_cache
+from .http_client import AsyncHttpClient, HttpClient
+from .imdb_service import AsyncIMDbService, IMDbService
+from .kinocheck_service import AsyncKinoCheckService, KinoCheckService
+from .negative_cache import NegativeCache, is_not_found, negative_cache
+from .rate_limit import RateLimitExceeded, UpstreamLimiter, rate_limiter_registry
+from .resilience import CircuitBreaker, CircuitOpenError, ResiliencePolicy, resilience_registry
+from .search_cache import SearchResultCache, search_result_cache
+from .tiered_cache import TieredCache
+from .watchmode_service import AsyncWatchmodeService, WatchmodeService, streaming_regions
 
 __all__ = [
+    "HttpCache",
+    "http_cache",
     "HttpClient",
+    "AsyncHttpClient",
+    "HttpClientRegistry",
+    "AsyncHttpClientRegistry",
+    "http_client_registry",
+    "async_http_client_registry",
+    "get_shared_client",
+    "get_shared_async_client",
     "IMDbService",
+    "AsyncIMDbService",
     "KinoCheckService",
+    "AsyncKinoCheckService",
+    "NegativeCache",
+    "negative_cache",
+    "is_not_found",
+    "RateLimitExceeded",
+    "UpstreamLimiter",
+    "rate_limiter_registry",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ResiliencePolicy",
+    "resilience_registry",
+    "SearchResultCache",
+    "search_result_cache",
+    "TieredCache",
     "WatchmodeService",
+    "AsyncWatchmodeService",
+    "streaming_regions",
 ]
 
 
@@ -0,0 +1,149 @@
+from __future__ import annotations
+
+import asyncio
+import atexit
+import importlib.util
+import logging
+import os
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+import httpx
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+
+class HttpClientRegistry:
+    """Process-wide registry of pooled ``httpx.Client`` instances keyed by base URL.
+
+    Services are constructed per request, so giving each of them a fresh
+    ``httpx.Client`` throws away keep-alive connections and leaks sockets.
+    The registry hands out one long-lived client per upstream instead.
+
+    The registry is fork-safe: clients created before a fork (for example by
+    gunicorn ``--preload``) are never reused in the child, because their
+    connection pools share sockets with the parent.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._clients: Dict[str, httpx.Client] = {}
+        self._pid = os.getpid()
+
+    def get(self, base_url: Optional[str] = None) -> httpx.Client:
+        """Return the shared client for ``base_url``, creating it on first use."""
+        key = base_url or ""
+        self._check_pid()
+        client = self._clients.get(key)
+        if client is not None and not client.is_closed:
+            return client
+        with self._lock:
+            client = self._clients.get(key)
+            if client is None or client.is_closed:
+                client = self._build_client(base_url)
+                self._clients[key] = client
+            return client
+
+    def close_all(self) -> None:
+        """Close every client owned by this process."""
+        with self._lock:
+            clients, self._clients = self._clients, {}
+        for client in clients.values():
+            try:
+                client.close()
+            except Exception:  # noqa: BLE001
+                logger.debug("Error closing pooled HTTP client", exc_info=True)
+
+    def reset_after_fork(self) -> None:
+        """Forget inherited clients without closing the parent's sockets."""
+        self._lock = threading.Lock()
+        self._clients = {}
+        self._pid = os.getpid()
+
+    def _check_pid(self) -> None:
+        if self._pid != os.getpid():
+            self.reset_after_fork()
+
+    def _build_client(self, base_url: Optional[str]) -> httpx.Client:
+        return httpx.Client(**_client_options(base_url))
+
+
+class AsyncHttpClientRegistry:
+    """Pooled ``httpx.AsyncClient`` instances keyed by event loop and base URL.
+
+    An ``AsyncClient``'s connections belong to the loop that opened them, so
+    each running loop (one per uvicorn worker) gets its own clients; they are
+    dropped together with the loop.
+    """
+
+    def __init__(self) -> None:
+        self._clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, httpx.AsyncClient]]" = (
+            weakref.WeakKeyDictionary()
+        )
+
+    def get(self, base_url: Optional[str] = None) -> httpx.AsyncClient:
+        """Return the running loop's client for ``base_url``; call from a coroutine."""
+        loop = asyncio.get_running_loop()
+        clients = self._clients.setdefault(loop, {})
+        key = base_url or ""
+        client = clients.get(key)
+        if client is None or client.is_closed:
+            client = httpx.AsyncClient(**_client_options(base_url))
+            clients[key] = client
+        return client
+
+    async def aclose_all(self) -> None:
+        """Close the running loop's clients (e.g. from an ASGI lifespan shutdown)."""
+        clients = self._clients.pop(asyncio.get_running_loop(), {})
+        for client in clients.values():
+            try:
+                await client.aclose()
+            except Exception:  # noqa: BLE001
+                logger.debug("Error closing pooled async HTTP client", exc_info=True)
+
+
+def _client_options(base_url: Optional[str]) -> Dict[str, Any]:
+    """Pool, timeout and HTTP/2 options shared by sync and async clients."""
+    limits = httpx.Limits(
+        max_connections=int(getattr(settings, "HTTP_POOL_MAX_CONNECTIONS", 100)),
+        max_keepalive_connections=int(getattr(settings, "HTTP_POOL_MAX_KEEPALIVE", 20)),
+        keepalive_expiry=float(getattr(settings, "HTTP_POOL_KEEPALIVE_EXPIRY", 30)),
+    )
+    return {
+        "base_url": base_url or "",
+        "timeout": float(getattr(settings, "HTTP_TIMEOUT", 10)),
+        "limits": limits,
+        "http2": _http2_enabled(),
+    }
+
+
+def _http2_enabled() -> bool:
+    """Return True if HTTP/2 is requested and the optional ``h2`` package is installed."""
+    if not getattr(settings, "HTTP_HTTP2", True):
+        return False
+    if importlib.util.find_spec("h2") is None:
+        logger.debug("HTTP/2 requested but 'h2' is not installed; using HTTP/1.1")
+        return False
+    return True
+
+
+http_client_registry = HttpClientRegistry()
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=http_client_registry.reset_after_fork)
+atexit.register(http_client_registry.close_all)
+
+
+def get_shared_client(base_url: Optional[str] = None) -> httpx.Client:
+    """Return the pooled client for ``base_url`` from the process-wide registry."""
+    return http_client_registry.get(base_url)
+
+
+async_http_client_registry = AsyncHttpClientRegistry()
+
+
+def get_shared_async_client(base_url: Optional[str] = None) -> httpx.AsyncClient:
+    """Return the running event loop's pooled async client for ``base_url``."""
+    return async_http_client_registry.get(base_url)
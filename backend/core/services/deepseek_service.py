@@ -99,14 +99,9 @@ class DeepSeekService:
 
     def _call_deepseek_api(self, prompt: str) -> Dict[str, Any]:
         """Call DeepSeek API to get recommendations."""
-        import httpx
-        from django.conf import settings
-        
         if not self.api_key:
             raise ValueError("DeepSeek API key not configured")
         
-        url = f"{self.BASE_URL}/chat/completions"
-        
         headers = {
             "Authorization": f"Bearer {self.api_key}",
             "Content-Type": "application/json",
@@ -128,11 +123,7 @@ class DeepSeekService:
             "max_tokens": 500,
         }
 
-        timeout = float(getattr(settings, "HTTP_TIMEOUT", 30))
-        with httpx.Client(timeout=timeout) as client:
-            response = client.post(url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        return self.http_client.post("/chat/completions", json=payload, headers=headers)
 
     def _parse_recommendations(self, response: Dict[str, Any]) -> List[str]:
         """Parse DeepSeek API response to extract film titles."""
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import hashlib
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+import zlib
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Mapping, Optional
+
+import httpx
+from django.conf import settings
+
+from core.utils.compression import compress_json, decompress_json
+
+logger = logging.getLogger(__name__)
+
+_MAX_AGE = re.compile(r"(?:^|,)\s*(?:s-maxage|max-age)\s*=\s*\"?(\d+)", re.IGNORECASE)
+
+
+@dataclass
+class CachedResponse:
+    """A stored upstream GET: its decoded JSON body and validators."""
+
+    data: Any
+    etag: Optional[str] = None
+    last_modified: Optional[str] = None
+    fresh_until: float = 0.0
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.fresh_until
+
+    def conditional_headers(self) -> Dict[str, str]:
+        headers = {}
+        if self.etag:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+def _freshness_lifetime(response: httpx.Response, cache_control: str) -> float:
+    """Seconds ``response`` may be served without revalidation."""
+    if "no-cache" in cache_control:
+        return 0.0
+    match = _MAX_AGE.search(cache_control)
+    if match:
+        return float(match.group(1))
+    expires = response.headers.get("Expires")
+    if expires:
+        try:
+            return max(0.0, parsedate_to_datetime(expires).timestamp() - time.time())
+        except (TypeError, ValueError):
+            return 0.0
+    return 0.0
+
+
+class HttpCache:
+    """Size-bounded on-disk cache of upstream GET responses.
+
+    Responses are stored only when upstream allows it (no ``no-store``) and
+    gives a reason to: a ``max-age``/``Expires`` freshness lifetime, an
+    ``ETag`` or a ``Last-Modified``. Fresh entries are served without a
+    request; stale ones are revalidated with ``If-None-Match`` /
+    ``If-Modified-Since`` so an unchanged resource costs a body-less 304.
+
+    Entries are zlib-compressed files named by a hash of the URL, query and
+    request headers, written atomically so every worker can share the
+    directory. Once the directory grows past ``max_bytes`` the least
+    recently used entries (by mtime, bumped on every hit) are evicted.
+    """
+
+    def __init__(self, directory: Optional[str] = None, max_bytes: Optional[int] = None) -> None:
+        self._directory = directory
+        self._max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._size: Optional[int] = None
+        self._stats = {"hits": 0, "stale": 0, "revalidated": 0, "misses": 0, "stores": 0, "evictions": 0, "errors": 0}
+
+    @property
+    def directory(self) -> str:
+        directory = self._directory or getattr(settings, "HTTP_CACHE_DIR", None)
+        return directory or os.path.join(tempfile.gettempdir(), "filmosphere-http-cache")
+
+    @property
+    def max_bytes(self) -> int:
+        return self._max_bytes or int(getattr(settings, "HTTP_CACHE_MAX_BYTES", 256 * 1024 * 1024))
+
+    @staticmethod
+    def key(url: str, params: Optional[Mapping[str, Any]] = None, headers: Optional[Mapping[str, str]] = None) -> str:
+        """Cache key of a GET; hashed so API keys in the query never reach file names."""
+        parts = [str(url)]
+        parts.extend(f"{name}={value}" for name, value in sorted((params or {}).items()))
+        parts.extend(f"{name.lower()}:{value}" for name, value in sorted((headers or {}).items()))
+        return hashlib.sha256("\n".join(parts).encode("utf-8")).hexdigest()
+
+    def lookup(self, key: str) -> Optional[CachedResponse]:
+        """Return the stored response for ``key``, fresh or not, or None."""
+        path = self._path(key)
+        try:
+            with open(path, "rb") as handle:
+                entry = CachedResponse(**decompress_json(handle.read()))
+            os.utime(path)
+        except FileNotFoundError:
+            self._record("misses")
+            return None
+        except (OSError, ValueError, TypeError, zlib.error):
+            self._record("errors")
+            logger.warning("Dropping unreadable HTTP cache entry %s", path, exc_info=True)
+            self._remove(path)
+            return None
+        self._record("hits" if entry.is_fresh() else "stale")
+        return entry
+
+    def revalidated(self, key: str, entry: CachedResponse, response: httpx.Response) -> Any:
+        """Handle a 304 for ``entry``: extend its freshness and return its data."""
+        self._record("revalidated")
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        entry.fresh_until = time.time() + _freshness_lifetime(response, cache_control)
+        entry.etag = response.headers.get("ETag") or entry.etag
+        entry.last_modified = response.headers.get("Last-Modified") or entry.last_modified
+        self._write(key, entry)
+        return entry.data
+
+    def store(self, key: str, response: httpx.Response, data: Any) -> None:
+        """Store a 200 response's decoded body if its headers allow and warrant it."""
+        cache_control = response.headers.get("Cache-Control", "").lower()
+        if response.status_code != 200 or "no-store" in cache_control:
+            return
+        lifetime = _freshness_lifetime(response, cache_control)
+        etag = response.headers.get("ETag")
+        last_modified = response.headers.get("Last-Modified")
+        if not (lifetime or etag or last_modified):
+            return
+        self._record("stores")
+        self._write(key, CachedResponse(data, etag, last_modified, time.time() + lifetime))
+
+    def clear(self) -> None:
+        """Delete every entry (used by tests and after upstream schema changes)."""
+        try:
+            names = os.listdir(self.directory)
+        except FileNotFoundError:
+            return
+        for name in names:
+            self._remove(os.path.join(self.directory, name))
+        with self._lock:
+            self._size = 0
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            return {**self._stats, "bytes": self._size, "max_bytes": self.max_bytes}
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"{key}.bin")
+
+    def _write(self, key: str, entry: CachedResponse) -> None:
+        blob = compress_json(
+            {
+                "data": entry.data,
+                "etag": entry.etag,
+                "last_modified": entry.last_modified,
+                "fresh_until": entry.fresh_until,
+            }
+        )
+        path = self._path(key)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            previous = os.path.getsize(path) if os.path.exists(path) else 0
+            with open(tmp_path, "wb") as handle:
+                handle.write(blob)
+            os.replace(tmp_path, path)
+        except OSError:
+            self._record("errors")
+            logger.warning("Cannot write HTTP cache entry %s", path, exc_info=True)
+            self._remove(tmp_path)
+            return
+        with self._lock:
+            if self._size is not None:
+                self._size += len(blob) - previous
+        if self._current_size() > self.max_bytes:
+            self._evict()
+
+    def _current_size(self) -> int:
+        with self._lock:
+            if self._size is not None:
+                return self._size
+        size = sum(entry.stat().st_size for entry in os.scandir(self.directory) if entry.is_file())
+        with self._lock:
+            self._size = size
+        return size
+
+    def _evict(self) -> None:
+        """Drop least recently used entries until the cache is at 90% of its budget."""
+        entries = []
+        for entry in os.scandir(self.directory):
+            try:
+                stat = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, entry.path))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        target = self.max_bytes * 0.9
+        evicted = 0
+        for _, size, path in entries:
+            if total <= target:
+                break
+            self._remove(path)
+            total -= size
+            evicted += 1
+        with self._lock:
+            # Other workers share the directory, so resync with what is on disk.
+            self._size = total
+            self._stats["evictions"] += evicted
+
+    @staticmethod
+    def _remove(path: str) -> None:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _record(self, name: str) -> None:
+        with self._lock:
+            self._stats[name] += 1
+
+
+http_cache = HttpCache()
@@ -1,37 +1,133 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 import httpx
 from django.conf import settings
-from tenacity import retry, retry_if_exception_type, stop_after_attempt, wait_exponential
+
+from core.utils.deadline import DeadlineExceeded, bounded_timeout
+
+from .client_registry import get_shared_async_client, get_shared_client
+from .http_cache import CachedResponse, HttpCache, http_cache
+from .rate_limit import UpstreamLimiter, rate_limiter_registry
+from .resilience import ResiliencePolicy, resilience_registry
 
 logger = logging.getLogger(__name__)
 
 
-class HttpClient:
-    """HTTP client wrapper around httpx with retry and timeout support.
+class BaseHttpClient:
+    """Upstream policy shared by ``HttpClient`` and ``AsyncHttpClient``.
 
-    This client is designed to be dependency-injected into services so that
-    external calls can be easily mocked in tests.
+    Holds the upstream's resilience policy, rate limiter and HTTP cache and
+    the request/response handling that does not depend on the transport.
     """
 
     def __init__(
         self,
         base_url: Optional[str] = None,
         timeout: Optional[float] = None,
+        policy: Optional[ResiliencePolicy] = None,
+        limiter: Optional[UpstreamLimiter] = None,
+        cache: Optional[HttpCache] = None,
     ) -> None:
         self.base_url = base_url
         self.timeout = timeout or float(getattr(settings, "HTTP_TIMEOUT", 10))
-        self._client = httpx.Client(base_url=self.base_url, timeout=self.timeout)
-
-    @retry(
-        retry=retry_if_exception_type(httpx.HTTPError),
-        stop=stop_after_attempt(getattr(settings, "HTTP_RETRIES", 3)),
-        wait=wait_exponential(multiplier=1, min=1, max=10),
-        reraise=True,
-    )
+        self.policy = policy or resilience_registry.get(self.base_url)
+        self.limiter = limiter or rate_limiter_registry.get(self.base_url)
+        if cache is None and getattr(settings, "HTTP_CACHE_ENABLED", True):
+            cache = http_cache
+        self.cache = cache
+
+    def _cache_lookup(
+        self, url: str, params: Optional[Dict[str, Any]], headers: Optional[Dict[str, str]]
+    ) -> Tuple[Optional[str], Optional[CachedResponse], Optional[Dict[str, str]]]:
+        """Return ``(cache key, stored response, headers to send)`` for a GET."""
+        if self.cache is None:
+            return None, None, headers
+        key = self.cache.key(f"{self.base_url or ''}{url}", params, headers)
+        cached = self.cache.lookup(key)
+        if cached is None or cached.is_fresh():
+            return key, cached, headers
+        return key, cached, {**(headers or {}), **cached.conditional_headers()}
+
+    def _get_result(self, response: httpx.Response, key: Optional[str], cached: Optional[CachedResponse]) -> Dict[str, Any]:
+        """Decode a GET response, answering a 304 from (and storing 200s in) the cache."""
+        self.limiter.observe(response)
+        if response.status_code == 304 and cached is not None:
+            return self.cache.revalidated(key, cached, response)
+        response.raise_for_status()
+        data = response.json()
+        if self.cache is not None:
+            self.cache.store(key, response, data)
+        return data
+
+    def _post_result(self, response: httpx.Response) -> Dict[str, Any]:
+        self.limiter.observe(response)
+        response.raise_for_status()
+        return response.json()
+
+    @contextmanager
+    def _deadline_timeout(self) -> Iterator[float]:
+        """Yield this attempt's timeout, bounded by the request deadline.
+
+        A timeout that only fired because the deadline shortened it says
+        nothing about the upstream, so it is reported as ``DeadlineExceeded``.
+        """
+        timeout = bounded_timeout(self.timeout)
+        try:
+            yield timeout
+        except httpx.TimeoutException as exc:
+            if timeout < self.timeout:
+                raise DeadlineExceeded() from exc
+            raise
+
+
+class HttpClient(BaseHttpClient):
+    """HTTP client wrapper around httpx with retry, circuit breaker and timeout support.
+
+    This client is designed to be dependency-injected into services so that
+    external calls can be easily mocked in tests.
+
+    By default the underlying ``httpx.Client`` comes from the process-wide
+    pooled registry, so every service talking to the same base URL reuses
+    the same keep-alive connections. Pass ``shared=False`` to get a private
+    client that is closed by :meth:`close`.
+
+    Calls go through the upstream's ``ResiliencePolicy`` (shared by every
+    client for the same host): GETs retry transport errors, 429 and 5xx
+    within a retry budget, never 4xx, and all calls fail fast with
+    ``CircuitOpenError`` while the upstream's circuit breaker is open.
+
+    Inside a request deadline each attempt's timeout shrinks to the time
+    left, and ``DeadlineExceeded`` is raised once none is.
+
+    Every attempt first takes a slot from the upstream's ``UpstreamLimiter``
+    (token bucket shared by the host's workers plus a concurrency cap), which
+    also pauses the upstream and slows down when it answers 429.
+
+    GETs go through the on-disk ``HttpCache`` (unless ``HTTP_CACHE_ENABLED``
+    is off): fresh responses are served locally and stale ones revalidated
+    with their ``ETag``/``Last-Modified``, so unchanged data costs a 304.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        shared: bool = True,
+        policy: Optional[ResiliencePolicy] = None,
+        limiter: Optional[UpstreamLimiter] = None,
+        cache: Optional[HttpCache] = None,
+    ) -> None:
+        super().__init__(base_url, timeout, policy, limiter, cache)
+        self.shared = shared
+        if shared:
+            self._client = get_shared_client(self.base_url)
+        else:
+            self._client = httpx.Client(base_url=self.base_url or "", timeout=self.timeout)
+
     def get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Perform a GET request and return the decoded JSON payload.
 
@@ -43,9 +139,16 @@ class HttpClient:
         Returns:
             Parsed JSON response as a dictionary.
         """
-        response = self._client.get(url, params=params, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        key, cached, request_headers = self._cache_lookup(url, params, headers)
+        if cached is not None and cached.is_fresh():
+            return cached.data
+
+        def attempt() -> Dict[str, Any]:
+            with self.limiter.slot(), self._deadline_timeout() as timeout:
+                response = self._client.get(url, params=params, headers=request_headers, timeout=timeout)
+            return self._get_result(response, key, cached)
+
+        return self.policy.call(attempt)
 
     def post(self, url: str, json: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
         """Perform a POST request and return the decoded JSON payload.
@@ -58,13 +161,74 @@ class HttpClient:
         Returns:
             Parsed JSON response as a dictionary.
         """
-        response = self._client.post(url, json=json, headers=headers)
-        response.raise_for_status()
-        return response.json()
+        def attempt() -> Dict[str, Any]:
+            with self.limiter.slot(), self._deadline_timeout() as timeout:
+                response = self._client.post(url, json=json, headers=headers, timeout=timeout)
+            return self._post_result(response)
+
+        # POSTs are not assumed idempotent: breaker only, no retries.
+        return self.policy.call(attempt, retry=False)
 
     def close(self) -> None:
-        """Close the underlying HTTP client."""
-        self._client.close()
+        """Close the underlying HTTP client unless it is shared through the registry."""
+        if not self.shared:
+            self._client.close()
+
+
+class AsyncHttpClient(BaseHttpClient):
+    """``HttpClient`` for coroutines, backed by ``httpx.AsyncClient``.
+
+    Shares the upstream's resilience policy, rate limiter and HTTP cache
+    with the sync client; waits (backoff, rate limits) use ``asyncio.sleep``
+    so one event loop can keep hundreds of slow upstream calls in flight.
+    The pooled ``AsyncClient`` is looked up per call because it belongs to
+    the running event loop.
+    """
+
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        timeout: Optional[float] = None,
+        policy: Optional[ResiliencePolicy] = None,
+        limiter: Optional[UpstreamLimiter] = None,
+        cache: Optional[HttpCache] = None,
+        client: Optional[httpx.AsyncClient] = None,
+    ) -> None:
+        super().__init__(base_url, timeout, policy, limiter, cache)
+        self._own_client = client
+
+    @property
+    def _client(self) -> httpx.AsyncClient:
+        return self._own_client or get_shared_async_client(self.base_url)
+
+    async def get(
+        self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async ``HttpClient.get``."""
+        key, cached, request_headers = self._cache_lookup(url, params, headers)
+        if cached is not None and cached.is_fresh():
+            return cached.data
+
+        async def attempt() -> Dict[str, Any]:
+            async with self.limiter.aslot():
+                with self._deadline_timeout() as timeout:
+                    response = await self._client.get(url, params=params, headers=request_headers, timeout=timeout)
+            return self._get_result(response, key, cached)
+
+        return await self.policy.acall(attempt)
+
+    async def post(
+        self, url: str, json: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Any]:
+        """Async ``HttpClient.post``; never retried."""
+
+        async def attempt() -> Dict[str, Any]:
+            async with self.limiter.aslot():
+                with self._deadline_timeout() as timeout:
+                    response = await self._client.post(url, json=json, headers=headers, timeout=timeout)
+            return self._post_result(response)
+
+        return await self.policy.acall(attempt, retry=False)
 
 
 
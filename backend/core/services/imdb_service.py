@@ -3,46 +3,63 @@ from __future__ import annotations
 from typing import Any, Dict, List, Optional
 
 import httpx
+from asgiref.sync import sync_to_async
 from django.conf import settings
 
-from .http_client import HttpClient
+from .http_client import AsyncHttpClient, HttpClient
+from .search_cache import SearchResultCache, search_result_cache
+
+# Titles IMDbAPI returns per search; a shorter answer holds every match.
+SEARCH_PAGE_SIZE = 10
+
+
+def normalize_search_results(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Turn an IMDbAPI `/search/titles` payload into {imdb_id, title, year, image, type} dicts."""
+    titles = payload.get("titles", []) or []
+    normalized: List[Dict[str, Any]] = []
+    for item in titles:
+        primary_image = item.get("primaryImage") or {}
+        normalized.append(
+            {
+                "imdb_id": item.get("id"),
+                "title": item.get("primaryTitle"),
+                "year": item.get("startYear"),
+                "image": primary_image.get("url"),
+                "type": item.get("type"),
+            }
+        )
+    return normalized
 
 
 class IMDbService:
     """Service wrapper for IMDbAPI.dev endpoints."""
 
-    def __init__(self, http_client: Optional[HttpClient] = None) -> None:
+    def __init__(self, http_client: Optional[HttpClient] = None, search_cache: Optional[SearchResultCache] = None) -> None:
         self.http_client = http_client or HttpClient(base_url=settings.IMDBAPI_BASE)
+        self.search_cache = search_cache or search_result_cache
 
     def search(self, query: str) -> List[Dict[str, Any]]:
         """Search films by text query using IMDbAPI `/search/titles`.
 
         This normalizes the external response into a simple list of
         {imdb_id, title, year, image, type} dictionaries suitable for the
-        public search endpoint.
+        public search endpoint. Answers are cached by normalised query
+        (see ``SearchResultCache``); failures are not.
         """
+        cached = self.search_cache.get(query)
+        if cached is not None:
+            return cached
         try:
             payload = self.http_client.get(
                 "/search/titles",
-                params={"query": query, "limit": 10},
+                params={"query": query, "limit": SEARCH_PAGE_SIZE},
             )
         except httpx.HTTPError:
             # Treat network / client errors as "no results" for now.
             return []
-        titles = payload.get("titles", []) or []
-        normalized: List[Dict[str, Any]] = []
-        for item in titles:
-            primary_image = item.get("primaryImage") or {}
-            normalized.append(
-                {
-                    "imdb_id": item.get("id"),
-                    "title": item.get("primaryTitle"),
-                    "year": item.get("startYear"),
-                    "image": primary_image.get("url"),
-                    "type": item.get("type"),
-                }
-            )
-        return normalized
+        results = normalize_search_results(payload)
+        self.search_cache.set(query, results, complete=len(results) < SEARCH_PAGE_SIZE)
+        return results
 
     def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
         """Fetch core metadata for a film."""
@@ -96,6 +113,14 @@ class IMDbService:
         """Fetch box office data for a film."""
         return self.http_client.get(f"/titles/{imdb_id}/boxOffice")
 
+    def get_title_page(self, imdb_id: str, resource: str, page_token: Optional[str] = None) -> Dict[str, Any]:
+        """Fetch one page of a ``/titles/{imdb_id}/{resource}`` endpoint.
+
+        Paginated endpoints return a ``nextPageToken`` while there are more pages.
+        """
+        params = {"pageToken": page_token} if page_token else None
+        return self.http_client.get(f"/titles/{imdb_id}/{resource}", params=params)
+
     def search_movies_graphql(self, query: str) -> Dict[str, Any]:
         """Search movies using GraphQL query (alternative search method).
         
@@ -113,4 +138,65 @@ class IMDbService:
         return self.http_client.post("/titles", json=graphql_payload)
 
 
+class AsyncIMDbService:
+    """``IMDbService`` for async views, backed by ``AsyncHttpClient``."""
+
+    def __init__(self, http_client: Optional[AsyncHttpClient] = None, search_cache: Optional[SearchResultCache] = None) -> None:
+        self.http_client = http_client or AsyncHttpClient(base_url=settings.IMDBAPI_BASE)
+        self.search_cache = search_cache or search_result_cache
+
+    async def search(self, query: str) -> List[Dict[str, Any]]:
+        """Async ``IMDbService.search``, sharing its result cache."""
+        cached = await sync_to_async(self.search_cache.get)(query)
+        if cached is not None:
+            return cached
+        try:
+            payload = await self.http_client.get("/search/titles", params={"query": query, "limit": SEARCH_PAGE_SIZE})
+        except httpx.HTTPError:
+            return []
+        results = normalize_search_results(payload)
+        await sync_to_async(self.search_cache.set)(query, results, len(results) < SEARCH_PAGE_SIZE)
+        return results
+
+    async def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}")
+
+    async def get_credits(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/credits")
+
+    async def get_images(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/images")
+
+    async def get_videos(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/videos")
+
+    async def get_parents_guide(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/parentsGuide")
+
+    async def get_certificates(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/certificates")
+
+    async def get_release_dates(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/releaseDates")
+
+    async def get_akas(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/akas")
+
+    async def get_seasons(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/seasons")
+
+    async def get_episodes(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/episodes")
+
+    async def get_award_nominations(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/awardNominations")
+
+    async def get_company_credits(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/companyCredits")
+
+    async def get_box_office(self, imdb_id: str) -> Dict[str, Any]:
+        return await self.http_client.get(f"/titles/{imdb_id}/boxOffice")
 
+    async def get_title_page(self, imdb_id: str, resource: str, page_token: Optional[str] = None) -> Dict[str, Any]:
+        params = {"pageToken": page_token} if page_token else None
+        return await self.http_client.get(f"/titles/{imdb_id}/{resource}", params=params)
@@ -1,14 +1,15 @@
 from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
+from asgiref.sync import sync_to_async
 from django.conf import settings
-from .http_client import HttpClient
+from .http_client import AsyncHttpClient, HttpClient
+from .negative_cache import is_not_found, negative_cache
 
 logger = logging.getLogger(__name__)
 
-class KinoCheckService:
-    def __init__(self, http_client: Optional[HttpClient] = None) -> None:
-        self.http_client = http_client or HttpClient(base_url=settings.KINO_BASE)
+class BaseKinoCheckService:
+    """Request headers and response parsing shared by the sync and async services."""
 
     def _get_headers(self) -> Dict[str, str]:
         return {
@@ -27,6 +28,17 @@ class KinoCheckService:
             return data
         return []
 
+    @staticmethod
+    def _format_movie(data: Any) -> Optional[Dict[str, Any]]:
+        if not isinstance(data, dict) or not data or data.get("error"):
+            return None
+        return data
+
+
+class KinoCheckService(BaseKinoCheckService):
+    def __init__(self, http_client: Optional[HttpClient] = None) -> None:
+        self.http_client = http_client or HttpClient(base_url=settings.KINO_BASE)
+
     def get_latest_trailers(self) -> List[Dict[str, Any]]:
         headers = self._get_headers()
         try:
@@ -56,22 +68,44 @@ class KinoCheckService:
             return []
 
     def get_movie_by_id(self, movie_id: str) -> Optional[Dict[str, Any]]:
+        if negative_cache.is_missing("kinocheck-movie", movie_id):
+            return None
         headers = self._get_headers()
         params = {"id": movie_id}
         try:
             data = self.http_client.get("/movies", params=params, headers=headers)
-            if isinstance(data, dict) and (data.get("error") or not data):
+            if not data or (isinstance(data, dict) and data.get("error")):
+                negative_cache.mark_missing("kinocheck-movie", movie_id)
                 return None
             return data
         except Exception as e:
+            if is_not_found(e):
+                negative_cache.mark_missing("kinocheck-movie", movie_id)
             logger.error(f"KinoCheck ID error: {e}")
             return None
         
 
+    def get_trailer(self, imdb_id: str, language: str = "en") -> Optional[Dict[str, Any]]:
+        """Return KinoCheck's movie record (with its ``trailer``) for an IMDb id.
+
+        Returns None when KinoCheck has no such movie. Other upstream errors
+        propagate so the aggregator reports the section as failed and retries it.
+        """
+        params = {"imdb_id": imdb_id, "language": language}
+        try:
+            data = self.http_client.get("/movies", headers=self._get_headers(), params=params)
+        except Exception as e:
+            if is_not_found(e):
+                return None
+            raise
+        return self._format_movie(data)
+
     def get_kinocheck_url_by_imdb_id(self, imdb_id: str, language: str = "en") -> Optional[str]:
         """
         Fetches the KinoCheck Trailer URL for a specific movie using its IMDb ID.
         """
+        if negative_cache.is_missing("kinocheck-url", f"{imdb_id}:{language}"):
+            return None
         headers = self._get_headers()
         params = {
             "imdb_id": imdb_id,
@@ -86,11 +120,85 @@ class KinoCheckService:
                 # Use (data.get("trailer") or {}) to handle if the value is None
                 trailer_data = data.get("trailer") or {}
                 
-                return trailer_data.get("url")
+                url = trailer_data.get("url")
+                if not url:
+                    negative_cache.mark_missing("kinocheck-url", f"{imdb_id}:{language}")
+                return url
             
             return None
 
         except Exception as e:
+            if is_not_found(e):
+                negative_cache.mark_missing("kinocheck-url", f"{imdb_id}:{language}")
             # Note: Make sure 'logger' is imported or defined in this file
             logger.error(f"KinoCheck trailer lookup error for IMDb ID {imdb_id}: {e}")
-            return None
\ No newline at end of file
+            return None
+
+
+class AsyncKinoCheckService(BaseKinoCheckService):
+    """``KinoCheckService`` for async views, backed by ``AsyncHttpClient``."""
+
+    def __init__(self, http_client: Optional[AsyncHttpClient] = None) -> None:
+        self.http_client = http_client or AsyncHttpClient(base_url=settings.KINO_BASE)
+
+    async def get_latest_trailers(self) -> List[Dict[str, Any]]:
+        return await self._get_trailers("/trailers/latest", "latest")
+
+    async def get_trending_trailers(self) -> List[Dict[str, Any]]:
+        return await self._get_trailers("/trailers/trending", "trending")
+
+    async def get_trailers_by_genre(self, genre: str) -> List[Dict[str, Any]]:
+        return await self._get_trailers("/trailers", "genre", params={"genres": genre})
+
+    async def get_movie_by_id(self, movie_id: str) -> Optional[Dict[str, Any]]:
+        # The negative cache's shared tier is the database cache: keep it off the event loop.
+        if await sync_to_async(negative_cache.is_missing)("kinocheck-movie", movie_id):
+            return None
+        try:
+            data = await self.http_client.get("/movies", params={"id": movie_id}, headers=self._get_headers())
+        except Exception as e:
+            if is_not_found(e):
+                await sync_to_async(negative_cache.mark_missing)("kinocheck-movie", movie_id)
+            logger.error(f"KinoCheck ID error: {e}")
+            return None
+        if not data or (isinstance(data, dict) and data.get("error")):
+            await sync_to_async(negative_cache.mark_missing)("kinocheck-movie", movie_id)
+            return None
+        return data
+
+    async def get_trailer(self, imdb_id: str, language: str = "en") -> Optional[Dict[str, Any]]:
+        params = {"imdb_id": imdb_id, "language": language}
+        try:
+            data = await self.http_client.get("/movies", headers=self._get_headers(), params=params)
+        except Exception as e:
+            if is_not_found(e):
+                return None
+            raise
+        return self._format_movie(data)
+
+    async def get_kinocheck_url_by_imdb_id(self, imdb_id: str, language: str = "en") -> Optional[str]:
+        key = f"{imdb_id}:{language}"
+        if await sync_to_async(negative_cache.is_missing)("kinocheck-url", key):
+            return None
+        params = {"imdb_id": imdb_id, "language": language}
+        try:
+            data = await self.http_client.get("/movies", headers=self._get_headers(), params=params)
+        except Exception as e:
+            if is_not_found(e):
+                await sync_to_async(negative_cache.mark_missing)("kinocheck-url", key)
+            logger.error(f"KinoCheck trailer lookup error for IMDb ID {imdb_id}: {e}")
+            return None
+        if not isinstance(data, dict):
+            return None
+        url = (data.get("trailer") or {}).get("url")
+        if not url:
+            await sync_to_async(negative_cache.mark_missing)("kinocheck-url", key)
+        return url
+
+    async def _get_trailers(self, url: str, label: str, params: Optional[Dict[str, Any]] = None) -> List[Dict[str, Any]]:
+        try:
+            data = await self.http_client.get(url, params=params, headers=self._get_headers())
+        except Exception as e:
+            logger.error(f"KinoCheck {label} error: {e}")
+            return []
+        return self._format_response(data)
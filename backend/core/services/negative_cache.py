@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Optional
+
+import httpx
+from django.conf import settings
+
+from .tiered_cache import MISSING, TieredCache
+
+# Upstream statuses that mean "this id does not exist", as opposed to an outage.
+NOT_FOUND_STATUSES = frozenset({400, 404, 410})
+
+
+def is_not_found(exc: BaseException) -> bool:
+    """Return True if ``exc`` is an upstream response saying the resource does not exist."""
+    return isinstance(exc, httpx.HTTPStatusError) and exc.response.status_code in NOT_FOUND_STATUSES
+
+
+class NegativeCache:
+    """Remember ids that an upstream reported as missing, shared across workers.
+
+    Entries are namespaced per lookup (``"imdb"``, ``"watchmode"``, ...) and
+    expire after ``NEGATIVE_CACHE_TTL`` seconds, so an id that appears
+    upstream later is picked up again without manual invalidation. Only
+    definitive "not found" answers should be recorded, never timeouts or
+    5xx responses.
+    """
+
+    def __init__(self, ttl: Optional[float] = None) -> None:
+        self._ttl = ttl
+        self._cache = TieredCache("missing")
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return float(getattr(settings, "NEGATIVE_CACHE_TTL", 600))
+
+    def is_missing(self, namespace: str, key: str) -> bool:
+        return self._cache.get(f"{namespace}:{key}") is not MISSING
+
+    def mark_missing(self, namespace: str, key: str) -> None:
+        if self.ttl > 0:
+            self._cache.set(f"{namespace}:{key}", True, timeout=self.ttl)
+
+    def forget(self, namespace: str, key: str) -> None:
+        self._cache.delete(f"{namespace}:{key}")
+
+    def clear_local(self) -> None:
+        self._cache.clear_local()
+
+    def stats(self) -> Dict[str, Any]:
+        return self._cache.stats()
+
+
+negative_cache = NegativeCache()
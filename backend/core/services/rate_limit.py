@@ -0,0 +1,321 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import os
+import re
+import tempfile
+import threading
+import time
+from contextlib import asynccontextmanager, contextmanager
+from email.utils import parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, Iterator, Optional
+
+import httpx
+from django.conf import settings
+
+from core.utils import deadline
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - non-POSIX platforms
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Adaptive backoff: every 429 halves the effective rate (down to this
+# fraction of the configured one); every successful call wins some back.
+MIN_RATE_FACTOR = 0.1
+RATE_FACTOR_RECOVERY = 0.05
+# How often a coroutine waiting for a concurrency slot checks again (seconds).
+ASYNC_SLOT_POLL_INTERVAL = 0.01
+
+
+class RateLimitExceeded(httpx.HTTPError):
+    """Raised instead of calling an upstream when no slot frees up within ``max_wait``.
+
+    Like ``DeadlineExceeded`` it is our own limit, not an upstream failure:
+    it is never retried and does not count against the circuit breaker.
+    """
+
+    def __init__(self, upstream: str, wait: float) -> None:
+        super().__init__(f"Rate limit for {upstream} would need a {wait:.1f}s wait")
+        self.upstream = upstream
+        self.wait = wait
+
+
+def retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a ``Retry-After`` header given in seconds or as an HTTP date."""
+    value = response.headers.get("Retry-After", "").strip()
+    if not value:
+        return None
+    if value.isdigit():
+        return float(value)
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+class UpstreamLimiter:
+    """Token bucket plus concurrency cap for one upstream.
+
+    The bucket allows ``rate`` calls per second with bursts of ``burst``.
+    With a ``state_dir`` its state lives in a small ``flock``-ed file, so
+    every gunicorn worker on the host draws from the same bucket; without
+    one (or where ``fcntl`` is missing) it is per process. The concurrency
+    cap is always per process.
+
+    A 429 pauses the upstream for its ``Retry-After`` (for every worker
+    sharing the state) and halves the effective rate; successful calls
+    restore it gradually. Callers that would wait longer than ``max_wait``
+    or past the request deadline get ``RateLimitExceeded`` instead.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        rate: float = 0,
+        burst: Optional[float] = None,
+        max_concurrency: Optional[int] = None,
+        max_wait: float = 10.0,
+        state_dir: Optional[str] = None,
+    ) -> None:
+        self.name = name
+        self.rate = rate
+        self.burst = burst or max(rate, 1.0)
+        self.max_concurrency = max_concurrency
+        self.max_wait = max_wait
+        self._semaphore = threading.BoundedSemaphore(max_concurrency) if max_concurrency else None
+        self._lock = threading.Lock()
+        self._path = None
+        if state_dir and fcntl is not None:
+            self._path = os.path.join(state_dir, re.sub(r"[^\w.-]", "_", name) + ".json")
+        self._memory = self._initial_state()
+        self._factor = 1.0
+        self._in_flight = 0
+        self._stats = {
+            "acquired": 0,
+            "delayed": 0,
+            "rejected": 0,
+            "throttled_responses": 0,
+            "wait_seconds_total": 0.0,
+            "max_wait_seconds": 0.0,
+        }
+
+    @contextmanager
+    def slot(self) -> Iterator[None]:
+        """Hold a rate-limit token and a concurrency slot for one call."""
+        started = time.monotonic()
+        while True:
+            wait = self._try_take()
+            if wait <= 0:
+                break
+            self._check_wait(wait, started)
+            time.sleep(wait)
+        if self._semaphore is not None and not self._semaphore.acquire(timeout=self._wait_budget(started)):
+            self._reject(self._wait_budget(started))
+        self._acquired(started)
+        try:
+            yield
+        finally:
+            self._released()
+
+    @asynccontextmanager
+    async def aslot(self) -> AsyncIterator[None]:
+        """``slot`` for coroutines: waits with ``asyncio.sleep`` instead of blocking."""
+        started = time.monotonic()
+        while True:
+            wait = self._try_take()
+            if wait <= 0:
+                break
+            self._check_wait(wait, started)
+            await asyncio.sleep(wait)
+        if self._semaphore is not None:
+            while not self._semaphore.acquire(blocking=False):
+                self._check_wait(ASYNC_SLOT_POLL_INTERVAL, started)
+                await asyncio.sleep(ASYNC_SLOT_POLL_INTERVAL)
+        self._acquired(started)
+        try:
+            yield
+        finally:
+            self._released()
+
+    def observe(self, response: httpx.Response) -> None:
+        """Adapt to an upstream response: back off on 429, recover otherwise."""
+        if response.status_code == 429:
+            self.throttled(retry_after_seconds(response))
+        elif self._factor < 1.0:
+            with self._state() as state:
+                state["factor"] = min(1.0, state["factor"] + RATE_FACTOR_RECOVERY)
+                self._factor = state["factor"]
+
+    def throttled(self, retry_after: Optional[float] = None) -> None:
+        """Record a 429: pause until ``Retry-After`` and halve the effective rate."""
+        with self._lock:
+            self._stats["throttled_responses"] += 1
+        with self._state() as state:
+            state["factor"] = max(MIN_RATE_FACTOR, state["factor"] / 2)
+            self._factor = state["factor"]
+            pause = retry_after if retry_after is not None else 1 / max(self.rate * state["factor"], 1.0)
+            state["blocked_until"] = max(state["blocked_until"], time.time() + pause)
+        logger.warning("%s answered 429; pausing %.1fs at %.0f%% of its rate", self.name, pause, self._factor * 100)
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            stats = dict(self._stats)
+            in_flight = self._in_flight
+        delayed = stats["delayed"]
+        return {
+            **stats,
+            "wait_seconds_total": round(stats["wait_seconds_total"], 3),
+            "max_wait_seconds": round(stats["max_wait_seconds"], 3),
+            "avg_wait_ms": round(stats["wait_seconds_total"] / delayed * 1000, 1) if delayed else 0.0,
+            "in_flight": in_flight,
+            "rate": self.rate,
+            "rate_factor": round(self._factor, 3),
+            "max_concurrency": self.max_concurrency,
+            "shared": self._path is not None,
+        }
+
+    def _check_wait(self, wait: float, started: float) -> None:
+        if wait > self._wait_budget(started):
+            self._reject(wait)
+
+    def _acquired(self, started: float) -> None:
+        waited = time.monotonic() - started
+        with self._lock:
+            self._stats["acquired"] += 1
+            self._in_flight += 1
+            if waited >= 0.001:
+                self._stats["delayed"] += 1
+                self._stats["wait_seconds_total"] += waited
+                self._stats["max_wait_seconds"] = max(self._stats["max_wait_seconds"], waited)
+
+    def _released(self) -> None:
+        with self._lock:
+            self._in_flight -= 1
+        if self._semaphore is not None:
+            self._semaphore.release()
+
+    def _try_take(self) -> float:
+        """Take a token if one is available; otherwise return seconds until one is."""
+        with self._state() as state:
+            now = time.time()
+            if now < state["blocked_until"]:
+                return state["blocked_until"] - now
+            if self.rate <= 0:
+                return 0.0
+            rate = self.rate * state["factor"]
+            tokens = min(self.burst, state["tokens"] + max(0.0, now - state["updated"]) * rate)
+            state["updated"] = now
+            self._factor = state["factor"]
+            if tokens >= 1:
+                state["tokens"] = tokens - 1
+                return 0.0
+            state["tokens"] = tokens
+            return (1 - tokens) / rate
+
+    def _wait_budget(self, started: float) -> float:
+        budget = self.max_wait - (time.monotonic() - started)
+        left = deadline.remaining()
+        if left is not None:
+            budget = min(budget, left)
+        return max(0.0, budget)
+
+    def _reject(self, wait: float) -> None:
+        with self._lock:
+            self._stats["rejected"] += 1
+        raise RateLimitExceeded(self.name, wait)
+
+    def _initial_state(self) -> Dict[str, float]:
+        return {"tokens": self.burst, "updated": time.time(), "factor": 1.0, "blocked_until": 0.0}
+
+    @contextmanager
+    def _state(self) -> Iterator[Dict[str, float]]:
+        """Yield the bucket state for update, locked across threads and processes."""
+        with self._lock:
+            if self._path is None:
+                yield self._memory
+                return
+            try:
+                handle = open(self._path, "a+", encoding="utf-8")
+            except OSError:
+                logger.warning("Cannot open rate limit state %s; limiting per process", self._path, exc_info=True)
+                self._path = None
+                yield self._memory
+                return
+            with handle:
+                fcntl.flock(handle, fcntl.LOCK_EX)
+                handle.seek(0)
+                try:
+                    state = {**self._initial_state(), **json.loads(handle.read() or "{}")}
+                except ValueError:
+                    state = self._initial_state()
+                yield state
+                handle.seek(0)
+                handle.truncate()
+                handle.write(json.dumps(state))
+                handle.flush()
+
+
+class RateLimiterRegistry:
+    """Process-wide ``UpstreamLimiter`` per upstream host.
+
+    ``HTTP_RATE_LIMITS`` configures hosts, e.g.
+    ``{"api.kinocheck.com": {"rate": 2, "burst": 4, "concurrency": 2}}``.
+    Unconfigured hosts are not rate limited but still pause on a 429's
+    ``Retry-After``. Bucket state is shared through files in
+    ``HTTP_RATE_LIMIT_STATE_DIR``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limiters: Dict[str, UpstreamLimiter] = {}
+
+    def get(self, base_url: Optional[str]) -> UpstreamLimiter:
+        from .resilience import upstream_name
+
+        name = upstream_name(base_url)
+        limiter = self._limiters.get(name)
+        if limiter is not None:
+            return limiter
+        with self._lock:
+            limiter = self._limiters.get(name)
+            if limiter is None:
+                limiter = self._build(name)
+                self._limiters[name] = limiter
+            return limiter
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            limiters = dict(self._limiters)
+        return {name: limiter.stats() for name, limiter in limiters.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._limiters = {}
+
+    @staticmethod
+    def _build(name: str) -> UpstreamLimiter:
+        config = (getattr(settings, "HTTP_RATE_LIMITS", {}) or {}).get(name)
+        max_wait = float(getattr(settings, "HTTP_RATE_LIMIT_MAX_WAIT", 10))
+        if not config:
+            return UpstreamLimiter(name, max_wait=max_wait)
+        state_dir = getattr(settings, "HTTP_RATE_LIMIT_STATE_DIR", None)
+        if state_dir is None:
+            state_dir = os.path.join(tempfile.gettempdir(), "filmosphere-rate-limits")
+        if state_dir:
+            os.makedirs(state_dir, exist_ok=True)
+        return UpstreamLimiter(
+            name,
+            rate=float(config.get("rate", 0)),
+            burst=config.get("burst"),
+            max_concurrency=config.get("concurrency"),
+            max_wait=float(config.get("max_wait", max_wait)),
+            state_dir=state_dir or None,
+        )
+
+
+rate_limiter_registry = RateLimiterRegistry()
@@ -0,0 +1,341 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import threading
+import time
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+from urllib.parse import urlsplit
+
+import httpx
+from django.conf import settings
+
+from core.utils import deadline
+
+from .rate_limit import RateLimitExceeded, retry_after_seconds
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+# Raised on our side before an upstream was even called; they say nothing
+# about its health.
+LOCAL_LIMIT_ERRORS = (deadline.DeadlineExceeded, RateLimitExceeded)
+
+
+class CircuitOpenError(httpx.HTTPError):
+    """Raised instead of calling an upstream whose circuit breaker is open.
+
+    It subclasses ``httpx.HTTPError`` so callers that already treat upstream
+    errors as "no data" handle a fast failure the same way.
+    """
+
+    def __init__(self, upstream: str, retry_in: float) -> None:
+        super().__init__(f"Circuit open for {upstream}; retry in {retry_in:.0f}s")
+        self.upstream = upstream
+        self.retry_in = retry_in
+
+
+def is_retryable(exc: BaseException) -> bool:
+    """Retry transport errors, 429 and 5xx; a 4xx answer will not change on retry."""
+    if isinstance(exc, (CircuitOpenError, *LOCAL_LIMIT_ERRORS)):
+        return False
+    if isinstance(exc, httpx.HTTPStatusError):
+        status = exc.response.status_code
+        return status == 429 or status >= 500
+    return isinstance(exc, httpx.HTTPError)
+
+
+def is_upstream_failure(exc: BaseException) -> bool:
+    """Failures that count against the breaker: the upstream, not the request, is at fault."""
+    return is_retryable(exc)
+
+
+class RetryBudget:
+    """Cap retries to a fraction of recent traffic.
+
+    Every request deposits ``ratio`` tokens (up to ``max_tokens``) and every
+    retry withdraws one, so when an upstream degrades retries add at most
+    ``ratio`` extra load instead of multiplying it by the attempt count.
+    """
+
+    def __init__(self, ratio: float, max_tokens: float) -> None:
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+        self.exhausted = 0
+
+    def deposit(self) -> None:
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def withdraw(self) -> bool:
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.exhausted += 1
+            return False
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            return self._tokens
+
+
+class CircuitBreaker:
+    """Closed / open / half-open breaker for one upstream.
+
+    ``failure_threshold`` consecutive upstream failures open the circuit and
+    calls fail fast for ``reset_timeout`` seconds. After that a single probe
+    is let through (half-open): success closes the circuit, failure opens it
+    again for another ``reset_timeout``.
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._lock = threading.Lock()
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probe_in_flight = False
+        self._stats = {"trips": 0, "rejected": 0, "successes": 0, "failures": 0}
+        self._last_trip: Optional[float] = None
+
+    def before_call(self) -> None:
+        """Raise ``CircuitOpenError`` unless a call may go through now."""
+        with self._lock:
+            if self._state == self.OPEN:
+                retry_in = self._opened_at + self.reset_timeout - time.monotonic()
+                if retry_in > 0:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpenError(self.name, retry_in)
+                self._state = self.HALF_OPEN
+                self._probe_in_flight = False
+            if self._state == self.HALF_OPEN:
+                if self._probe_in_flight:
+                    self._stats["rejected"] += 1
+                    raise CircuitOpenError(self.name, self.reset_timeout)
+                self._probe_in_flight = True
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._stats["successes"] += 1
+            if self._state != self.CLOSED:
+                logger.info("Circuit for %s closed after a successful probe", self.name)
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probe_in_flight = False
+
+    def release(self) -> None:
+        """End a call that said nothing about upstream health (e.g. our own deadline or rate limit)."""
+        with self._lock:
+            self._probe_in_flight = False
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._stats["failures"] += 1
+            self._failures += 1
+            if self._state == self.HALF_OPEN or self._failures >= self.failure_threshold:
+                if self._state != self.OPEN:
+                    self._stats["trips"] += 1
+                    self._last_trip = time.time()
+                    logger.warning("Circuit for %s opened after %s failures", self.name, self._failures)
+                self._state = self.OPEN
+                self._opened_at = time.monotonic()
+                self._probe_in_flight = False
+
+    @property
+    def state(self) -> str:
+        with self._lock:
+            if self._state == self.OPEN and time.monotonic() >= self._opened_at + self.reset_timeout:
+                return self.HALF_OPEN
+            return self._state
+
+    def stats(self) -> Dict[str, Any]:
+        state = self.state
+        with self._lock:
+            return {
+                **self._stats,
+                "state": state,
+                "consecutive_failures": self._failures,
+                "last_trip_at": self._last_trip,
+            }
+
+
+class ResiliencePolicy:
+    """Retry, retry budget and circuit breaker for calls to one upstream."""
+
+    def __init__(
+        self,
+        name: str,
+        max_attempts: int,
+        backoff_base: float,
+        backoff_max: float,
+        budget: RetryBudget,
+        breaker: CircuitBreaker,
+    ) -> None:
+        self.name = name
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.budget = budget
+        self.breaker = breaker
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def call(self, fn: Callable[[], T], retry: bool = True) -> T:
+        """Run ``fn`` through the breaker, retrying retryable failures within the budget.
+
+        Pass ``retry=False`` for non-idempotent calls; they still go through
+        the breaker. A retry is skipped when the request deadline (see
+        ``core.utils.deadline``) would expire during its backoff.
+        """
+        self.budget.deposit()
+        attempt = 1
+        while True:
+            self._before_attempt()
+            try:
+                result = fn()
+            except Exception as exc:
+                time.sleep(self._retry_delay(exc, attempt, retry))
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    async def acall(self, fn: Callable[[], Awaitable[T]], retry: bool = True) -> T:
+        """``call`` for coroutine functions; backs off without blocking the event loop."""
+        self.budget.deposit()
+        attempt = 1
+        while True:
+            self._before_attempt()
+            try:
+                result = await fn()
+            except Exception as exc:
+                await asyncio.sleep(self._retry_delay(exc, attempt, retry))
+                attempt += 1
+                continue
+            self.breaker.record_success()
+            return result
+
+    def _before_attempt(self) -> None:
+        left = deadline.remaining()
+        if left is not None and left <= 0:
+            raise deadline.DeadlineExceeded()
+        self.breaker.before_call()
+
+    def _retry_delay(self, exc: Exception, attempt: int, retry: bool) -> float:
+        """Record a failed attempt and return the backoff before the next one.
+
+        Re-raises ``exc`` (must be called from its ``except`` block) when it
+        should not be retried.
+        """
+        if isinstance(exc, LOCAL_LIMIT_ERRORS):
+            self.breaker.release()
+            raise
+        if is_upstream_failure(exc):
+            self.breaker.record_failure()
+        else:
+            self.breaker.record_success()
+        if not (retry and is_retryable(exc) and attempt < self.max_attempts and self.budget.withdraw()):
+            raise
+        with self._lock:
+            self._retries += 1
+        delay = self._backoff(attempt, exc)
+        left = deadline.remaining()
+        if left is not None and left <= delay:
+            raise
+        logger.info("Retrying %s in %.2fs after %s (attempt %s)", self.name, delay, exc, attempt)
+        return delay
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        """Exponential backoff with full jitter, honouring a short Retry-After."""
+        if isinstance(exc, httpx.HTTPStatusError):
+            retry_after = retry_after_seconds(exc.response)
+            if retry_after is not None:
+                return min(retry_after, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** (attempt - 1))))
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            retries = self._retries
+        return {
+            **self.breaker.stats(),
+            "retries": retries,
+            "retry_budget_tokens": round(self.budget.tokens, 2),
+            "retry_budget_exhausted": self.budget.exhausted,
+        }
+
+
+def upstream_name(base_url: Optional[str]) -> str:
+    """Policies are keyed by upstream host, so every client for one API shares them."""
+    return urlsplit(base_url or "").netloc or "default"
+
+
+class ResilienceRegistry:
+    """Process-wide ``ResiliencePolicy`` per upstream host.
+
+    Defaults come from ``HTTP_RETRIES``, ``HTTP_RETRY_*`` and
+    ``CIRCUIT_BREAKER_*``; ``HTTP_RESILIENCE_OVERRIDES`` can change any of
+    them per host, e.g. ``{"api.watchmode.com": {"failure_threshold": 3}}``.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._policies: Dict[str, ResiliencePolicy] = {}
+
+    def get(self, base_url: Optional[str]) -> ResiliencePolicy:
+        name = upstream_name(base_url)
+        policy = self._policies.get(name)
+        if policy is not None:
+            return policy
+        with self._lock:
+            policy = self._policies.get(name)
+            if policy is None:
+                policy = self._build(name)
+                self._policies[name] = policy
+            return policy
+
+    def stats(self) -> Dict[str, Dict[str, Any]]:
+        with self._lock:
+            policies = dict(self._policies)
+        return {name: policy.stats() for name, policy in policies.items()}
+
+    def reset(self) -> None:
+        with self._lock:
+            self._policies = {}
+
+    @staticmethod
+    def _build(name: str) -> ResiliencePolicy:
+        overrides = (getattr(settings, "HTTP_RESILIENCE_OVERRIDES", {}) or {}).get(name, {})
+
+        def option(key: str, setting: str, default: float) -> float:
+            return overrides.get(key, getattr(settings, setting, default))
+
+        return ResiliencePolicy(
+            name=name,
+            max_attempts=int(option("max_attempts", "HTTP_RETRIES", 3)),
+            backoff_base=float(option("backoff_base", "HTTP_RETRY_BACKOFF_BASE", 0.5)),
+            backoff_max=float(option("backoff_max", "HTTP_RETRY_BACKOFF_MAX", 4.0)),
+            budget=RetryBudget(
+                ratio=float(option("retry_budget_ratio", "HTTP_RETRY_BUDGET_RATIO", 0.2)),
+                max_tokens=float(option("retry_budget_max", "HTTP_RETRY_BUDGET_MAX", 10)),
+            ),
+            breaker=CircuitBreaker(
+                name,
+                failure_threshold=int(option("failure_threshold", "CIRCUIT_BREAKER_FAILURE_THRESHOLD", 5)),
+                reset_timeout=float(option("reset_timeout", "CIRCUIT_BREAKER_RESET_TIMEOUT", 30)),
+            ),
+        )
+
+
+resilience_registry = ResilienceRegistry()
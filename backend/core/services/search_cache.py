@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import hashlib
+import re
+import threading
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+
+from core.utils.text import fold, normalize_query
+
+from .tiered_cache import TieredCache
+
+TOKEN_PATTERN = re.compile(r"\w+")
+
+
+def title_matches(title: Optional[str], query: str) -> bool:
+    """True if every word of the normalised ``query`` starts a word of ``title``."""
+    title_tokens = TOKEN_PATTERN.findall(fold(title))
+    return all(
+        any(token.startswith(word) for token in title_tokens)
+        for word in TOKEN_PATTERN.findall(query)
+    )
+
+
+class SearchResultCache:
+    """Cache upstream title search results by normalised query, shared across workers.
+
+    Queries are keyed by ``normalize_query``, so "Inception", " inception "
+    and "INCEPTİON" share one entry. Entries live for ``SEARCH_CACHE_TTL``
+    seconds, with the ``SEARCH_CACHE_MAX_ENTRIES`` most recently used kept
+    in-process in front of the shared cache.
+
+    A result set shorter than one upstream page is complete: it holds every
+    title upstream matched. A longer query ("inception") is then answered by
+    filtering the complete set cached for one of its prefixes ("incep")
+    instead of asking upstream again. Only prefixes of at least
+    ``SEARCH_CACHE_MIN_PREFIX`` characters are reused.
+    """
+
+    def __init__(self, ttl: Optional[float] = None, max_entries: Optional[int] = None) -> None:
+        self._ttl = ttl
+        ttl = self.ttl
+        self._cache = TieredCache(
+            "search",
+            max_entries=max_entries or int(getattr(settings, "SEARCH_CACHE_MAX_ENTRIES", 2048)),
+            local_ttl=ttl,
+            shared_ttl=ttl,
+        )
+        self._lock = threading.Lock()
+        self._prefix_hits = 0
+
+    @property
+    def ttl(self) -> float:
+        if self._ttl is not None:
+            return self._ttl
+        return float(getattr(settings, "SEARCH_CACHE_TTL", 6 * 3600))
+
+    def get(self, query: str) -> Optional[List[Dict[str, Any]]]:
+        """Return the cached results for ``query``, or None if upstream has to be asked."""
+        key = normalize_query(query)
+        if not key or self.ttl <= 0:
+            return None
+        min_prefix = int(getattr(settings, "SEARCH_CACHE_MIN_PREFIX", 3))
+        prefixes = [key[:length] for length in range(len(key) - 1, min_prefix - 1, -1) if not key[:length].endswith(" ")]
+        found = self._cache.get_many([self._cache_key(query) for query in (key, *prefixes)])
+        if self._cache_key(key) in found:
+            return found[self._cache_key(key)]["results"]
+        for prefix in prefixes:
+            entry = found.get(self._cache_key(prefix))
+            if entry is not None and entry["complete"]:
+                results = [item for item in entry["results"] if title_matches(item.get("title"), key)]
+                self._cache.set(self._cache_key(key), {"results": results, "complete": True}, timeout=self.ttl)
+                with self._lock:
+                    self._prefix_hits += 1
+                return results
+        return None
+
+    def set(self, query: str, results: List[Dict[str, Any]], complete: bool) -> None:
+        """Cache ``results``; ``complete`` means upstream had no more matches than these."""
+        key = normalize_query(query)
+        if key and self.ttl > 0:
+            self._cache.set(self._cache_key(key), {"results": results, "complete": complete}, timeout=self.ttl)
+
+    @staticmethod
+    def _cache_key(normalized: str) -> str:
+        # Queries hold spaces and any Unicode; shared backends such as memcached accept neither.
+        return hashlib.sha1(normalized.encode("utf-8")).hexdigest()
+
+    def clear_local(self) -> None:
+        self._cache.clear_local()
+
+    def stats(self) -> Dict[str, Any]:
+        with self._lock:
+            prefix_hits = self._prefix_hits
+        return {**self._cache.stats(), "prefix_hits": prefix_hits}
+
+
+search_result_cache = SearchResultCache()
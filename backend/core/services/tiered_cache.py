@@ -0,0 +1,187 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.core.cache import caches
+
+logger = logging.getLogger(__name__)
+
+MISSING = object()
+
+
+class TieredCache:
+    """Read-through cache with a bounded in-process LRU in front of a Django cache.
+
+    Lookups try the local LRU first, then the shared backend named by
+    ``alias`` (see ``CACHES``), and report a miss only when both are empty;
+    values found in the shared tier are promoted into the local one.
+
+    Local entries live for at most ``local_ttl`` seconds. ``delete`` clears
+    both tiers in this process, but other processes only drop their local
+    copy when it expires, so ``local_ttl`` bounds cross-worker staleness.
+    Errors from the shared backend are logged and treated as misses.
+    """
+
+    def __init__(
+        self,
+        prefix: str,
+        alias: str = "default",
+        max_entries: Optional[int] = None,
+        local_ttl: Optional[float] = None,
+        shared_ttl: Optional[float] = None,
+    ) -> None:
+        self.prefix = prefix
+        self.alias = alias
+        self._max_entries = max_entries
+        self._local_ttl = local_ttl
+        self._shared_ttl = shared_ttl
+        self._lock = threading.Lock()
+        self._local: "OrderedDict[str, Tuple[float, Any]]" = OrderedDict()
+        self._pid = os.getpid()
+        self._stats = {"local_hits": 0, "shared_hits": 0, "misses": 0, "sets": 0, "invalidations": 0, "errors": 0}
+
+    @property
+    def max_entries(self) -> int:
+        return self._max_entries or int(getattr(settings, "LOCAL_CACHE_MAX_ENTRIES", 512))
+
+    @property
+    def local_ttl(self) -> float:
+        if self._local_ttl is not None:
+            return self._local_ttl
+        return float(getattr(settings, "LOCAL_CACHE_TTL", 30))
+
+    @property
+    def shared_ttl(self) -> float:
+        if self._shared_ttl is not None:
+            return self._shared_ttl
+        return float(getattr(settings, "SHARED_CACHE_TTL", 3600))
+
+    def get(self, key: str) -> Any:
+        """Return the cached value for ``key`` or ``MISSING``."""
+        now = time.monotonic()
+        with self._lock:
+            self._check_pid()
+            entry = self._local.get(key)
+            if entry is not None:
+                if entry[0] > now:
+                    self._local.move_to_end(key)
+                    self._stats["local_hits"] += 1
+                    return entry[1]
+                del self._local[key]
+
+        value = self._shared_get(key)
+        with self._lock:
+            if value is MISSING:
+                self._stats["misses"] += 1
+                return MISSING
+            self._stats["shared_hits"] += 1
+            self._store_local(key, value, now)
+        return value
+
+    def get_many(self, keys: List[str]) -> Dict[str, Any]:
+        """Return the cached values of ``keys`` (misses left out), asking the shared tier once."""
+        now = time.monotonic()
+        found: Dict[str, Any] = {}
+        with self._lock:
+            self._check_pid()
+            for key in keys:
+                entry = self._local.get(key)
+                if entry is not None:
+                    if entry[0] > now:
+                        self._local.move_to_end(key)
+                        self._stats["local_hits"] += 1
+                        found[key] = entry[1]
+                        continue
+                    del self._local[key]
+        remaining = [key for key in keys if key not in found]
+        if not remaining:
+            return found
+        try:
+            shared = caches[self.alias].get_many([self._shared_key(key) for key in remaining])
+        except Exception:  # noqa: BLE001
+            self._record_error("get_many", remaining[0])
+            shared = {}
+        with self._lock:
+            for key in remaining:
+                if self._shared_key(key) in shared:
+                    found[key] = shared[self._shared_key(key)]
+                    self._stats["shared_hits"] += 1
+                    self._store_local(key, found[key], now)
+                else:
+                    self._stats["misses"] += 1
+        return found
+
+    def set(self, key: str, value: Any, timeout: Optional[float] = None) -> None:
+        """Store ``value`` in both tiers; ``timeout`` caps the shared TTL in seconds."""
+        shared_ttl = self.shared_ttl if timeout is None else min(timeout, self.shared_ttl)
+        with self._lock:
+            self._check_pid()
+            self._stats["sets"] += 1
+            self._store_local(key, value, time.monotonic(), cap=shared_ttl)
+        try:
+            caches[self.alias].set(self._shared_key(key), value, max(1, int(shared_ttl)))
+        except Exception:  # noqa: BLE001
+            self._record_error("set", key)
+
+    def delete(self, key: str) -> None:
+        """Invalidate ``key`` in the local LRU and the shared backend."""
+        with self._lock:
+            self._local.pop(key, None)
+            self._stats["invalidations"] += 1
+        try:
+            caches[self.alias].delete(self._shared_key(key))
+        except Exception:  # noqa: BLE001
+            self._record_error("delete", key)
+
+    def clear_local(self) -> None:
+        """Drop every local entry (the shared tier is left untouched)."""
+        with self._lock:
+            self._local.clear()
+
+    def stats(self) -> Dict[str, Any]:
+        """Return a snapshot of the hit/miss counters, the hit ratio and the local size."""
+        with self._lock:
+            lookups = self._stats["local_hits"] + self._stats["shared_hits"] + self._stats["misses"]
+            hits = lookups - self._stats["misses"]
+            return {
+                **self._stats,
+                "hit_ratio": round(hits / lookups, 4) if lookups else None,
+                "local_entries": len(self._local),
+            }
+
+    def _shared_key(self, key: str) -> str:
+        return f"{self.prefix}:{key}"
+
+    def _shared_get(self, key: str) -> Any:
+        try:
+            return caches[self.alias].get(self._shared_key(key), MISSING)
+        except Exception:  # noqa: BLE001
+            self._record_error("get", key)
+            return MISSING
+
+    def _store_local(self, key: str, value: Any, now: float, cap: Optional[float] = None) -> None:
+        ttl = self.local_ttl if cap is None else min(cap, self.local_ttl)
+        if ttl <= 0:
+            return
+        self._local[key] = (now + ttl, value)
+        self._local.move_to_end(key)
+        while len(self._local) > self.max_entries:
+            self._local.popitem(last=False)
+
+    def _check_pid(self) -> None:
+        # Entries cached before a fork are fine to keep, but counters should
+        # describe this process only.
+        if self._pid != os.getpid():
+            self._pid = os.getpid()
+            self._stats = dict.fromkeys(self._stats, 0)
+
+    def _record_error(self, op: str, key: str) -> None:
+        with self._lock:
+            self._stats["errors"] += 1
+        logger.warning("Shared cache %s failed for %s", op, self._shared_key(key), exc_info=True)
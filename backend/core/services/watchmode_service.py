@@ -1,10 +1,19 @@
 from __future__ import annotations
 
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional
 
+from asgiref.sync import sync_to_async
 from django.conf import settings
 
-from .http_client import HttpClient
+from .http_client import AsyncHttpClient, HttpClient
+from .negative_cache import is_not_found, negative_cache
+
+
+def streaming_regions(regions: Optional[Iterable[str]] = None) -> List[str]:
+    """Regions to fetch sources for; ``STREAMING_REGIONS`` unless given."""
+    if regions is None:
+        regions = getattr(settings, "STREAMING_REGIONS", ["TR"])
+    return [region.strip().upper() for region in regions if region.strip()]
 
 
 class WatchmodeService:
@@ -14,19 +23,61 @@ class WatchmodeService:
         self.http_client = http_client or HttpClient(base_url=settings.WATCHMODE_BASE)
 
     def lookup_title_id(self, imdb_id: str) -> Optional[int]:
-        """Look up the Watchmode title id for a given IMDb id."""
+        """Look up the Watchmode title id for a given IMDb id.
+
+        Ids Watchmode does not know are remembered in the negative cache.
+        """
+        if negative_cache.is_missing("watchmode", imdb_id):
+            return None
         params = {"imdb_id": imdb_id, "apiKey": settings.WATCHMODE_API_KEY}
-        data = self.http_client.get("/search/", params=params)
+        try:
+            data = self.http_client.get("/search/", params=params)
+        except Exception as exc:
+            if is_not_found(exc):
+                negative_cache.mark_missing("watchmode", imdb_id)
+                return None
+            raise
         results = data.get("title_results") or []
         if not results:
+            negative_cache.mark_missing("watchmode", imdb_id)
             return None
         return results[0].get("id")
 
-    def get_streaming_sources(self, watchmode_id: int) -> List[Dict[str, Any]]:
-        """Retrieve streaming sources for the given Watchmode title id."""
-        params = {"apiKey": settings.WATCHMODE_API_KEY, "regions": "TR"}
+    def get_streaming_sources(self, watchmode_id: int, regions: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        """Retrieve streaming sources for the given Watchmode title id.
+
+        Every source carries its ``region``; one call covers all ``regions``.
+        """
+        params = {"apiKey": settings.WATCHMODE_API_KEY, "regions": ",".join(streaming_regions(regions))}
         data = self.http_client.get(f"/title/{watchmode_id}/sources/", params=params)
         return data or []
 
 
+class AsyncWatchmodeService:
+    """``WatchmodeService`` for async views, backed by ``AsyncHttpClient``."""
+
+    def __init__(self, http_client: Optional[AsyncHttpClient] = None) -> None:
+        self.http_client = http_client or AsyncHttpClient(base_url=settings.WATCHMODE_BASE)
+
+    async def lookup_title_id(self, imdb_id: str) -> Optional[int]:
+        """Async ``WatchmodeService.lookup_title_id``."""
+        if await sync_to_async(negative_cache.is_missing)("watchmode", imdb_id):
+            return None
+        params = {"imdb_id": imdb_id, "apiKey": settings.WATCHMODE_API_KEY}
+        try:
+            data = await self.http_client.get("/search/", params=params)
+        except Exception as exc:
+            if is_not_found(exc):
+                await sync_to_async(negative_cache.mark_missing)("watchmode", imdb_id)
+                return None
+            raise
+        results = data.get("title_results") or []
+        if not results:
+            await sync_to_async(negative_cache.mark_missing)("watchmode", imdb_id)
+            return None
+        return results[0].get("id")
 
+    async def get_streaming_sources(self, watchmode_id: int, regions: Optional[Iterable[str]] = None) -> List[Dict[str, Any]]:
+        params = {"apiKey": settings.WATCHMODE_API_KEY, "regions": ",".join(streaming_regions(regions))}
+        data = await self.http_client.get(f"/title/{watchmode_id}/sources/", params=params)
+        return data or []
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import asyncio
+from typing import List
+
+import httpx
+
+from core.services import AsyncHttpClient, HttpCache
+from core.services.resilience import CircuitBreaker, ResiliencePolicy, RetryBudget
+
+
+def make_client(tmp_path, handler) -> AsyncHttpClient:
+    return AsyncHttpClient(
+        base_url="https://api.example.com",
+        policy=ResiliencePolicy(
+            name="api.example.com",
+            max_attempts=3,
+            backoff_base=0,
+            backoff_max=0,
+            budget=RetryBudget(ratio=0.2, max_tokens=10),
+            breaker=CircuitBreaker("api.example.com", failure_threshold=5, reset_timeout=60),
+        ),
+        cache=HttpCache(directory=str(tmp_path)),
+        client=httpx.AsyncClient(base_url="https://api.example.com", transport=httpx.MockTransport(handler)),
+    )
+
+
+def test_async_get_retries_and_caches_like_the_sync_client(tmp_path) -> None:
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        if len(calls) == 1:
+            return httpx.Response(503)
+        return httpx.Response(200, json={"id": 1}, headers={"Cache-Control": "max-age=60"})
+
+    client = make_client(tmp_path, handler)
+
+    async def fetch_twice():
+        return await client.get("/titles/tt1"), await client.get("/titles/tt1")
+
+    assert asyncio.run(fetch_twice()) == ({"id": 1}, {"id": 1})
+    assert calls == ["/titles/tt1", "/titles/tt1"]
+    assert client.policy.stats()["retries"] == 1
+
+
+def test_async_requests_run_concurrently(tmp_path) -> None:
+    in_flight = 0
+    peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.05)
+        in_flight -= 1
+        return httpx.Response(200, json={"path": request.url.path})
+
+    client = make_client(tmp_path, handler)
+
+    async def fetch_all():
+        return await asyncio.gather(*(client.get(f"/titles/tt{index}") for index in range(5)))
+
+    results = asyncio.run(fetch_all())
+    assert [result["path"] for result in results] == [f"/titles/tt{index}" for index in range(5)]
+    assert peak == 5
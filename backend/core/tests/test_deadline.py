@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import time
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import List
+
+import httpx
+import pytest
+
+from core.middleware import RequestDeadlineMiddleware
+from core.services.resilience import CircuitBreaker, ResiliencePolicy, RetryBudget
+from core.utils.deadline import (
+    DeadlineExceeded,
+    bounded_timeout,
+    propagate,
+    remaining,
+    request_deadline,
+)
+
+
+def make_policy(backoff: float = 0) -> ResiliencePolicy:
+    return ResiliencePolicy(
+        name="api.example.com",
+        max_attempts=3,
+        backoff_base=backoff,
+        backoff_max=backoff,
+        budget=RetryBudget(ratio=0.2, max_tokens=10),
+        breaker=CircuitBreaker("api.example.com", failure_threshold=1, reset_timeout=60),
+    )
+
+
+def test_bounded_timeout_shrinks_to_remaining_budget() -> None:
+    assert bounded_timeout(10.0) == 10.0
+    with request_deadline(2):
+        assert bounded_timeout(10.0) <= 2
+        assert bounded_timeout(1.0) == 1.0
+        with request_deadline(60):
+            # Nested deadlines never extend the outer one.
+            assert remaining() <= 2
+    assert remaining() is None
+
+
+def test_spent_deadline_fails_fast_without_touching_the_breaker() -> None:
+    policy = make_policy()
+    calls: List[int] = []
+    with request_deadline(0):
+        with pytest.raises(DeadlineExceeded):
+            policy.call(lambda: calls.append(1))
+    assert calls == []
+    assert policy.breaker.state == CircuitBreaker.CLOSED
+
+
+def test_retry_skipped_when_backoff_would_outlast_deadline() -> None:
+    policy = make_policy(backoff=5)
+    calls: List[int] = []
+
+    def fn():
+        calls.append(1)
+        request = httpx.Request("GET", "https://api.example.com/x")
+        response = httpx.Response(503, headers={"Retry-After": "5"}, request=request)
+        raise httpx.HTTPStatusError("unavailable", request=request, response=response)
+
+    started = time.monotonic()
+    with request_deadline(1), pytest.raises(httpx.HTTPStatusError):
+        policy.call(fn)
+    assert calls == [1]
+    assert time.monotonic() - started < 1
+
+
+def test_propagate_carries_deadline_into_executor_threads() -> None:
+    with request_deadline(5), ThreadPoolExecutor(max_workers=1) as executor:
+        assert executor.submit(remaining).result() is None
+        left = executor.submit(propagate(remaining)).result()
+    assert left is not None and 0 < left <= 5
+
+
+def test_middleware_uses_view_request_deadline(settings) -> None:
+    settings.REQUEST_DEADLINE_SECONDS = 25
+    seen = {}
+
+    class SlowView:
+        request_deadline = 90
+
+    def view(request):
+        seen["left"] = remaining()
+
+    view.cls = SlowView
+    request = SimpleNamespace()
+
+    def get_response(req):
+        middleware.process_view(req, view, (), {})
+        view(req)
+        return "response"
+
+    middleware = RequestDeadlineMiddleware(get_response)
+    assert middleware(request) == "response"
+    assert 25 < seen["left"] <= 90
+    assert remaining() is None
@@ -0,0 +1,72 @@
+from __future__ import annotations
+
+import os
+from typing import List
+
+import httpx
+
+from core.services import HttpCache, HttpClient
+
+
+def make_client(tmp_path, handler, max_bytes: int = 1024 * 1024) -> HttpClient:
+    client = HttpClient(
+        base_url="https://api.example.com",
+        shared=False,
+        cache=HttpCache(directory=str(tmp_path), max_bytes=max_bytes),
+    )
+    client._client = httpx.Client(base_url="https://api.example.com", transport=httpx.MockTransport(handler))
+    return client
+
+
+def test_fresh_response_is_served_without_a_request(tmp_path) -> None:
+    calls: List[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(200, json={"id": 1}, headers={"Cache-Control": "max-age=60"})
+
+    client = make_client(tmp_path, handler)
+    assert client.get("/titles/tt1") == {"id": 1}
+    assert client.get("/titles/tt1") == {"id": 1}
+    assert calls == ["/titles/tt1"]
+    assert client.cache.stats()["hits"] == 1
+
+
+def test_stale_response_is_revalidated_with_etag(tmp_path) -> None:
+    seen_headers: List[httpx.Headers] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen_headers.append(request.headers)
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        return httpx.Response(200, json={"credits": ["a"]}, headers={"ETag": '"v1"', "Cache-Control": "no-cache"})
+
+    client = make_client(tmp_path, handler)
+    assert client.get("/titles/tt1/credits") == {"credits": ["a"]}
+    assert client.get("/titles/tt1/credits") == {"credits": ["a"]}
+    assert seen_headers[1]["If-None-Match"] == '"v1"'
+    assert client.cache.stats()["revalidated"] == 1
+
+
+def test_no_store_and_uncacheable_responses_are_not_stored(tmp_path) -> None:
+    def handler(request: httpx.Request) -> httpx.Response:
+        if request.url.path == "/private":
+            return httpx.Response(200, json={}, headers={"Cache-Control": "no-store", "ETag": '"x"'})
+        return httpx.Response(200, json={})
+
+    client = make_client(tmp_path, handler)
+    client.get("/private")
+    client.get("/plain")
+    assert os.listdir(tmp_path) == []
+
+
+def test_cache_evicts_least_recently_used_entries(tmp_path) -> None:
+    cache = HttpCache(directory=str(tmp_path), max_bytes=600)
+    response = httpx.Response(200, headers={"Cache-Control": "max-age=60"})
+    for index in range(10):
+        cache.store(cache.key(f"/titles/tt{index}"), response, {"id": index, "blob": os.urandom(40).hex()})
+
+    assert cache.stats()["evictions"] > 0
+    assert sum(os.path.getsize(tmp_path / name) for name in os.listdir(tmp_path)) <= 600
+    assert cache.lookup(cache.key("/titles/tt9")) is not None
+    assert cache.lookup(cache.key("/titles/tt0")) is None
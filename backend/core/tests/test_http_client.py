@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import os
+
+import httpx
+import pytest
+
+from core.services import HttpClient, HttpClientRegistry
+import core.services.client_registry as client_registry_module
+
+
+def test_registry_reuses_client_per_base_url() -> None:
+    registry = HttpClientRegistry()
+
+    first = registry.get("https://api.example.com")
+    second = registry.get("https://api.example.com")
+    other = registry.get("https://other.example.com")
+
+    assert first is second
+    assert first is not other
+    registry.close_all()
+    assert first.is_closed
+
+
+def test_registry_rebuilds_clients_after_fork(monkeypatch) -> None:
+    registry = HttpClientRegistry()
+    parent_client = registry.get("https://api.example.com")
+
+    monkeypatch.setattr(os, "getpid", lambda: registry._pid + 1)
+    child_client = registry.get("https://api.example.com")
+
+    assert child_client is not parent_client
+    # The inherited client must stay open: its sockets belong to the parent.
+    assert not parent_client.is_closed
+    registry.close_all()
+    parent_client.close()
+
+
+def test_registry_falls_back_to_http1_without_h2(settings, monkeypatch) -> None:
+    settings.HTTP_HTTP2 = True
+    monkeypatch.setattr(client_registry_module.importlib.util, "find_spec", lambda name: None)
+
+    assert client_registry_module._http2_enabled() is False
+
+
+def test_http_clients_share_pool_and_close_is_noop() -> None:
+    first = HttpClient(base_url="https://api.example.com")
+    second = HttpClient(base_url="https://api.example.com", timeout=3)
+
+    assert first._client is second._client
+    first.close()
+    assert not second._client.is_closed
+
+
+def test_private_http_client_is_closed() -> None:
+    client = HttpClient(base_url="https://api.example.com", shared=False)
+    client.close()
+    assert client._client.is_closed
+
+
+def test_http_client_does_not_retry_client_errors() -> None:
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request.url.path)
+        return httpx.Response(404, json={"error": "not found"})
+
+    client = HttpClient(base_url="https://api.example.com", shared=False)
+    client._client = httpx.Client(base_url="https://api.example.com", transport=httpx.MockTransport(handler))
+
+    with pytest.raises(httpx.HTTPStatusError):
+        client.get("/titles/tt0")
+
+    assert calls == ["/titles/tt0"]
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import time
+from typing import List
+
+import httpx
+import pytest
+
+from core.services.rate_limit import RateLimitExceeded, UpstreamLimiter, retry_after_seconds
+from core.services.resilience import CircuitBreaker, ResiliencePolicy, RetryBudget
+
+
+def test_bucket_delays_calls_past_the_burst() -> None:
+    limiter = UpstreamLimiter("api.example.com", rate=20, burst=1)
+    started = time.monotonic()
+    for _ in range(3):
+        with limiter.slot():
+            pass
+    assert time.monotonic() - started >= 0.08
+    stats = limiter.stats()
+    assert stats["acquired"] == 3
+    assert stats["delayed"] == 2
+    assert stats["wait_seconds_total"] > 0
+
+
+def test_rejects_instead_of_waiting_past_max_wait() -> None:
+    limiter = UpstreamLimiter("api.example.com", rate=1, burst=1, max_wait=0.05)
+    with limiter.slot():
+        pass
+    with pytest.raises(RateLimitExceeded):
+        with limiter.slot():
+            pass
+    assert limiter.stats()["rejected"] == 1
+
+
+def test_bucket_is_shared_through_the_state_dir(tmp_path) -> None:
+    worker_a = UpstreamLimiter("api.example.com", rate=0.5, burst=1, max_wait=0, state_dir=str(tmp_path))
+    worker_b = UpstreamLimiter("api.example.com", rate=0.5, burst=1, max_wait=0, state_dir=str(tmp_path))
+    with worker_a.slot():
+        pass
+    with pytest.raises(RateLimitExceeded):
+        with worker_b.slot():
+            pass
+
+
+def test_429_pauses_upstream_and_halves_rate(tmp_path) -> None:
+    limiter = UpstreamLimiter("api.example.com", rate=10, burst=10, max_wait=0.1, state_dir=str(tmp_path))
+    limiter.observe(httpx.Response(429, headers={"Retry-After": "5"}))
+    with pytest.raises(RateLimitExceeded):
+        with limiter.slot():
+            pass
+    stats = limiter.stats()
+    assert stats["throttled_responses"] == 1
+    assert stats["rate_factor"] == 0.5
+
+
+def test_retry_after_accepts_http_dates() -> None:
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "7"})) == 7
+    assert retry_after_seconds(httpx.Response(429, headers={"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"})) == 0
+    assert retry_after_seconds(httpx.Response(429)) is None
+
+
+def test_rate_limit_rejection_is_not_retried_or_counted_by_breaker() -> None:
+    breaker = CircuitBreaker("api.example.com", failure_threshold=1, reset_timeout=60)
+    policy = ResiliencePolicy(
+        name="api.example.com",
+        max_attempts=3,
+        backoff_base=0,
+        backoff_max=0,
+        budget=RetryBudget(ratio=0.2, max_tokens=10),
+        breaker=breaker,
+    )
+    calls: List[int] = []
+
+    def fn():
+        calls.append(1)
+        raise RateLimitExceeded("api.example.com", 5)
+
+    with pytest.raises(RateLimitExceeded):
+        policy.call(fn)
+    assert calls == [1]
+    assert breaker.state == CircuitBreaker.CLOSED
+    assert breaker.stats()["successes"] == 0
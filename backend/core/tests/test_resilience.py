@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+from typing import List
+
+import httpx
+import pytest
+
+from core.services.resilience import CircuitBreaker, CircuitOpenError, ResiliencePolicy, RetryBudget
+
+
+def status_error(status: int) -> httpx.HTTPStatusError:
+    request = httpx.Request("GET", "https://api.example.com/x")
+    return httpx.HTTPStatusError("error", request=request, response=httpx.Response(status, request=request))
+
+
+def make_policy(max_attempts: int = 3, threshold: int = 3, budget: float = 10) -> ResiliencePolicy:
+    return ResiliencePolicy(
+        name="api.example.com",
+        max_attempts=max_attempts,
+        backoff_base=0,
+        backoff_max=0,
+        budget=RetryBudget(ratio=0.2, max_tokens=budget),
+        breaker=CircuitBreaker("api.example.com", failure_threshold=threshold, reset_timeout=60),
+    )
+
+
+def failing(errors: List[BaseException], calls: List[int]):
+    def fn():
+        calls.append(1)
+        if errors:
+            raise errors.pop(0)
+        return "ok"
+
+    return fn
+
+
+def test_policy_retries_server_errors_but_not_client_errors() -> None:
+    policy = make_policy()
+    calls: List[int] = []
+    assert policy.call(failing([status_error(503), httpx.ConnectError("down")], calls)) == "ok"
+    assert len(calls) == 3
+
+    calls = []
+    with pytest.raises(httpx.HTTPStatusError):
+        policy.call(failing([status_error(404)], calls))
+    assert len(calls) == 1
+    assert policy.breaker.stats()["consecutive_failures"] == 0
+
+
+def test_retry_budget_caps_retries() -> None:
+    policy = make_policy(max_attempts=5, threshold=100, budget=1)
+    calls: List[int] = []
+
+    with pytest.raises(httpx.HTTPStatusError):
+        policy.call(failing([status_error(500)] * 5, calls))
+
+    # One token in the budget: the first attempt plus a single retry.
+    assert len(calls) == 2
+    assert policy.stats()["retry_budget_exhausted"] == 1
+
+
+def test_breaker_opens_fails_fast_and_half_open_probe_closes(monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("core.services.resilience.time.monotonic", lambda: now[0])
+    policy = make_policy(max_attempts=1, threshold=2)
+    calls: List[int] = []
+
+    for _ in range(2):
+        with pytest.raises(httpx.HTTPStatusError):
+            policy.call(failing([status_error(502)], calls))
+    assert policy.breaker.state == CircuitBreaker.OPEN
+
+    with pytest.raises(CircuitOpenError):
+        policy.call(failing([], calls))
+    assert len(calls) == 2
+
+    now[0] += 61
+    assert policy.breaker.state == CircuitBreaker.HALF_OPEN
+    assert policy.call(failing([], calls)) == "ok"
+
+    stats = policy.stats()
+    assert (stats["state"], stats["trips"], stats["rejected"]) == ("closed", 1, 1)
+
+
+def test_failed_half_open_probe_reopens_breaker(monkeypatch) -> None:
+    now = [1000.0]
+    monkeypatch.setattr("core.services.resilience.time.monotonic", lambda: now[0])
+    breaker = CircuitBreaker("api.example.com", failure_threshold=1, reset_timeout=10)
+    breaker.record_failure()
+    now[0] += 11
+
+    breaker.before_call()
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()  # only one probe at a time
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert breaker.stats()["trips"] == 2
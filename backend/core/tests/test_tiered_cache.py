@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import pytest
+from django.core.cache import caches
+
+from core.services import TieredCache
+from core.services.tiered_cache import MISSING
+
+
+@pytest.fixture
+def locmem(settings):
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache", "LOCATION": "tiered-test"}}
+    caches["default"].clear()
+    yield caches["default"]
+    caches["default"].clear()
+
+
+def test_tiered_cache_reads_through_local_then_shared(locmem) -> None:
+    cache = TieredCache("t", local_ttl=60)
+
+    assert cache.get("a") is MISSING
+    cache.set("a", {"v": 1})
+    assert cache.get("a") == {"v": 1}
+
+    other_process = TieredCache("t", local_ttl=60)
+    assert other_process.get("a") == {"v": 1}
+    assert other_process.get("a") == {"v": 1}
+
+    assert cache.stats()["local_hits"] == 1
+    assert cache.stats()["misses"] == 1
+    stats = other_process.stats()
+    assert (stats["shared_hits"], stats["local_hits"], stats["hit_ratio"]) == (1, 1, 1.0)
+
+
+def test_tiered_cache_delete_invalidates_both_tiers(locmem) -> None:
+    cache = TieredCache("t", local_ttl=60)
+    cache.set("a", 1)
+
+    cache.delete("a")
+
+    assert cache.get("a") is MISSING
+    assert locmem.get("t:a") is None
+
+
+def test_tiered_cache_local_tier_is_bounded_lru(locmem) -> None:
+    cache = TieredCache("t", max_entries=2, local_ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.stats()["local_entries"] == 2
+    locmem.clear()
+    assert cache.get("a") == 1
+    assert cache.get("b") is MISSING
+
+
+def test_tiered_cache_treats_backend_errors_as_misses(settings) -> None:
+    settings.CACHES = {"default": {"BACKEND": "django.core.cache.backends.db.DatabaseCache", "LOCATION": "missing_table"}}
+    cache = TieredCache("t", local_ttl=0)
+
+    cache.set("a", 1)
+
+    assert cache.get("a") is MISSING
+    assert cache.stats()["errors"] == 2
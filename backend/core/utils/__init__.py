@@ -1,3 +1,3 @@
-"""Utility helpers for logging and decorators."""
+"""Utility helpers for logging, decorators, compression and request deadlines."""
 
 
@@ -0,0 +1,21 @@
+from __future__ import annotations
+
+import json
+import zlib
+from typing import Any, Optional
+
+# zlib ships with Python; level 6 is a good size/CPU trade-off for JSON.
+COMPRESSION_LEVEL = 6
+
+
+def compress_json(value: Any) -> bytes:
+    """Serialize ``value`` as compact JSON and zlib-compress it."""
+    raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return zlib.compress(raw, COMPRESSION_LEVEL)
+
+
+def decompress_json(blob: Optional[bytes]) -> Any:
+    """Inverse of ``compress_json``; returns None for an empty blob."""
+    if not blob:
+        return None
+    return json.loads(zlib.decompress(bytes(blob)).decode("utf-8"))
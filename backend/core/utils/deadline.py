@@ -0,0 +1,85 @@
+from __future__ import annotations
+
+import contextvars
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator, Optional, TypeVar
+
+import httpx
+
+T = TypeVar("T")
+
+# Monotonic timestamp by which the current request must finish, if any.
+_deadline: contextvars.ContextVar[Optional[float]] = contextvars.ContextVar("request_deadline", default=None)
+
+
+class DeadlineExceeded(httpx.HTTPError):
+    """Raised instead of starting an upstream call once the request budget is spent.
+
+    It subclasses ``httpx.HTTPError`` so code that already degrades on
+    upstream errors does the same here; it is never retried and does not
+    count against an upstream's circuit breaker.
+    """
+
+    def __init__(self, message: str = "Request deadline exceeded") -> None:
+        super().__init__(message)
+
+
+def start_deadline(seconds: Optional[float]) -> Optional[contextvars.Token]:
+    """Start a deadline ``seconds`` from now; pass the result to ``end_deadline``.
+
+    Nested deadlines can only shrink the budget, never extend it. Returns
+    None (nothing to undo) when ``seconds`` is None.
+    """
+    if seconds is None:
+        return None
+    deadline = time.monotonic() + seconds
+    current = _deadline.get()
+    return _deadline.set(deadline if current is None else min(current, deadline))
+
+
+def end_deadline(token: Optional[contextvars.Token]) -> None:
+    if token is None:
+        return
+    try:
+        _deadline.reset(token)
+    except ValueError:
+        # Token from another context (e.g. a sync view run in a worker thread).
+        _deadline.set(None)
+
+
+@contextmanager
+def request_deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Bound everything run inside the block to ``seconds`` (None = no deadline)."""
+    token = start_deadline(seconds)
+    try:
+        yield
+    finally:
+        end_deadline(token)
+
+
+def remaining() -> Optional[float]:
+    """Seconds left in the current deadline, or None if there is none."""
+    deadline = _deadline.get()
+    if deadline is None:
+        return None
+    return deadline - time.monotonic()
+
+
+def bounded_timeout(timeout: float) -> float:
+    """Shrink ``timeout`` to the remaining budget; raise if nothing is left."""
+    left = remaining()
+    if left is None:
+        return timeout
+    if left <= 0:
+        raise DeadlineExceeded()
+    return min(timeout, left)
+
+
+def propagate(fn: Callable[[], T]) -> Callable[[], T]:
+    """Wrap ``fn`` so it runs with the caller's deadline in another thread.
+
+    Executor threads do not inherit context variables on their own.
+    """
+    context = contextvars.copy_context()
+    return lambda: context.run(fn)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import unicodedata
+from typing import Optional
+
+# Letters NFKD does not decompose into a base letter plus combining marks.
+_FOLD_TABLE = str.maketrans({"ı": "i", "ø": "o", "đ": "d", "ł": "l", "æ": "ae", "œ": "oe", "þ": "th"})
+
+
+def fold(text: Optional[str]) -> str:
+    """Lower-case ``text`` and strip its diacritics, so "Amélie" and "AMELIE" match."""
+    text = unicodedata.normalize("NFKD", (text or "").casefold().translate(_FOLD_TABLE))
+    return "".join(ch for ch in text if not unicodedata.combining(ch))
+
+
+def normalize_query(query: Optional[str]) -> str:
+    """``fold`` a search query and collapse its whitespace: "  Amélie " -> "amelie"."""
+    return " ".join(fold(query).split())
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+from typing import Any
+
+from asgiref.sync import sync_to_async
+from rest_framework.request import Request
+from rest_framework.response import Response
+from rest_framework.views import APIView
+
+
+class AsyncAPIView(APIView):
+    """``APIView`` whose handlers are coroutines.
+
+    DRF only dispatches sync handlers. This view awaits them instead, so
+    under ASGI a request waiting on upstream HTTP holds no thread. The
+    sync parts of DRF's request cycle (authentication, permissions,
+    throttling, which may hit the database) run via ``sync_to_async``;
+    handlers must do the same for ORM access.
+    """
+
+    async def dispatch(self, request, *args: Any, **kwargs: Any):
+        self.args = args
+        self.kwargs = kwargs
+        request = self.initialize_request(request, *args, **kwargs)
+        self.request = request
+        self.headers = self.default_response_headers
+
+        try:
+            await sync_to_async(self.initial)(request, *args, **kwargs)
+            if request.method.lower() in self.http_method_names:
+                handler = getattr(self, request.method.lower(), self.http_method_not_allowed)
+            else:
+                handler = self.http_method_not_allowed
+            # http_method_not_allowed is sync but raises before returning.
+            response = await handler(request, *args, **kwargs)
+        except Exception as exc:
+            response = self.handle_exception(exc)
+
+        self.response = self.finalize_response(request, response, *args, **kwargs)
+        return self.response
+
+    async def options(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        return await sync_to_async(super().options)(request, *args, **kwargs)
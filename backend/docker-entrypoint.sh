@@ -12,6 +12,8 @@ echo "PostgreSQL started"
 echo "Running migrations..."
 python manage.py makemigrations --noinput
 python manage.py migrate --noinput
+python manage.py createcachetable
+python manage.py rebuild_search_index --missing
 
 echo "Collecting static files..."
 python manage.py collectstatic --noinput --clear
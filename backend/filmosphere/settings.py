@@ -61,6 +61,7 @@ MIDDLEWARE = [
     "allauth.account.middleware.AccountMiddleware",
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
+    "core.middleware.RequestDeadlineMiddleware",
 ]
 
 ROOT_URLCONF = "filmosphere.urls"
@@ -168,9 +169,120 @@ DEEPSEEK_BASE = env("DEEPSEEK_BASE", default="https://api.deepseek.com/v1")
 DEEPSEEK_MODEL = env("DEEPSEEK_MODEL", default="deepseek-chat")
 
 CACHE_TTL_HOURS = env.int("CACHE_TTL_HOURS", default=24)
+# Serve stale films (up to CACHE_MAX_STALE_HOURS past expiry) while refreshing them in the background
+CACHE_STALE_WHILE_REVALIDATE = env.bool("CACHE_STALE_WHILE_REVALIDATE", default=True)
+CACHE_MAX_STALE_HOURS = env.int("CACHE_MAX_STALE_HOURS", default=24 * 7)
+FILM_REFRESH_WORKERS = env.int("FILM_REFRESH_WORKERS", default=2)
+# Per-section cache TTLs override FilmCacheService defaults, e.g. {"streaming": 6}
+FILM_SECTION_TTL_HOURS: dict[str, float] = {}
+# A failed section is retried after FILM_SECTION_RETRY_MINUTES, doubling per consecutive failure up to its TTL
+FILM_SECTION_RETRY_MINUTES = env.int("FILM_SECTION_RETRY_MINUTES", default=15)
+# Stored extended IMDb sections (/api/films/<id>/credits etc.): per-section TTL
+# overrides of IMDB_SECTIONS, e.g. {"episodes": 12}, the upstream pages walked
+# per section and the default page size served to clients.
+EXTENDED_SECTION_TTL_HOURS: dict[str, float] = {}
+EXTENDED_SECTION_MAX_PAGES = env.int("EXTENDED_SECTION_MAX_PAGES", default=20)
+EXTENDED_SECTION_PAGE_SIZE = env.int("EXTENDED_SECTION_PAGE_SIZE", default=50)
+# Ids an upstream reported as missing are not looked up again for this long (seconds)
+NEGATIVE_CACHE_TTL = env.int("NEGATIVE_CACHE_TTL", default=600)
+
+# Shared cache behind the in-process LRU (DB table by default; e.g. redis://... in CACHE_URL).
+# The table is created with `python manage.py createcachetable`.
+CACHES = {"default": env.cache("CACHE_URL", default="dbcache://django_cache")}
+LOCAL_CACHE_MAX_ENTRIES = env.int("LOCAL_CACHE_MAX_ENTRIES", default=512)
+LOCAL_CACHE_TTL = env.float("LOCAL_CACHE_TTL", default=30.0)
+SHARED_CACHE_TTL = env.int("SHARED_CACHE_TTL", default=3600)
 HTTP_TIMEOUT = env.int("HTTP_TIMEOUT", default=10)
 HTTP_RETRIES = env.int("HTTP_RETRIES", default=3)
 
+# Per-upstream resilience: retries (5xx/429/connection errors only) capped by a
+# retry budget, and a circuit breaker that fails fast while an upstream is down.
+# HTTP_RESILIENCE_OVERRIDES tunes single hosts, e.g. {"api.watchmode.com": {"failure_threshold": 3}}
+HTTP_RETRY_BACKOFF_BASE = env.float("HTTP_RETRY_BACKOFF_BASE", default=0.5)
+HTTP_RETRY_BACKOFF_MAX = env.float("HTTP_RETRY_BACKOFF_MAX", default=4.0)
+HTTP_RETRY_BUDGET_RATIO = env.float("HTTP_RETRY_BUDGET_RATIO", default=0.2)
+HTTP_RETRY_BUDGET_MAX = env.int("HTTP_RETRY_BUDGET_MAX", default=10)
+CIRCUIT_BREAKER_FAILURE_THRESHOLD = env.int("CIRCUIT_BREAKER_FAILURE_THRESHOLD", default=5)
+CIRCUIT_BREAKER_RESET_TIMEOUT = env.float("CIRCUIT_BREAKER_RESET_TIMEOUT", default=30.0)
+HTTP_RESILIENCE_OVERRIDES: dict[str, dict[str, float]] = {}
+
+# Client-side rate limits per upstream host, shared by the workers on one host
+# through files in HTTP_RATE_LIMIT_STATE_DIR (default: a temp dir; "" keeps
+# them per process). "concurrency" caps in-flight calls per process. A 429
+# pauses the host for its Retry-After and halves its rate until calls succeed.
+HTTP_RATE_LIMITS: dict[str, dict[str, float]] = {
+    "api.imdbapi.dev": {"rate": 10, "burst": 20, "concurrency": 8},
+    "api.kinocheck.com": {"rate": 2, "burst": 4, "concurrency": 2},
+    "api.watchmode.com": {"rate": 2, "burst": 4, "concurrency": 2},
+    "api.deepseek.com": {"rate": 1, "burst": 3, "concurrency": 4},
+}
+HTTP_RATE_LIMIT_STATE_DIR = env("HTTP_RATE_LIMIT_STATE_DIR", default=None)
+HTTP_RATE_LIMIT_MAX_WAIT = env.float("HTTP_RATE_LIMIT_MAX_WAIT", default=10.0)
+
+# On-disk cache of upstream GETs honouring Cache-Control/ETag/Last-Modified;
+# shared by the workers on a host (default directory: under the temp dir).
+HTTP_CACHE_ENABLED = env.bool("HTTP_CACHE_ENABLED", default=True)
+HTTP_CACHE_DIR = env("HTTP_CACHE_DIR", default=None)
+HTTP_CACHE_MAX_BYTES = env.int("HTTP_CACHE_MAX_BYTES", default=256 * 1024 * 1024)
+
+# Pooled upstream HTTP clients (one keep-alive pool per base URL and process)
+HTTP_POOL_MAX_CONNECTIONS = env.int("HTTP_POOL_MAX_CONNECTIONS", default=100)
+HTTP_POOL_MAX_KEEPALIVE = env.int("HTTP_POOL_MAX_KEEPALIVE", default=20)
+HTTP_POOL_KEEPALIVE_EXPIRY = env.float("HTTP_POOL_KEEPALIVE_EXPIRY", default=30.0)
+HTTP_HTTP2 = env.bool("HTTP_HTTP2", default=True)
+
+# Film aggregation: fan out upstream sections in parallel under one deadline (seconds)
+FILM_AGGREGATOR_CONCURRENT = env.bool("FILM_AGGREGATOR_CONCURRENT", default=True)
+FILM_AGGREGATOR_DEADLINE = env.float("FILM_AGGREGATOR_DEADLINE", default=15.0)
+# Parallel metadata-only fetches when trailer feeds resolve uncached posters
+FILM_POSTER_MAX_WORKERS = env.int("FILM_POSTER_MAX_WORKERS", default=8)
+# Watchmode regions fetched with each film's streaming section and kept in
+# the streaming availability index; more can be indexed with
+# `manage.py refresh_streaming_index --region US`.
+STREAMING_REGIONS = env.list("STREAMING_REGIONS", default=["TR"])
+# Film search answers from the local index over cached films and asks IMDb
+# only when fewer than SEARCH_LOCAL_MIN_RESULTS match (or for ?more=1).
+SEARCH_RESULTS_LIMIT = env.int("SEARCH_RESULTS_LIMIT", default=10)
+SEARCH_LOCAL_MIN_RESULTS = env.int("SEARCH_LOCAL_MIN_RESULTS", default=5)
+# IMDb search answers are cached by normalised query for SEARCH_CACHE_TTL seconds
+# (the most recent SEARCH_CACHE_MAX_ENTRIES also in-process); a complete answer
+# for a prefix of at least SEARCH_CACHE_MIN_PREFIX characters also answers longer queries.
+SEARCH_CACHE_TTL = env.float("SEARCH_CACHE_TTL", default=6 * 3600)
+SEARCH_CACHE_MAX_ENTRIES = env.int("SEARCH_CACHE_MAX_ENTRIES", default=2048)
+SEARCH_CACHE_MIN_PREFIX = env.int("SEARCH_CACHE_MIN_PREFIX", default=3)
+# Federated search (/api/search) waits this long (seconds) for IMDb before answering
+# with local films and users only and a page token for the late IMDb results.
+FEDERATED_SEARCH_BUDGET = env.float("FEDERATED_SEARCH_BUDGET", default=0.8)
+FEDERATED_SEARCH_USERS_LIMIT = env.int("FEDERATED_SEARCH_USERS_LIMIT", default=5)
+# Typeahead (/api/search/suggest) is served from an in-process title index,
+# built in the gunicorn master when preloading and shared by the workers.
+# Other workers' new films are picked up every TITLE_SUGGEST_SYNC_SECONDS;
+# popularity ranks are recomputed by a full rebuild every TITLE_SUGGEST_REBUILD_HOURS.
+TITLE_SUGGEST_PRELOAD = env.bool("TITLE_SUGGEST_PRELOAD", default=True)
+TITLE_SUGGEST_SYNC_SECONDS = env.float("TITLE_SUGGEST_SYNC_SECONDS", default=30.0)
+TITLE_SUGGEST_REBUILD_HOURS = env.float("TITLE_SUGGEST_REBUILD_HOURS", default=6.0)
+TITLE_SUGGEST_MAX_RESULTS = env.int("TITLE_SUGGEST_MAX_RESULTS", default=20)
+# Materialised KinoCheck trailer feeds (rebuild with `manage.py refresh_trailer_feeds`
+# from cron); snapshots older than this are served and rebuilt in the background.
+TRAILER_FEED_TTL_HOURS = env.float("TRAILER_FEED_TTL_HOURS", default=3.0)
+# KinoCheck genres kept materialised; defaults to the genres the frontend offers.
+TRAILER_FEED_GENRES = env.list("TRAILER_FEED_GENRES", default=[
+    "Action", "Abenteuer", "Animation", "Komödie", "Krimi", "Drama", "Fantasy",
+    "Horror", "Mystery", "Lovestory", "Science Fiction", "Thriller", "Familie",
+])
+# Total budget for a request's upstream calls; views can override it with a
+# ``request_deadline`` class attribute.
+REQUEST_DEADLINE_SECONDS = env.float("REQUEST_DEADLINE_SECONDS", default=25.0)
+# Cross-worker single-flight lock for cold film fetches (seconds)
+FILM_FETCH_LOCK_TTL = env.int("FILM_FETCH_LOCK_TTL", default=60)
+FILM_FETCH_WAIT_TIMEOUT = env.float("FILM_FETCH_WAIT_TIMEOUT", default=20.0)
+# In-process coalescing of identical IMDb searches: waiters give up after this (seconds)
+IMDB_SEARCH_WAIT_TIMEOUT = env.float("IMDB_SEARCH_WAIT_TIMEOUT", default=5.0)
+# Route upstream-bound film/trailer endpoints to the async views in
+# films.async_views. Only useful under ASGI, e.g.
+#   gunicorn filmosphere.asgi:application -k uvicorn.workers.UvicornWorker
+ASYNC_UPSTREAM_VIEWS = env.bool("ASYNC_UPSTREAM_VIEWS", default=False)
+
 # ----------------------------------------------------
 # CORS Settings (DEV)
 # ----------------------------------------------------
@@ -1,9 +1,15 @@
+import json
+
 from django.contrib import admin
+from django.utils.html import format_html
+
+from films.services.film_cache import FilmCacheService
 
 from films.models import (
     Badge,
     CommentFlag,
     Film,
+    FilmSection,
     List,
     ListItem,
     Mood,
@@ -24,6 +30,30 @@ class FilmAdmin(admin.ModelAdmin):
     list_filter = ["year", "created_at"]
 
 
+@admin.register(FilmSection)
+class FilmSectionAdmin(admin.ModelAdmin):
+    list_display = ["film", "section", "available", "fetched_at", "expires_at"]
+    list_filter = ["section", "available"]
+    search_fields = ["film__title", "film__imdb_id"]
+    readonly_fields = ["fetched_at", "section_data"]
+    exclude = ["data"]
+    raw_id_fields = ["film"]
+
+    @admin.display(description="Data")
+    def section_data(self, obj):
+        return format_html("<pre>{}</pre>", json.dumps(obj.get_data(), indent=2, ensure_ascii=False))
+
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # Rebuild Film.full_json from the edited rows (this also invalidates the cache)
+        FilmCacheService().save_sections(obj.film.imdb_id, {})
+
+    def delete_model(self, request, obj):
+        imdb_id = obj.film.imdb_id
+        super().delete_model(request, obj)
+        FilmCacheService().save_sections(imdb_id, {})
+
+
 @admin.register(Rating)
 class RatingAdmin(admin.ModelAdmin):
     list_display = [
@@ -9,3 +9,7 @@ class FilmsConfig(AppConfig):
 
 
 
+
+    def ready(self):
+        # Register cache invalidation signal handlers
+        from . import signals  # noqa
@@ -0,0 +1,294 @@
+"""Async variants of the upstream-bound film views, for ASGI deployments.
+
+Each view mirrors its sync counterpart in ``films.views`` (same responses
+and error handling) but awaits upstream HTTP through the async services, so
+a uvicorn worker keeps hundreds of slow upstream calls in flight on one
+event loop. ORM access goes through ``sync_to_async``. ``films.urls`` routes
+to these views when ``ASYNC_UPSTREAM_VIEWS`` is on.
+"""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, List
+
+from asgiref.sync import sync_to_async
+from django.http import Http404
+from rest_framework import status
+from rest_framework.request import Request
+from rest_framework.response import Response
+
+from core.services import AsyncIMDbService, AsyncKinoCheckService
+from core.views import AsyncAPIView
+from films.serializers import SearchResultSerializer
+from films.services import FilmAggregatorService, FilmCacheService, IMDbSectionService, TrailerFeedService, asearch_films
+from films.services.trailer_feeds import apply_trailer_posters, trailer_imdb_ids
+from films.views import (
+    IMDB_ID_PATTERN,
+    feed_response,
+    film_rating_fields,
+    section_error_response,
+    section_page_params,
+    section_response,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def aget_film_section(aggregator: FilmAggregatorService, imdb_id: str, name: str, default: Any = None) -> Any:
+    """Async ``films.views.get_film_section``."""
+    cached = await sync_to_async(FilmCacheService().get_section)(imdb_id, name)
+    if cached is not None and cached[1]:
+        return cached[0]
+    payload = await aggregator.afetch_and_cache(imdb_id)
+    return payload.get(name, default)
+
+
+class AsyncSearchView(AsyncAPIView):
+    """Async ``SearchView``: GET /api/search/imdb/?q=<query>."""
+
+    def __init__(self, imdb_service: AsyncIMDbService | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.imdb_service = imdb_service or AsyncIMDbService()
+
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"detail": "Query parameter 'q' is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        more = request.query_params.get("more", "").lower() in ("1", "true", "yes")
+        results_raw, searched_imdb = await asearch_films(query, self.imdb_service, more=more)
+        serializer = SearchResultSerializer(results_raw, many=True)
+        return Response({"query": query, "results": serializer.data, "searched_imdb": searched_imdb})
+
+
+class AsyncFilmView(AsyncAPIView):
+    """Base for async views built on the film aggregator."""
+
+    def __init__(self, aggregator: FilmAggregatorService | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.aggregator = aggregator or FilmAggregatorService()
+
+
+class AsyncFilmDetailView(AsyncFilmView):
+    """Async ``FilmDetailView``: GET /api/films/{imdb_id}."""
+
+    async def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
+        if not IMDB_ID_PATTERN.match(imdb_id):
+            raise Http404("Invalid IMDb id")
+        payload: Dict[str, Any] = await self.aggregator.afetch_and_cache(imdb_id)
+        payload.update(await sync_to_async(film_rating_fields)(request.user, imdb_id))
+        return Response(payload)
+
+
+class AsyncFilmTrailerView(AsyncFilmView):
+    """Async ``FilmTrailerView``: GET /api/films/{imdb_id}/trailer."""
+
+    async def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
+        if not IMDB_ID_PATTERN.match(imdb_id):
+            raise Http404("Invalid IMDb id")
+        trailer = await aget_film_section(self.aggregator, imdb_id, "trailer")
+        return Response({"imdb_id": imdb_id, "trailer": trailer})
+
+
+class AsyncFilmStreamingView(AsyncFilmView):
+    """Async ``FilmStreamingView``: GET /api/films/{imdb_id}/streaming."""
+
+    async def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
+        if not IMDB_ID_PATTERN.match(imdb_id):
+            raise Http404("Invalid IMDb id")
+        streaming = await aget_film_section(self.aggregator, imdb_id, "streaming", [])
+        return Response({"imdb_id": imdb_id, "streaming": streaming})
+
+
+class AsyncIMDbProxyView(AsyncAPIView):
+    """Base for the async extended IMDb endpoints (``FilmCreditsView`` ... ``FilmBoxOfficeView``).
+
+    Same stored, cursor-paginated sections as ``IMDbSectionView``; a cold
+    section's pages are walked on the event loop.
+    """
+
+    section = ""
+    resource = ""
+
+    async def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
+        if not IMDB_ID_PATTERN.match(imdb_id):
+            return Response(
+                {"detail": "Invalid IMDb id"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            offset, limit = section_page_params(request)
+        except ValueError:
+            return Response({"detail": "Invalid cursor or limit"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            snapshot = await IMDbSectionService().aserve(imdb_id, self.section)
+        except Exception as e:
+            return section_error_response(imdb_id, self.resource, e)
+        return section_response(request, self.section, snapshot, offset, limit)
+
+
+class AsyncFilmCreditsView(AsyncIMDbProxyView):
+    section = "credits"
+    resource = "credits"
+
+
+class AsyncFilmReleaseDatesView(AsyncIMDbProxyView):
+    section = "release_dates"
+    resource = "release dates"
+
+
+class AsyncFilmAKAsView(AsyncIMDbProxyView):
+    section = "akas"
+    resource = "AKAs"
+
+
+class AsyncFilmSeasonsView(AsyncIMDbProxyView):
+    section = "seasons"
+    resource = "seasons"
+
+
+class AsyncFilmEpisodesView(AsyncIMDbProxyView):
+    section = "episodes"
+    resource = "episodes"
+
+
+class AsyncFilmImagesView(AsyncIMDbProxyView):
+    section = "images"
+    resource = "images"
+
+
+class AsyncFilmVideosView(AsyncIMDbProxyView):
+    section = "videos"
+    resource = "videos"
+
+
+class AsyncFilmAwardNominationsView(AsyncIMDbProxyView):
+    section = "award_nominations"
+    resource = "award nominations"
+
+
+class AsyncFilmParentsGuideView(AsyncIMDbProxyView):
+    section = "parents_guide"
+    resource = "parents guide"
+
+
+class AsyncFilmCertificatesView(AsyncIMDbProxyView):
+    section = "certificates"
+    resource = "certificates"
+
+
+class AsyncFilmCompanyCreditsView(AsyncIMDbProxyView):
+    section = "company_credits"
+    resource = "company credits"
+
+
+class AsyncFilmBoxOfficeView(AsyncIMDbProxyView):
+    section = "box_office"
+    resource = "box office data"
+
+
+class AsyncKinoCheckLatestTrailersView(AsyncAPIView):
+    """Async ``KinoCheckLatestTrailersView``."""
+
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        try:
+            snapshot = await sync_to_async(TrailerFeedService().serve)("latest")
+            return feed_response(request, snapshot)
+        except Exception as e:
+            logger.error(f"Error fetching latest trailers: {e}")
+            return Response(
+                {"detail": "Failed to fetch latest trailers"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class AsyncKinoCheckTrendingTrailersView(AsyncAPIView):
+    """Async ``KinoCheckTrendingTrailersView``."""
+
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        snapshot = await sync_to_async(TrailerFeedService().serve)("trending")
+        return feed_response(request, snapshot)
+
+
+class AsyncKinoCheckTrailersByGenreView(AsyncAPIView):
+    """Async ``KinoCheckTrailersByGenreView``: GET /api/kinocheck/trailers?genres=Action.
+
+    Unmaterialised genres are fetched live with their posters resolved
+    concurrently on the event loop.
+    """
+
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        genre = request.query_params.get("genres")
+        if not genre:
+            return Response(
+                {"detail": "Query parameter 'genres' is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        materialised = TrailerFeedService.materialised_genre(genre)
+        if materialised:
+            snapshot = await sync_to_async(TrailerFeedService().serve)("genre", materialised)
+            return feed_response(request, snapshot)
+
+        raw_trailers = await AsyncKinoCheckService().get_trailers_by_genre(genre)
+        if not isinstance(raw_trailers, list):
+            return Response(
+                {"detail": "Invalid trailer data format received from upstream service."},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        # Skip corrupted entries with no title to prevent empty UI boxes
+        trailers: List[Dict[str, Any]] = [item for item in raw_trailers if item.get("title")]
+        posters = await FilmAggregatorService().aresolve_posters(trailer_imdb_ids(trailers))
+        return Response(apply_trailer_posters(trailers, posters), status=status.HTTP_200_OK)
+
+
+class AsyncKinoCheckMovieByIdView(AsyncAPIView):
+    """Async ``KinoCheckMovieByIdView``: GET /api/kinocheck/movies?id={movie_id}."""
+
+    async def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        movie_id = request.query_params.get("id")
+        if not movie_id:
+            return Response(
+                {"detail": "Movie ID parameter is required"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            data = await AsyncKinoCheckService().get_movie_by_id(movie_id)
+            if data is None:
+                return Response(
+                    {"detail": "Movie not found"},
+                    status=status.HTTP_404_NOT_FOUND,
+                )
+            return Response(data)
+        except Exception as e:
+            logger.error(f"Error fetching movie by ID: {e}")
+            return Response(
+                {"detail": "Failed to fetch movie"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+
+
+class AsyncMovieUrlView(AsyncAPIView):
+    """Async ``MovieUrlView``."""
+
+    async def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
+        try:
+            kino_url = await AsyncKinoCheckService().get_kinocheck_url_by_imdb_id(imdb_id)
+        except AttributeError:
+            return Response(
+                {"error": "External service returned invalid data"},
+                status=status.HTTP_502_BAD_GATEWAY,
+            )
+        except Exception as e:
+            return Response(
+                {"error": str(e)},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            )
+        if kino_url:
+            return Response({"kinocheck_url": kino_url})
+        return Response(
+            {"error": "Movie not found or API error"},
+            status=status.HTTP_404_NOT_FOUND,
+        )
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import itertools
+import random
+import resource
+import time
+from typing import Iterator, List
+
+from django.core.management.base import BaseCommand
+
+from films.services.title_suggest import PrefixIndex, parse_query
+
+SYLLABLES = [
+    "ka", "ro", "mi", "ta", "shi", "lo", "ve", "an", "dor", "el", "star", "war", "night", "man", "dark",
+    "go", "fa", "the", "ri", "sun", "mo", "on", "re", "tur", "ne", "zo", "ya", "ki", "ber", "lin",
+]
+
+
+def synthetic_vocabulary(size: int, rng: random.Random) -> List[str]:
+    words = set()
+    while len(words) < size:
+        words.add("".join(rng.choice(SYLLABLES) for _ in range(rng.randint(1, 4))))
+    return sorted(words)
+
+
+def synthetic_titles(count: int, vocabulary: List[str], rng: random.Random) -> Iterator[tuple]:
+    # Word frequencies follow a Zipf-like curve, as real title words do.
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(len(vocabulary))))
+    for number in range(count):
+        words = rng.choices(vocabulary, cum_weights=cum_weights, k=rng.randint(1, 5))
+        popularity = float(int(rng.paretovariate(1.2)) - 1)
+        yield f"tt{number:08d}", " ".join(words).title(), rng.randint(1920, 2025), popularity
+
+
+class Command(BaseCommand):
+    help = (
+        "Benchmark the typeahead prefix index on synthetic titles (no database "
+        "needed): builds an index of --titles titles and reports the latency "
+        "percentiles of --queries prefix lookups."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--titles", type=int, default=1_000_000, help="Synthetic titles indexed (default: 1000000)")
+        parser.add_argument("--queries", type=int, default=20_000, help="Lookups timed (default: 20000)")
+        parser.add_argument("--vocabulary", type=int, default=200_000, help="Distinct title words (default: 200000)")
+        parser.add_argument("--limit", type=int, default=8, help="Suggestions per lookup (default: 8)")
+        parser.add_argument("--seed", type=int, default=1)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options["seed"])
+        vocabulary = synthetic_vocabulary(options["vocabulary"], rng)
+        titles = list(synthetic_titles(options["titles"], vocabulary, rng))
+
+        started = time.perf_counter()
+        index = PrefixIndex(titles)
+        build_seconds = time.perf_counter() - started
+        compact_bytes = sum(
+            len(part)
+            for part in (index.id_blob, index.title_blob, index.folded_blob, index.token_blob)
+        ) + sum(
+            part.itemsize * len(part)
+            for part in (
+                index.id_offsets, index.title_offsets, index.folded_offsets, index.token_offsets,
+                index.token_starts, index.postings, index.id_order, index.years, index.scores,
+            )
+        )
+
+        queries = []
+        for _ in range(options["queries"]):
+            words = rng.choice(titles)[1].split()
+            typed = " ".join(words[:rng.randint(1, min(len(words), 3))])
+            queries.append(typed[:rng.randint(1, len(typed))])
+        del titles
+
+        timings = []
+        for query in queries:
+            started = time.perf_counter()
+            words, prefix = parse_query(query)
+            if prefix:
+                [index.entry(position) for position in index.search(words, prefix, options["limit"])]
+            timings.append((time.perf_counter() - started) * 1000)
+        timings.sort()
+
+        def percentile(p: float) -> float:
+            return timings[min(len(timings) - 1, int(len(timings) * p))]
+
+        self.stdout.write(
+            f"Indexed {index.size} titles ({len(index.token_offsets) - 1} distinct words) in {build_seconds:.1f}s; "
+            f"compact index {compact_bytes / 2**20:.0f} MiB, peak RSS {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MiB."
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"{len(timings)} lookups: p50 {percentile(0.5):.3f}ms, p95 {percentile(0.95):.3f}ms, "
+            f"p99 {percentile(0.99):.3f}ms, max {timings[-1]:.3f}ms."
+        ))
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import csv
+import re
+import sys
+from typing import Iterable, Iterator, Tuple
+
+import httpx
+from django.core.management.base import BaseCommand, CommandError
+
+from films.services import watchmode_id_map
+
+IMDB_ID_PATTERN = re.compile(r"^tt\d+$")
+
+# Watchmode publishes every title's ids as a CSV with (at least) these columns.
+DEFAULT_URL = "https://api.watchmode.com/datasets/title_id_map.csv"
+WATCHMODE_COLUMN = "watchmode id"
+IMDB_COLUMN = "imdb id"
+
+
+class Command(BaseCommand):
+    help = (
+        "Bulk import IMDb to Watchmode title id pairs from Watchmode's title id "
+        "mapping CSV, so streaming refreshes skip the /search/ lookup."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", nargs="?", help="Local mapping CSV ('-' for stdin); downloaded from --url if omitted")
+        parser.add_argument("--url", default=DEFAULT_URL, help=f"Mapping file URL (default: {DEFAULT_URL})")
+        parser.add_argument("--batch-size", type=int, default=5000, help="Rows upserted per query (default: 5000)")
+
+    def handle(self, *args, **options):
+        path = options["path"]
+        try:
+            if path == "-":
+                written, skipped = self._import(sys.stdin, options["batch_size"])
+            elif path:
+                with open(path, encoding="utf-8-sig", newline="") as handle:
+                    written, skipped = self._import(handle, options["batch_size"])
+            else:
+                self.stdout.write(f"Downloading {options['url']}...")
+                with httpx.stream("GET", options["url"], timeout=60, follow_redirects=True) as response:
+                    response.raise_for_status()
+                    written, skipped = self._import(response.iter_lines(), options["batch_size"])
+        except OSError as exc:
+            raise CommandError(f"Cannot read {path}: {exc}")
+        except httpx.HTTPError as exc:
+            raise CommandError(f"Cannot download {options['url']}: {exc}")
+
+        self.stdout.write(self.style.SUCCESS(f"Imported {written} Watchmode ids ({skipped} rows skipped)."))
+
+    def _import(self, lines: Iterable[str], batch_size: int) -> Tuple[int, int]:
+        self.skipped = 0
+        written = watchmode_id_map.import_pairs(self._pairs(lines), batch_size=max(1, batch_size))
+        return written, self.skipped
+
+    def _pairs(self, lines: Iterable[str]) -> Iterator[Tuple[str, int]]:
+        reader = csv.reader(lines)
+        header = [name.strip().lstrip("\ufeff").lower() for name in next(reader, [])]
+        try:
+            watchmode_index = header.index(WATCHMODE_COLUMN)
+            imdb_index = header.index(IMDB_COLUMN)
+        except ValueError:
+            raise CommandError(f"Expected '{WATCHMODE_COLUMN}' and '{IMDB_COLUMN}' columns, got {header}")
+        for row in reader:
+            try:
+                imdb_id = row[imdb_index].strip()
+                watchmode_id = int(row[watchmode_index])
+            except (IndexError, ValueError):
+                self.skipped += 1
+                continue
+            if not IMDB_ID_PATTERN.match(imdb_id):
+                self.skipped += 1
+                continue
+            yield imdb_id, watchmode_id
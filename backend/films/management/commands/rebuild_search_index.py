@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from films.models import Film
+from films.services import film_search_index
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the local film search index (titles, original titles, AKAs and "
+        "years of every cached film). Films are reindexed on save, so this is "
+        "only needed once after upgrading or after a bulk import; --missing only "
+        "indexes films that have no search document yet (run on every deploy)."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=500, help="Films indexed per batch (default: 500)")
+        parser.add_argument("--missing", action="store_true", help="Only index films without a search document")
+
+    def handle(self, *args, **options):
+        batch_size = max(1, options["batch_size"])
+        films = Film.objects.order_by("imdb_id")
+        if options["missing"]:
+            films = films.filter(search_document__isnull=True)
+        imdb_ids = list(films.values_list("imdb_id", flat=True))
+        indexed = 0
+        for start in range(0, len(imdb_ids), batch_size):
+            indexed += film_search_index.index(imdb_ids[start:start + batch_size])
+            self.stdout.write(f"  {indexed}/{len(imdb_ids)} films indexed")
+        self.stdout.write(self.style.SUCCESS(f"Indexed {indexed} films for search ({film_search_index.backend})."))
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+from django.core.management.base import BaseCommand
+
+from films.services.rating_stats import reconcile_rating_stats
+
+
+class Command(BaseCommand):
+    help = (
+        "Recompute every film's FilmRatingStats row from its ratings in bulk and "
+        "report drift from the incrementally maintained copy. Drifted, missing and "
+        "orphaned rows are rewritten unless --dry-run is given."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000, help="Films recomputed per query (default: 1000)")
+        parser.add_argument("--dry-run", action="store_true", help="Only report drift, do not fix it")
+
+    def handle(self, *args, **options):
+        report = reconcile_rating_stats(batch_size=max(1, options["batch_size"]), apply=not options["dry_run"])
+        drift = report["missing"] + report["drifted"] + report["orphaned"]
+        summary = (
+            f"Checked {report['checked']} films: {report['drifted']} drifted, "
+            f"{report['missing']} missing, {report['orphaned']} orphaned."
+        )
+        if not drift:
+            self.stdout.write(self.style.SUCCESS(summary))
+            return
+        self.stdout.write(self.style.WARNING(summary))
+        if report["examples"]:
+            self.stdout.write(f"  Drifted films: {', '.join(report['examples'])}")
+        if options["dry_run"]:
+            self.stdout.write("Dry run: nothing was changed.")
+        else:
+            self.stdout.write(self.style.SUCCESS(f"Rewrote {drift} rows."))
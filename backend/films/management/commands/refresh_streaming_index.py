@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import re
+from datetime import timedelta
+from typing import List
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Exists, F, Min, OuterRef, Q
+from django.utils import timezone
+
+from core.services import WatchmodeService
+from films.models import Film, StreamingRefresh
+from films.services import film_streaming_index, watchmode_id_map
+
+REGION_PATTERN = re.compile(r"^[A-Z]{2}$")
+
+
+class Command(BaseCommand):
+    help = (
+        "Incrementally refresh the streaming availability index for one or more "
+        "regions: films whose availability there is missing or older than "
+        "--max-age-hours are refetched from Watchmode, oldest first."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--region", action="append", required=True, help="Region code, e.g. --region TR --region US")
+        parser.add_argument("--max-age-hours", type=float, default=24, help="Refresh availability older than this (default: 24)")
+        parser.add_argument("--limit", type=int, default=200, help="Films refreshed per run (default: 200)")
+
+    def handle(self, *args, **options):
+        regions = [region.strip().upper() for region in options["region"]]
+        invalid = [region for region in regions if not REGION_PATTERN.match(region)]
+        if invalid:
+            raise CommandError(f"Invalid region code(s): {', '.join(invalid)}")
+
+        films = self._due_films(regions, options["max_age_hours"], max(1, options["limit"]))
+        if not films:
+            self.stdout.write(self.style.SUCCESS(f"Streaming index for {', '.join(regions)} is up to date."))
+            return
+
+        service = WatchmodeService()
+        indexed = failed = 0
+        for imdb_id in films:
+            try:
+                title_id = watchmode_id_map.resolve(imdb_id, service.lookup_title_id)
+                sources = service.get_streaming_sources(title_id, regions) if title_id is not None else []
+                # Films Watchmode does not know are recorded with no sources, so they are not retried every run.
+                indexed += film_streaming_index.record(imdb_id, sources, regions)
+            except Exception as exc:  # noqa: BLE001
+                failed += 1
+                self.stderr.write(f"  {imdb_id}: {exc}")
+
+        summary = f"Refreshed {len(films) - failed} films in {', '.join(regions)}: {indexed} sources indexed, {failed} failed."
+        self.stdout.write(self.style.SUCCESS(summary) if not failed else self.style.WARNING(summary))
+
+    @staticmethod
+    def _due_films(regions: List[str], max_age_hours: float, limit: int) -> List[str]:
+        """IMDb ids of films missing a refresh newer than ``max_age_hours`` in any of ``regions``."""
+        cutoff = timezone.now() - timedelta(hours=max_age_hours)
+        fresh_everywhere = Q()
+        for region in regions:
+            fresh_everywhere &= Q(
+                Exists(StreamingRefresh.objects.filter(film=OuterRef("pk"), region=region, refreshed_at__gte=cutoff))
+            )
+        last_refreshed = Min("streaming_refreshes__refreshed_at", filter=Q(streaming_refreshes__region__in=regions))
+        return list(
+            Film.objects.exclude(fresh_everywhere)
+            .annotate(last_refreshed=last_refreshed)
+            .order_by(F("last_refreshed").asc(nulls_first=True), "imdb_id")
+            .values_list("imdb_id", flat=True)[:limit]
+        )
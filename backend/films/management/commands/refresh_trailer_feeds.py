@@ -0,0 +1,68 @@
+from __future__ import annotations
+
+from typing import List, Tuple
+
+from django.core.management.base import BaseCommand, CommandError
+
+from films.services import TrailerFeedService
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuild the materialised KinoCheck trailer feeds (latest, trending and "
+        "TRAILER_FEED_GENRES) with their IMDb posters. Run it from cron, e.g. hourly."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--feed",
+            action="append",
+            choices=["latest", "trending", "genre"],
+            default=[],
+            help="Only rebuild these feeds (default: all)",
+        )
+        parser.add_argument(
+            "--genre",
+            action="append",
+            default=[],
+            help="Only rebuild these genre feeds (default: every TRAILER_FEED_GENRES entry)",
+        )
+
+    def handle(self, *args, **options):
+        service = TrailerFeedService()
+        feeds = self._feeds(service, options["feed"], options["genre"])
+        failed = 0
+        for feed, genre in feeds:
+            label = f"{feed} {genre}".strip()
+            previous = service.get(feed, genre)
+            try:
+                snapshot = service.refresh(feed, genre)
+            except Exception as exc:  # noqa: BLE001
+                failed += 1
+                self.stderr.write(f"  {label}: {exc}")
+                continue
+            if previous is not None and snapshot.refreshed_at == previous.refreshed_at:
+                failed += 1
+                self.stderr.write(f"  {label}: KinoCheck returned no trailers; kept snapshot from {previous.refreshed_at}")
+            elif not snapshot.items:
+                failed += 1
+                self.stderr.write(f"  {label}: KinoCheck returned no trailers")
+            elif previous is not None and previous.etag == snapshot.etag:
+                self.stdout.write(f"  {label}: unchanged ({len(snapshot.items)} trailers)")
+            else:
+                self.stdout.write(f"  {label}: {len(snapshot.items)} trailers, version {snapshot.etag}")
+
+        summary = f"Refreshed {len(feeds) - failed} of {len(feeds)} trailer feeds."
+        self.stdout.write(self.style.SUCCESS(summary) if not failed else self.style.WARNING(summary))
+
+    @staticmethod
+    def _feeds(service: TrailerFeedService, feeds: List[str], genres: List[str]) -> List[Tuple[str, str]]:
+        feeds = feeds or ["latest", "trending", "genre"]
+        selected = [(feed, "") for feed in feeds if feed != "genre"]
+        if "genre" in feeds or genres:
+            for genre in genres or service.genres():
+                materialised = service.materialised_genre(genre)
+                if materialised is None:
+                    raise CommandError(f"Genre '{genre}' is not in TRAILER_FEED_GENRES")
+                selected.append(("genre", materialised))
+        return selected
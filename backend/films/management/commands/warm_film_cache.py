@@ -0,0 +1,284 @@
+from __future__ import annotations
+
+import json
+import os
+import re
+import sys
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from typing import Any, Dict, Iterable, List, Optional, Set
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import close_old_connections
+
+from core.services import IMDbService, KinoCheckService, WatchmodeService
+from films.models import ListItem, Rating, WatchedFilm
+from films.services import FilmAggregatorService, FilmCacheService
+
+IMDB_ID_PATTERN = re.compile(r"^tt\d+$")
+
+DEFAULT_RATES = {"imdb": 5.0, "kinocheck": 2.0, "watchmode": 2.0}
+
+
+class RateLimiter:
+    """Blocking token bucket allowing ``rate`` calls per second (0 disables it)."""
+
+    def __init__(self, rate: float) -> None:
+        self.rate = rate
+        self._lock = threading.Lock()
+        self._tokens = max(rate, 1.0)
+        self._updated = time.monotonic()
+
+    def acquire(self) -> None:
+        if self.rate <= 0:
+            return
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(max(self.rate, 1.0), self._tokens + (now - self._updated) * self.rate)
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                delay = (1 - self._tokens) / self.rate
+            time.sleep(delay)
+
+
+class RateLimitedService:
+    """Proxy that takes a token from ``limiter`` before every public method call."""
+
+    def __init__(self, service: Any, limiter: RateLimiter) -> None:
+        self._service = service
+        self._limiter = limiter
+
+    def __getattr__(self, name: str) -> Any:
+        attr = getattr(self._service, name)
+        if name.startswith("_") or not callable(attr):
+            return attr
+
+        def call(*args: Any, **kwargs: Any) -> Any:
+            self._limiter.acquire()
+            return attr(*args, **kwargs)
+
+        return call
+
+
+class Checkpoint:
+    """JSON file of completed and failed ids so an interrupted run can resume."""
+
+    def __init__(self, path: Optional[str]) -> None:
+        self.path = path
+        self.completed: Set[str] = set()
+        self.failed: Dict[str, str] = {}
+        if path and os.path.exists(path):
+            with open(path, encoding="utf-8") as handle:
+                data = json.load(handle)
+            self.completed = set(data.get("completed", []))
+            self.failed = dict(data.get("failed", {}))
+
+    def mark(self, imdb_id: str, error: Optional[str] = None) -> None:
+        if error is None:
+            self.completed.add(imdb_id)
+            self.failed.pop(imdb_id, None)
+        else:
+            self.failed[imdb_id] = error
+
+    def save(self) -> None:
+        if not self.path:
+            return
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            json.dump({"completed": sorted(self.completed), "failed": self.failed}, handle, indent=2)
+        os.replace(tmp_path, self.path)
+
+
+class Command(BaseCommand):
+    help = (
+        "Pre-populate the film cache by hydrating IMDb ids through the aggregator "
+        "with bounded concurrency and per-upstream rate limits."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("imdb_ids", nargs="*", help="IMDb ids to warm (e.g. tt1375666)")
+        parser.add_argument("--file", dest="files", action="append", default=[], help="File with one IMDb id per line ('-' for stdin)")
+        parser.add_argument("--stdin", action="store_true", help="Read IMDb ids from stdin")
+        parser.add_argument(
+            "--kinocheck",
+            action="append",
+            choices=["trending", "latest"],
+            default=[],
+            help="Add films from a KinoCheck trailer feed",
+        )
+        parser.add_argument(
+            "--referenced",
+            action="store_true",
+            help="Add every film referenced by ratings, watched films or lists",
+        )
+        parser.add_argument("--concurrency", type=int, default=4, help="Films hydrated in parallel (default: 4)")
+        parser.add_argument(
+            "--rate",
+            action="append",
+            default=[],
+            metavar="UPSTREAM=PER_SECOND",
+            help="Per-upstream request rate, e.g. --rate imdb=5 --rate watchmode=1 (0 disables the limit)",
+        )
+        parser.add_argument("--checkpoint", help="JSON checkpoint file; completed ids in it are skipped")
+        parser.add_argument("--checkpoint-every", type=int, default=25, help="Save the checkpoint every N films")
+        parser.add_argument("--force", action="store_true", help="Hydrate films even if their cache is still fresh")
+        parser.add_argument("--report-every", type=int, default=10, help="Print progress every N films")
+
+    def handle(self, *args, **options):
+        ids = self._collect_ids(options)
+        checkpoint = Checkpoint(options["checkpoint"])
+        pending = [imdb_id for imdb_id in ids if imdb_id not in checkpoint.completed]
+        resumed = len(ids) - len(pending)
+        if not pending:
+            self.stdout.write(self.style.SUCCESS(f"Nothing to warm ({len(ids)} ids, {resumed} already done)."))
+            return
+
+        aggregator = self._build_aggregator(self._parse_rates(options["rate"]))
+        cache_service = FilmCacheService()
+        concurrency = max(1, options["concurrency"])
+        self.stdout.write(
+            f"Warming {len(pending)} films ({resumed} skipped from checkpoint) with concurrency {concurrency}..."
+        )
+
+        stats = {"hydrated": 0, "fresh": 0, "failed": 0}
+        started = time.monotonic()
+        done = 0
+
+        def warm(imdb_id: str) -> str:
+            close_old_connections()
+            try:
+                if not options["force"] and cache_service.is_fresh(imdb_id, use_cache=False):
+                    return "fresh"
+                aggregator.hydrate(imdb_id)
+                return "hydrated"
+            finally:
+                close_old_connections()
+
+        remaining = iter(pending)
+        with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="warm-film") as executor:
+            # Keep at most ``concurrency`` films in flight so a huge id list is not queued up front.
+            in_flight = {}
+            for imdb_id in remaining:
+                in_flight[executor.submit(warm, imdb_id)] = imdb_id
+                if len(in_flight) >= concurrency:
+                    break
+            try:
+                while in_flight:
+                    finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    for future in finished:
+                        imdb_id = in_flight.pop(future)
+                        try:
+                            outcome = future.result()
+                        except Exception as exc:  # noqa: BLE001
+                            stats["failed"] += 1
+                            checkpoint.mark(imdb_id, error=str(exc) or exc.__class__.__name__)
+                            self.stderr.write(f"  {imdb_id}: {exc}")
+                        else:
+                            stats[outcome] += 1
+                            checkpoint.mark(imdb_id)
+                        done += 1
+                        if done % max(1, options["checkpoint_every"]) == 0:
+                            checkpoint.save()
+                        if done % max(1, options["report_every"]) == 0:
+                            self._report(done, len(pending), stats, started)
+                        next_id = next(remaining, None)
+                        if next_id is not None:
+                            in_flight[executor.submit(warm, next_id)] = next_id
+            except KeyboardInterrupt:
+                for future in in_flight:
+                    future.cancel()
+                checkpoint.save()
+                raise CommandError(f"Interrupted after {done} films; rerun with the same --checkpoint to resume.")
+
+        checkpoint.save()
+        self._report(done, len(pending), stats, started)
+        summary = f"Done: {stats['hydrated']} hydrated, {stats['fresh']} already fresh, {stats['failed']} failed."
+        self.stdout.write(self.style.SUCCESS(summary) if not stats["failed"] else self.style.WARNING(summary))
+
+    def _collect_ids(self, options: Dict[str, Any]) -> List[str]:
+        """Merge ids from every requested source, de-duplicated in first-seen order."""
+        sources: List[Iterable[str]] = [options["imdb_ids"]]
+        for path in options["files"]:
+            if path == "-":
+                sources.append(sys.stdin.read().split())
+                continue
+            try:
+                with open(path, encoding="utf-8") as handle:
+                    sources.append([line.split("#", 1)[0].strip() for line in handle])
+            except OSError as exc:
+                raise CommandError(f"Cannot read {path}: {exc}")
+        if options["stdin"]:
+            sources.append(sys.stdin.read().split())
+        if options["kinocheck"]:
+            sources.append(self._kinocheck_ids(options["kinocheck"]))
+        if options["referenced"]:
+            sources.append(self._referenced_ids())
+
+        ids: Dict[str, None] = {}
+        invalid = 0
+        for source in sources:
+            for imdb_id in source:
+                if not imdb_id:
+                    continue
+                if IMDB_ID_PATTERN.match(imdb_id):
+                    ids.setdefault(imdb_id, None)
+                else:
+                    invalid += 1
+        if invalid:
+            self.stderr.write(f"Ignored {invalid} invalid IMDb ids.")
+        if not ids:
+            raise CommandError("No IMDb ids given. Pass ids, --file, --stdin, --kinocheck or --referenced.")
+        return list(ids)
+
+    @staticmethod
+    def _kinocheck_ids(feeds: Iterable[str]) -> List[str]:
+        service = KinoCheckService()
+        ids = []
+        for feed in feeds:
+            items = service.get_trending_trailers() if feed == "trending" else service.get_latest_trailers()
+            for item in items:
+                resource = item.get("resource") or {}
+                if resource.get("imdb_id"):
+                    ids.append(resource["imdb_id"])
+        return ids
+
+    @staticmethod
+    def _referenced_ids() -> List[str]:
+        ids: List[str] = []
+        for model in (Rating, WatchedFilm, ListItem):
+            ids.extend(model.objects.values_list("film__imdb_id", flat=True).distinct())
+        return ids
+
+    @staticmethod
+    def _parse_rates(values: Iterable[str]) -> Dict[str, float]:
+        rates = dict(DEFAULT_RATES)
+        for value in values:
+            name, _, rate = value.partition("=")
+            if name not in rates:
+                raise CommandError(f"Unknown upstream '{name}'; expected one of {', '.join(rates)}")
+            try:
+                rates[name] = float(rate)
+            except ValueError:
+                raise CommandError(f"Invalid rate '{value}'")
+        return rates
+
+    @staticmethod
+    def _build_aggregator(rates: Dict[str, float]) -> FilmAggregatorService:
+        return FilmAggregatorService(
+            imdb_service=RateLimitedService(IMDbService(), RateLimiter(rates["imdb"])),
+            kino_service=RateLimitedService(KinoCheckService(), RateLimiter(rates["kinocheck"])),
+            watchmode_service=RateLimitedService(WatchmodeService(), RateLimiter(rates["watchmode"])),
+        )
+
+    def _report(self, done: int, total: int, stats: Dict[str, int], started: float) -> None:
+        elapsed = max(time.monotonic() - started, 1e-6)
+        throughput = done / elapsed
+        eta = (total - done) / throughput if throughput else 0
+        self.stdout.write(
+            f"  {done}/{total} films | {stats['hydrated']} hydrated, {stats['fresh']} fresh, "
+            f"{stats['failed']} failed | {throughput:.2f} films/s | eta {eta:.0f}s"
+        )
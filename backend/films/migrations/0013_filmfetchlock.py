@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 00:42
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0012_alter_moderationlog_direction'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FilmFetchLock',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('imdb_id', models.CharField(max_length=20, unique=True)),
+                ('owner', models.CharField(max_length=128)),
+                ('acquired_at', models.DateTimeField(auto_now_add=True)),
+                ('expires_at', models.DateTimeField(db_index=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.1.3 on 2026-10-17 00:45
+
+from datetime import timedelta
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+SECTIONS = [
+    "metadata",
+    "credits",
+    "images",
+    "videos",
+    "parents_guide",
+    "certificates",
+    "release_dates",
+    "trailer",
+    "streaming",
+]
+
+
+def split_full_json_into_sections(apps, schema_editor):
+    """Backfill FilmSection rows from existing full_json payloads, in chunks."""
+    Film = apps.get_model("films", "Film")
+    FilmSection = apps.get_model("films", "FilmSection")
+    ttl = timedelta(hours=getattr(settings, "CACHE_TTL_HOURS", 24))
+
+    batch = []
+    films = Film.objects.exclude(full_json=None).exclude(cached_at=None).only("id", "full_json", "cached_at")
+    for film in films.iterator(chunk_size=500):
+        payload = film.full_json or {}
+        warnings = payload.get("warnings") or []
+        expires_at = film.cached_at + ttl
+        for name in SECTIONS:
+            if name not in payload:
+                continue
+            batch.append(
+                FilmSection(
+                    film_id=film.id,
+                    section=name,
+                    data=payload[name],
+                    available=f"{name}_unavailable" not in warnings,
+                    fetched_at=film.cached_at,
+                    expires_at=expires_at,
+                )
+            )
+        Film.objects.filter(id=film.id).update(expires_at=expires_at)
+        if len(batch) >= 1000:
+            FilmSection.objects.bulk_create(batch, ignore_conflicts=True)
+            batch = []
+    if batch:
+        FilmSection.objects.bulk_create(batch, ignore_conflicts=True)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0013_filmfetchlock'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='film',
+            name='expires_at',
+            field=models.DateTimeField(blank=True, help_text="Earliest expiry among the film's cached sections", null=True),
+        ),
+        migrations.CreateModel(
+            name='FilmSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('section', models.CharField(choices=[('metadata', 'Metadata'), ('credits', 'Credits'), ('images', 'Images'), ('videos', 'Videos'), ('parents_guide', 'Parents Guide'), ('certificates', 'Certificates'), ('release_dates', 'Release Dates'), ('trailer', 'Trailer'), ('streaming', 'Streaming')], max_length=32)),
+                ('data', models.JSONField(blank=True, null=True)),
+                ('available', models.BooleanField(default=True, help_text='False if upstream has never returned this section successfully')),
+                ('fetched_at', models.DateTimeField()),
+                ('expires_at', models.DateTimeField()),
+                ('film', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='sections', to='films.film')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['film', 'section'], name='films_films_film_id_f45d1b_idx')],
+                'unique_together': {('film', 'section')},
+            },
+        ),
+        migrations.RunPython(split_full_json_into_sections, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,106 @@
+# Generated by Django 5.1.3 on 2026-10-17 00:51
+
+import json
+import zlib
+
+from django.db import migrations, models
+
+CHUNK_SIZE = 500
+
+# Frozen copies of films.services.payload_projection and
+# core.utils.compression as of this migration; later changes to those
+# modules must not change what it writes.
+_IMAGE = {"url": True, "width": True, "height": True}
+_NAME = {"id": True, "displayName": True, "primaryImage": _IMAGE}
+SECTION_PROJECTIONS = {
+    "credits": {
+        "credits": {"name": _NAME, "category": True, "characters": True},
+        "totalCount": True,
+    },
+    "images": {
+        "images": {"url": True, "width": True, "height": True, "type": True},
+        "totalCount": True,
+    },
+    "videos": {
+        "videos": {"id": True, "type": True, "name": True, "primaryImage": _IMAGE, "runtimeSeconds": True},
+        "totalCount": True,
+    },
+}
+
+
+def project(value, spec):
+    if spec is True or value is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, spec) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], sub) for key, sub in spec.items() if key in value}
+    return value
+
+
+def trim_section(name, data):
+    spec = SECTION_PROJECTIONS.get(name)
+    if spec is None:
+        return data
+    if isinstance(data, dict) and not spec.keys() & data.keys():
+        return data
+    return project(data, spec)
+
+
+def compress_json(value):
+    raw = json.dumps(value, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return zlib.compress(raw, 6)
+
+
+def compress_sections(apps, schema_editor):
+    """Trim and compress legacy section data and shrink full_json, in chunks."""
+    Film = apps.get_model("films", "Film")
+    FilmSection = apps.get_model("films", "FilmSection")
+
+    while True:
+        rows = list(FilmSection.objects.filter(blob=None).exclude(data=None).only("id", "section", "data")[:CHUNK_SIZE])
+        if not rows:
+            break
+        for row in rows:
+            row.blob = compress_json(trim_section(row.section, row.data))
+            row.data = None
+        FilmSection.objects.bulk_update(rows, ["blob", "data"])
+
+    # Only films whose payload now lives in section rows lose their full_json copy.
+    batch = []
+    films = Film.objects.exclude(full_json=None).filter(sections__isnull=False).distinct().only("id", "full_json")
+    for film in films.iterator(chunk_size=CHUNK_SIZE):
+        payload = film.full_json or {}
+        film.full_json = {key: payload.get(key) for key in ("imdb_id", "title", "metadata", "warnings")}
+        batch.append(film)
+        if len(batch) >= CHUNK_SIZE:
+            Film.objects.bulk_update(batch, ["full_json"])
+            batch = []
+    if batch:
+        Film.objects.bulk_update(batch, ["full_json"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0014_filmsection'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='filmsection',
+            name='blob',
+            field=models.BinaryField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='film',
+            name='full_json',
+            field=models.JSONField(blank=True, help_text='Summary of the cached payload (title, metadata, warnings); sections live in FilmSection', null=True),
+        ),
+        migrations.AlterField(
+            model_name='filmsection',
+            name='data',
+            field=models.JSONField(blank=True, help_text='Legacy uncompressed data; new rows use blob', null=True),
+        ),
+        migrations.RunPython(compress_sections, migrations.RunPython.noop),
+    ]
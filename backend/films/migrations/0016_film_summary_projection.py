@@ -0,0 +1,51 @@
+# Generated by Django 5.1.3 on 2026-10-17 00:53
+
+from django.db import migrations
+from django.db.models import Q
+
+CHUNK_SIZE = 500
+
+
+def backfill_summary_columns(apps, schema_editor):
+    """Copy title, year and poster from full_json metadata into empty columns, in chunks."""
+    Film = apps.get_model("films", "Film")
+
+    batch = []
+    films = (
+        Film.objects.exclude(full_json=None)
+        .filter(Q(title="") | Q(year=None) | Q(poster_url=None) | Q(poster_url=""))
+        .only("id", "title", "year", "poster_url", "full_json")
+    )
+    for film in films.iterator(chunk_size=CHUNK_SIZE):
+        metadata = (film.full_json or {}).get("metadata") or {}
+        primary_image = metadata.get("primaryImage")
+        if isinstance(primary_image, dict):
+            poster_url = primary_image.get("url")
+        else:
+            poster_url = primary_image if isinstance(primary_image, str) else None
+        poster_url = poster_url or metadata.get("poster_url")
+
+        film.title = film.title or metadata.get("primaryTitle") or metadata.get("title") or ""
+        film.year = film.year or metadata.get("startYear") or metadata.get("year")
+        film.poster_url = film.poster_url or poster_url
+        batch.append(film)
+        if len(batch) >= CHUNK_SIZE:
+            Film.objects.bulk_update(batch, ["title", "year", "poster_url"])
+            batch = []
+    if batch:
+        Film.objects.bulk_update(batch, ["title", "year", "poster_url"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0015_compress_film_sections'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='film',
+            options={'base_manager_name': 'objects'},
+        ),
+        migrations.RunPython(backfill_summary_columns, migrations.RunPython.noop),
+    ]
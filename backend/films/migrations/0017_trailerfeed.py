@@ -0,0 +1,28 @@
+# Generated by Django 5.1.3 on 2026-10-17 01:14
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0016_film_summary_projection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='TrailerFeed',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('feed', models.CharField(choices=[('latest', 'Latest'), ('trending', 'Trending'), ('genre', 'Genre')], max_length=16)),
+                ('genre', models.CharField(blank=True, default='', max_length=64)),
+                ('items', models.JSONField(default=list)),
+                ('etag', models.CharField(max_length=64)),
+                ('refreshed_at', models.DateTimeField()),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'unique_together': {('feed', 'genre')},
+            },
+        ),
+    ]
@@ -0,0 +1,23 @@
+# Generated by Django 5.1.3 on 2026-10-17 01:16
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0017_trailerfeed'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='WatchmodeTitle',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('imdb_id', models.CharField(max_length=20, unique=True)),
+                ('watchmode_id', models.PositiveIntegerField()),
+                ('source', models.CharField(choices=[('lookup', 'Search lookup'), ('import', 'Mapping file import')], default='lookup', max_length=16)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 5.1.3 on 2026-10-17 01:17
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0018_watchmodetitle'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='StreamingAvailability',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('region', models.CharField(max_length=2)),
+                ('source_id', models.PositiveIntegerField()),
+                ('service', models.CharField(max_length=128)),
+                ('type', models.CharField(choices=[('sub', 'Subscription'), ('free', 'Free'), ('rent', 'Rent'), ('buy', 'Buy'), ('tve', 'TV Everywhere')], max_length=8)),
+                ('format', models.CharField(blank=True, default='', max_length=8)),
+                ('price', models.DecimalField(blank=True, decimal_places=2, max_digits=8, null=True)),
+                ('web_url', models.URLField(blank=True, default='', max_length=1000)),
+                ('last_seen', models.DateTimeField()),
+                ('film', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='availability', to='films.film')),
+            ],
+            options={
+                'indexes': [models.Index(fields=['region', 'service', 'type'], name='films_strea_region_9d929f_idx'), models.Index(fields=['film', 'region'], name='films_strea_film_id_730861_idx')],
+                'unique_together': {('film', 'region', 'source_id', 'type', 'format')},
+            },
+        ),
+        migrations.CreateModel(
+            name='StreamingRefresh',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('region', models.CharField(max_length=2)),
+                ('refreshed_at', models.DateTimeField(db_index=True)),
+                ('film', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='streaming_refreshes', to='films.film')),
+            ],
+            options={
+                'unique_together': {('film', 'region')},
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 5.1.3 on 2026-10-17 01:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0019_streamingavailability_streamingrefresh'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='IMDbSection',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('imdb_id', models.CharField(max_length=32)),
+                ('section', models.CharField(max_length=32)),
+                ('data', models.JSONField(default=dict, help_text='Top-level fields of the first page, without the item list')),
+                ('blob', models.BinaryField(help_text='Compressed list of every item across all pages')),
+                ('item_count', models.PositiveIntegerField(default=0)),
+                ('complete', models.BooleanField(default=True, help_text='False if page walking stopped at EXTENDED_SECTION_MAX_PAGES')),
+                ('etag', models.CharField(max_length=64)),
+                ('fetched_at', models.DateTimeField()),
+                ('expires_at', models.DateTimeField()),
+            ],
+            options={
+                'unique_together': {('imdb_id', 'section')},
+            },
+        ),
+    ]
@@ -0,0 +1,98 @@
+# Generated by Django 5.1.3 on 2026-10-17 01:25
+
+import logging
+
+import django.db.models.deletion
+from django.db import DatabaseError, migrations, models, transaction
+
+logger = logging.getLogger(__name__)
+
+# The full-text DDL as of this migration, spelt out so later changes to
+# films.services.film_search never change what it creates.
+FTS_TABLE = "films_filmsearch_fts"
+
+SQLITE_SETUP = [
+    f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+    "title, original_title, akas, content='films_filmsearchdocument', content_rowid='id', "
+    "tokenize='unicode61 remove_diacritics 2')",
+    f"CREATE TRIGGER IF NOT EXISTS films_filmsearch_ai AFTER INSERT ON films_filmsearchdocument BEGIN "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, original_title, akas) VALUES (new.id, new.title, new.original_title, new.akas); END",
+    f"CREATE TRIGGER IF NOT EXISTS films_filmsearch_ad AFTER DELETE ON films_filmsearchdocument BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, original_title, akas) "
+    "VALUES ('delete', old.id, old.title, old.original_title, old.akas); END",
+    f"CREATE TRIGGER IF NOT EXISTS films_filmsearch_au AFTER UPDATE ON films_filmsearchdocument BEGIN "
+    f"INSERT INTO {FTS_TABLE}({FTS_TABLE}, rowid, title, original_title, akas) "
+    "VALUES ('delete', old.id, old.title, old.original_title, old.akas); "
+    f"INSERT INTO {FTS_TABLE}(rowid, title, original_title, akas) VALUES (new.id, new.title, new.original_title, new.akas); END",
+]
+SQLITE_TEARDOWN = [
+    "DROP TRIGGER IF EXISTS films_filmsearch_ai",
+    "DROP TRIGGER IF EXISTS films_filmsearch_ad",
+    "DROP TRIGGER IF EXISTS films_filmsearch_au",
+    f"DROP TABLE IF EXISTS {FTS_TABLE}",
+]
+
+PG_SETUP = [
+    "CREATE INDEX IF NOT EXISTS films_filmsearch_tsv ON films_filmsearchdocument "
+    "USING GIN (to_tsvector('simple', title || ' ' || original_title || ' ' || akas))",
+]
+PG_TRIGRAM_SETUP = [
+    "CREATE EXTENSION IF NOT EXISTS pg_trgm",
+    "CREATE INDEX IF NOT EXISTS films_filmsearch_trgm ON films_filmsearchdocument USING GIN (title gin_trgm_ops)",
+]
+PG_TEARDOWN = [
+    "DROP INDEX IF EXISTS films_filmsearch_trgm",
+    "DROP INDEX IF EXISTS films_filmsearch_tsv",
+]
+
+
+def create_full_text_index(apps, schema_editor):
+    """FTS5 table and sync triggers on SQLite; GIN tsvector (and, if possible, trigram) indexes on Postgres."""
+    vendor = schema_editor.connection.vendor
+    if vendor == "sqlite":
+        statements = SQLITE_SETUP
+    elif vendor == "postgresql":
+        statements = PG_SETUP
+    else:
+        return
+    for statement in statements:
+        schema_editor.execute(statement)
+    if vendor == "postgresql":
+        try:
+            with transaction.atomic(using=schema_editor.connection.alias):
+                for statement in PG_TRIGRAM_SETUP:
+                    schema_editor.execute(statement)
+        except DatabaseError:
+            logger.warning("pg_trgm is not available; film search will not match misspelt titles")
+
+
+def drop_full_text_index(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for statement in {"sqlite": SQLITE_TEARDOWN, "postgresql": PG_TEARDOWN}.get(vendor, []):
+        schema_editor.execute(statement)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0020_imdbsection'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FilmSearchDocument',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('title', models.CharField(max_length=512)),
+                ('original_title', models.CharField(blank=True, default='', max_length=512)),
+                ('akas', models.TextField(blank=True, default='', help_text='Alternate titles, one per line')),
+                ('year', models.IntegerField(blank=True, db_index=True, null=True)),
+                ('title_type', models.CharField(blank=True, default='', max_length=32)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+                ('film', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, related_name='search_document', to='films.film')),
+            ],
+        ),
+        # Existing films get their documents from `manage.py rebuild_search_index --missing`,
+        # which build.sh and docker-entrypoint.sh run after migrating.
+        migrations.RunPython(create_full_text_index, drop_full_text_index),
+    ]
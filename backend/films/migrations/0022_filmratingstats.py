@@ -0,0 +1,75 @@
+# Generated by Django 5.1.3 on 2026-10-17 02:00
+
+import django.db.models.deletion
+from django.db import migrations, models
+from django.db.models import Count, Q, Sum
+from django.db.models.functions import Coalesce
+
+CHUNK_SIZE = 1000
+
+# The rating aspects as of this migration; spelt out so it never depends on
+# app code.
+ASPECTS = ["plot", "acting", "cinematography", "soundtrack", "originality", "direction"]
+
+
+def backfill_rating_stats(apps, schema_editor):
+    """Create every rated film's stats row from one grouped query over its ratings."""
+    Rating = apps.get_model("films", "Rating")
+    FilmRatingStats = apps.get_model("films", "FilmRatingStats")
+
+    aggregates = {
+        "ratings_count": Count("pk"),
+        "overall_sum": Coalesce(Sum("overall_rating"), 0),
+    }
+    for score in range(1, 6):
+        aggregates[f"overall_{score}"] = Count("pk", filter=Q(overall_rating=score))
+    for aspect in ASPECTS:
+        aggregates[f"{aspect}_sum"] = Coalesce(Sum(f"{aspect}_rating"), 0)
+        aggregates[f"{aspect}_count"] = Count(f"{aspect}_rating")
+
+    rows = Rating.objects.values("film_id").annotate(**aggregates).order_by()
+    batch = []
+    for row in rows.iterator(chunk_size=CHUNK_SIZE):
+        batch.append(FilmRatingStats(**row))
+        if len(batch) >= CHUNK_SIZE:
+            FilmRatingStats.objects.bulk_create(batch)
+            batch = []
+    if batch:
+        FilmRatingStats.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0021_filmsearchdocument'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='FilmRatingStats',
+            fields=[
+                ('film', models.OneToOneField(on_delete=django.db.models.deletion.CASCADE, primary_key=True, related_name='rating_stats', serialize=False, to='films.film')),
+                ('ratings_count', models.IntegerField(default=0)),
+                ('overall_sum', models.BigIntegerField(default=0)),
+                ('overall_1', models.IntegerField(default=0)),
+                ('overall_2', models.IntegerField(default=0)),
+                ('overall_3', models.IntegerField(default=0)),
+                ('overall_4', models.IntegerField(default=0)),
+                ('overall_5', models.IntegerField(default=0)),
+                ('plot_sum', models.BigIntegerField(default=0)),
+                ('plot_count', models.IntegerField(default=0)),
+                ('acting_sum', models.BigIntegerField(default=0)),
+                ('acting_count', models.IntegerField(default=0)),
+                ('cinematography_sum', models.BigIntegerField(default=0)),
+                ('cinematography_count', models.IntegerField(default=0)),
+                ('soundtrack_sum', models.BigIntegerField(default=0)),
+                ('soundtrack_count', models.IntegerField(default=0)),
+                ('originality_sum', models.BigIntegerField(default=0)),
+                ('originality_count', models.IntegerField(default=0)),
+                ('direction_sum', models.BigIntegerField(default=0)),
+                ('direction_count', models.IntegerField(default=0)),
+                ('updated_at', models.DateTimeField(auto_now=True)),
+            ],
+        ),
+        migrations.RunPython(backfill_rating_stats, migrations.RunPython.noop),
+    ]
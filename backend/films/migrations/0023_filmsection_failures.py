@@ -0,0 +1,18 @@
+# Generated by Django 5.1.3 on 2026-10-17 02:17
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('films', '0022_filmratingstats'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='filmsection',
+            name='failures',
+            field=models.PositiveIntegerField(default=0, help_text='Consecutive failed refreshes; each one doubles the retry delay'),
+        ),
+    ]
@@ -3,8 +3,46 @@ from decimal import Decimal
 
 from django.contrib.auth.models import User
 from django.core.validators import MinValueValidator, MaxValueValidator
-from django.db import models
-from django.db.models import Avg, Count
+from django.db import models, transaction
+
+from core.utils.compression import decompress_json
+
+
+# Columns only the film cache reads. They are deferred whenever films are
+# loaded as summaries (list endpoints, feeds, relation access).
+FILM_PAYLOAD_FIELDS = ("full_json",)
+
+
+class FilmQuerySet(models.QuerySet):
+    def with_payload(self):
+        """Load every column, including the deferred payload fields."""
+        return self.defer(None)
+
+
+class FilmManager(models.Manager.from_queryset(FilmQuerySet)):
+    """Default Film manager returning the summary projection (no ``full_json``)."""
+
+    def get_queryset(self):
+        return super().get_queryset().defer(*FILM_PAYLOAD_FIELDS)
+
+
+class FilmRelatedQuerySet(models.QuerySet):
+    """QuerySet for models with a ``film`` foreign key.
+
+    ``select_related`` on a film relation loads the FilmSummary projection:
+    the payload fields are deferred automatically, so feeds and lists never
+    pull ``full_json`` for every row.
+    """
+
+    def select_related(self, *fields):
+        queryset = super().select_related(*fields)
+        deferred = [
+            f"{field}__{name}"
+            for field in fields
+            if field and (field == "film" or field.endswith("__film"))
+            for name in FILM_PAYLOAD_FIELDS
+        ]
+        return queryset.defer(*deferred) if deferred else queryset
 
 
 class Film(models.Model):
@@ -15,12 +53,25 @@ class Film(models.Model):
     title = models.CharField(max_length=512, db_index=True)
     year = models.IntegerField(null=True, blank=True)
     poster_url = models.URLField(max_length=2000, null=True, blank=True)
-    full_json = models.JSONField(null=True, blank=True)
+    full_json = models.JSONField(
+        null=True,
+        blank=True,
+        help_text="Summary of the cached payload (title, metadata, warnings); sections live in FilmSection",
+    )
     cached_at = models.DateTimeField(null=True, blank=True)
+    expires_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        help_text="Earliest expiry among the film's cached sections",
+    )
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FilmManager()
+
     class Meta:
+        # Lazy relation access (review.film) and prefetches use the summary too
+        base_manager_name = "objects"
         indexes = [
             models.Index(fields=["imdb_id"]),
             models.Index(fields=["title"]),
@@ -30,45 +81,210 @@ class Film(models.Model):
         return f"{self.title} ({self.imdb_id})"
 
     def get_average_ratings(self):
-        """Calculate average ratings for all aspects from all user ratings."""
-        ratings = Rating.objects.filter(film=self)
-
-        if not ratings.exists():
-            return {
-                "overall": None,
-                "plot": None,
-                "acting": None,
-                "cinematography": None,
-                "soundtrack": None,
-                "originality": None,
-                "direction": None,
-                "total_ratings": 0,
-            }
-
-        # Calculate averages for each aspect
-        aspect_ratings = ratings.aggregate(
-            avg_overall=Avg("overall_rating"),
-            avg_plot=Avg("plot_rating"),
-            avg_acting=Avg("acting_rating"),
-            avg_cinematography=Avg("cinematography_rating"),
-            avg_soundtrack=Avg("soundtrack_rating"),
-            avg_originality=Avg("originality_rating"),
-            avg_direction=Avg("direction_rating"),
-            total=Count("id"),
-        )
-
+        """Return average ratings for all aspects, read from the film's ``FilmRatingStats`` row."""
+        stats = FilmRatingStats.objects.filter(film=self).first()
+        if stats is None:
+            return self.empty_average_ratings()
+        return stats.as_averages()
+
+    @staticmethod
+    def empty_average_ratings():
         return {
-            "overall": round(float(aspect_ratings["avg_overall"] or 0), 2),
-            "plot": round(float(aspect_ratings["avg_plot"] or 0), 2) if aspect_ratings["avg_plot"] else None,
-            "acting": round(float(aspect_ratings["avg_acting"] or 0), 2) if aspect_ratings["avg_acting"] else None,
-            "cinematography": round(float(aspect_ratings["avg_cinematography"] or 0), 2) if aspect_ratings["avg_cinematography"] else None,
-            "soundtrack": round(float(aspect_ratings["avg_soundtrack"] or 0), 2) if aspect_ratings["avg_soundtrack"] else None,
-            "originality": round(float(aspect_ratings["avg_originality"] or 0), 2) if aspect_ratings["avg_originality"] else None,
-            "direction": round(float(aspect_ratings["avg_direction"] or 0), 2) if aspect_ratings["avg_direction"] else None,
-            "total_ratings": aspect_ratings["total"],
+            "overall": None,
+            "plot": None,
+            "acting": None,
+            "cinematography": None,
+            "soundtrack": None,
+            "originality": None,
+            "direction": None,
+            "total_ratings": 0,
+            "histogram": {str(score): 0 for score in range(1, 6)},
         }
 
 
+class FilmSection(models.Model):
+    """One cached section of a film's aggregated payload with its own expiry."""
+
+    SECTION_CHOICES = [
+        ("metadata", "Metadata"),
+        ("credits", "Credits"),
+        ("images", "Images"),
+        ("videos", "Videos"),
+        ("parents_guide", "Parents Guide"),
+        ("certificates", "Certificates"),
+        ("release_dates", "Release Dates"),
+        ("trailer", "Trailer"),
+        ("streaming", "Streaming"),
+    ]
+
+    film = models.ForeignKey(Film, on_delete=models.CASCADE, related_name="sections")
+    section = models.CharField(max_length=32, choices=SECTION_CHOICES)
+    data = models.JSONField(null=True, blank=True, help_text="Legacy uncompressed data; new rows use blob")
+    blob = models.BinaryField(null=True, blank=True, editable=False)
+    available = models.BooleanField(
+        default=True,
+        help_text="False if upstream has never returned this section successfully",
+    )
+    failures = models.PositiveIntegerField(
+        default=0,
+        help_text="Consecutive failed refreshes; each one doubles the retry delay",
+    )
+    fetched_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = [["film", "section"]]
+        indexes = [
+            models.Index(fields=["film", "section"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.section} for {self.film.imdb_id}"
+
+    def get_data(self):
+        """Return the section data, decompressing it on access."""
+        if self.blob:
+            return decompress_json(self.blob)
+        return self.data
+
+
+class FilmFetchLock(models.Model):
+    """Cross-worker lock row held while one worker aggregates a cold film."""
+
+    imdb_id = models.CharField(max_length=20, unique=True)
+    owner = models.CharField(max_length=128)
+    acquired_at = models.DateTimeField(auto_now_add=True)
+    expires_at = models.DateTimeField(db_index=True)
+
+    def __str__(self) -> str:
+        return f"{self.imdb_id} locked by {self.owner} until {self.expires_at}"
+
+
+class WatchmodeTitle(models.Model):
+    """IMDb id to Watchmode title id mapping; the pairing never changes once known."""
+
+    SOURCE_CHOICES = [
+        ("lookup", "Search lookup"),
+        ("import", "Mapping file import"),
+    ]
+
+    imdb_id = models.CharField(max_length=20, unique=True)
+    watchmode_id = models.PositiveIntegerField()
+    source = models.CharField(max_length=16, choices=SOURCE_CHOICES, default="lookup")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"{self.imdb_id} -> {self.watchmode_id}"
+
+
+class StreamingAvailability(models.Model):
+    """One way to watch a film in one region, normalised from Watchmode's sources."""
+
+    TYPE_CHOICES = [
+        ("sub", "Subscription"),
+        ("free", "Free"),
+        ("rent", "Rent"),
+        ("buy", "Buy"),
+        ("tve", "TV Everywhere"),
+    ]
+
+    film = models.ForeignKey(Film, on_delete=models.CASCADE, related_name="availability")
+    region = models.CharField(max_length=2)
+    source_id = models.PositiveIntegerField()
+    service = models.CharField(max_length=128)
+    type = models.CharField(max_length=8, choices=TYPE_CHOICES)
+    format = models.CharField(max_length=8, blank=True, default="")
+    price = models.DecimalField(max_digits=8, decimal_places=2, null=True, blank=True)
+    web_url = models.URLField(max_length=1000, blank=True, default="")
+    last_seen = models.DateTimeField()
+
+    class Meta:
+        unique_together = [["film", "region", "source_id", "type", "format"]]
+        indexes = [
+            models.Index(fields=["region", "service", "type"]),
+            models.Index(fields=["film", "region"]),
+        ]
+
+    def __str__(self) -> str:
+        return f"{self.film_id} on {self.service} ({self.region}, {self.type})"
+
+
+class StreamingRefresh(models.Model):
+    """When a film's availability in a region was last refreshed, even if it had none."""
+
+    film = models.ForeignKey(Film, on_delete=models.CASCADE, related_name="streaming_refreshes")
+    region = models.CharField(max_length=2)
+    refreshed_at = models.DateTimeField(db_index=True)
+
+    class Meta:
+        unique_together = [["film", "region"]]
+
+    def __str__(self) -> str:
+        return f"{self.film_id} in {self.region} at {self.refreshed_at}"
+
+
+class TrailerFeed(models.Model):
+    """Materialised KinoCheck trailer feed, stored with its posters already resolved."""
+
+    FEED_CHOICES = [
+        ("latest", "Latest"),
+        ("trending", "Trending"),
+        ("genre", "Genre"),
+    ]
+
+    feed = models.CharField(max_length=16, choices=FEED_CHOICES)
+    genre = models.CharField(max_length=64, blank=True, default="")
+    items = models.JSONField(default=list)
+    etag = models.CharField(max_length=64)
+    refreshed_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = [["feed", "genre"]]
+
+    def __str__(self) -> str:
+        return f"{self.feed} trailers {self.genre}".rstrip()
+
+
+class FilmSearchDocument(models.Model):
+    """Diacritic-folded search text of a cached film, indexed by ``FilmSearchIndex``."""
+
+    film = models.OneToOneField(Film, on_delete=models.CASCADE, related_name="search_document")
+    title = models.CharField(max_length=512)
+    original_title = models.CharField(max_length=512, blank=True, default="")
+    akas = models.TextField(blank=True, default="", help_text="Alternate titles, one per line")
+    year = models.IntegerField(null=True, blank=True, db_index=True)
+    title_type = models.CharField(max_length=32, blank=True, default="")
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"search document of {self.film_id}"
+
+
+class IMDbSection(models.Model):
+    """Stored copy of one extended IMDb endpoint of a title, with every upstream page merged."""
+
+    imdb_id = models.CharField(max_length=32)
+    section = models.CharField(max_length=32)
+    data = models.JSONField(default=dict, help_text="Top-level fields of the first page, without the item list")
+    blob = models.BinaryField(editable=False, help_text="Compressed list of every item across all pages")
+    item_count = models.PositiveIntegerField(default=0)
+    complete = models.BooleanField(default=True, help_text="False if page walking stopped at EXTENDED_SECTION_MAX_PAGES")
+    etag = models.CharField(max_length=64)
+    fetched_at = models.DateTimeField()
+    expires_at = models.DateTimeField()
+
+    class Meta:
+        unique_together = [["imdb_id", "section"]]
+
+    def __str__(self) -> str:
+        return f"{self.section} for {self.imdb_id}"
+
+    def get_items(self):
+        """Return the stored items, decompressing them on access."""
+        return decompress_json(self.blob) if self.blob else []
+
+
 class Rating(models.Model):
     """Advanced multi-aspect rating system for films."""
 
@@ -124,6 +340,8 @@ class Rating(models.Model):
     rated_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FilmRelatedQuerySet.as_manager()
+
     class Meta:
         unique_together = [["user", "film"]]
         indexes = [
@@ -175,7 +393,61 @@ class Rating(models.Model):
             if calculated_overall:
                 self.overall_rating = calculated_overall
 
-        super().save(*args, **kwargs)
+        # FilmRatingStats is updated from post_save, inside the same transaction.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+# Optional rating aspects; each has a ``<aspect>_rating`` column on Rating.
+RATING_ASPECTS = ("plot", "acting", "cinematography", "soundtrack", "originality", "direction")
+
+
+class FilmRatingStats(models.Model):
+    """Running totals of a film's ratings, kept in step with every Rating write.
+
+    Averages are derived from sums and counts (aspects are optional, so
+    each has its own count) and ``overall_1`` .. ``overall_5`` hold the
+    histogram of overall ratings. Rows are updated with ``F()`` deltas by
+    ``films.services.rating_stats``; ``manage.py reconcile_rating_stats``
+    recomputes them from the ratings and reports any drift.
+    """
+
+    film = models.OneToOneField(Film, on_delete=models.CASCADE, primary_key=True, related_name="rating_stats")
+    ratings_count = models.IntegerField(default=0)
+    overall_sum = models.BigIntegerField(default=0)
+    overall_1 = models.IntegerField(default=0)
+    overall_2 = models.IntegerField(default=0)
+    overall_3 = models.IntegerField(default=0)
+    overall_4 = models.IntegerField(default=0)
+    overall_5 = models.IntegerField(default=0)
+    plot_sum = models.BigIntegerField(default=0)
+    plot_count = models.IntegerField(default=0)
+    acting_sum = models.BigIntegerField(default=0)
+    acting_count = models.IntegerField(default=0)
+    cinematography_sum = models.BigIntegerField(default=0)
+    cinematography_count = models.IntegerField(default=0)
+    soundtrack_sum = models.BigIntegerField(default=0)
+    soundtrack_count = models.IntegerField(default=0)
+    originality_sum = models.BigIntegerField(default=0)
+    originality_count = models.IntegerField(default=0)
+    direction_sum = models.BigIntegerField(default=0)
+    direction_count = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    def __str__(self) -> str:
+        return f"Rating stats for {self.film_id} ({self.ratings_count} ratings)"
+
+    def as_averages(self):
+        """Return the ``Film.get_average_ratings`` payload."""
+        if not self.ratings_count:
+            return Film.empty_average_ratings()
+        averages = {"overall": round(self.overall_sum / self.ratings_count, 2)}
+        for aspect in RATING_ASPECTS:
+            count = getattr(self, f"{aspect}_count")
+            averages[aspect] = round(getattr(self, f"{aspect}_sum") / count, 2) if count else None
+        averages["total_ratings"] = self.ratings_count
+        averages["histogram"] = {str(score): getattr(self, f"overall_{score}") for score in range(1, 6)}
+        return averages
 
 
 class List(models.Model):
@@ -212,6 +484,8 @@ class ListItem(models.Model):
     order = models.IntegerField(default=0, help_text="Position in the list")
     added_at = models.DateTimeField(auto_now_add=True)
 
+    objects = FilmRelatedQuerySet.as_manager()
+
     class Meta:
         unique_together = [["list", "film"]]
         indexes = [
@@ -284,6 +558,8 @@ class Review(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FilmRelatedQuerySet.as_manager()
+
     @property
     def contains_spoiler(self):
         """Check if review contains spoiler (manual or auto-detected) (FR06.3)."""
@@ -427,6 +703,8 @@ class Mood(models.Model):
     logged_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FilmRelatedQuerySet.as_manager()
+
     class Meta:
         unique_together = [["user", "film"]]
         indexes = [
@@ -523,6 +801,8 @@ class WatchedFilm(models.Model):
     watched_at = models.DateTimeField(auto_now_add=True, help_text="When the user marked the film as watched")
     updated_at = models.DateTimeField(auto_now=True)
 
+    objects = FilmRelatedQuerySet.as_manager()
+
     class Meta:
         unique_together = [["user", "film"]]
         indexes = [
@@ -281,20 +281,8 @@ class ReviewSerializer(serializers.ModelSerializer):
     content = serializers.SerializerMethodField()  # Override to handle spoiler hiding
     
     def get_film_poster_url(self, obj):
-        """Get poster URL from film.poster_url or from full_json metadata."""
-        if obj.film.poster_url:
-            return obj.film.poster_url
-        
-        # Fallback: extract from full_json metadata
-        if obj.film.full_json:
-            metadata = obj.film.full_json.get("metadata", {})
-            primary_image = metadata.get("primaryImage")
-            if isinstance(primary_image, dict):
-                return primary_image.get("url")
-            elif isinstance(primary_image, str):
-                return primary_image
-        
-        return None
+        """Get poster URL from film.poster_url (backfilled from metadata when the film is cached)."""
+        return obj.film.poster_url or None
 
     class Meta:
         model = Review
@@ -440,48 +428,16 @@ class WatchedFilmSerializer(serializers.ModelSerializer):
     film_poster_url = serializers.SerializerMethodField()
     
     def get_film_title(self, obj):
-        """Get film title from film.title or from full_json metadata."""
-        if obj.film.title:
-            return obj.film.title
-        
-        # Fallback: extract from full_json metadata
-        if obj.film.full_json:
-            metadata = obj.film.full_json.get("metadata", {})
-            title = metadata.get("primaryTitle") or metadata.get("title")
-            if title:
-                return title
-        
-        return None
+        """Get film title from the film.title column."""
+        return obj.film.title or None
     
     def get_film_year(self, obj):
-        """Get film year from film.year or from full_json metadata."""
-        if obj.film.year:
-            return obj.film.year
-        
-        # Fallback: extract from full_json metadata
-        if obj.film.full_json:
-            metadata = obj.film.full_json.get("metadata", {})
-            year = metadata.get("startYear") or metadata.get("year")
-            if year:
-                return year
-        
-        return None
+        """Get film year from the film.year column."""
+        return obj.film.year or None
     
     def get_film_poster_url(self, obj):
-        """Get poster URL from film.poster_url or from full_json metadata."""
-        if obj.film.poster_url:
-            return obj.film.poster_url
-        
-        # Fallback: extract from full_json metadata
-        if obj.film.full_json:
-            metadata = obj.film.full_json.get("metadata", {})
-            primary_image = metadata.get("primaryImage")
-            if isinstance(primary_image, dict):
-                return primary_image.get("url")
-            elif isinstance(primary_image, str):
-                return primary_image
-        
-        return None
+        """Get poster URL from film.poster_url (backfilled from metadata when the film is cached)."""
+        return obj.film.poster_url or None
 
     class Meta:
         model = WatchedFilm
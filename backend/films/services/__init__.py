@@ -1,13 +1,48 @@
 """Service layer for film caching and aggregation."""
 
 from .badge_service import BadgeService
-from .film_cache import FilmCacheService
+from .film_cache import FilmCacheService, film_payload_cache
 from .film_aggregator import FilmAggregatorService
+from .film_refresh import BackgroundRefresher, film_refresher
+from .federated_search import FederatedSearchService
+from .film_search import FilmSearchIndex, asearch_films, film_search_index, search_films
+from .imdb_sections import IMDB_SECTIONS, IMDbSectionService, SectionSnapshot
+from .rating_stats import apply_rating_change, reconcile_rating_stats
+from .single_flight import SingleFlight, film_fetch_flight, imdb_search_flight
+from .streaming_index import StreamingIndex, film_streaming_index
+from .title_suggest import PrefixIndex, TitleSuggestIndex, title_suggest_index
+from .trailer_feeds import FeedSnapshot, TrailerFeedService
+from .watchmode_ids import WatchmodeIdMap, watchmode_id_map
 
 __all__ = [
     "BadgeService",
     "FilmCacheService",
+    "film_payload_cache",
     "FilmAggregatorService",
+    "BackgroundRefresher",
+    "film_refresher",
+    "FederatedSearchService",
+    "FilmSearchIndex",
+    "film_search_index",
+    "search_films",
+    "asearch_films",
+    "IMDB_SECTIONS",
+    "IMDbSectionService",
+    "SectionSnapshot",
+    "apply_rating_change",
+    "reconcile_rating_stats",
+    "SingleFlight",
+    "film_fetch_flight",
+    "imdb_search_flight",
+    "StreamingIndex",
+    "film_streaming_index",
+    "PrefixIndex",
+    "TitleSuggestIndex",
+    "title_suggest_index",
+    "FeedSnapshot",
+    "TrailerFeedService",
+    "WatchmodeIdMap",
+    "watchmode_id_map",
 ]
 
 
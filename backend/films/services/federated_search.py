@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import base64
+import json
+import logging
+import math
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Dict, List, Optional, Tuple
+
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.db import connections
+from django.db.models import Count, Q
+
+from core.services import IMDbService
+from core.utils import deadline as request_deadline
+from core.utils.text import normalize_query
+from films.models import Rating, WatchedFilm
+from users.models import Follow
+
+from .film_search import film_search_index
+from .single_flight import SingleFlight, imdb_search_flight
+
+logger = logging.getLogger(__name__)
+
+# A friend who watched a film counts for more than a stranger's rating.
+FRIEND_WEIGHT = 2.0
+RATINGS_WEIGHT = 1.0
+
+
+def encode_page_token(query: str) -> str:
+    raw = json.dumps({"q": query, "s": "imdb"}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_page_token(token: str) -> str:
+    """Return the query of a follow-up ``token``; raises ValueError if it is not one of ours."""
+    try:
+        data = json.loads(base64.urlsafe_b64decode(token + "=" * (-len(token) % 4)))
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid page token")
+    if not isinstance(data, dict) or data.get("s") != "imdb" or not isinstance(data.get("q"), str):
+        raise ValueError("Invalid page token")
+    return data["q"]
+
+
+class FederatedSearchService:
+    """Search cached films, users and IMDb in one call under one latency budget.
+
+    The IMDb search runs on a worker thread while the local film index and
+    the user search run on the request thread. Whatever IMDb has answered
+    when ``FEDERATED_SEARCH_BUDGET`` seconds are up is merged in; otherwise
+    the response carries a ``next_page_token`` and the call keeps running
+    in the background. Its answer lands in the search result cache, so
+    ``follow_up`` with that token returns it without a second upstream call
+    (a follow-up arriving while it is still running joins it).
+
+    Films are deduplicated by IMDb id and ranked by their position in each
+    source, the number of ratings they have and how many of the requesting
+    user's followees watched them.
+    """
+
+    def __init__(
+        self,
+        imdb_service: Optional[IMDbService] = None,
+        single_flight: Optional[SingleFlight] = None,
+    ) -> None:
+        self.imdb_service = imdb_service or IMDbService()
+        self.single_flight = single_flight or imdb_search_flight
+
+    def search(self, query: str, user: Optional[User] = None) -> Dict[str, Any]:
+        limit = int(getattr(settings, "SEARCH_RESULTS_LIMIT", 10))
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="federated-search")
+        try:
+            remote = executor.submit(request_deadline.propagate(lambda: self._imdb_search(query)))
+            local = film_search_index.search(query, limit=limit)
+            users = self.search_users(query, user)
+            imdb, pending = self._collect(remote)
+        finally:
+            # The IMDb call may outlive the budget; it finishes (and is cached) in the background.
+            executor.shutdown(wait=False)
+        return {
+            "query": query,
+            "results": self.rank_films(local, imdb or [], user)[:limit],
+            "users": users,
+            "pending": ["imdb"] if pending else [],
+            "next_page_token": encode_page_token(query) if pending else None,
+        }
+
+    def follow_up(self, token: str, user: Optional[User] = None) -> Dict[str, Any]:
+        """Return the IMDb results a previous ``search`` did not wait for.
+
+        Raises ValueError for a token that is not from ``search``.
+        """
+        query = decode_page_token(token)
+        executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="federated-search")
+        try:
+            remote = executor.submit(request_deadline.propagate(lambda: self._imdb_search(query)))
+            imdb, pending = self._collect(remote)
+        finally:
+            executor.shutdown(wait=False)
+        # Films the first page already answered from the local index are not repeated.
+        seen = {item["imdb_id"] for item in film_search_index.search(query, limit=int(getattr(settings, "SEARCH_RESULTS_LIMIT", 10)))}
+        films = [item for item in imdb or [] if item.get("imdb_id") and item["imdb_id"] not in seen]
+        return {
+            "query": query,
+            "results": self.rank_films([], films, user),
+            "users": [],
+            "pending": ["imdb"] if pending else [],
+            "next_page_token": token if pending else None,
+        }
+
+    def rank_films(
+        self,
+        local: List[Dict[str, Any]],
+        remote: List[Dict[str, Any]],
+        user: Optional[User] = None,
+    ) -> List[Dict[str, Any]]:
+        """Merge local and IMDb results by IMDb id and order them by internal signals."""
+        films: Dict[str, Dict[str, Any]] = {}
+        relevance: Dict[str, float] = {}
+        for source, items in (("local", local), ("imdb", remote)):
+            for rank, item in enumerate(items):
+                imdb_id = item.get("imdb_id")
+                if not imdb_id:
+                    continue
+                if imdb_id not in films:
+                    films[imdb_id] = {**item, "source": source}
+                elif not films[imdb_id].get("image"):
+                    films[imdb_id]["image"] = item.get("image")
+                relevance[imdb_id] = max(relevance.get(imdb_id, 0.0), 1.0 / (rank + 1))
+
+        ratings, friends = self._signals(list(films), user)
+        for imdb_id, film in films.items():
+            film["ratings_count"] = ratings.get(imdb_id, 0)
+            film["friends_watched"] = friends.get(imdb_id, 0)
+            film["score"] = round(
+                relevance[imdb_id]
+                + RATINGS_WEIGHT * math.log1p(film["ratings_count"])
+                + FRIEND_WEIGHT * film["friends_watched"],
+                4,
+            )
+        return sorted(films.values(), key=lambda film: -film["score"])
+
+    def search_users(self, query: str, user: Optional[User] = None) -> List[Dict[str, Any]]:
+        """Users whose username or display name contains ``query``; followees and exact matches first."""
+        limit = int(getattr(settings, "FEDERATED_SEARCH_USERS_LIMIT", 5))
+        terms = query.strip()
+        if not terms:
+            return []
+        matches = list(
+            User.objects.filter(is_active=True)
+            .filter(Q(username__icontains=terms) | Q(profile__display_name__icontains=terms))
+            .values("id", "username", "profile__display_name", "profile__profile_picture_url")
+            .order_by("username")[:limit * 4]
+        )
+        followed = set()
+        if user is not None and user.is_authenticated:
+            followed = set(
+                Follow.objects.filter(follower=user, following_id__in=[row["id"] for row in matches])
+                .values_list("following_id", flat=True)
+            )
+        folded = normalize_query(terms)
+        matches.sort(key=lambda row: (
+            row["id"] not in followed,
+            normalize_query(row["username"]) != folded,
+            not normalize_query(row["username"]).startswith(folded),
+        ))
+        return [
+            {
+                "id": row["id"],
+                "username": row["username"],
+                "display_name": row["profile__display_name"] or "",
+                "profile_picture_url": row["profile__profile_picture_url"],
+                "is_following": row["id"] in followed,
+            }
+            for row in matches[:limit]
+        ]
+
+    def _imdb_search(self, query: str) -> List[Dict[str, Any]]:
+        try:
+            return self.single_flight.do(f"imdb-search:{normalize_query(query)}", lambda: self.imdb_service.search(query))
+        finally:
+            # This thread's search cache lookups opened its own connection.
+            connections.close_all()
+
+    def _collect(self, remote: Future) -> Tuple[Optional[List[Dict[str, Any]]], bool]:
+        """Wait for ``remote`` until the budget is spent; returns ``(results, still pending)``."""
+        done, _ = wait([remote], timeout=self._budget())
+        if not done:
+            return None, True
+        if remote.exception() is not None:
+            logger.warning("Federated IMDb search failed: %s", remote.exception())
+            return None, False
+        return remote.result(), False
+
+    @staticmethod
+    def _signals(imdb_ids: List[str], user: Optional[User]) -> Tuple[Dict[str, int], Dict[str, int]]:
+        if not imdb_ids:
+            return {}, {}
+        ratings = dict(
+            Rating.objects.filter(film__imdb_id__in=imdb_ids)
+            .values_list("film__imdb_id")
+            .annotate(count=Count("id"))
+            .order_by()
+        )
+        friends: Dict[str, int] = {}
+        if user is not None and user.is_authenticated:
+            friends = dict(
+                WatchedFilm.objects.filter(
+                    film__imdb_id__in=imdb_ids,
+                    user__in=Follow.objects.filter(follower=user).values("following"),
+                )
+                .values_list("film__imdb_id")
+                .annotate(count=Count("id"))
+                .order_by()
+            )
+        return ratings, friends
+
+    @staticmethod
+    def _budget() -> float:
+        """``FEDERATED_SEARCH_BUDGET``, capped by what is left of the request deadline."""
+        budget = float(getattr(settings, "FEDERATED_SEARCH_BUDGET", 0.8))
+        left = request_deadline.remaining()
+        if left is not None:
+            budget = min(budget, max(0.0, left))
+        return budget
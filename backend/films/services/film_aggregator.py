@@ -1,16 +1,70 @@
 from __future__ import annotations
 
+import asyncio
+import logging
 import re
-from typing import Any, Dict, List, Optional
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional, Tuple
 
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connections
 from django.http import Http404
 
-from core.services import IMDbService, KinoCheckService, WatchmodeService
-from .film_cache import FilmCacheService
+from core.services import (
+    AsyncIMDbService,
+    AsyncKinoCheckService,
+    AsyncWatchmodeService,
+    IMDbService,
+    KinoCheckService,
+    WatchmodeService,
+    is_not_found,
+    negative_cache,
+    streaming_regions,
+)
+from core.utils import deadline as request_deadline
+from .film_cache import FilmCacheService, poster_from_metadata
+from .film_refresh import BackgroundRefresher, film_refresher
+from .streaming_index import StreamingIndex, film_streaming_index
+from .watchmode_ids import WatchmodeIdMap, watchmode_id_map
+from .single_flight import (
+    AsyncSingleFlight,
+    SingleFlight,
+    acquire_film_fetch_lock,
+    async_film_fetch_flight,
+    await_other_worker,
+    film_fetch_flight,
+    film_fetch_lock,
+    release_film_fetch_lock,
+    wait_for_other_worker,
+)
+
+logger = logging.getLogger(__name__)
 
 IMDB_ID_PATTERN = re.compile(r"^tt\d+$")
 
 
+def _pool_task(fn: Callable[[], Any]) -> Callable[[], Any]:
+    """Wrap ``fn`` for an executor thread: run it under the caller's deadline
+    and close the database connections it opened (Watchmode id lookups, HTTP
+    and negative caches) when it is done, since nothing else ever will.
+    """
+    run = request_deadline.propagate(fn)
+
+    def task() -> Any:
+        try:
+            return run()
+        finally:
+            connections.close_all()
+
+    return task
+
+
+async def _awaited(fetch: Callable[[], Awaitable[Any]]) -> Any:
+    return await fetch()
+
+
 class FilmAggregatorService:
     """Aggregate data from external services and manage caching."""
 
@@ -20,11 +74,31 @@ class FilmAggregatorService:
         kino_service: Optional[KinoCheckService] = None,
         watchmode_service: Optional[WatchmodeService] = None,
         cache_service: Optional[FilmCacheService] = None,
+        concurrent: Optional[bool] = None,
+        single_flight: Optional[SingleFlight] = None,
+        refresher: Optional[BackgroundRefresher] = None,
+        async_imdb_service: Optional[AsyncIMDbService] = None,
+        async_kino_service: Optional[AsyncKinoCheckService] = None,
+        async_watchmode_service: Optional[AsyncWatchmodeService] = None,
+        async_single_flight: Optional[AsyncSingleFlight] = None,
+        watchmode_ids: Optional[WatchmodeIdMap] = None,
+        streaming_index: Optional[StreamingIndex] = None,
     ) -> None:
         self.imdb_service = imdb_service or IMDbService()
         self.kino_service = kino_service or KinoCheckService()
         self.watchmode_service = watchmode_service or WatchmodeService()
         self.cache_service = cache_service or FilmCacheService()
+        if concurrent is None:
+            concurrent = getattr(settings, "FILM_AGGREGATOR_CONCURRENT", True)
+        self.concurrent = concurrent
+        self.single_flight = single_flight or film_fetch_flight
+        self.refresher = refresher or film_refresher
+        self.async_imdb_service = async_imdb_service or AsyncIMDbService()
+        self.async_kino_service = async_kino_service or AsyncKinoCheckService()
+        self.async_watchmode_service = async_watchmode_service or AsyncWatchmodeService()
+        self.async_single_flight = async_single_flight or async_film_fetch_flight
+        self.watchmode_ids = watchmode_ids or watchmode_id_map
+        self.streaming_index = streaming_index or film_streaming_index
 
     def fetch_and_cache(self, imdb_id: str) -> Dict[str, Any]:
         """Return aggregated payload for the given IMDb id, using cache when valid.
@@ -32,93 +106,421 @@ class FilmAggregatorService:
         The method validates the IMDb id, checks cache freshness, and on cache miss
         or stale data, fetches from all external services, merges the result,
         persists it, and returns the combined payload including any warnings.
+
+        Only expired sections are refetched (see ``FilmCacheService``). With
+        stale-while-revalidate enabled, a payload whose earliest section
+        expired less than ``CACHE_MAX_STALE_HOURS`` ago is returned
+        immediately and refreshed in the background instead. Every payload
+        carries a ``cache`` block with its age and staleness.
+
+        Ids IMDb recently reported as missing raise ``Http404`` straight from
+        the negative cache without going upstream.
         """
         if not IMDB_ID_PATTERN.match(imdb_id):
             raise Http404("Invalid IMDb id")
 
-        if self.cache_service.is_fresh(imdb_id):
-            cached = self.cache_service.get_cached(imdb_id)
-            if cached:
-                return cached
+        entry = self.cache_service.get_cached_with_age(imdb_id)
+        if not entry and negative_cache.is_missing("imdb", imdb_id):
+            raise Http404("Film not found in IMDb")
+        served = self._serve_cached(imdb_id, entry)
+        if served is not None:
+            return served
 
-        warnings: List[str] = []
-        metadata: Dict[str, Any] = {}
-        credits: Dict[str, Any] = {}
-        images: Dict[str, Any] = {}
-        videos: Dict[str, Any] = {}
-        parents_guide: Dict[str, Any] = {}
-        certificates: Dict[str, Any] = {}
-        release_dates: Dict[str, Any] = {}
-        trailer: Optional[Dict[str, Any]] = None
-        streaming: List[Dict[str, Any]] = []
-
-        # IMDb group
-        try:
-            metadata = self.imdb_service.get_metadata(imdb_id)
-        except Exception:  # noqa: BLE001
+        # Concurrent misses for the same film share one aggregation. Each caller
+        # gets its own top-level copy because views add per-user keys to it.
+        payload = self.single_flight.do(imdb_id, lambda: self._fetch_across_workers(imdb_id))
+        return self._with_cache_info(imdb_id, payload, 0.0, stale=False)
+
+    async def afetch_and_cache(self, imdb_id: str) -> Dict[str, Any]:
+        """``fetch_and_cache`` for async views.
+
+        Cache and lock reads and writes run in a worker thread (the ORM is
+        sync only); a cold fetch fans out to the async upstream services on
+        the event loop instead of a thread pool.
+        """
+        if not IMDB_ID_PATTERN.match(imdb_id):
+            raise Http404("Invalid IMDb id")
+
+        entry = await sync_to_async(self.cache_service.get_cached_with_age)(imdb_id)
+        if not entry and await sync_to_async(negative_cache.is_missing)("imdb", imdb_id):
             raise Http404("Film not found in IMDb")
+        served = self._serve_cached(imdb_id, entry)
+        if served is not None:
+            return served
 
-        try:
-            credits = self.imdb_service.get_credits(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("credits_unavailable")
+        payload = await self.async_single_flight.do(imdb_id, lambda: self._afetch_across_workers(imdb_id))
+        return self._with_cache_info(imdb_id, payload, 0.0, stale=False)
 
-        try:
-            images = self.imdb_service.get_images(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("images_unavailable")
+    def _serve_cached(
+        self, imdb_id: str, entry: Optional[Tuple[Dict[str, Any], float, float]]
+    ) -> Optional[Dict[str, Any]]:
+        """Return the cached payload if it is fresh or may be served stale, else None."""
+        if not entry:
+            return None
+        cached, age, overdue = entry
+        if overdue < 0:
+            return self._with_cache_info(imdb_id, cached, age, stale=False)
+        max_stale_seconds = getattr(settings, "CACHE_MAX_STALE_HOURS", 24 * 7) * 3600
+        if getattr(settings, "CACHE_STALE_WHILE_REVALIDATE", True) and overdue < max_stale_seconds:
+            self.refresher.schedule(imdb_id, lambda: self._refresh(imdb_id))
+            return self._with_cache_info(imdb_id, cached, age, stale=True)
+        return None
 
-        try:
-            videos = self.imdb_service.get_videos(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("videos_unavailable")
+    def hydrate(self, imdb_id: str) -> Dict[str, Any]:
+        """Synchronously fetch and persist any expired sections of ``imdb_id``.
 
-        try:
-            parents_guide = self.imdb_service.get_parents_guide(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("parents_guide_unavailable")
+        Unlike ``fetch_and_cache`` this never serves a stale payload while
+        refreshing in the background; bulk warm-up uses it so the cache is
+        actually populated when it returns.
+        """
+        if not IMDB_ID_PATTERN.match(imdb_id):
+            raise Http404("Invalid IMDb id")
+        if negative_cache.is_missing("imdb", imdb_id):
+            raise Http404("Film not found in IMDb")
+        return self.single_flight.do(imdb_id, lambda: self._fetch_across_workers(imdb_id))
 
-        try:
-            certificates = self.imdb_service.get_certificates(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("certificates_unavailable")
+    def resolve_posters(self, imdb_ids: Iterable[str]) -> Dict[str, str]:
+        """Return the IMDb poster URL of each film in ``imdb_ids`` that has one.
 
-        try:
-            release_dates = self.imdb_service.get_release_dates(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("release_dates_unavailable")
+        Trailer feeds only need a poster per film, so this never aggregates
+        inline: stored posters come from one Film query, the rest from
+        metadata-only IMDb fetches run in parallel under the aggregation
+        deadline. Films fetched that way get their full aggregation queued
+        on the background refresher, so the next feed finds them stored.
+        """
+        ids = list(dict.fromkeys(imdb_id for imdb_id in imdb_ids if IMDB_ID_PATTERN.match(imdb_id)))
+        posters = self.cache_service.get_posters(ids)
+        misses = self._poster_misses(ids, posters)
+        if not misses:
+            return posters
 
-        # KinoCheck trailer
+        max_workers = min(len(misses), int(getattr(settings, "FILM_POSTER_MAX_WORKERS", 8)))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="film-poster")
         try:
-            trailer = self.kino_service.get_trailer(imdb_id)
-        except Exception:  # noqa: BLE001
-            warnings.append("trailer_unavailable")
+            futures = {
+                imdb_id: executor.submit(
+                    _pool_task(lambda imdb_id=imdb_id: self.imdb_service.get_metadata(imdb_id))
+                )
+                for imdb_id in misses
+            }
+            wait(futures.values(), timeout=self._aggregation_budget())
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        results = {
+            imdb_id: future.exception() or future.result()
+            for imdb_id, future in futures.items()
+            if future.done() and not future.cancelled()
+        }
+        posters.update(self._posters_from_metadata(results))
+        return posters
+
+    async def aresolve_posters(self, imdb_ids: Iterable[str]) -> Dict[str, str]:
+        """``resolve_posters`` for async views; metadata is fetched as tasks on the event loop."""
+        ids = list(dict.fromkeys(imdb_id for imdb_id in imdb_ids if IMDB_ID_PATTERN.match(imdb_id)))
+        posters = await sync_to_async(self.cache_service.get_posters)(ids)
+        misses = await sync_to_async(self._poster_misses)(ids, posters)
+        if not misses:
+            return posters
+
+        tasks = {imdb_id: asyncio.ensure_future(self.async_imdb_service.get_metadata(imdb_id)) for imdb_id in misses}
+        done, pending = await asyncio.wait(tasks.values(), timeout=self._aggregation_budget())
+        for task in pending:
+            task.cancel()
+        results = {imdb_id: task.exception() or task.result() for imdb_id, task in tasks.items() if task in done}
+        posters.update(await sync_to_async(self._posters_from_metadata)(results))
+        return posters
+
+    @staticmethod
+    def _poster_misses(ids: List[str], posters: Dict[str, str]) -> List[str]:
+        """Ids without a stored poster, minus those IMDb recently reported as missing."""
+        return [imdb_id for imdb_id in ids if imdb_id not in posters and not negative_cache.is_missing("imdb", imdb_id)]
 
-        # Watchmode streaming
+    def _posters_from_metadata(self, results: Dict[str, Any]) -> Dict[str, str]:
+        """Extract posters from metadata fetches (a dict or the exception raised per id).
+
+        Films that fetched fine are queued for full aggregation; definitive
+        misses go to the negative cache; other failures are left for the next
+        request to retry.
+        """
+        posters: Dict[str, str] = {}
+        for imdb_id, result in results.items():
+            if isinstance(result, BaseException):
+                if is_not_found(result):
+                    negative_cache.mark_missing("imdb", imdb_id)
+                else:
+                    logger.warning("Poster lookup for %s failed: %s", imdb_id, result)
+                continue
+            poster = poster_from_metadata(result)
+            if poster:
+                posters[imdb_id] = poster
+            self.refresher.schedule(imdb_id, lambda imdb_id=imdb_id: self._refresh(imdb_id))
+        return posters
+
+    def _with_cache_info(self, imdb_id: str, payload: Dict[str, Any], age: float, stale: bool) -> Dict[str, Any]:
+        """Return a shallow copy of ``payload`` annotated with cache age metadata."""
+        return {
+            **payload,
+            "cache": {
+                "age_seconds": int(age),
+                "stale": stale,
+                "refreshing": stale and self.refresher.is_pending(imdb_id),
+            },
+        }
+
+    def _refresh(self, imdb_id: str) -> None:
+        """Background revalidation of a stale film; skipped if another worker is on it."""
+        with film_fetch_lock(imdb_id) as acquired:
+            if acquired and not self.cache_service.is_fresh(imdb_id, use_cache=False):
+                self._aggregate(imdb_id)
+
+    def _get_fresh_cached(self, imdb_id: str) -> Optional[Dict[str, Any]]:
+        # Bypass the payload cache: it is what told us the film was stale.
+        if self.cache_service.is_fresh(imdb_id, use_cache=False):
+            return self.cache_service.get_cached(imdb_id, use_cache=False)
+        return None
+
+    def _fetch_across_workers(self, imdb_id: str) -> Dict[str, Any]:
+        """Aggregate ``imdb_id`` unless another worker is already doing it.
+
+        The worker that takes the film's lock row aggregates; the others poll
+        the cache until that worker has stored the payload. If the wait times
+        out they aggregate themselves rather than fail the request.
+        """
+        with film_fetch_lock(imdb_id) as acquired:
+            if acquired:
+                # Another worker may have finished between our miss and the lock.
+                return self._get_fresh_cached(imdb_id) or self._aggregate(imdb_id)
+
+        self.single_flight.record("cross_process_waits")
+        if wait_for_other_worker(imdb_id, lambda: self.cache_service.is_fresh(imdb_id, use_cache=False)):
+            cached = self.cache_service.get_cached(imdb_id, use_cache=False)
+            if cached:
+                return cached
+        self.single_flight.record("cross_process_fallbacks")
+        return self._aggregate(imdb_id)
+
+    async def _afetch_across_workers(self, imdb_id: str) -> Dict[str, Any]:
+        """Async ``_fetch_across_workers``."""
+        owner = await sync_to_async(acquire_film_fetch_lock)(imdb_id)
+        if owner is not None:
+            try:
+                cached = await sync_to_async(self._get_fresh_cached)(imdb_id)
+                return cached or await self._aaggregate(imdb_id)
+            finally:
+                await sync_to_async(release_film_fetch_lock)(imdb_id, owner)
+
+        self.single_flight.record("cross_process_waits")
+        if await await_other_worker(imdb_id, lambda: self.cache_service.is_fresh(imdb_id, use_cache=False)):
+            cached = await sync_to_async(self.cache_service.get_cached)(imdb_id, use_cache=False)
+            if cached:
+                return cached
+        self.single_flight.record("cross_process_fallbacks")
+        return await self._aaggregate(imdb_id)
+
+    async def _aaggregate(self, imdb_id: str) -> Dict[str, Any]:
+        """Async ``_aggregate``: sections are fetched as tasks on the event loop."""
+        names = await sync_to_async(self.cache_service.expired_sections)(imdb_id)
+        fetched, failed = await self._fetch_as_tasks(imdb_id, names)
+        payload = await sync_to_async(self.cache_service.save_sections)(imdb_id, fetched, failed)
+        await sync_to_async(self._index_streaming)(imdb_id, fetched)
+        return payload
+
+    def _aggregate(self, imdb_id: str) -> Dict[str, Any]:
+        """Refetch the expired sections from upstream, persist them and return the payload."""
+        names = self.cache_service.expired_sections(imdb_id)
+        if self.concurrent:
+            fetched, failed = self._fetch_concurrently(imdb_id, names)
+        else:
+            fetched, failed = self._fetch_sequentially(imdb_id, names)
+        payload = self.cache_service.save_sections(imdb_id, fetched, failed)
+        self._index_streaming(imdb_id, fetched)
+        return payload
+
+    def _index_streaming(self, imdb_id: str, fetched: Dict[str, Any]) -> None:
+        """Mirror freshly fetched streaming sources into the ``StreamingIndex``."""
+        if "streaming" not in fetched:
+            return
         try:
-            title_id = self.watchmode_service.lookup_title_id(imdb_id)
-            if title_id is not None:
-                streaming = self.watchmode_service.get_streaming_sources(title_id)
+            self.streaming_index.record(imdb_id, fetched["streaming"] or [], streaming_regions())
         except Exception:  # noqa: BLE001
-            warnings.append("streaming_unavailable")
-
-        payload: Dict[str, Any] = {
-            "imdb_id": imdb_id,
-            "title": metadata.get("title"),
-            "metadata": metadata,
-            "credits": credits,
-            "images": images,
-            "videos": videos,
-            "parents_guide": parents_guide,
-            "certificates": certificates,
-            "release_dates": release_dates,
-            "trailer": trailer,
-            "streaming": streaming,
-            "warnings": warnings,
+            # The payload is already stored; a stale index row is not worth failing the request.
+            logger.warning("Could not index streaming sources for %s", imdb_id, exc_info=True)
+
+    @staticmethod
+    def _metadata_failed(imdb_id: str, exc: BaseException) -> None:
+        """Raise ``Http404`` for a failed metadata fetch, remembering definitive misses."""
+        if is_not_found(exc):
+            negative_cache.mark_missing("imdb", imdb_id)
+        raise Http404("Film not found in IMDb")
+
+    def _section_fetchers(self, imdb_id: str, names: Iterable[str]) -> Dict[str, Callable[[], Any]]:
+        """Return fetchers for the requested optional sections, keyed by name.
+
+        Each section that fails is reported as ``<name>_unavailable`` in the
+        payload warnings and falls back to its previous or empty value.
+        """
+        fetchers = {
+            "credits": lambda: self.imdb_service.get_credits(imdb_id),
+            "images": lambda: self.imdb_service.get_images(imdb_id),
+            "videos": lambda: self.imdb_service.get_videos(imdb_id),
+            "parents_guide": lambda: self.imdb_service.get_parents_guide(imdb_id),
+            "certificates": lambda: self.imdb_service.get_certificates(imdb_id),
+            "release_dates": lambda: self.imdb_service.get_release_dates(imdb_id),
+            "trailer": lambda: self.kino_service.get_trailer(imdb_id),
+            "streaming": lambda: self._fetch_streaming(imdb_id),
         }
+        return {name: fetchers[name] for name in names if name in fetchers}
 
-        self.cache_service.save_cache(imdb_id, payload)
-        return payload
+    def _async_section_fetchers(self, imdb_id: str, names: Iterable[str]) -> Dict[str, Callable[[], Awaitable[Any]]]:
+        """``_section_fetchers`` backed by the async services."""
+        fetchers = {
+            "credits": lambda: self.async_imdb_service.get_credits(imdb_id),
+            "images": lambda: self.async_imdb_service.get_images(imdb_id),
+            "videos": lambda: self.async_imdb_service.get_videos(imdb_id),
+            "parents_guide": lambda: self.async_imdb_service.get_parents_guide(imdb_id),
+            "certificates": lambda: self.async_imdb_service.get_certificates(imdb_id),
+            "release_dates": lambda: self.async_imdb_service.get_release_dates(imdb_id),
+            "trailer": lambda: self.async_kino_service.get_trailer(imdb_id),
+            "streaming": lambda: self._afetch_streaming(imdb_id),
+        }
+        return {name: fetchers[name] for name in names if name in fetchers}
+
+    async def _afetch_streaming(self, imdb_id: str) -> List[Dict[str, Any]]:
+        title_id = await self.watchmode_ids.aresolve(imdb_id, self.async_watchmode_service.lookup_title_id)
+        if title_id is None:
+            return []
+        return await self.async_watchmode_service.get_streaming_sources(title_id)
+
+    def _fetch_streaming(self, imdb_id: str) -> List[Dict[str, Any]]:
+        """Resolve the Watchmode title id and return its streaming sources.
+
+        The id comes from ``WatchmodeIdMap`` when known, so only the first
+        refresh of a film pays for the ``/search/`` lookup.
+        """
+        title_id = self.watchmode_ids.resolve(imdb_id, self.watchmode_service.lookup_title_id)
+        if title_id is None:
+            return []
+        return self.watchmode_service.get_streaming_sources(title_id)
+
+    def _fetch_sequentially(self, imdb_id: str, names: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """Fetch the requested sections one after another."""
+        fetched: Dict[str, Any] = {}
+        if "metadata" in names:
+            try:
+                fetched["metadata"] = self.imdb_service.get_metadata(imdb_id)
+            except Exception as exc:  # noqa: BLE001
+                self._metadata_failed(imdb_id, exc)
+
+        failed: List[str] = []
+        for name, fetch in self._section_fetchers(imdb_id, names).items():
+            left = request_deadline.remaining()
+            if left is not None and left <= 0:
+                failed.append(name)
+                continue
+            try:
+                fetched[name] = fetch()
+            except Exception:  # noqa: BLE001
+                failed.append(name)
+        return fetched, failed
+
+    def _fetch_concurrently(self, imdb_id: str, names: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """Fetch the requested sections in parallel under one overall deadline.
+
+        Metadata is still authoritative: if it fails (or misses the deadline)
+        the remaining sections are abandoned and ``Http404`` is raised. Sections
+        that fail or are still running when the deadline expires are reported
+        as failed exactly like the sequential path. The deadline never outlasts
+        the request's own (see ``core.utils.deadline``), which the workers
+        inherit.
+        """
+        fetchers = self._section_fetchers(imdb_id, names)
+        max_workers = int(getattr(settings, "FILM_AGGREGATOR_MAX_WORKERS", len(fetchers) + 1))
+        deadline = time.monotonic() + self._aggregation_budget()
+
+        fetched: Dict[str, Any] = {}
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="film-aggregator")
+        try:
+            metadata_future = None
+            if "metadata" in names:
+                metadata_future = executor.submit(
+                    _pool_task(lambda: self.imdb_service.get_metadata(imdb_id))
+                )
+            futures: Dict[str, Future] = {
+                name: executor.submit(_pool_task(fetch)) for name, fetch in fetchers.items()
+            }
+
+            if metadata_future is not None:
+                done, _ = wait([metadata_future], timeout=max(0.0, deadline - time.monotonic()))
+                if metadata_future not in done:
+                    raise Http404("Film not found in IMDb")
+                if metadata_future.exception() is not None:
+                    self._metadata_failed(imdb_id, metadata_future.exception())
+                fetched["metadata"] = metadata_future.result()
+
+            wait(futures.values(), timeout=max(0.0, deadline - time.monotonic()))
+        finally:
+            # Never block the request thread on stragglers past the deadline.
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        failed: List[str] = []
+        for name, future in futures.items():
+            if future.done() and not future.cancelled() and future.exception() is None:
+                fetched[name] = future.result()
+                continue
+            if not future.done():
+                logger.warning("Section %s for %s missed the aggregation deadline", name, imdb_id)
+            failed.append(name)
+        return fetched, failed
+
+    async def _fetch_as_tasks(self, imdb_id: str, names: List[str]) -> Tuple[Dict[str, Any], List[str]]:
+        """``_fetch_concurrently`` for the async path: one task per section, same deadline rules."""
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self._aggregation_budget()
+        tasks: Dict[str, asyncio.Future] = {}
+        metadata_task = None
+        fetched: Dict[str, Any] = {}
+        try:
+            # Fetchers are called inside their tasks, so even one that fails
+            # before awaiting anything only fails its own section.
+            for name, fetch in self._async_section_fetchers(imdb_id, names).items():
+                tasks[name] = asyncio.ensure_future(_awaited(fetch))
+            if "metadata" in names:
+                metadata_task = asyncio.ensure_future(_awaited(lambda: self.async_imdb_service.get_metadata(imdb_id)))
 
+            if metadata_task is not None:
+                done, _ = await asyncio.wait([metadata_task], timeout=max(0.0, deadline - loop.time()))
+                if metadata_task not in done:
+                    raise Http404("Film not found in IMDb")
+                if metadata_task.exception() is not None:
+                    self._metadata_failed(imdb_id, metadata_task.exception())
+                fetched["metadata"] = metadata_task.result()
+            if tasks:
+                await asyncio.wait(tasks.values(), timeout=max(0.0, deadline - loop.time()))
+        finally:
+            for task in [metadata_task, *tasks.values()]:
+                if task is None:
+                    continue
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # mark failures as retrieved; they are reported below
 
+        failed: List[str] = []
+        for name, task in tasks.items():
+            if task.done() and not task.cancelled() and task.exception() is None:
+                fetched[name] = task.result()
+                continue
+            if not task.done():
+                logger.warning("Section %s for %s missed the aggregation deadline", name, imdb_id)
+            failed.append(name)
+        return fetched, failed
 
+    @staticmethod
+    def _aggregation_budget() -> float:
+        """``FILM_AGGREGATOR_DEADLINE``, capped by what is left of the request deadline."""
+        budget = float(getattr(settings, "FILM_AGGREGATOR_DEADLINE", 15))
+        left = request_deadline.remaining()
+        if left is not None:
+            budget = min(budget, max(0.0, left))
+        return budget
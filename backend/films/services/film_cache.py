@@ -1,61 +1,317 @@
 from __future__ import annotations
 
-from datetime import timedelta
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 
 from django.conf import settings
+from django.db import transaction
 from django.utils import timezone
 
-from films.models import Film
+from core.services.tiered_cache import MISSING, TieredCache
+from core.utils.compression import compress_json, decompress_json
+from films.models import Film, FilmSection
+
+from .payload_projection import trim_section
+
+FILM_SECTIONS: List[str] = [name for name, _ in FilmSection.SECTION_CHOICES]
+
+# Upstream data changes at very different rates: streaming availability turns
+# over within hours while credits and certificates almost never change.
+DEFAULT_SECTION_TTL_HOURS: Dict[str, float] = {
+    "metadata": 24,
+    "credits": 24 * 30,
+    "images": 24 * 7,
+    "videos": 24 * 7,
+    "parents_guide": 24 * 30,
+    "certificates": 24 * 30,
+    "release_dates": 24 * 7,
+    "trailer": 24,
+    "streaming": 6,
+}
+
+# Read-through cache of ``(full_json, cached_at, expires_at)`` per IMDb id.
+film_payload_cache = TieredCache("film")
+
+
+def section_default(name: str) -> Any:
+    """Return the empty value used for a section that has never been fetched."""
+    if name == "trailer":
+        return None
+    if name == "streaming":
+        return []
+    return {}
+
+
+def poster_from_metadata(metadata: Optional[Dict[str, Any]]) -> Optional[str]:
+    """Return the poster URL of an IMDb metadata section, if it has one."""
+    metadata = metadata or {}
+    # Extract poster URL from metadata.primaryImage.url (IMDb format)
+    primary_image = metadata.get("primaryImage")
+    poster_url = None
+    if isinstance(primary_image, dict):
+        poster_url = primary_image.get("url")
+    elif isinstance(primary_image, str):
+        poster_url = primary_image
+    # Fallback to metadata.poster_url if primaryImage is not available
+    return poster_url or metadata.get("poster_url") or None
 
 
 class FilmCacheService:
-    """Service responsible for reading and writing cached film payloads."""
+    """Service responsible for reading and writing cached film payloads.
+
+    Each payload section is stored as its own ``FilmSection`` row with an
+    independent TTL, so an expired section can be refreshed without
+    refetching the rest. Sections are trimmed to the fields the API serves
+    (see ``payload_projection``) and stored zlib-compressed, so a section is
+    only decompressed when it is read. ``Film.full_json`` keeps a small
+    summary (title, metadata, warnings) and ``Film.expires_at`` the earliest
+    section expiry.
 
-    def get_cached(self, imdb_id: str) -> Optional[Dict[str, Any]]:
+    Payload reads go through ``film_payload_cache`` (in-process LRU, then the
+    shared ``CACHES`` backend, then the Film row). Every write through
+    ``save_sections`` and every Film save or delete invalidates the entry.
+    """
+
+    def get_cached(self, imdb_id: str, use_cache: bool = True) -> Optional[Dict[str, Any]]:
         """Return cached payload for the given IMDb id if present."""
-        try:
-            film = Film.objects.get(imdb_id=imdb_id)
-        except Film.DoesNotExist:
+        entry = self._load(imdb_id, use_cache)
+        return entry[0] if entry else None
+
+    def get_cached_with_age(self, imdb_id: str) -> Optional[Tuple[Dict[str, Any], float, float]]:
+        """Return the cached payload, its age and how overdue it is.
+
+        Age is seconds since the payload was last written; overdue is seconds
+        past the earliest section expiry (negative while still fresh).
+        Returns None when there is no row, no payload or no ``cached_at``.
+        """
+        entry = self._load(imdb_id)
+        if not entry or not entry[0]:
             return None
-        return film.full_json
+        payload, cached_at, expires_at = entry
+        now = timezone.now()
+        return payload, max(0.0, (now - cached_at).total_seconds()), (now - expires_at).total_seconds()
+
+    def invalidate(self, imdb_id: str) -> None:
+        """Drop the cached payload of ``imdb_id`` from every cache tier."""
+        film_payload_cache.delete(imdb_id)
+
+    def get_section(self, imdb_id: str, name: str) -> Optional[Tuple[Any, bool]]:
+        """Return ``(data, is_fresh)`` for one cached section, reading only its row."""
+        row = (
+            FilmSection.objects.filter(film__imdb_id=imdb_id, section=name)
+            .values_list("data", "blob", "expires_at")
+            .first()
+        )
+        if not row:
+            return None
+        data, blob, expires_at = row
+        if blob:
+            data = decompress_json(blob)
+        return data, expires_at > timezone.now()
+
+    def get_posters(self, imdb_ids: Iterable[str]) -> Dict[str, str]:
+        """Return the stored poster URL of each film in ``imdb_ids`` that has one.
+
+        One query reading only the poster column; no payload is loaded.
+        """
+        rows = (
+            Film.objects.filter(imdb_id__in=list(imdb_ids), poster_url__isnull=False)
+            .exclude(poster_url="")
+            .values_list("imdb_id", "poster_url")
+        )
+        return dict(rows)
+
+    def expired_sections(self, imdb_id: str) -> List[str]:
+        """Return the sections of ``imdb_id`` that are missing or past their TTL."""
+        fresh = set(
+            FilmSection.objects.filter(
+                film__imdb_id=imdb_id,
+                expires_at__gt=timezone.now(),
+            ).values_list("section", flat=True)
+        )
+        return [name for name in FILM_SECTIONS if name not in fresh]
 
     def save_cache(self, imdb_id: str, payload: Dict[str, Any]) -> None:
         """Persist the given payload into the Film cache row."""
-        metadata = payload.get("metadata", {})
-        # Extract poster URL from metadata.primaryImage.url (IMDb format)
-        primary_image = metadata.get("primaryImage")
-        poster_url = None
-        if isinstance(primary_image, dict):
-            poster_url = primary_image.get("url")
-        elif isinstance(primary_image, str):
-            poster_url = primary_image
-        # Fallback to metadata.poster_url if primaryImage is not available
-        if not poster_url:
-            poster_url = metadata.get("poster_url")
-        
-        # Extract title from payload or metadata
-        title = payload.get("title") or metadata.get("primaryTitle") or metadata.get("title") or ""
-        
-        defaults = {
-            "title": title,
-            "year": metadata.get("startYear") or metadata.get("year"),
-            "poster_url": poster_url,
-            "full_json": payload,
-            "cached_at": timezone.now(),
+        warnings = payload.get("warnings") or []
+        failed = [name for name in FILM_SECTIONS if f"{name}_unavailable" in warnings]
+        fetched = {name: payload[name] for name in FILM_SECTIONS if name in payload and name not in failed}
+        self.save_sections(imdb_id, fetched, failed, title=payload.get("title"))
+
+    def save_sections(
+        self,
+        imdb_id: str,
+        fetched: Dict[str, Any],
+        failed: Iterable[str] = (),
+        title: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Store freshly fetched sections, then reassemble and return the full payload.
+
+        Sections in ``failed`` keep their previous data if they ever had any
+        and are retried with backoff (see ``retry_delay``); sections that
+        never succeeded are reported as ``<name>_unavailable`` warnings.
+        """
+        now = timezone.now()
+
+        with transaction.atomic():
+            film, _ = Film.objects.get_or_create(imdb_id=imdb_id, defaults={"title": title or ""})
+            rows = {row.section: row for row in film.sections.all()}
+            to_create: List[FilmSection] = []
+            to_update: List[FilmSection] = []
+
+            for name, data in fetched.items():
+                row = rows.get(name)
+                if row is None:
+                    row = FilmSection(film=film, section=name)
+                    rows[name] = row
+                    to_create.append(row)
+                else:
+                    to_update.append(row)
+                row.data = None
+                row.blob = compress_json(trim_section(name, data))
+                row.available = True
+                row.failures = 0
+                row.fetched_at = now
+                row.expires_at = now + timedelta(hours=self.section_ttl_hours(name))
+
+            for name in failed:
+                row = rows.get(name)
+                if row is None:
+                    row = FilmSection(
+                        film=film,
+                        section=name,
+                        blob=compress_json(section_default(name)),
+                        available=False,
+                        fetched_at=now,
+                    )
+                    rows[name] = row
+                    to_create.append(row)
+                else:
+                    to_update.append(row)
+                row.failures += 1
+                row.expires_at = now + self.retry_delay(name, row.failures)
+
+            FilmSection.objects.bulk_create(to_create)
+            if to_update:
+                FilmSection.objects.bulk_update(
+                    to_update, ["data", "blob", "available", "failures", "fetched_at", "expires_at"]
+                )
+
+            sections = {name: (row.get_data(), row.available) for name, row in rows.items()}
+            payload = self._assemble(imdb_id, sections, title, film.title)
+            self._apply_metadata(film, payload, title)
+            film.full_json = self._summary(payload)
+            film.cached_at = now
+            film.expires_at = min(row.expires_at for row in rows.values()) if rows else now
+            film.save()
+            # Film.save() already invalidated the entry; drop it again once the
+            # write is visible so a concurrent reader cannot re-cache old data.
+            transaction.on_commit(lambda: self.invalidate(imdb_id))
+        return payload
+
+    def is_fresh(self, imdb_id: str, use_cache: bool = True) -> bool:
+        """Return True if no cached section of the record has expired.
+
+        Pass ``use_cache=False`` to read the row itself, e.g. when polling for
+        another worker's write that this process's LRU cannot know about.
+        """
+        entry = self._load(imdb_id, use_cache)
+        return bool(entry) and entry[2] > timezone.now()
+
+    def _load(self, imdb_id: str, use_cache: bool = True) -> Optional[Tuple[Dict[str, Any], datetime, datetime]]:
+        """Return ``(payload, cached_at, expires_at)`` through the tiered cache.
+
+        Returns None for films that were never cached (no ``cached_at``).
+        """
+        if use_cache:
+            entry = film_payload_cache.get(imdb_id)
+            if entry is not MISSING:
+                return entry
+
+        row = (
+            Film.objects.filter(imdb_id=imdb_id)
+            .values_list("id", "title", "full_json", "cached_at", "expires_at")
+            .first()
+        )
+        if not row or not row[3]:
+            return None
+        film_id, title, summary, cached_at, expires_at = row
+        sections = {
+            name: (decompress_json(blob) if blob else data, available)
+            for name, data, blob, available in FilmSection.objects.filter(film_id=film_id).values_list(
+                "section", "data", "blob", "available"
+            )
         }
-        Film.objects.update_or_create(imdb_id=imdb_id, defaults=defaults)
+        # Films cached before sections existed still carry the whole payload in full_json.
+        payload = self._assemble(imdb_id, sections, (summary or {}).get("title"), title) if sections else summary
+        entry = (payload, cached_at, expires_at or self._legacy_expiry(cached_at))
+        # Nothing is served once a payload is past its maximum staleness, so
+        # there is no point keeping it cached any longer than that.
+        max_stale = timedelta(hours=getattr(settings, "CACHE_MAX_STALE_HOURS", 24 * 7))
+        remaining = (entry[2] + max_stale - timezone.now()).total_seconds()
+        if remaining > 0:
+            film_payload_cache.set(imdb_id, entry, timeout=remaining)
+        return entry
 
-    def is_fresh(self, imdb_id: str) -> bool:
-        """Return True if the cached record is within the configured TTL."""
-        try:
-            film = Film.objects.get(imdb_id=imdb_id)
-        except Film.DoesNotExist:
-            return False
-        if not film.cached_at:
-            return False
-        ttl_hours = getattr(settings, "CACHE_TTL_HOURS", 24)
-        return film.cached_at + timedelta(hours=ttl_hours) > timezone.now()
+    @staticmethod
+    def section_ttl_hours(name: str) -> float:
+        """Return the TTL for a section, honouring ``FILM_SECTION_TTL_HOURS`` overrides."""
+        overrides = getattr(settings, "FILM_SECTION_TTL_HOURS", {}) or {}
+        if name in overrides:
+            return float(overrides[name])
+        return float(DEFAULT_SECTION_TTL_HOURS.get(name, getattr(settings, "CACHE_TTL_HOURS", 24)))
 
+    @classmethod
+    def retry_delay(cls, name: str, failures: int) -> timedelta:
+        """How long to wait before refetching a section that failed ``failures`` times in a row.
+
+        Starts at ``FILM_SECTION_RETRY_MINUTES`` and doubles per failure up to
+        the section's TTL, so a section that is permanently unavailable
+        upstream stops dragging the film's ``expires_at`` (the earliest
+        section expiry) down to a few minutes.
+        """
+        base = float(getattr(settings, "FILM_SECTION_RETRY_MINUTES", 15))
+        minutes = base * 2 ** min(max(failures - 1, 0), 20)
+        return timedelta(minutes=min(minutes, cls.section_ttl_hours(name) * 60))
+
+    @staticmethod
+    def _legacy_expiry(cached_at: datetime) -> datetime:
+        """Expiry for rows cached before per-section TTLs existed."""
+        return cached_at + timedelta(hours=getattr(settings, "CACHE_TTL_HOURS", 24))
+
+    @staticmethod
+    def _assemble(
+        imdb_id: str,
+        sections: Dict[str, Tuple[Any, bool]],
+        title: Optional[str],
+        fallback_title: Optional[str] = None,
+    ) -> Dict[str, Any]:
+        """Build the API payload from ``{section: (data, available)}``."""
+        metadata = sections["metadata"][0] if "metadata" in sections else {}
+        metadata = metadata or {}
+        payload: Dict[str, Any] = {
+            "imdb_id": imdb_id,
+            "title": title or metadata.get("primaryTitle") or metadata.get("title") or fallback_title or None,
+        }
+        warnings: List[str] = []
+        for name in FILM_SECTIONS:
+            data, available = sections.get(name, (section_default(name), True))
+            payload[name] = data
+            if not available:
+                warnings.append(f"{name}_unavailable")
+        payload["warnings"] = warnings
+        return payload
 
+    @staticmethod
+    def _summary(payload: Dict[str, Any]) -> Dict[str, Any]:
+        """The part of the payload kept uncompressed on the Film row."""
+        return {key: payload.get(key) for key in ("imdb_id", "title", "metadata", "warnings")}
 
+    @staticmethod
+    def _apply_metadata(film: Film, payload: Dict[str, Any], title: Optional[str]) -> None:
+        """Copy title, year and poster from the payload metadata onto the Film row."""
+        metadata = payload.get("metadata") or {}
+        poster_url = poster_from_metadata(metadata)
+        film.title = title or metadata.get("primaryTitle") or metadata.get("title") or film.title or ""
+        film.year = metadata.get("startYear") or metadata.get("year") or film.year
+        film.poster_url = poster_url or film.poster_url
@@ -0,0 +1,78 @@
+from __future__ import annotations
+
+import logging
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Dict, Optional, Set
+
+from django.conf import settings
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class BackgroundRefresher:
+    """Run deduplicated cache refreshes on a small background thread pool.
+
+    A key that is already queued or running is not scheduled again, so a
+    popular stale film is refreshed once no matter how many requests see it.
+    The pool is created lazily and rebuilt after a fork, because worker
+    threads do not survive into gunicorn children.
+    """
+
+    def __init__(self, max_workers: Optional[int] = None) -> None:
+        self._max_workers = max_workers
+        self._lock = threading.Lock()
+        self._pending: Set[str] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pid = os.getpid()
+        self._stats = {"scheduled": 0, "deduplicated": 0, "failed": 0}
+
+    def schedule(self, key: str, fn: Callable[[], object]) -> bool:
+        """Queue ``fn`` for ``key`` unless a refresh for it is already pending.
+
+        Returns True if a new refresh was queued.
+        """
+        with self._lock:
+            if self._pid != os.getpid():
+                self._executor = None
+                self._pending = set()
+                self._pid = os.getpid()
+            if key in self._pending:
+                self._stats["deduplicated"] += 1
+                return False
+            self._pending.add(key)
+            self._stats["scheduled"] += 1
+            if self._executor is None:
+                workers = self._max_workers or int(getattr(settings, "FILM_REFRESH_WORKERS", 2))
+                self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="film-refresh")
+            executor = self._executor
+
+        executor.submit(self._run, key, fn)
+        return True
+
+    def _run(self, key: str, fn: Callable[[], object]) -> None:
+        close_old_connections()
+        try:
+            fn()
+        except Exception:  # noqa: BLE001
+            with self._lock:
+                self._stats["failed"] += 1
+            logger.warning("Background refresh failed for %s", key, exc_info=True)
+        finally:
+            with self._lock:
+                self._pending.discard(key)
+            close_old_connections()
+
+    def is_pending(self, key: str) -> bool:
+        with self._lock:
+            return key in self._pending
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the refresh counters plus currently pending keys."""
+        with self._lock:
+            return {**self._stats, "pending": len(self._pending)}
+
+
+film_refresher = BackgroundRefresher()
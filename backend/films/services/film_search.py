@@ -0,0 +1,213 @@
+from __future__ import annotations
+
+import re
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import connection
+from django.db.models import Case, IntegerField, Q, Value, When
+
+from core.services import AsyncIMDbService, IMDbService
+from core.utils.text import fold
+from films.models import Film, FilmSearchDocument, IMDbSection
+
+FTS_TABLE = "films_filmsearch_fts"
+YEAR_PATTERN = re.compile(r"^(18[89]\d|19\d\d|20\d\d|2100)$")
+
+# Must match the expression of the GIN index created by migration 0021.
+_PG_DOCUMENT = "to_tsvector('simple', d.title || ' ' || d.original_title || ' ' || d.akas)"
+
+
+def search_terms(query: str) -> Tuple[List[str], Optional[int]]:
+    """Split a query into folded word tokens and an optional release year."""
+    tokens = re.findall(r"\w+", fold(query))
+    years = [token for token in tokens if YEAR_PATTERN.match(token)]
+    # A lone number is a title ("1917", "2012"), not a year filter.
+    if years and len(tokens) > 1:
+        tokens.remove(years[-1])
+        return tokens, int(years[-1])
+    return tokens, None
+
+
+def _limited(sql: str, params: List[Any], limit: Optional[int]) -> Tuple[str, List[Any]]:
+    if limit is None:
+        return sql, params
+    return f"{sql} LIMIT %s", params + [limit]
+
+
+class FilmSearchIndex:
+    """Local full-text search over cached films.
+
+    Every Film has a ``FilmSearchDocument`` holding its title, original
+    title, AKAs (from the stored ``akas`` section) and year, folded to
+    lower case without diacritics. The documents are indexed with FTS5 on
+    SQLite and ``tsvector``/trigram on Postgres (created by migration 0021)
+    and ranked with title matches first. Films are reindexed whenever they
+    are saved or their AKAs are refetched; ``rebuild_search_index``
+    backfills existing rows.
+    """
+
+    def __init__(self) -> None:
+        self._backend: Optional[str] = None
+
+    @property
+    def backend(self) -> str:
+        """``fts5``, ``postgres``, ``postgres_trgm`` or ``basic``, detected once per process."""
+        if self._backend is None:
+            self._backend = self._detect_backend()
+        return self._backend
+
+    def index(self, imdb_ids: Iterable[str]) -> int:
+        """(Re)build the documents of ``imdb_ids``; returns how many were written."""
+        films = list(
+            Film.objects.filter(imdb_id__in=list(imdb_ids)).with_payload().only("id", "imdb_id", "title", "year", "full_json")
+        )
+        akas = self._akas([film.imdb_id for film in films])
+        for film in films:
+            self.index_film(film, akas.get(film.imdb_id, []))
+        return len(films)
+
+    def index_film(self, film: Film, akas: Optional[List[str]] = None) -> None:
+        """Write the document of ``film``; ``akas`` are looked up unless given.
+
+        Called from the Film ``post_save`` signal, so a film loaded without
+        its payload keeps the original title and type already indexed.
+        """
+        if akas is None:
+            akas = self._akas([film.imdb_id]).get(film.imdb_id, [])
+        defaults: Dict[str, Any] = {
+            "title": fold(film.title)[:512],
+            "akas": "\n".join(dict.fromkeys(fold(aka) for aka in akas if aka)),
+            "year": film.year,
+        }
+        if "full_json" not in film.get_deferred_fields():
+            metadata = (film.full_json or {}).get("metadata") or {}
+            defaults["original_title"] = fold(metadata.get("originalTitle"))[:512]
+            defaults["title_type"] = str(metadata.get("type") or "")[:32]
+        FilmSearchDocument.objects.update_or_create(film_id=film.pk, defaults=defaults)
+
+    def search(self, query: str, limit: Optional[int] = 10) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` (None = all) cached films matching ``query``, best first.
+
+        Results have the ``SearchResultSerializer`` shape.
+        """
+        tokens, year = search_terms(query)
+        if not tokens:
+            return []
+        if self.backend == "fts5":
+            rows = self._search_fts5(tokens, year, limit)
+        elif self.backend.startswith("postgres"):
+            rows = self._search_postgres(tokens, year, fold(query), limit)
+        else:
+            rows = self._search_basic(tokens, year, limit)
+        return [
+            {"imdb_id": imdb_id, "title": title, "year": film_year, "image": poster_url, "type": title_type or None}
+            for imdb_id, title, film_year, poster_url, title_type in rows
+        ]
+
+    def _search_fts5(self, tokens: List[str], year: Optional[int], limit: Optional[int]) -> List[tuple]:
+        # Every token must match, the last one as a prefix of a word (search-as-you-type).
+        match = " ".join(f'"{token}"' for token in tokens[:-1]) + f' "{tokens[-1]}"*'
+        sql = (
+            "SELECT f.imdb_id, f.title, f.year, f.poster_url, d.title_type "
+            f"FROM {FTS_TABLE} "
+            f"JOIN films_filmsearchdocument d ON d.id = {FTS_TABLE}.rowid "
+            "JOIN films_film f ON f.id = d.film_id "
+            f"WHERE {FTS_TABLE} MATCH %s "
+            f"ORDER BY CASE WHEN d.year = %s THEN 0 ELSE 1 END, bm25({FTS_TABLE}, 10.0, 5.0, 1.0)"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(*_limited(sql, [match.strip(), year], limit))
+            return cursor.fetchall()
+
+    def _search_postgres(self, tokens: List[str], year: Optional[int], folded: str, limit: Optional[int]) -> List[tuple]:
+        tsquery = " & ".join(f"{token}:*" for token in tokens)
+        rank = f"ts_rank({_PG_DOCUMENT}, to_tsquery('simple', %s))"
+        where = f"{_PG_DOCUMENT} @@ to_tsquery('simple', %s)"
+        params: List[Any] = [tsquery]
+        if self.backend == "postgres_trgm":
+            # Trigram similarity also finds misspelt titles the tsquery misses.
+            where += " OR d.title %% %s"
+            rank += " + similarity(d.title, %s)"
+            params.append(folded)
+        sql = (
+            "SELECT f.imdb_id, f.title, f.year, f.poster_url, d.title_type "
+            "FROM films_filmsearchdocument d JOIN films_film f ON f.id = d.film_id "
+            f"WHERE {where} "
+            f"ORDER BY CASE WHEN d.year = %s THEN 0 ELSE 1 END, {rank} DESC"
+        )
+        with connection.cursor() as cursor:
+            cursor.execute(*_limited(sql, params + [year] + params, limit))
+            return cursor.fetchall()
+
+    def _search_basic(self, tokens: List[str], year: Optional[int], limit: Optional[int]) -> List[tuple]:
+        documents = FilmSearchDocument.objects.all()
+        for token in tokens:
+            documents = documents.filter(Q(title__contains=token) | Q(original_title__contains=token) | Q(akas__contains=token))
+        documents = documents.annotate(
+            year_rank=Case(When(year=year, then=Value(0)), default=Value(1), output_field=IntegerField())
+        ).order_by("year_rank", "title")
+        return list(
+            documents.values_list("film__imdb_id", "film__title", "film__year", "film__poster_url", "title_type")[:limit]
+        )
+
+    @staticmethod
+    def _akas(imdb_ids: List[str]) -> Dict[str, List[str]]:
+        akas: Dict[str, List[str]] = {}
+        for row in IMDbSection.objects.filter(imdb_id__in=imdb_ids, section="akas"):
+            akas[row.imdb_id] = [str(item.get("text") or "") for item in row.get_items() if isinstance(item, dict)]
+        return akas
+
+    @staticmethod
+    def _detect_backend() -> str:
+        tables = connection.introspection.table_names()
+        if connection.vendor == "sqlite":
+            return "fts5" if FTS_TABLE in tables else "basic"
+        if connection.vendor == "postgresql":
+            with connection.cursor() as cursor:
+                cursor.execute("SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm'")
+                return "postgres_trgm" if cursor.fetchone() else "postgres"
+        return "basic"
+
+
+film_search_index = FilmSearchIndex()
+
+
+def search_films(
+    query: str,
+    imdb_service: Optional[IMDbService] = None,
+    more: bool = False,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Search the local index first and IMDb only to fill the gaps.
+
+    IMDb is queried when fewer than ``SEARCH_LOCAL_MIN_RESULTS`` cached films
+    match, or always with ``more``. Returns ``(results, searched_imdb)``;
+    local results come first and IMDb results never repeat them.
+    """
+    results = film_search_index.search(query, limit=int(getattr(settings, "SEARCH_RESULTS_LIMIT", 10)))
+    if not _needs_imdb(results, more):
+        return results, False
+    return merge_results(results, (imdb_service or IMDbService()).search(query)), True
+
+
+async def asearch_films(
+    query: str,
+    imdb_service: Optional[AsyncIMDbService] = None,
+    more: bool = False,
+) -> Tuple[List[Dict[str, Any]], bool]:
+    """Async ``search_films``."""
+    limit = int(getattr(settings, "SEARCH_RESULTS_LIMIT", 10))
+    results = await sync_to_async(film_search_index.search)(query, limit=limit)
+    if not _needs_imdb(results, more):
+        return results, False
+    return merge_results(results, await (imdb_service or AsyncIMDbService()).search(query)), True
+
+
+def _needs_imdb(local: List[Dict[str, Any]], more: bool) -> bool:
+    return more or len(local) < int(getattr(settings, "SEARCH_LOCAL_MIN_RESULTS", 5))
+
+
+def merge_results(local: List[Dict[str, Any]], remote: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    seen = {item["imdb_id"] for item in local}
+    return local + [item for item in remote if item.get("imdb_id") and item["imdb_id"] not in seen]
@@ -0,0 +1,246 @@
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.utils import timezone
+
+from core.services import AsyncIMDbService, IMDbService
+from core.utils.compression import compress_json
+from films.models import IMDbSection
+
+from .film_refresh import BackgroundRefresher, film_refresher
+from .film_search import film_search_index
+from .single_flight import AsyncSingleFlight, SingleFlight, async_film_fetch_flight, film_fetch_flight
+
+
+@dataclass(frozen=True)
+class SectionSpec:
+    """How one extended IMDb endpoint is fetched and stored."""
+
+    resource: str
+    # The list field IMDbAPI paginates with ``pageToken``; None for single-object endpoints.
+    items_key: Optional[str]
+    ttl_hours: float
+
+
+# Award nominations, credits and certificates of a released title are close to
+# immutable; episode lists and box office figures move while a title is running.
+IMDB_SECTIONS: Dict[str, SectionSpec] = {
+    "credits": SectionSpec("credits", "credits", 24 * 30),
+    "release_dates": SectionSpec("releaseDates", "releaseDates", 24 * 7),
+    "akas": SectionSpec("akas", "akas", 24 * 30),
+    "seasons": SectionSpec("seasons", "seasons", 24),
+    "episodes": SectionSpec("episodes", "episodes", 24),
+    "images": SectionSpec("images", "images", 24 * 7),
+    "videos": SectionSpec("videos", "videos", 24 * 7),
+    "award_nominations": SectionSpec("awardNominations", "awardNominations", 24 * 30),
+    "parents_guide": SectionSpec("parentsGuide", "parentsGuide", 24 * 30),
+    "certificates": SectionSpec("certificates", "certificates", 24 * 30),
+    "company_credits": SectionSpec("companyCredits", "companyCredits", 24 * 30),
+    "box_office": SectionSpec("boxOffice", None, 24 * 7),
+}
+
+
+def encode_cursor(offset: int) -> str:
+    return base64.urlsafe_b64encode(f"o:{offset}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str]) -> int:
+    """Return the item offset of ``cursor``; raises ValueError if it is not one of ours."""
+    if not cursor:
+        return 0
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
+    prefix, _, offset = raw.partition(":")
+    if prefix != "o" or not offset.isdigit():
+        raise ValueError("Invalid cursor")
+    return int(offset)
+
+
+def merge_pages(spec: SectionSpec, pages: List[Dict[str, Any]]) -> Tuple[Dict[str, Any], List[Any], bool]:
+    """Merge upstream pages into ``(top-level fields, all items, complete)``."""
+    first = dict(pages[0] or {})
+    complete = not (pages[-1] or {}).get("nextPageToken")
+    first.pop("nextPageToken", None)
+    if spec.items_key is None:
+        return first, [], True
+    items: List[Any] = []
+    for page in pages:
+        items.extend((page or {}).get(spec.items_key) or [])
+    first.pop(spec.items_key, None)
+    return first, items, complete
+
+
+@dataclass
+class SectionSnapshot:
+    """A stored extended section as served."""
+
+    data: Dict[str, Any]
+    items: List[Any]
+    etag: str
+    complete: bool = True
+    fetched_at: Optional[datetime] = None
+    stale: bool = False
+
+
+class IMDbSectionService:
+    """Serve the extended IMDb endpoints from stored ``IMDbSection`` rows.
+
+    The first request for a title's section walks every upstream page
+    (``pageToken``, up to ``EXTENDED_SECTION_MAX_PAGES``) and stores the
+    merged item list, so clients page through the local copy with opaque
+    cursors instead of hitting IMDbAPI. Each section has its own TTL
+    (``IMDB_SECTIONS``, overridable with ``EXTENDED_SECTION_TTL_HOURS``);
+    an expired copy is still served and refetched in the background.
+    Concurrent cold requests for the same section share one fetch.
+    """
+
+    def __init__(
+        self,
+        imdb_service: Optional[IMDbService] = None,
+        async_imdb_service: Optional[AsyncIMDbService] = None,
+        refresher: Optional[BackgroundRefresher] = None,
+        single_flight: Optional[SingleFlight] = None,
+        async_single_flight: Optional[AsyncSingleFlight] = None,
+    ) -> None:
+        self.imdb_service = imdb_service or IMDbService()
+        self._async_imdb_service = async_imdb_service
+        self.refresher = refresher or film_refresher
+        self.single_flight = single_flight or film_fetch_flight
+        self.async_single_flight = async_single_flight or async_film_fetch_flight
+
+    @property
+    def async_imdb_service(self) -> AsyncIMDbService:
+        # Built on first use: its client belongs to the event loop that first awaits it.
+        if self._async_imdb_service is None:
+            self._async_imdb_service = AsyncIMDbService()
+        return self._async_imdb_service
+
+    def serve(self, imdb_id: str, name: str) -> SectionSnapshot:
+        """Return the stored section, fetching it only if it was never stored."""
+        snapshot = self.get(imdb_id, name)
+        if snapshot is None:
+            return self.single_flight.do(self._key(imdb_id, name), lambda: self.refresh(imdb_id, name))
+        if snapshot.stale:
+            self.refresher.schedule(self._key(imdb_id, name), lambda: self.refresh(imdb_id, name))
+        return snapshot
+
+    async def aserve(self, imdb_id: str, name: str) -> SectionSnapshot:
+        """Async ``serve``: a cold section is fetched on the event loop."""
+        snapshot = await sync_to_async(self.get)(imdb_id, name)
+        if snapshot is None:
+            return await self.async_single_flight.do(self._key(imdb_id, name), lambda: self.arefresh(imdb_id, name))
+        if snapshot.stale:
+            self.refresher.schedule(self._key(imdb_id, name), lambda: self.refresh(imdb_id, name))
+        return snapshot
+
+    def get(self, imdb_id: str, name: str) -> Optional[SectionSnapshot]:
+        row = IMDbSection.objects.filter(imdb_id=imdb_id, section=name).first()
+        if row is None:
+            return None
+        return SectionSnapshot(
+            row.data,
+            row.get_items(),
+            row.etag,
+            row.complete,
+            row.fetched_at,
+            stale=row.expires_at <= timezone.now(),
+        )
+
+    def refresh(self, imdb_id: str, name: str) -> SectionSnapshot:
+        """Fetch every page of a section from IMDbAPI and store it."""
+        return self.store(imdb_id, name, self.fetch_pages(imdb_id, name))
+
+    async def arefresh(self, imdb_id: str, name: str) -> SectionSnapshot:
+        return await sync_to_async(self.store)(imdb_id, name, await self.afetch_pages(imdb_id, name))
+
+    def fetch_pages(self, imdb_id: str, name: str) -> List[Dict[str, Any]]:
+        spec = IMDB_SECTIONS[name]
+        pages = [self.imdb_service.get_title_page(imdb_id, spec.resource)]
+        while (token := self._next_token(spec, pages)) is not None:
+            pages.append(self.imdb_service.get_title_page(imdb_id, spec.resource, token))
+        return pages
+
+    async def afetch_pages(self, imdb_id: str, name: str) -> List[Dict[str, Any]]:
+        spec = IMDB_SECTIONS[name]
+        pages = [await self.async_imdb_service.get_title_page(imdb_id, spec.resource)]
+        while (token := self._next_token(spec, pages)) is not None:
+            pages.append(await self.async_imdb_service.get_title_page(imdb_id, spec.resource, token))
+        return pages
+
+    def store(self, imdb_id: str, name: str, pages: List[Dict[str, Any]]) -> SectionSnapshot:
+        data, items, complete = merge_pages(IMDB_SECTIONS[name], pages)
+        blob = compress_json(items)
+        now = timezone.now()
+        snapshot = SectionSnapshot(data, items, self._etag(data, blob), complete, now)
+        IMDbSection.objects.update_or_create(
+            imdb_id=imdb_id,
+            section=name,
+            defaults={
+                "data": data,
+                "blob": blob,
+                "item_count": len(items),
+                "complete": complete,
+                "etag": snapshot.etag,
+                "fetched_at": now,
+                "expires_at": now + timedelta(hours=self.ttl_hours(name)),
+            },
+        )
+        if name == "akas":
+            film_search_index.index([imdb_id])
+        return snapshot
+
+    @staticmethod
+    def ttl_hours(name: str) -> float:
+        """Return the TTL of a section, honouring ``EXTENDED_SECTION_TTL_HOURS`` overrides."""
+        overrides = getattr(settings, "EXTENDED_SECTION_TTL_HOURS", {}) or {}
+        if name in overrides:
+            return float(overrides[name])
+        return IMDB_SECTIONS[name].ttl_hours
+
+    @staticmethod
+    def _next_token(spec: SectionSpec, pages: List[Dict[str, Any]]) -> Optional[str]:
+        if spec.items_key is None or len(pages) >= int(getattr(settings, "EXTENDED_SECTION_MAX_PAGES", 20)):
+            return None
+        token = (pages[-1] or {}).get("nextPageToken")
+        # A token we already followed would loop forever.
+        if not token or any((page or {}).get("nextPageToken") == token for page in pages[:-1]):
+            return None
+        return token
+
+    @staticmethod
+    def _etag(data: Dict[str, Any], blob: bytes) -> str:
+        digest = hashlib.sha256(blob)
+        digest.update(json.dumps(data, sort_keys=True, separators=(",", ":"), default=str).encode("utf-8"))
+        return digest.hexdigest()[:32]
+
+    @staticmethod
+    def _key(imdb_id: str, name: str) -> str:
+        return f"imdb-section:{imdb_id}:{name}"
+
+
+def section_page(spec: SectionSpec, snapshot: SectionSnapshot, offset: int, limit: int) -> Dict[str, Any]:
+    """Return one cursor page of a stored section in IMDbAPI's shape.
+
+    ``nextCursor`` replaces upstream's ``nextPageToken`` and is None on the last page.
+    """
+    if spec.items_key is None:
+        return dict(snapshot.data)
+    page = snapshot.items[offset:offset + limit]
+    end = offset + len(page)
+    return {
+        **snapshot.data,
+        spec.items_key: page,
+        "count": len(snapshot.items),
+        "complete": snapshot.complete,
+        "nextCursor": encode_cursor(end) if end < len(snapshot.items) else None,
+    }
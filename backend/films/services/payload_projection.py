@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+from typing import Any, Dict, Union
+
+# A projection declares which parts of an upstream section the API serves.
+#
+# * ``True`` keeps the value as-is.
+# * A dict keeps only the listed keys, each projected by its own spec; for a
+#   list of objects the dict is applied to every item.
+#
+# Only fields are dropped, never list items: the film detail page searches
+# whole lists (e.g. the credits for the director). Sections without an entry
+# are stored whole. Keep these in sync with what the serializers and the
+# film detail page actually read.
+Projection = Union[bool, Dict[str, Any]]
+
+_IMAGE = {"url": True, "width": True, "height": True}
+_NAME = {"id": True, "displayName": True, "primaryImage": _IMAGE}
+
+SECTION_PROJECTIONS: Dict[str, Projection] = {
+    "credits": {
+        "credits": {"name": _NAME, "category": True, "characters": True},
+        "totalCount": True,
+    },
+    "images": {
+        "images": {"url": True, "width": True, "height": True, "type": True},
+        "totalCount": True,
+    },
+    "videos": {
+        "videos": {
+            "id": True,
+            "type": True,
+            "name": True,
+            "primaryImage": _IMAGE,
+            "runtimeSeconds": True,
+        },
+        "totalCount": True,
+    },
+}
+
+
+def project(value: Any, spec: Projection) -> Any:
+    """Return the part of ``value`` selected by ``spec``."""
+    if spec is True or value is None:
+        return value
+    if isinstance(value, list):
+        return [project(item, spec) for item in value]
+    if isinstance(value, dict):
+        return {key: project(value[key], sub) for key, sub in spec.items() if key in value}
+    return value
+
+
+def trim_section(name: str, data: Any) -> Any:
+    """Drop the fields of section ``name`` that the API never reads."""
+    spec = SECTION_PROJECTIONS.get(name)
+    if spec is None:
+        return data
+    # An upstream shape we do not recognise is stored whole rather than emptied.
+    if isinstance(spec, dict) and isinstance(data, dict) and not spec.keys() & data.keys():
+        return data
+    return project(data, spec)
@@ -0,0 +1,146 @@
+from __future__ import annotations
+
+from collections import Counter, defaultdict
+from contextlib import nullcontext
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from django.db import transaction
+from django.db.models import Count, F, Q, Sum
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from films.models import RATING_ASPECTS, Film, FilmRatingStats, Rating
+
+STATS_FIELDS = [
+    "ratings_count",
+    "overall_sum",
+    *(f"overall_{score}" for score in range(1, 6)),
+    *(f"{aspect}_{kind}" for aspect in RATING_ASPECTS for kind in ("sum", "count")),
+]
+RATING_FIELDS = ["film_id", "overall_rating", *(f"{aspect}_rating" for aspect in RATING_ASPECTS)]
+
+
+def rating_values(rating: Rating) -> Dict[str, Any]:
+    """The columns of ``rating`` that feed its film's stats."""
+    return {field: getattr(rating, field) for field in RATING_FIELDS}
+
+
+def contribution(values: Dict[str, Any]) -> Counter:
+    """What one rating adds to its film's ``FilmRatingStats`` fields."""
+    overall = values["overall_rating"] or 0
+    added = Counter({"ratings_count": 1, "overall_sum": overall})
+    if 1 <= overall <= 5:
+        added[f"overall_{overall}"] += 1
+    for aspect in RATING_ASPECTS:
+        value = values[f"{aspect}_rating"]
+        if value is not None:
+            added[f"{aspect}_sum"] += value
+            added[f"{aspect}_count"] += 1
+    return added
+
+
+def apply_rating_change(old: Optional[Dict[str, Any]], new: Optional[Dict[str, Any]]) -> None:
+    """Move the stats of the affected film(s) from rating ``old`` to rating ``new``.
+
+    ``old`` is None for a created rating and ``new`` None for a deleted one.
+    Deltas are applied with ``F()`` expressions, so concurrent writes to the
+    same film never lose each other's updates.
+    """
+    deltas: Dict[Any, Counter] = defaultdict(Counter)
+    if old is not None:
+        deltas[old["film_id"]].subtract(contribution(old))
+    if new is not None:
+        deltas[new["film_id"]].update(contribution(new))
+    with transaction.atomic():
+        for film_id, delta in deltas.items():
+            changes = {field: F(field) + value for field, value in delta.items() if value}
+            if not changes:
+                continue
+            if delta["ratings_count"] > 0:
+                FilmRatingStats.objects.get_or_create(film_id=film_id)
+            # Otherwise the row exists unless the film itself is being deleted, and then there is nothing to update.
+            FilmRatingStats.objects.filter(film_id=film_id).update(**changes, updated_at=timezone.now())
+
+
+def compute_rating_stats(film_ids: Iterable[Any]) -> Dict[Any, Dict[str, int]]:
+    """Recompute the stats of ``film_ids`` from their ratings in one grouped query."""
+    aggregates: Dict[str, Any] = {
+        "ratings_count": Count("pk"),
+        "overall_sum": Coalesce(Sum("overall_rating"), 0),
+    }
+    for score in range(1, 6):
+        aggregates[f"overall_{score}"] = Count("pk", filter=Q(overall_rating=score))
+    for aspect in RATING_ASPECTS:
+        aggregates[f"{aspect}_sum"] = Coalesce(Sum(f"{aspect}_rating"), 0)
+        aggregates[f"{aspect}_count"] = Count(f"{aspect}_rating")
+    rows = Rating.objects.filter(film_id__in=list(film_ids)).values("film_id").annotate(**aggregates).order_by()
+    return {row.pop("film_id"): row for row in rows}
+
+
+def reconcile_rating_stats(batch_size: int = 1000, apply: bool = True) -> Dict[str, Any]:
+    """Recompute every film's stats in batches and report (and by default fix) drift.
+
+    Returns counts of films ``checked``, rows ``missing``, rows that
+    ``drifted`` from their ratings and ``orphaned`` rows of films without
+    ratings, plus ``examples`` of drifted film ids.
+
+    When applying, each batch runs in one transaction that first creates the
+    missing rows and locks every stats row of the batch, so a rating saved
+    meanwhile either lands before the recount (and is counted) or waits for
+    it (and applies its delta on top); neither is lost.
+    """
+    film_ids = sorted(
+        set(Rating.objects.values_list("film_id", flat=True).distinct().order_by())
+        | set(FilmRatingStats.objects.values_list("film_id", flat=True)),
+        key=str,
+    )
+    report: Dict[str, Any] = {"checked": 0, "missing": 0, "drifted": 0, "orphaned": 0, "examples": []}
+    for start in range(0, len(film_ids), batch_size):
+        batch = film_ids[start:start + batch_size]
+        with transaction.atomic() if apply else nullcontext():
+            _reconcile_batch(batch, apply, report)
+    return report
+
+
+def _reconcile_batch(batch: List[Any], apply: bool, report: Dict[str, Any]) -> None:
+    rows = FilmRatingStats.objects.filter(film_id__in=batch)
+    existing = set(rows.values_list("film_id", flat=True))
+    if apply:
+        # Films deleted since the listing get no row.
+        missing = Film.objects.filter(pk__in=[film_id for film_id in batch if film_id not in existing])
+        FilmRatingStats.objects.bulk_create(
+            [FilmRatingStats(film_id=film_id) for film_id in missing.values_list("pk", flat=True)],
+            ignore_conflicts=True,
+        )
+        rows = rows.select_for_update()
+    stored = {row.pop("film_id"): row for row in rows.values("film_id", *STATS_FIELDS)}
+    expected = compute_rating_stats(batch)
+
+    fixes: List[Tuple[Any, Dict[str, int]]] = []
+    orphans = []
+    for film_id in batch:
+        report["checked"] += 1
+        if film_id not in expected:
+            if any(stored.get(film_id, {}).values()):
+                report["orphaned"] += 1
+                orphans.append(film_id)
+            continue
+        if film_id not in existing:
+            report["missing"] += 1
+        elif stored[film_id] != expected[film_id]:
+            report["drifted"] += 1
+            if len(report["examples"]) < 10:
+                report["examples"].append(str(film_id))
+        else:
+            continue
+        fixes.append((film_id, expected[film_id]))
+    if not apply:
+        return
+    if fixes:
+        now = timezone.now()
+        FilmRatingStats.objects.bulk_update(
+            [FilmRatingStats(film_id=film_id, updated_at=now, **values) for film_id, values in fixes],
+            [*STATS_FIELDS, "updated_at"],
+        )
+    if orphans:
+        FilmRatingStats.objects.filter(film_id__in=orphans).delete()
@@ -0,0 +1,253 @@
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+import socket
+import threading
+import time
+import uuid
+import weakref
+from contextlib import contextmanager
+from datetime import timedelta
+from typing import Any, Awaitable, Callable, Dict, Iterator, Optional, TypeVar
+
+from asgiref.sync import sync_to_async
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from core.utils import deadline as request_deadline
+from films.models import FilmFetchLock
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+
+class _Call:
+    """An in-flight call that concurrent callers for the same key wait on."""
+
+    def __init__(self) -> None:
+        self.event = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+        self.waiters = 0
+
+
+class SingleFlight:
+    """Coalesce concurrent calls for the same key into one execution.
+
+    Within a process, the first caller for a key (the leader) runs the
+    function and every caller that arrives while it is running blocks on
+    the leader's result instead of repeating the work. Exceptions raised by
+    the leader are re-raised in every waiter. A waiter gives up after the
+    ``timeout_setting`` seconds (see ``wait_timeout``) and runs ``fn``
+    itself, or raises ``DeadlineExceeded`` if the request deadline is what
+    ran out.
+    """
+
+    def __init__(self, timeout_setting: str = "FILM_FETCH_WAIT_TIMEOUT", default_timeout: float = 20.0) -> None:
+        self.timeout_setting = timeout_setting
+        self.default_timeout = default_timeout
+        self._lock = threading.Lock()
+        self._calls: Dict[str, _Call] = {}
+        self._stats = {
+            "leaders": 0,
+            "coalesced": 0,
+            "wait_timeouts": 0,
+            "cross_process_waits": 0,
+            "cross_process_fallbacks": 0,
+        }
+
+    def do(self, key: str, fn: Callable[[], T]) -> T:
+        """Run ``fn`` once for all concurrent callers of ``key`` and return its result."""
+        with self._lock:
+            call = self._calls.get(key)
+            if call is None:
+                call = _Call()
+                self._calls[key] = call
+                self._stats["leaders"] += 1
+                leader = True
+            else:
+                call.waiters += 1
+                self._stats["coalesced"] += 1
+                leader = False
+
+        if not leader:
+            if not call.event.wait(wait_timeout(self.timeout_setting, self.default_timeout)):
+                # The leader outlived our budget: fail fast once the request
+                # deadline is spent, otherwise do the work ourselves.
+                self.record("wait_timeouts")
+                left = request_deadline.remaining()
+                if left is not None and left <= 0:
+                    raise request_deadline.DeadlineExceeded()
+                return fn()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+            return call.result
+        except BaseException as exc:
+            call.error = exc
+            raise
+        finally:
+            with self._lock:
+                self._calls.pop(key, None)
+            call.event.set()
+            if call.waiters:
+                logger.info("Coalesced %s concurrent fetches for %s", call.waiters, key)
+
+    def record(self, name: str) -> None:
+        """Increment one of the named counters."""
+        with self._lock:
+            self._stats[name] = self._stats.get(name, 0) + 1
+
+    def stats(self) -> Dict[str, int]:
+        """Return a snapshot of the coalescing counters plus current in-flight keys."""
+        with self._lock:
+            return {**self._stats, "in_flight": len(self._calls)}
+
+
+film_fetch_flight = SingleFlight()
+# IMDb searches are cheaper and more interactive than film fetches: wait less.
+imdb_search_flight = SingleFlight("IMDB_SEARCH_WAIT_TIMEOUT", 5.0)
+
+
+class AsyncSingleFlight:
+    """``SingleFlight`` for coroutines: concurrent callers on one event loop share a call.
+
+    Waiters await the leader's future instead of blocking a thread. If the
+    leader is cancelled (e.g. its client went away) the waiters see the
+    cancellation too.
+    """
+
+    def __init__(self) -> None:
+        self._calls: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, Dict[str, asyncio.Future]]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._stats = {"leaders": 0, "coalesced": 0}
+
+    async def do(self, key: str, fn: Callable[[], Awaitable[T]]) -> T:
+        """Await ``fn()`` once for all concurrent callers of ``key`` on this loop."""
+        loop = asyncio.get_running_loop()
+        calls = self._calls.setdefault(loop, {})
+        future = calls.get(key)
+        if future is not None:
+            self._stats["coalesced"] += 1
+            return await asyncio.shield(future)
+
+        future = loop.create_future()
+        calls[key] = future
+        self._stats["leaders"] += 1
+        try:
+            result = await fn()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()  # retrieved here; waiters re-raise it
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            calls.pop(key, None)
+
+    def stats(self) -> Dict[str, int]:
+        return {**self._stats, "in_flight": sum(len(calls) for calls in list(self._calls.values()))}
+
+
+async_film_fetch_flight = AsyncSingleFlight()
+
+
+def _lock_owner() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+
+@contextmanager
+def film_fetch_lock(imdb_id: str) -> Iterator[bool]:
+    """Try to take the cross-worker fetch lock for ``imdb_id``.
+
+    Yields True if this worker now owns the lock row (and releases it on
+    exit), or False if another worker holds an unexpired lock. Expired rows
+    left behind by crashed workers are taken over.
+    """
+    owner = acquire_film_fetch_lock(imdb_id)
+    try:
+        yield owner is not None
+    finally:
+        if owner is not None:
+            release_film_fetch_lock(imdb_id, owner)
+
+
+def acquire_film_fetch_lock(imdb_id: str) -> Optional[str]:
+    """Take the fetch lock for ``imdb_id``; return the owner token, or None if it is held."""
+    ttl = float(getattr(settings, "FILM_FETCH_LOCK_TTL", 60))
+    now = timezone.now()
+    owner = _lock_owner()
+    expires_at = now + timedelta(seconds=ttl)
+
+    acquired = False
+    try:
+        with transaction.atomic():
+            FilmFetchLock.objects.create(imdb_id=imdb_id, owner=owner, expires_at=expires_at)
+        acquired = True
+    except IntegrityError:
+        acquired = bool(
+            FilmFetchLock.objects.filter(imdb_id=imdb_id, expires_at__lt=now).update(
+                owner=owner, expires_at=expires_at
+            )
+        )
+
+    return owner if acquired else None
+
+
+def release_film_fetch_lock(imdb_id: str, owner: str) -> None:
+    FilmFetchLock.objects.filter(imdb_id=imdb_id, owner=owner).delete()
+
+
+def _lock_held(imdb_id: str) -> bool:
+    return FilmFetchLock.objects.filter(imdb_id=imdb_id, expires_at__gte=timezone.now()).exists()
+
+
+def wait_timeout(setting: str = "FILM_FETCH_WAIT_TIMEOUT", default: float = 20.0) -> float:
+    """The ``setting`` timeout (seconds), capped by what is left of the request deadline."""
+    timeout = float(getattr(settings, setting, default))
+    left = request_deadline.remaining()
+    if left is not None:
+        timeout = min(timeout, max(0.0, left))
+    return timeout
+
+
+def wait_for_other_worker(imdb_id: str, is_ready: Callable[[], bool]) -> bool:
+    """Poll until ``is_ready`` is true or the other worker's lock goes away.
+
+    Returns True if the result became ready, False if the wait timed out
+    (see ``wait_timeout``) or the other worker gave up without producing one.
+    """
+    interval = float(getattr(settings, "FILM_FETCH_POLL_INTERVAL", 0.25))
+    deadline = time.monotonic() + wait_timeout()
+    while time.monotonic() < deadline:
+        time.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+        if is_ready():
+            return True
+        if not _lock_held(imdb_id):
+            return is_ready()
+    return False
+
+
+async def await_other_worker(imdb_id: str, is_ready: Callable[[], bool]) -> bool:
+    """``wait_for_other_worker`` for coroutines; ``is_ready`` runs in a worker thread."""
+    interval = float(getattr(settings, "FILM_FETCH_POLL_INTERVAL", 0.25))
+    deadline = time.monotonic() + wait_timeout()
+    while time.monotonic() < deadline:
+        await asyncio.sleep(min(interval, max(0.0, deadline - time.monotonic())))
+        if await sync_to_async(is_ready)():
+            return True
+        if not await sync_to_async(_lock_held)(imdb_id):
+            return await sync_to_async(is_ready)()
+    return False
@@ -0,0 +1,102 @@
+from __future__ import annotations
+
+from datetime import datetime
+from decimal import Decimal, InvalidOperation
+from typing import Any, Dict, Iterable, List, Optional
+
+from django.db import transaction
+from django.utils import timezone
+
+from films.models import Film, StreamingAvailability, StreamingRefresh
+
+AVAILABILITY_FIELDS = ["service", "source_id", "type", "format", "price", "web_url", "last_seen"]
+
+
+def _price(value: Any) -> Optional[Decimal]:
+    if value in (None, ""):
+        return None
+    try:
+        return Decimal(str(value)).quantize(Decimal("0.01"))
+    except (InvalidOperation, ValueError):
+        return None
+
+
+class StreamingIndex:
+    """Normalised, queryable copy of Watchmode streaming sources.
+
+    Each film's sources are stored as one ``StreamingAvailability`` row per
+    (region, service, type, format), indexed for browsing a region's
+    catalogue by service and for checking many films at once. ``record``
+    replaces one film's rows only for the regions it was refreshed for, so
+    regions are refreshed independently of each other.
+    """
+
+    def record(
+        self,
+        imdb_id: str,
+        sources: Iterable[Dict[str, Any]],
+        regions: Iterable[str],
+        seen_at: Optional[datetime] = None,
+    ) -> int:
+        """Replace the availability of ``imdb_id`` in ``regions`` with ``sources``.
+
+        Sources for other regions are ignored. Returns the number of rows stored.
+        """
+        film_id = Film.objects.filter(imdb_id=imdb_id).values_list("id", flat=True).first()
+        if film_id is None:
+            return 0
+        regions = [region.upper() for region in regions]
+        seen_at = seen_at or timezone.now()
+        rows: Dict[tuple, StreamingAvailability] = {}
+        for source in sources:
+            row = self._row(film_id, source, seen_at)
+            if row is not None and row.region in regions:
+                rows[(row.region, row.source_id, row.type, row.format)] = row
+
+        with transaction.atomic():
+            if rows:
+                StreamingAvailability.objects.bulk_create(
+                    list(rows.values()),
+                    update_conflicts=True,
+                    unique_fields=["film", "region", "source_id", "type", "format"],
+                    update_fields=AVAILABILITY_FIELDS,
+                )
+            StreamingAvailability.objects.filter(film_id=film_id, region__in=regions, last_seen__lt=seen_at).delete()
+            for region in regions:
+                StreamingRefresh.objects.update_or_create(film_id=film_id, region=region, defaults={"refreshed_at": seen_at})
+        return len(rows)
+
+    def availability(self, imdb_ids: Iterable[str], region: str) -> Dict[str, List[Dict[str, Any]]]:
+        """Return the sources of each of ``imdb_ids`` in ``region`` (one query)."""
+        imdb_ids = list(imdb_ids)
+        results: Dict[str, List[Dict[str, Any]]] = {imdb_id: [] for imdb_id in imdb_ids}
+        rows = (
+            StreamingAvailability.objects.filter(film__imdb_id__in=imdb_ids, region=region)
+            .order_by("service", "type")
+            .values("film__imdb_id", "service", "type", "format", "price", "web_url", "last_seen")
+        )
+        for row in rows:
+            results[row.pop("film__imdb_id")].append(row)
+        return results
+
+    @staticmethod
+    def _row(film_id: Any, source: Dict[str, Any], seen_at: datetime) -> Optional[StreamingAvailability]:
+        try:
+            source_id = int(source["source_id"])
+            region = str(source["region"]).upper()
+        except (KeyError, TypeError, ValueError):
+            return None
+        return StreamingAvailability(
+            film_id=film_id,
+            region=region,
+            source_id=source_id,
+            service=str(source.get("name") or source_id)[:128],
+            type=str(source.get("type") or "sub")[:8],
+            format=str(source.get("format") or "")[:8],
+            price=_price(source.get("price")),
+            web_url=str(source.get("web_url") or "")[:1000],
+            last_seen=seen_at,
+        )
+
+
+film_streaming_index = StreamingIndex()
@@ -0,0 +1,428 @@
+from __future__ import annotations
+
+import bisect
+import gc
+import heapq
+import logging
+import re
+import threading
+import time
+from array import array
+from collections import defaultdict
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional, Sequence, Set, Tuple
+
+from django.conf import settings
+from django.db import DatabaseError, connections
+from django.db.models import Count
+
+from core.utils.text import fold
+from films.models import Film, ListItem, Rating, WatchedFilm
+
+from .film_refresh import BackgroundRefresher, film_refresher
+
+logger = logging.getLogger(__name__)
+
+TOKEN_PATTERN = re.compile(r"\w+")
+# Titles added or renamed since the last rebuild are kept in a small side
+# index; past this many a full rebuild is scheduled.
+DELTA_MAX = 5000
+# Bounds on the work done for one prefix, which keep the tail latency flat.
+MAX_RANGE_TOKENS = 2048
+MAX_SCAN = 2000
+
+# (imdb_id, title, year, popularity)
+Entry = Tuple[str, str, Optional[int], float]
+
+
+def _pack(values: Sequence[bytes]) -> Tuple[bytes, array]:
+    offsets = array("I", [0])
+    total = 0
+    for value in values:
+        total += len(value)
+        offsets.append(total)
+    return b"".join(values), offsets
+
+
+class PrefixIndex:
+    """Immutable, compact prefix index over film titles.
+
+    Titles are folded (see ``core.utils.text.fold``) and split into word
+    tokens. The distinct tokens are kept sorted in one ``bytes`` blob with
+    an offsets array, and each token's films in a shared postings array,
+    ordered by popularity. A prefix maps to a contiguous range of tokens
+    found by binary search; the best films are merged from the head of
+    each token's postings. Prefixes that span more than ``table_min_tokens``
+    tokens ("s", "st", "the") would make that slow, so their top results are
+    precomputed.
+
+    Everything lives in a handful of ``bytes``/``array`` objects rather than
+    millions of Python objects, which keeps a million titles in tens of
+    megabytes and lets forked workers share the pages copy-on-write.
+    """
+
+    def __init__(self, entries: Iterable[Entry], max_results: int = 20, table_min_tokens: int = 32) -> None:
+        self.max_results = max_results
+        self.table_min_tokens = table_min_tokens
+        ids: List[bytes] = []
+        titles: List[bytes] = []
+        folded: List[bytes] = []
+        self.years = array("H")
+        self.scores = array("f")
+        postings_by_token: Dict[str, List[int]] = defaultdict(list)
+        for position, (imdb_id, title, year, score) in enumerate(entries):
+            folded_title = fold(title)
+            ids.append(imdb_id.encode())
+            titles.append(title.encode())
+            folded.append(folded_title.encode())
+            self.years.append(year if year and 0 < year < 65536 else 0)
+            self.scores.append(float(score))
+            for token in set(TOKEN_PATTERN.findall(folded_title)):
+                postings_by_token[token].append(position)
+
+        self.size = len(ids)
+        self.id_blob, self.id_offsets = _pack(ids)
+        self.title_blob, self.title_offsets = _pack(titles)
+        self.folded_blob, self.folded_offsets = _pack(folded)
+        # Positions ordered by IMDb id, to find a film's entry by binary search.
+        self.id_order = array("I", sorted(range(self.size), key=ids.__getitem__))
+        del ids, titles, folded
+
+        tokens = sorted(postings_by_token)
+        self.token_blob, self.token_offsets = _pack([token.encode() for token in tokens])
+        self.token_starts = array("I", [0])
+        self.postings = array("I")
+        scores = self.scores
+        for token in tokens:
+            postings = postings_by_token.pop(token)
+            postings.sort(key=lambda position: -scores[position])
+            self.postings.extend(postings)
+            self.token_starts.append(len(self.postings))
+        self.tables = self._prefix_tables(tokens)
+
+    # -- entries ---------------------------------------------------------
+
+    def imdb_id(self, position: int) -> str:
+        return self.id_blob[self.id_offsets[position]:self.id_offsets[position + 1]].decode()
+
+    def title(self, position: int) -> str:
+        return self.title_blob[self.title_offsets[position]:self.title_offsets[position + 1]].decode()
+
+    def folded(self, position: int) -> str:
+        return self.folded_blob[self.folded_offsets[position]:self.folded_offsets[position + 1]].decode()
+
+    def entry(self, position: int) -> Entry:
+        return self.imdb_id(position), self.title(position), self.years[position] or None, self.scores[position]
+
+    def position_of(self, imdb_id: str) -> Optional[int]:
+        key = imdb_id.encode()
+        lo, hi = 0, self.size
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self.id_blob[self.id_offsets[self.id_order[mid]]:self.id_offsets[self.id_order[mid] + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < self.size and self.imdb_id(self.id_order[lo]) == imdb_id:
+            return self.id_order[lo]
+        return None
+
+    def entries(self) -> Iterable[Entry]:
+        return (self.entry(position) for position in range(self.size))
+
+    # -- lookup ----------------------------------------------------------
+
+    def search(self, words: List[str], prefix: str, limit: int, skip: Set[int] = frozenset()) -> List[int]:
+        """Positions of the most popular titles with all ``words`` and a word starting with ``prefix``."""
+        limit = min(limit, self.max_results)
+        if not prefix:
+            return []
+        if words:
+            return self._search_words(words, prefix, limit, skip)
+        ranked = self.tables.get(prefix)
+        if ranked is not None:
+            return [position for position in ranked if position not in skip][:limit]
+        candidates: Set[int] = set()
+        lo, hi = self.token_range(prefix)
+        for token in range(lo, min(hi, lo + MAX_RANGE_TOKENS)):
+            start = self.token_starts[token]
+            # Each token's postings are ranked, so only their heads can make the top ``limit``.
+            candidates.update(self.postings[start:min(start + limit + len(skip), self.token_starts[token + 1])])
+        candidates -= skip
+        return heapq.nlargest(limit, candidates, key=lambda position: (self.scores[position], -position))
+
+    def token_range(self, prefix: str) -> Tuple[int, int]:
+        key = prefix.encode()
+        # 0xff never occurs in UTF-8, so it sorts after every token starting with ``key``.
+        return self._bisect(key), self._bisect(key + b"\xff")
+
+    def _search_words(self, words: List[str], prefix: str, limit: int, skip: Set[int]) -> List[int]:
+        segments = []
+        for word in words:
+            lo, hi = self.token_range(word)
+            if lo == hi or self._token(lo) != word.encode():
+                return []
+            segments.append((self.token_starts[lo + 1] - self.token_starts[lo], lo))
+        rarest, token = min(segments)
+        lo, hi = self.token_range(prefix)
+        start, end = self.token_starts[lo], self.token_starts[hi]
+        if end - start <= min(rarest, MAX_SCAN):
+            # "the matr": the typed prefix narrows more than the complete words,
+            # so its titles are checked instead, most popular first.
+            candidates = sorted(set(self.postings[start:end]), key=lambda position: (-self.scores[position], position))
+        else:
+            # Otherwise walk the rarest complete word's postings, already in popularity order.
+            start, end = self.token_starts[token], self.token_starts[token + 1]
+            candidates = self.postings[start:min(end, start + MAX_SCAN)]
+        found: List[int] = []
+        for position in candidates:
+            if position in skip:
+                continue
+            if matches(self.folded(position), words, prefix):
+                found.append(position)
+                if len(found) == limit:
+                    break
+        return found
+
+    def _token(self, index: int) -> bytes:
+        return self.token_blob[self.token_offsets[index]:self.token_offsets[index + 1]]
+
+    def _bisect(self, key: bytes) -> int:
+        lo, hi = 0, len(self.token_offsets) - 1
+        blob, offsets = self.token_blob, self.token_offsets
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if blob[offsets[mid]:offsets[mid + 1]] < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        return lo
+
+    def _prefix_tables(self, tokens: List[str]) -> Dict[str, array]:
+        spans: Dict[str, int] = defaultdict(int)
+        for token in tokens:
+            for length in range(1, len(token) + 1):
+                spans[token[:length]] += 1
+        heaps: Dict[str, List[Tuple[float, int, int]]] = {
+            prefix: [] for prefix, span in spans.items() if span > self.table_min_tokens
+        }
+        del spans
+        for index, token in enumerate(tokens):
+            start, end = self.token_starts[index], self.token_starts[index + 1]
+            for length in range(1, len(token) + 1):
+                heap = heaps.get(token[:length])
+                if heap is None:
+                    break
+                for position in self.postings[start:min(end, start + self.max_results)]:
+                    item = (self.scores[position], -position, position)
+                    if len(heap) == self.max_results and item <= heap[0]:
+                        break
+                    # A title with two words sharing the prefix is pushed once.
+                    if item in heap:
+                        continue
+                    if len(heap) < self.max_results:
+                        heapq.heappush(heap, item)
+                    else:
+                        heapq.heapreplace(heap, item)
+        return {prefix: array("I", [item[2] for item in sorted(heap, reverse=True)]) for prefix, heap in heaps.items()}
+
+
+def matches(folded_title: str, words: List[str], prefix: str) -> bool:
+    """True if ``folded_title`` has every word in ``words`` and one starting with ``prefix``."""
+    # Cheap substring checks first: most candidates fail them.
+    if prefix not in folded_title or any(word not in folded_title for word in words):
+        return False
+    tokens = TOKEN_PATTERN.findall(folded_title)
+    return all(word in tokens for word in words) and any(token.startswith(prefix) for token in tokens)
+
+
+def parse_query(query: str) -> Tuple[List[str], str]:
+    """Split a typeahead query into complete words and the word being typed."""
+    tokens = TOKEN_PATTERN.findall(fold(query))
+    if not tokens:
+        return [], ""
+    return tokens[:-1], tokens[-1]
+
+
+class TitleSuggestIndex:
+    """Process-wide typeahead index over cached film titles.
+
+    Built from the Film table with each film's popularity (watches,
+    ratings and list entries) as its rank. Films saved in this process are
+    added immediately; films saved by other workers are picked up every
+    ``TITLE_SUGGEST_SYNC_SECONDS`` from ``Film.updated_at``. Both go to a
+    small side index that is merged into a fresh ``PrefixIndex`` by the
+    background rebuild, which also refreshes popularity, every
+    ``TITLE_SUGGEST_REBUILD_HOURS`` or once the side index grows past
+    ``DELTA_MAX`` titles.
+
+    Under gunicorn ``--preload`` the index is built in the master (see
+    ``preload_title_suggestions``) and shared by the forked workers.
+    """
+
+    def __init__(self, refresher: Optional[BackgroundRefresher] = None) -> None:
+        self.refresher = refresher or film_refresher
+        self._lock = threading.Lock()
+        self._index: Optional[PrefixIndex] = None
+        self._built_at = 0.0
+        self._synced_at = 0.0
+        self._high_water: Optional[datetime] = None
+        self._reset_delta()
+
+    def _reset_delta(self) -> None:
+        self._delta: Dict[str, Entry] = {}
+        self._delta_tokens: List[Tuple[str, str]] = []
+        self._replaced: Set[int] = set()
+
+    @property
+    def loaded(self) -> bool:
+        return self._index is not None
+
+    def suggest(self, query: str, limit: int = 8) -> List[Dict[str, Any]]:
+        """Return up to ``limit`` titles completing ``query``, most popular first."""
+        words, prefix = parse_query(query)
+        if not prefix:
+            return []
+        self._ensure_fresh()
+        index = self._index
+        with self._lock:
+            skip = set(self._replaced)
+            delta = self._delta_matches(words, prefix)
+        ranked = [(index.scores[position], index.entry(position)) for position in index.search(words, prefix, limit, skip)]
+        ranked += [(entry[3], entry) for entry in delta]
+        ranked.sort(key=lambda item: -item[0])
+        results: List[Dict[str, Any]] = []
+        seen: Set[str] = set()
+        for _, (imdb_id, title, year, _) in ranked:
+            if imdb_id not in seen:
+                seen.add(imdb_id)
+                results.append({"imdb_id": imdb_id, "title": title, "year": year})
+        return results[:limit]
+
+    def add(self, imdb_id: str, title: str, year: Optional[int]) -> None:
+        """Make a new or renamed film suggestible in this process right away."""
+        index = self._index
+        if index is None or not title:
+            return
+        with self._lock:
+            position = index.position_of(imdb_id)
+            if position is not None and imdb_id not in self._delta:
+                if index.title(position) == title and (index.years[position] or None) == year:
+                    return
+                self._replaced.add(position)
+                score = index.scores[position]
+            else:
+                score = self._delta.get(imdb_id, (imdb_id, title, year, 0.0))[3]
+            self._put_delta((imdb_id, title, year, score))
+        if len(self._delta) > DELTA_MAX:
+            self.refresher.schedule("title-suggest:rebuild", self.rebuild)
+
+    def remove(self, imdb_id: str) -> None:
+        """Stop suggesting a deleted film."""
+        index = self._index
+        if index is None:
+            return
+        with self._lock:
+            position = index.position_of(imdb_id)
+            if position is not None:
+                self._replaced.add(position)
+            if self._delta.pop(imdb_id, None) is not None:
+                self._delta_tokens = [item for item in self._delta_tokens if item[1] != imdb_id]
+
+    def rebuild(self) -> PrefixIndex:
+        """Reload every title and popularity from the database and swap the index in."""
+        started = time.monotonic()
+        high_water = Film.objects.order_by("-updated_at").values_list("updated_at", flat=True).first()
+        index = PrefixIndex(self._load_entries(), max_results=self.max_results())
+        with self._lock:
+            self._index = index
+            self._reset_delta()
+            self._high_water = high_water
+            self._built_at = self._synced_at = time.monotonic()
+        logger.info("Built title suggest index of %d films in %.1fs", index.size, time.monotonic() - started)
+        return index
+
+    def sync(self) -> int:
+        """Add the films saved by any worker since the last sync; returns how many."""
+        films = Film.objects.all()
+        if self._high_water is not None:
+            films = films.filter(updated_at__gt=self._high_water)
+        rows = list(films.order_by("updated_at").values_list("imdb_id", "title", "year", "updated_at")[:DELTA_MAX])
+        for imdb_id, title, year, updated_at in rows:
+            self.add(imdb_id, title, year)
+            self._high_water = updated_at
+        self._synced_at = time.monotonic()
+        return len(rows)
+
+    @staticmethod
+    def max_results() -> int:
+        return int(getattr(settings, "TITLE_SUGGEST_MAX_RESULTS", 20))
+
+    def _ensure_fresh(self) -> None:
+        if self._index is None:
+            with self._lock:
+                if self._index is not None:
+                    return
+            self.rebuild()
+            return
+        now = time.monotonic()
+        if now - self._built_at > float(getattr(settings, "TITLE_SUGGEST_REBUILD_HOURS", 6)) * 3600:
+            self.refresher.schedule("title-suggest:rebuild", self.rebuild)
+        if now - self._synced_at > float(getattr(settings, "TITLE_SUGGEST_SYNC_SECONDS", 30)):
+            self._synced_at = now
+            try:
+                self.sync()
+            except DatabaseError:
+                logger.warning("Could not sync the title suggest index", exc_info=True)
+
+    def _put_delta(self, entry: Entry) -> None:
+        imdb_id = entry[0]
+        if imdb_id in self._delta:
+            self._delta_tokens = [item for item in self._delta_tokens if item[1] != imdb_id]
+        self._delta[imdb_id] = entry
+        for token in set(TOKEN_PATTERN.findall(fold(entry[1]))):
+            bisect.insort(self._delta_tokens, (token, imdb_id))
+
+    def _delta_matches(self, words: List[str], prefix: str) -> List[Entry]:
+        found: Dict[str, Entry] = {}
+        start = bisect.bisect_left(self._delta_tokens, (prefix, ""))
+        for token, imdb_id in self._delta_tokens[start:]:
+            if not token.startswith(prefix):
+                break
+            entry = self._delta[imdb_id]
+            if not words or matches(fold(entry[1]), words, prefix):
+                found[imdb_id] = entry
+        return list(found.values())
+
+    @staticmethod
+    def _load_entries() -> Iterable[Entry]:
+        popularity: Dict[Any, float] = defaultdict(float)
+        for model in (WatchedFilm, Rating, ListItem):
+            for film_id, count in model.objects.values_list("film_id").annotate(count=Count("id")).order_by():
+                popularity[film_id] += count
+        films = Film.objects.exclude(title="").order_by("imdb_id").values_list("id", "imdb_id", "title", "year")
+        for film_id, imdb_id, title, year in films.iterator(chunk_size=5000):
+            yield imdb_id, title, year, popularity.get(film_id, 0.0)
+
+
+title_suggest_index = TitleSuggestIndex()
+
+
+def preload_title_suggestions() -> None:
+    """Build the suggest index before workers fork (call from the WSGI module).
+
+    With gunicorn ``--preload`` the WSGI module is imported once in the
+    master, so the workers inherit the built index. The collector is
+    frozen afterwards so it never writes to the shared pages, and the
+    master's database connection is closed so no worker inherits it.
+    """
+    if not getattr(settings, "TITLE_SUGGEST_PRELOAD", True):
+        return
+    try:
+        title_suggest_index.rebuild()
+    except DatabaseError:
+        # e.g. before the first migrate; the index is then built on first use.
+        logger.warning("Could not preload the title suggest index", exc_info=True)
+    finally:
+        connections.close_all()
+    gc.freeze()
@@ -0,0 +1,175 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional
+
+from django.conf import settings
+from django.utils import timezone
+
+from core.services import KinoCheckService
+from films.models import TrailerFeed
+
+from .film_aggregator import IMDB_ID_PATTERN, FilmAggregatorService
+from .film_refresh import BackgroundRefresher, film_refresher
+
+logger = logging.getLogger(__name__)
+
+# The KinoCheck genre names the frontend offers.
+DEFAULT_TRAILER_FEED_GENRES = [
+    "Action",
+    "Abenteuer",
+    "Animation",
+    "Komödie",
+    "Krimi",
+    "Drama",
+    "Fantasy",
+    "Horror",
+    "Mystery",
+    "Lovestory",
+    "Science Fiction",
+    "Thriller",
+    "Familie",
+]
+
+
+def trailer_imdb_ids(trailers: List[Dict[str, Any]]) -> List[str]:
+    """Return the valid IMDb ids referenced by KinoCheck trailer items."""
+    ids = ((item.get("resource") or {}).get("imdb_id") for item in trailers)
+    return [imdb_id for imdb_id in ids if imdb_id and IMDB_ID_PATTERN.match(imdb_id)]
+
+
+def apply_trailer_posters(trailers: List[Dict[str, Any]], posters: Dict[str, str]) -> List[Dict[str, Any]]:
+    """Prefer IMDb posters over KinoCheck's own thumbnails, keeping them as the fallback."""
+    for item in trailers:
+        imdb_id = (item.get("resource") or {}).get("imdb_id")
+        # Ensure the thumbnail key is never None for frontend compatibility
+        item["thumbnail"] = posters.get(imdb_id or "") or item.get("thumbnail") or ""
+    return trailers
+
+
+def feed_etag(items: List[Dict[str, Any]]) -> str:
+    """Version of a feed snapshot: a hash of its canonical JSON."""
+    blob = json.dumps(items, sort_keys=True, separators=(",", ":"), default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+
+@dataclass
+class FeedSnapshot:
+    """A trailer feed as served: its items, version and when it was built."""
+
+    items: List[Dict[str, Any]]
+    etag: str
+    refreshed_at: Optional[datetime] = None
+    stale: bool = False
+
+
+class TrailerFeedService:
+    """Serve KinoCheck trailer feeds from materialised ``TrailerFeed`` rows.
+
+    The latest, trending and ``TRAILER_FEED_GENRES`` genre feeds are stored
+    with their IMDb posters already resolved, so serving one is a single
+    query. ``refresh_trailer_feeds`` rebuilds them periodically; a snapshot
+    read more than ``TRAILER_FEED_TTL_HOURS`` after its refresh is still
+    served and rebuilt in the background. Only a missing snapshot is fetched
+    live, and it is stored for the next request.
+    """
+
+    ENRICHED_FEEDS = ("trending", "genre")
+
+    def __init__(
+        self,
+        kino_service: Optional[KinoCheckService] = None,
+        aggregator: Optional[FilmAggregatorService] = None,
+        refresher: Optional[BackgroundRefresher] = None,
+    ) -> None:
+        self.kino_service = kino_service or KinoCheckService()
+        self._aggregator = aggregator
+        self.refresher = refresher or film_refresher
+
+    @property
+    def aggregator(self) -> FilmAggregatorService:
+        # Built on first use: serving a stored snapshot never needs it.
+        if self._aggregator is None:
+            self._aggregator = FilmAggregatorService(kino_service=self.kino_service)
+        return self._aggregator
+
+    @staticmethod
+    def genres() -> List[str]:
+        return list(getattr(settings, "TRAILER_FEED_GENRES", DEFAULT_TRAILER_FEED_GENRES))
+
+    @classmethod
+    def materialised_genre(cls, genre: str) -> Optional[str]:
+        """Return the configured spelling of ``genre`` if it is materialised, else None."""
+        wanted = genre.strip().casefold()
+        return next((name for name in cls.genres() if name.casefold() == wanted), None)
+
+    def serve(self, feed: str, genre: str = "") -> FeedSnapshot:
+        """Return the stored snapshot of a feed, fetching it live only if there is none."""
+        snapshot = self.get(feed, genre)
+        if snapshot is None:
+            return self.refresh(feed, genre)
+        if snapshot.stale:
+            self.refresher.schedule(f"trailer-feed:{feed}:{genre}", lambda: self.refresh(feed, genre))
+        return snapshot
+
+    def get(self, feed: str, genre: str = "") -> Optional[FeedSnapshot]:
+        row = (
+            TrailerFeed.objects.filter(feed=feed, genre=genre)
+            .values_list("items", "etag", "refreshed_at", "expires_at")
+            .first()
+        )
+        if row is None:
+            return None
+        items, etag, refreshed_at, expires_at = row
+        return FeedSnapshot(items, etag, refreshed_at, stale=expires_at <= timezone.now())
+
+    def refresh(self, feed: str, genre: str = "") -> FeedSnapshot:
+        """Fetch a feed live, resolve its posters and store it.
+
+        KinoCheck errors come back as an empty feed; an empty result never
+        replaces a stored snapshot, which is kept and served instead.
+        """
+        items = self.build(feed, genre)
+        if not items:
+            logger.warning("KinoCheck returned no %s trailers %s; keeping the stored snapshot", feed, genre)
+            return self.get(feed, genre) or FeedSnapshot([], feed_etag([]))
+
+        now = timezone.now()
+        ttl = float(getattr(settings, "TRAILER_FEED_TTL_HOURS", 3))
+        snapshot = FeedSnapshot(items, feed_etag(items), now)
+        TrailerFeed.objects.update_or_create(
+            feed=feed,
+            genre=genre,
+            defaults={
+                "items": items,
+                "etag": snapshot.etag,
+                "refreshed_at": now,
+                "expires_at": now + timedelta(hours=ttl),
+            },
+        )
+        return snapshot
+
+    def build(self, feed: str, genre: str = "") -> List[Dict[str, Any]]:
+        """Fetch a feed live and resolve its posters, without storing it."""
+        items = self._fetch(feed, genre)
+        if feed in self.ENRICHED_FEEDS:
+            # Skip corrupted entries with no title to prevent empty UI boxes
+            items = [item for item in items if item.get("title")]
+            items = apply_trailer_posters(items, self.aggregator.resolve_posters(trailer_imdb_ids(items)))
+        return items
+
+    def _fetch(self, feed: str, genre: str) -> List[Dict[str, Any]]:
+        if feed == "latest":
+            items = self.kino_service.get_latest_trailers()
+        elif feed == "trending":
+            items = self.kino_service.get_trending_trailers()
+        else:
+            items = self.kino_service.get_trailers_by_genre(genre)
+        if not isinstance(items, list):
+            logger.error("KinoCheck returned %s trailers %s in an unexpected format", feed, genre)
+            return []
+        return items
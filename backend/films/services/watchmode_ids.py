@@ -0,0 +1,76 @@
+from __future__ import annotations
+
+from typing import Awaitable, Callable, Dict, Iterable, Optional, Tuple
+
+from asgiref.sync import sync_to_async
+
+from films.models import WatchmodeTitle
+
+
+class WatchmodeIdMap:
+    """Persistent IMDb id to Watchmode title id mapping.
+
+    Watchmode ids never change, so once a ``/search/`` lookup has resolved
+    an IMDb id the pairing is stored in ``WatchmodeTitle`` and a streaming
+    refresh needs only the (metered) sources call. The table can also be
+    seeded in bulk from Watchmode's title id mapping file with
+    ``import_watchmode_ids``.
+    """
+
+    def get(self, imdb_id: str) -> Optional[int]:
+        return self.get_many([imdb_id]).get(imdb_id)
+
+    def get_many(self, imdb_ids: Iterable[str]) -> Dict[str, int]:
+        """Return the known Watchmode id of each of ``imdb_ids`` in one query."""
+        rows = WatchmodeTitle.objects.filter(imdb_id__in=list(imdb_ids)).values_list("imdb_id", "watchmode_id")
+        return dict(rows)
+
+    def remember(self, imdb_id: str, watchmode_id: int, source: str = "lookup") -> None:
+        WatchmodeTitle.objects.update_or_create(
+            imdb_id=imdb_id,
+            defaults={"watchmode_id": watchmode_id, "source": source},
+        )
+
+    def resolve(self, imdb_id: str, lookup: Callable[[str], Optional[int]]) -> Optional[int]:
+        """Return the Watchmode id of ``imdb_id``, calling ``lookup`` (and storing its answer) if unknown."""
+        watchmode_id = self.get(imdb_id)
+        if watchmode_id is None:
+            watchmode_id = lookup(imdb_id)
+            if watchmode_id is not None:
+                self.remember(imdb_id, watchmode_id)
+        return watchmode_id
+
+    async def aresolve(self, imdb_id: str, lookup: Callable[[str], Awaitable[Optional[int]]]) -> Optional[int]:
+        """``resolve`` with an async ``lookup``."""
+        watchmode_id = await sync_to_async(self.get)(imdb_id)
+        if watchmode_id is None:
+            watchmode_id = await lookup(imdb_id)
+            if watchmode_id is not None:
+                await sync_to_async(self.remember)(imdb_id, watchmode_id)
+        return watchmode_id
+
+    def import_pairs(self, pairs: Iterable[Tuple[str, int]], batch_size: int = 5000) -> int:
+        """Upsert ``(imdb_id, watchmode_id)`` pairs in batches; returns how many were written."""
+        written = 0
+        batch: Dict[str, int] = {}
+        for imdb_id, watchmode_id in pairs:
+            batch[imdb_id] = watchmode_id
+            if len(batch) >= batch_size:
+                written += self._upsert(batch)
+                batch = {}
+        if batch:
+            written += self._upsert(batch)
+        return written
+
+    @staticmethod
+    def _upsert(batch: Dict[str, int]) -> int:
+        WatchmodeTitle.objects.bulk_create(
+            [WatchmodeTitle(imdb_id=imdb_id, watchmode_id=watchmode_id, source="import") for imdb_id, watchmode_id in batch.items()],
+            update_conflicts=True,
+            unique_fields=["imdb_id"],
+            update_fields=["watchmode_id", "source", "updated_at"],
+        )
+        return len(batch)
+
+
+watchmode_id_map = WatchmodeIdMap()
@@ -0,0 +1,60 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from .models import Film, Rating
+from .services.film_cache import film_payload_cache
+from .services.film_search import film_search_index
+from .services.rating_stats import RATING_FIELDS, apply_rating_change, rating_values
+from .services.title_suggest import title_suggest_index
+
+
+@receiver(post_save, sender=Film)
+@receiver(post_delete, sender=Film)
+def invalidate_film_payload_cache(sender, instance, **kwargs):
+    """
+    Drop the cached payload whenever a Film row is saved or deleted
+    (aggregator writes, admin edits and deletes alike).
+    """
+    film_payload_cache.delete(instance.imdb_id)
+
+
+@receiver(post_save, sender=Film)
+def index_film_for_search(sender, instance, raw=False, **kwargs):
+    """Keep the film's search document in step with its title, year and metadata."""
+    if raw:
+        return
+    film_search_index.index_film(instance)
+
+
+@receiver(post_save, sender=Film)
+def add_film_to_title_suggestions(sender, instance, raw=False, **kwargs):
+    """Make new and renamed films suggestible in this process without waiting for a sync."""
+    if raw:
+        return
+    title_suggest_index.add(instance.imdb_id, instance.title, instance.year)
+
+
+@receiver(post_delete, sender=Film)
+def remove_film_from_title_suggestions(sender, instance, **kwargs):
+    title_suggest_index.remove(instance.imdb_id)
+
+
+
+@receiver(pre_save, sender=Rating)
+def remember_previous_rating(sender, instance, raw=False, **kwargs):
+    """Keep the stored values of an edited rating so post_save can apply the difference."""
+    instance._previous_rating = None
+    if not raw and instance.pk:
+        instance._previous_rating = Rating.objects.filter(pk=instance.pk).values(*RATING_FIELDS).first()
+
+
+@receiver(post_save, sender=Rating)
+def update_rating_stats_on_save(sender, instance, created, raw=False, **kwargs):
+    if raw:
+        return
+    apply_rating_change(None if created else getattr(instance, "_previous_rating", None), rating_values(instance))
+
+
+@receiver(post_delete, sender=Rating)
+def update_rating_stats_on_delete(sender, instance, **kwargs):
+    apply_rating_change(rating_values(instance), None)
@@ -0,0 +1,18 @@
+from __future__ import annotations
+
+import pytest
+
+from core.services import negative_cache, search_result_cache
+from films.services import film_payload_cache
+
+
+@pytest.fixture(autouse=True)
+def clear_local_film_cache():
+    """The in-process tiers outlive each test's database, so start every test empty."""
+    film_payload_cache.clear_local()
+    negative_cache.clear_local()
+    search_result_cache.clear_local()
+    yield
+    film_payload_cache.clear_local()
+    negative_cache.clear_local()
+    search_result_cache.clear_local()
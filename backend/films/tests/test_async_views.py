@@ -0,0 +1,150 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List
+
+import pytest
+from asgiref.sync import async_to_sync
+from rest_framework.test import APIRequestFactory
+
+import films.async_views as async_views
+
+
+class DummyAsyncAggregator:
+    requested_ids: List[str] = []
+
+    async def afetch_and_cache(self, imdb_id: str) -> Dict[str, Any]:
+        self.requested_ids.append(imdb_id)
+        return {
+            "imdb_id": imdb_id,
+            "title": "Film",
+            "metadata": {"primaryImage": {"url": f"https://img/{imdb_id}.jpg"}},
+            "trailer": {"id": "tr1"},
+            "streaming": [],
+            "warnings": [],
+        }
+
+    async def aresolve_posters(self, imdb_ids: List[str]) -> Dict[str, str]:
+        self.requested_ids.extend(imdb_ids)
+        return {imdb_id: f"https://img/{imdb_id}.jpg" for imdb_id in imdb_ids}
+
+
+class DummyAsyncKinoCheckService:
+    async def get_trailers_by_genre(self, genre: str) -> List[Dict[str, Any]]:
+        return [
+            {"title": "A", "thumbnail": "kc-a", "resource": {"imdb_id": "tt1"}},
+            {"title": "", "thumbnail": "kc-empty", "resource": {"imdb_id": "tt2"}},
+            {"title": "B", "thumbnail": "kc-b", "resource": {}},
+        ]
+
+
+@pytest.fixture(autouse=True)
+def dummy_upstreams(monkeypatch):
+    DummyAsyncAggregator.requested_ids = []
+    monkeypatch.setattr(async_views, "FilmAggregatorService", DummyAsyncAggregator)
+    monkeypatch.setattr(async_views, "AsyncKinoCheckService", DummyAsyncKinoCheckService)
+
+
+def call(view_class, path: str, **kwargs: Any):
+    response = async_to_sync(view_class.as_view())(APIRequestFactory().get(path), **kwargs)
+    return response.render()
+
+
+@pytest.mark.django_db
+def test_async_film_detail_view_adds_rating_fields() -> None:
+    response = call(async_views.AsyncFilmDetailView, "/api/films/tt1", imdb_id="tt1")
+
+    assert response.status_code == 200
+    assert response.data["title"] == "Film"
+    assert response.data["rating_statistics"] is None
+    assert DummyAsyncAggregator.requested_ids == ["tt1"]
+
+
+@pytest.mark.django_db
+def test_async_film_detail_view_rejects_invalid_ids() -> None:
+    response = call(async_views.AsyncFilmDetailView, "/api/films/nope", imdb_id="nope")
+
+    assert response.status_code == 404
+    assert DummyAsyncAggregator.requested_ids == []
+
+
+@pytest.mark.django_db
+def test_async_live_genre_feed_uses_imdb_posters() -> None:
+    response = call(async_views.AsyncKinoCheckTrailersByGenreView, "/api/kinocheck/trailers/?genres=Western")
+
+    assert response.status_code == 200
+    assert [item["thumbnail"] for item in response.data] == ["https://img/tt1.jpg", "kc-b"]
+    assert DummyAsyncAggregator.requested_ids == ["tt1"]
+
+
+class DummyAsyncIMDbService:
+    def __init__(self) -> None:
+        self.requested: List[Any] = []
+
+    async def get_title_page(self, imdb_id: str, resource: str, page_token: Any = None) -> Dict[str, Any]:
+        self.requested.append((resource, page_token))
+        if page_token is None:
+            return {"episodes": [{"id": "tt2"}], "nextPageToken": "p2"}
+        return {"episodes": [{"id": "tt3"}]}
+
+
+@pytest.mark.django_db
+def test_async_extended_section_walks_pages_on_the_event_loop(monkeypatch) -> None:
+    from films.services import IMDbSectionService
+
+    imdb = DummyAsyncIMDbService()
+    monkeypatch.setattr(async_views, "IMDbSectionService", lambda: IMDbSectionService(async_imdb_service=imdb))
+
+    response = call(async_views.AsyncFilmEpisodesView, "/api/films/tt1/episodes", imdb_id="tt1")
+    again = call(async_views.AsyncFilmEpisodesView, "/api/films/tt1/episodes", imdb_id="tt1")
+
+    assert response.status_code == 200
+    assert [item["id"] for item in response.data["episodes"]] == ["tt2", "tt3"]
+    assert again.data == response.data
+    assert imdb.requested == [("episodes", None), ("episodes", "p2")]
+
+
+class DummyAsyncSectionsIMDbService:
+    async def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
+        return {"primaryTitle": "Film"}
+
+    def __getattr__(self, name: str) -> Any:
+        async def section(imdb_id: str) -> Dict[str, Any]:
+            return {"section": name}
+
+        return section
+
+
+class DummyAsyncKinoHttpClient:
+    async def get(self, url: str, params: Any = None, headers: Any = None) -> Dict[str, Any]:
+        return {"id": "kc1", "trailer": {"url": "https://kc/tr1"}}
+
+
+class DummyAsyncWatchmodeService:
+    async def lookup_title_id(self, imdb_id: str) -> None:
+        return None
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("kino_works", [True, False])
+def test_async_cold_fetch_turns_a_failing_section_into_its_warning(kino_works: bool) -> None:
+    from core.services import AsyncKinoCheckService
+    from films.services import FilmAggregatorService
+
+    # A service without get_trailer fails when its fetcher is called, before any await.
+    kino = AsyncKinoCheckService(http_client=DummyAsyncKinoHttpClient()) if kino_works else object()
+    aggregator = FilmAggregatorService(
+        async_imdb_service=DummyAsyncSectionsIMDbService(),
+        async_kino_service=kino,
+        async_watchmode_service=DummyAsyncWatchmodeService(),
+    )
+
+    payload = async_to_sync(aggregator.afetch_and_cache)("tt1")
+
+    assert payload["credits"] == {"section": "get_credits"}
+    assert payload["streaming"] == []
+    if kino_works:
+        assert payload["trailer"]["trailer"] == {"url": "https://kc/tr1"}
+        assert "trailer_unavailable" not in payload["warnings"]
+    else:
+        assert payload["trailer"] is None
+        assert payload["warnings"] == ["trailer_unavailable"]
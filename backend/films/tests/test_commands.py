@@ -0,0 +1,182 @@
+from __future__ import annotations
+
+import json
+from io import StringIO
+from typing import Any, Dict, List
+
+import pytest
+from django.core.management import call_command
+
+import films.management.commands.warm_film_cache as warm_command
+
+
+class RecordingAggregator:
+    hydrated: List[str] = []
+
+    def __init__(self, **kwargs: Any) -> None:
+        self.services = kwargs
+
+    def hydrate(self, imdb_id: str) -> Dict[str, Any]:
+        if imdb_id == "tt3":
+            raise RuntimeError("upstream down")
+        RecordingAggregator.hydrated.append(imdb_id)
+        return {"imdb_id": imdb_id}
+
+
+@pytest.mark.django_db
+def test_warm_film_cache_hydrates_ids_and_resumes_from_checkpoint(tmp_path, monkeypatch) -> None:
+    RecordingAggregator.hydrated = []
+    monkeypatch.setattr(warm_command, "FilmAggregatorService", RecordingAggregator)
+    ids_file = tmp_path / "ids.txt"
+    ids_file.write_text("tt1\ntt2  # comment\nnot-an-id\ntt3\ntt1\n")
+    checkpoint = tmp_path / "checkpoint.json"
+    out = StringIO()
+
+    call_command("warm_film_cache", "--file", str(ids_file), "--checkpoint", str(checkpoint), "--concurrency", "2", stdout=out, stderr=StringIO())
+
+    assert sorted(RecordingAggregator.hydrated) == ["tt1", "tt2"]
+    state = json.loads(checkpoint.read_text())
+    assert state["completed"] == ["tt1", "tt2"]
+    assert "tt3" in state["failed"]
+    assert "2 hydrated, 0 already fresh, 1 failed" in out.getvalue()
+
+    RecordingAggregator.hydrated = []
+    call_command("warm_film_cache", "--file", str(ids_file), "--checkpoint", str(checkpoint), stdout=StringIO(), stderr=StringIO())
+
+    # Only the failed id is retried on resume.
+    assert RecordingAggregator.hydrated == []
+    assert "tt3" in json.loads(checkpoint.read_text())["failed"]
+
+
+def test_rate_limited_service_takes_a_token_per_call() -> None:
+    calls: List[str] = []
+
+    class Limiter:
+        def acquire(self) -> None:
+            calls.append("token")
+
+    class Service:
+        base = "x"
+
+        def get_metadata(self, imdb_id: str) -> str:
+            return imdb_id
+
+    proxy = warm_command.RateLimitedService(Service(), Limiter())
+
+    assert proxy.get_metadata("tt1") == "tt1"
+    assert proxy.base == "x"
+    assert calls == ["token"]
+
+
+@pytest.mark.django_db
+def test_refresh_trailer_feeds_rebuilds_selected_feeds(monkeypatch) -> None:
+    from films.services import FeedSnapshot, TrailerFeedService
+
+    refreshed: List[str] = []
+
+    def refresh(self, feed: str, genre: str = "") -> FeedSnapshot:
+        refreshed.append(f"{feed}:{genre}")
+        return FeedSnapshot([{"title": "A"}], "v1")
+
+    monkeypatch.setattr(TrailerFeedService, "refresh", refresh)
+    out = StringIO()
+
+    call_command("refresh_trailer_feeds", "--feed", "trending", "--genre", "action", stdout=out, stderr=StringIO())
+
+    assert refreshed == ["trending:", "genre:Action"]
+    assert "Refreshed 2 of 2 trailer feeds." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_import_watchmode_ids_upserts_mapping_file(tmp_path) -> None:
+    from films.models import WatchmodeTitle
+    from films.services import watchmode_id_map
+
+    watchmode_id_map.remember("tt1", 1)
+    mapping = tmp_path / "title_id_map.csv"
+    mapping.write_text(
+        "Watchmode ID,IMDB ID,TMDB ID,TMDB Type,Title,Year\n"
+        "10,tt1,11,movie,Film,2010\n"
+        "20,tt2,21,tv,Show,2012\n"
+        "30,,31,movie,No IMDb id,2013\n",
+        encoding="utf-8",
+    )
+    out = StringIO()
+
+    call_command("import_watchmode_ids", str(mapping), "--batch-size", "1", stdout=out)
+
+    assert watchmode_id_map.get_many(["tt1", "tt2", "tt3"]) == {"tt1": 10, "tt2": 20}
+    assert WatchmodeTitle.objects.get(imdb_id="tt1").source == "import"
+    assert "Imported 2 Watchmode ids (1 rows skipped)." in out.getvalue()
+
+
+class RegionalWatchmodeService:
+    def __init__(self) -> None:
+        self.requested: List[Any] = []
+
+    def lookup_title_id(self, imdb_id: str) -> Any:
+        return None if imdb_id == "tt3" else int(imdb_id[2:])
+
+    def get_streaming_sources(self, watchmode_id: int, regions: Any = None) -> List[Dict[str, Any]]:
+        self.requested.append((watchmode_id, list(regions)))
+        return [{"source_id": 203, "name": "Netflix", "type": "sub", "region": "US"}]
+
+
+@pytest.mark.django_db
+def test_refresh_streaming_index_refreshes_only_due_films(monkeypatch) -> None:
+    import films.management.commands.refresh_streaming_index as streaming_command
+    from films.models import Film, StreamingAvailability, StreamingRefresh
+    from films.services import film_streaming_index
+
+    for imdb_id in ("tt1", "tt2", "tt3"):
+        Film.objects.create(imdb_id=imdb_id, title=imdb_id)
+    film_streaming_index.record("tt1", [], ["US"])
+    watchmode = RegionalWatchmodeService()
+    monkeypatch.setattr(streaming_command, "WatchmodeService", lambda: watchmode)
+    out = StringIO()
+
+    call_command("refresh_streaming_index", "--region", "us", stdout=out)
+
+    assert watchmode.requested == [(2, ["US"])]
+    assert list(StreamingAvailability.objects.values_list("film__imdb_id", "service")) == [("tt2", "Netflix")]
+    assert StreamingRefresh.objects.filter(region="US").count() == 3
+    assert "Refreshed 2 films in US: 1 sources indexed, 0 failed." in out.getvalue()
+
+
+@pytest.mark.django_db
+def test_reconcile_rating_stats_reports_and_fixes_drift() -> None:
+    from django.contrib.auth.models import User
+
+    from films.models import Film, FilmRatingStats, Rating
+
+    user = User.objects.create_user(username="critic", password="pw")
+    films = [Film.objects.create(imdb_id=f"tt{i}", title=f"Film {i}") for i in range(3)]
+    for film in films:
+        Rating.objects.create(user=user, film=film, overall_rating=3, plot_rating=4)
+    FilmRatingStats.objects.filter(film=films[0]).update(ratings_count=7)
+    FilmRatingStats.objects.filter(film=films[1]).delete()
+
+    out = StringIO()
+    call_command("reconcile_rating_stats", "--dry-run", "--batch-size", "2", stdout=out)
+    assert "Checked 3 films: 1 drifted, 1 missing, 0 orphaned." in out.getvalue()
+    assert FilmRatingStats.objects.get(film=films[0]).ratings_count == 7
+
+    call_command("reconcile_rating_stats", stdout=StringIO())
+    out = StringIO()
+    call_command("reconcile_rating_stats", stdout=out)
+    assert "0 drifted, 0 missing, 0 orphaned" in out.getvalue()
+    assert [film.get_average_ratings()["plot"] for film in films] == [4.0, 4.0, 4.0]
+
+
+@pytest.mark.django_db
+def test_rebuild_search_index_missing_only_indexes_films_without_documents() -> None:
+    from films.models import Film, FilmSearchDocument
+
+    films = [Film.objects.create(imdb_id=f"tt{i}", title=f"Film {i}") for i in range(3)]
+    FilmSearchDocument.objects.filter(film__in=films[1:]).delete()
+
+    out = StringIO()
+    call_command("rebuild_search_index", "--missing", stdout=out)
+
+    assert "Indexed 2 films" in out.getvalue()
+    assert FilmSearchDocument.objects.count() == 3
@@ -1,14 +1,20 @@
 from __future__ import annotations
 
+import threading
+import time
 from datetime import timedelta
 from typing import Any, Dict, List, Optional
 
+import httpx
 import pytest
+from django.http import Http404
 from django.utils import timezone
 
 from core.services import IMDbService, KinoCheckService, WatchmodeService
-from films.models import Film
-from films.services import FilmAggregatorService, FilmCacheService
+from core.utils import deadline as request_deadline
+from films.models import Film, FilmFetchLock, FilmSection, StreamingAvailability, StreamingRefresh, TrailerFeed
+from films.services import BackgroundRefresher, FilmAggregatorService, FilmCacheService, SingleFlight, StreamingIndex
+from films.services.single_flight import film_fetch_lock
 
 
 class DummyHttpClient:
@@ -114,3 +120,956 @@ def test_aggregator_cache_hit_uses_cached_payload(settings) -> None:
     assert result["title"] == "Film"
 
 
+class SlowIMDbService:
+    """IMDb stand-in where every section call sleeps for ``delay`` seconds."""
+
+    def __init__(self, delay: float = 0.2, fail_metadata: bool = False, slow_section: Optional[str] = None) -> None:
+        self.delay = delay
+        self.fail_metadata = fail_metadata
+        self.slow_section = slow_section
+
+    def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
+        if self.fail_metadata:
+            raise RuntimeError("404")
+        return {"title": "Film", "primaryTitle": "Film"}
+
+    def __getattr__(self, name: str) -> Any:
+        def section(imdb_id: str) -> Dict[str, Any]:
+            time.sleep(2 if name == self.slow_section else self.delay)
+            return {"section": name}
+
+        return section
+
+
+class FailingService:
+    def __getattr__(self, name: str) -> Any:
+        def call(*args: Any) -> Any:
+            raise RuntimeError("upstream down")
+
+        return call
+
+
+@pytest.mark.django_db
+def test_aggregator_fetches_sections_concurrently(settings) -> None:
+    settings.FILM_AGGREGATOR_DEADLINE = 5
+    aggregator = FilmAggregatorService(
+        imdb_service=SlowIMDbService(delay=0.2),
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=True,
+    )
+
+    started = time.monotonic()
+    result = aggregator.fetch_and_cache("tt1")
+    elapsed = time.monotonic() - started
+
+    # Six IMDb sections at 0.2s each would take 1.2s sequentially.
+    assert elapsed < 1.0
+    assert result["credits"] == {"section": "get_credits"}
+    assert result["trailer"] is None
+    assert result["streaming"] == []
+    assert result["warnings"] == ["trailer_unavailable", "streaming_unavailable"]
+    assert Film.objects.filter(imdb_id="tt1").exists()
+
+
+@pytest.mark.django_db
+def test_aggregator_pool_threads_close_their_db_connections(monkeypatch, settings) -> None:
+    import films.services.film_aggregator as film_aggregator
+
+    closed_on: List[str] = []
+
+    class RecordingConnections:
+        def close_all(self) -> None:
+            closed_on.append(threading.current_thread().name)
+
+    monkeypatch.setattr(film_aggregator, "connections", RecordingConnections())
+    settings.FILM_AGGREGATOR_DEADLINE = 5
+    aggregator = FilmAggregatorService(
+        imdb_service=SlowIMDbService(delay=0),
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=True,
+    )
+
+    aggregator.fetch_and_cache("tt1")
+
+    # One close per task: metadata plus every section, streaming included.
+    assert len(closed_on) == 9
+    assert all(name.startswith("film-aggregator") for name in closed_on)
+
+
+@pytest.mark.django_db
+def test_aggregator_deadline_turns_stragglers_into_warnings(settings) -> None:
+    settings.FILM_AGGREGATOR_DEADLINE = 0.5
+    aggregator = FilmAggregatorService(
+        imdb_service=SlowIMDbService(delay=0, slow_section="get_images"),
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=True,
+    )
+
+    started = time.monotonic()
+    result = aggregator.fetch_and_cache("tt1")
+
+    assert time.monotonic() - started < 1.5
+    assert result["images"] == {}
+    assert "images_unavailable" in result["warnings"]
+    assert result["credits"] == {"section": "get_credits"}
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_aggregator_metadata_failure_raises_404(concurrent: bool) -> None:
+    aggregator = FilmAggregatorService(
+        imdb_service=SlowIMDbService(delay=0, fail_metadata=True),
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=concurrent,
+    )
+
+    with pytest.raises(Http404):
+        aggregator.fetch_and_cache("tt1")
+    assert not Film.objects.filter(imdb_id="tt1").exists()
+
+
+def test_single_flight_coalesces_concurrent_callers() -> None:
+    flight = SingleFlight()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def slow_fetch() -> Dict[str, Any]:
+        calls.append(1)
+        release.wait(2)
+        return {"imdb_id": "tt1"}
+
+    results: List[Dict[str, Any]] = []
+    threads = [threading.Thread(target=lambda: results.append(flight.do("tt1", slow_fetch))) for _ in range(5)]
+    for thread in threads:
+        thread.start()
+    while flight.stats()["coalesced"] < 4:
+        time.sleep(0.01)
+    release.set()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == [{"imdb_id": "tt1"}] * 5
+    assert flight.stats() == {
+        "leaders": 1,
+        "coalesced": 4,
+        "wait_timeouts": 0,
+        "cross_process_waits": 0,
+        "cross_process_fallbacks": 0,
+        "in_flight": 0,
+    }
+
+
+def test_single_flight_propagates_leader_error() -> None:
+    flight = SingleFlight()
+
+    def missing() -> Dict[str, Any]:
+        raise Http404("missing")
+
+    with pytest.raises(Http404):
+        flight.do("tt1", missing)
+    assert flight.stats()["in_flight"] == 0
+
+
+def test_single_flight_waiter_gives_up_at_request_deadline(settings) -> None:
+    settings.FILM_FETCH_WAIT_TIMEOUT = 20
+    flight = SingleFlight()
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do("tt1", lambda: release.wait(2)))
+    leader.start()
+    while flight.stats()["in_flight"] < 1:
+        time.sleep(0.01)
+
+    started = time.monotonic()
+    try:
+        with request_deadline.request_deadline(0.1):
+            with pytest.raises(request_deadline.DeadlineExceeded):
+                flight.do("tt1", lambda: "never")
+    finally:
+        release.set()
+        leader.join()
+
+    assert time.monotonic() - started < 1
+    assert flight.stats()["wait_timeouts"] == 1
+
+
+def test_imdb_search_flight_has_its_own_wait_timeout(settings) -> None:
+    from films.services import FederatedSearchService, film_fetch_flight, imdb_search_flight
+
+    settings.FILM_FETCH_WAIT_TIMEOUT = 20
+    settings.IMDB_SEARCH_WAIT_TIMEOUT = 0.05
+    assert FederatedSearchService(imdb_service=object()).single_flight is imdb_search_flight
+    assert imdb_search_flight is not film_fetch_flight
+
+    flight = SingleFlight("IMDB_SEARCH_WAIT_TIMEOUT")
+    release = threading.Event()
+    leader = threading.Thread(target=lambda: flight.do("q", lambda: release.wait(2)))
+    leader.start()
+    while flight.stats()["in_flight"] < 1:
+        time.sleep(0.01)
+    try:
+        assert flight.do("q", lambda: "own result") == "own result"
+    finally:
+        release.set()
+        leader.join()
+    assert flight.stats()["wait_timeouts"] == 1
+
+
+@pytest.mark.django_db
+def test_film_fetch_lock_is_exclusive_until_expired(settings) -> None:
+    settings.FILM_FETCH_LOCK_TTL = 60
+    with film_fetch_lock("tt1") as first:
+        with film_fetch_lock("tt1") as second:
+            assert first is True
+            assert second is False
+    assert not FilmFetchLock.objects.exists()
+
+    FilmFetchLock.objects.create(imdb_id="tt2", owner="crashed", expires_at=timezone.now() - timedelta(seconds=1))
+    with film_fetch_lock("tt2") as taken_over:
+        assert taken_over is True
+
+
+@pytest.mark.django_db
+def test_aggregator_waits_for_other_worker_then_falls_back(settings) -> None:
+    settings.FILM_FETCH_WAIT_TIMEOUT = 0.2
+    settings.FILM_FETCH_POLL_INTERVAL = 0.05
+    FilmFetchLock.objects.create(imdb_id="tt1", owner="other-worker", expires_at=timezone.now() + timedelta(minutes=1))
+    flight = SingleFlight()
+    aggregator = FilmAggregatorService(
+        imdb_service=SlowIMDbService(delay=0),
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        single_flight=flight,
+    )
+
+    result = aggregator.fetch_and_cache("tt1")
+
+    assert result["title"] == "Film"
+    assert flight.stats()["cross_process_waits"] == 1
+    assert flight.stats()["cross_process_fallbacks"] == 1
+
+
+class RecordingRefresher:
+    def __init__(self) -> None:
+        self.keys: List[str] = []
+
+    def schedule(self, key: str, fn: Any) -> bool:
+        self.keys.append(key)
+        return True
+
+    def is_pending(self, key: str) -> bool:
+        return key in self.keys
+
+
+class NoopService:
+    def __getattr__(self, name: str) -> Any:
+        raise AssertionError("External service should not be called while serving stale data")
+
+
+@pytest.mark.django_db
+def test_aggregator_serves_stale_payload_and_schedules_refresh(settings) -> None:
+    settings.CACHE_TTL_HOURS = 24
+    settings.CACHE_MAX_STALE_HOURS = 72
+    settings.CACHE_STALE_WHILE_REVALIDATE = True
+    Film.objects.create(
+        imdb_id="tt1",
+        title="Film",
+        cached_at=timezone.now() - timedelta(hours=30),
+        full_json={"imdb_id": "tt1", "title": "Film", "warnings": []},
+    )
+    refresher = RecordingRefresher()
+    aggregator = FilmAggregatorService(
+        imdb_service=NoopService(),
+        kino_service=NoopService(),
+        watchmode_service=NoopService(),
+        cache_service=FilmCacheService(),
+        refresher=refresher,
+    )
+
+    result = aggregator.fetch_and_cache("tt1")
+
+    assert result["title"] == "Film"
+    assert result["cache"]["stale"] is True
+    assert result["cache"]["refreshing"] is True
+    assert 30 * 3600 <= result["cache"]["age_seconds"] < 31 * 3600
+    assert refresher.keys == ["tt1"]
+    assert "cache" not in Film.objects.get(imdb_id="tt1").full_json
+
+
+@pytest.mark.django_db
+def test_aggregator_refetches_past_max_staleness(settings) -> None:
+    settings.CACHE_TTL_HOURS = 24
+    settings.CACHE_MAX_STALE_HOURS = 72
+    Film.objects.create(
+        imdb_id="tt1",
+        title="Old",
+        cached_at=timezone.now() - timedelta(hours=100),
+        full_json={"imdb_id": "tt1", "title": "Old"},
+    )
+    refresher = RecordingRefresher()
+    aggregator = FilmAggregatorService(
+        imdb_service=SlowIMDbService(delay=0),
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        refresher=refresher,
+    )
+
+    result = aggregator.fetch_and_cache("tt1")
+
+    assert result["title"] == "Film"
+    assert result["cache"] == {"age_seconds": 0, "stale": False, "refreshing": False}
+    assert refresher.keys == []
+
+
+def test_background_refresher_deduplicates_pending_keys() -> None:
+    refresher = BackgroundRefresher(max_workers=1)
+    release = threading.Event()
+    done = threading.Event()
+    runs: List[str] = []
+
+    def refresh() -> None:
+        release.wait(2)
+        runs.append("tt1")
+        done.set()
+
+    assert refresher.schedule("tt1", refresh) is True
+    assert refresher.schedule("tt1", refresh) is False
+    release.set()
+    done.wait(2)
+    while refresher.is_pending("tt1"):
+        time.sleep(0.01)
+
+    assert runs == ["tt1"]
+    assert refresher.stats() == {"scheduled": 1, "deduplicated": 1, "failed": 0, "pending": 0}
+
+
+class CountingIMDbService(SlowIMDbService):
+    def __init__(self) -> None:
+        super().__init__(delay=0)
+        self.calls: List[str] = []
+
+    def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
+        self.calls.append("get_metadata")
+        return super().get_metadata(imdb_id)
+
+    def __getattr__(self, name: str) -> Any:
+        section = super().__getattr__(name)
+
+        def call(imdb_id: str) -> Dict[str, Any]:
+            self.calls.append(name)
+            return section(imdb_id)
+
+        return call
+
+
+@pytest.mark.django_db
+def test_aggregator_refreshes_only_expired_sections(settings) -> None:
+    settings.CACHE_STALE_WHILE_REVALIDATE = False
+    imdb = CountingIMDbService()
+    aggregator = FilmAggregatorService(
+        imdb_service=imdb,
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=False,
+    )
+    aggregator.fetch_and_cache("tt1")
+    assert FilmSection.objects.filter(film__imdb_id="tt1").count() == 9
+
+    FilmSection.objects.filter(film__imdb_id="tt1", section="credits").update(
+        expires_at=timezone.now() - timedelta(minutes=1)
+    )
+    Film.objects.filter(imdb_id="tt1").update(expires_at=timezone.now() - timedelta(minutes=1))
+    imdb.calls.clear()
+
+    result = aggregator.fetch_and_cache("tt1")
+
+    assert imdb.calls == ["get_credits"]
+    assert result["credits"] == {"section": "get_credits"}
+    assert result["images"] == {"section": "get_images"}
+    assert result["warnings"] == ["trailer_unavailable", "streaming_unavailable"]
+
+
+@pytest.mark.django_db
+def test_film_cache_section_ttls_are_independent(settings) -> None:
+    settings.FILM_SECTION_TTL_HOURS = {"streaming": 1, "credits": 100}
+    cache = FilmCacheService()
+
+    cache.save_sections("tt1", {"metadata": {"primaryTitle": "Film"}, "credits": {"a": 1}, "streaming": [{"s": 1}]})
+
+    sections = {row.section: row for row in FilmSection.objects.filter(film__imdb_id="tt1")}
+    assert sections["streaming"].expires_at < sections["credits"].expires_at
+    film = Film.objects.get(imdb_id="tt1")
+    assert film.title == "Film"
+    assert film.expires_at == min(row.expires_at for row in sections.values())
+    assert cache.get_section("tt1", "streaming") == ([{"s": 1}], True)
+    assert "images" in cache.expired_sections("tt1")
+    assert "credits" not in cache.expired_sections("tt1")
+
+
+@pytest.mark.django_db
+def test_film_cache_backs_off_permanently_failing_sections(settings) -> None:
+    settings.FILM_SECTION_RETRY_MINUTES = 15
+    settings.FILM_SECTION_TTL_HOURS = {"metadata": 24, "trailer": 24}
+    cache = FilmCacheService()
+
+    delays = []
+    for _ in range(9):
+        before = timezone.now()
+        cache.save_sections("tt1", {"metadata": {"primaryTitle": "Film"}}, failed=["trailer"])
+        row = FilmSection.objects.get(film__imdb_id="tt1", section="trailer")
+        delays.append(round((row.expires_at - before).total_seconds() / 60))
+
+    assert delays == [15, 30, 60, 120, 240, 480, 960, 1440, 1440]
+    assert row.failures == 9 and not row.available
+    film = Film.objects.get(imdb_id="tt1")
+    assert film.expires_at - timezone.now() > timedelta(hours=23)
+
+    cache.save_sections("tt1", {"trailer": {"trailer": {"url": "u"}}})
+    assert FilmSection.objects.get(film__imdb_id="tt1", section="trailer").failures == 0
+
+
+@pytest.mark.django_db
+def test_film_cache_serves_repeat_reads_without_queries(django_assert_num_queries) -> None:
+    cache = FilmCacheService()
+    cache.save_sections("tt1", {"metadata": {"primaryTitle": "Film"}})
+    cache.get_cached_with_age("tt1")
+
+    with django_assert_num_queries(0):
+        payload, _, _ = cache.get_cached_with_age("tt1")
+        assert cache.is_fresh("tt1") is True
+
+    assert payload["title"] == "Film"
+
+
+@pytest.mark.django_db
+def test_film_cache_invalidated_on_write_and_admin_edit() -> None:
+    cache = FilmCacheService()
+    cache.save_sections("tt1", {"metadata": {"primaryTitle": "Old"}})
+    assert cache.get_cached("tt1")["title"] == "Old"
+
+    cache.save_sections("tt1", {"metadata": {"primaryTitle": "New"}})
+    assert cache.get_cached("tt1")["title"] == "New"
+
+    film = Film.objects.get(imdb_id="tt1")
+    film.full_json = {**film.full_json, "title": "Edited"}
+    film.save()
+    assert cache.get_cached("tt1")["title"] == "Edited"
+
+    film.delete()
+    assert cache.get_cached("tt1") is None
+
+
+@pytest.mark.django_db
+def test_film_cache_stores_trimmed_compressed_sections() -> None:
+    credits = {
+        "credits": [
+            {"name": {"id": f"nm{i}", "displayName": f"Actor {i}", "alternativeNames": ["x"] * 20}, "category": "actor"}
+            for i in range(80)
+        ],
+        "totalCount": 80,
+        "nextPageToken": "abc",
+    }
+    cache = FilmCacheService()
+
+    cache.save_sections("tt1", {"metadata": {"primaryTitle": "Film"}, "credits": credits})
+
+    row = FilmSection.objects.get(film__imdb_id="tt1", section="credits")
+    assert row.data is None and row.blob
+    stored = row.get_data()
+    assert len(stored["credits"]) == 80
+    assert stored["credits"][0] == {"name": {"id": "nm0", "displayName": "Actor 0"}, "category": "actor"}
+    assert "nextPageToken" not in stored
+
+    film = Film.objects.get(imdb_id="tt1")
+    assert set(film.full_json) == {"imdb_id", "title", "metadata", "warnings"}
+    assert cache.get_cached("tt1", use_cache=False)["credits"] == stored
+    assert cache.get_section("tt1", "credits") == (stored, True)
+
+
+class MissingIMDbService:
+    def __init__(self, status_code: int = 404) -> None:
+        self.status_code = status_code
+        self.calls = 0
+
+    def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
+        self.calls += 1
+        request = httpx.Request("GET", f"https://imdb.example/titles/{imdb_id}")
+        response = httpx.Response(self.status_code, request=request)
+        raise httpx.HTTPStatusError("error", request=request, response=response)
+
+
+@pytest.mark.django_db
+@pytest.mark.parametrize("concurrent", [True, False])
+def test_aggregator_negative_caches_ids_missing_upstream(concurrent) -> None:
+    imdb = MissingIMDbService(404)
+    aggregator = FilmAggregatorService(
+        imdb_service=imdb,
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=concurrent,
+    )
+
+    for _ in range(3):
+        with pytest.raises(Http404):
+            aggregator.fetch_and_cache("tt404")
+
+    assert imdb.calls == 1
+    assert not Film.objects.filter(imdb_id="tt404").exists()
+
+
+@pytest.mark.django_db
+def test_aggregator_does_not_negative_cache_upstream_outages() -> None:
+    imdb = MissingIMDbService(503)
+    aggregator = FilmAggregatorService(
+        imdb_service=imdb,
+        kino_service=FailingService(),
+        watchmode_service=FailingService(),
+        cache_service=FilmCacheService(),
+        concurrent=False,
+    )
+
+    for _ in range(2):
+        with pytest.raises(Http404):
+            aggregator.fetch_and_cache("tt503")
+
+    assert imdb.calls == 2
+
+
+@pytest.mark.django_db
+def test_watchmode_lookup_remembers_unknown_ids() -> None:
+    client = DummyHttpClient({"title_results": []})
+    service = WatchmodeService(http_client=client)
+
+    assert service.lookup_title_id("tt404") is None
+    assert service.lookup_title_id("tt404") is None
+
+    assert len(client.calls) == 1
+
+
+class PosterIMDbService:
+    def __init__(self) -> None:
+        self.requested: List[str] = []
+
+    def get_metadata(self, imdb_id: str) -> Dict[str, Any]:
+        self.requested.append(imdb_id)
+        if imdb_id == "tt404":
+            return MissingIMDbService(404).get_metadata(imdb_id)
+        return {"primaryTitle": imdb_id, "primaryImage": {"url": f"https://img/{imdb_id}.jpg"}}
+
+
+@pytest.mark.django_db
+def test_aggregator_resolves_posters_without_aggregating_inline() -> None:
+    Film.objects.create(imdb_id="tt1", title="Stored", poster_url="https://img/stored.jpg")
+    Film.objects.create(imdb_id="tt2", title="No poster")
+    imdb = PosterIMDbService()
+    refresher = RecordingRefresher()
+    aggregator = FilmAggregatorService(
+        imdb_service=imdb,
+        kino_service=NoopService(),
+        watchmode_service=NoopService(),
+        cache_service=FilmCacheService(),
+        refresher=refresher,
+    )
+
+    posters = aggregator.resolve_posters(["tt1", "tt2", "tt3", "tt404", "tt1", "not-an-id"])
+
+    assert posters == {
+        "tt1": "https://img/stored.jpg",
+        "tt2": "https://img/tt2.jpg",
+        "tt3": "https://img/tt3.jpg",
+    }
+    assert sorted(imdb.requested) == ["tt2", "tt3", "tt404"]
+    assert sorted(refresher.keys) == ["tt2", "tt3"]
+    assert aggregator.resolve_posters(["tt404"]) == {}
+    assert imdb.requested.count("tt404") == 1
+
+
+class FeedKinoCheckService:
+    def __init__(self) -> None:
+        self.trending: List[Dict[str, Any]] = [
+            {"title": "A", "thumbnail": "kc-a", "resource": {"imdb_id": "tt1"}},
+            {"title": "", "thumbnail": "kc-empty", "resource": {"imdb_id": "tt2"}},
+            {"title": "B", "thumbnail": "kc-b", "resource": {}},
+        ]
+        self.calls = 0
+
+    def get_trending_trailers(self) -> List[Dict[str, Any]]:
+        self.calls += 1
+        return [dict(item) for item in self.trending]
+
+
+class PosterAggregator:
+    def resolve_posters(self, imdb_ids: List[str]) -> Dict[str, str]:
+        return {imdb_id: f"https://img/{imdb_id}.jpg" for imdb_id in imdb_ids}
+
+
+@pytest.mark.django_db
+def test_trailer_feed_is_materialised_and_served_from_its_snapshot(settings) -> None:
+    from films.services import TrailerFeedService
+
+    settings.TRAILER_FEED_TTL_HOURS = 1
+    kino = FeedKinoCheckService()
+    refresher = RecordingRefresher()
+    service = TrailerFeedService(kino_service=kino, aggregator=PosterAggregator(), refresher=refresher)
+
+    first = service.serve("trending")
+    assert [item["thumbnail"] for item in first.items] == ["https://img/tt1.jpg", "kc-b"]
+    second = service.serve("trending")
+    assert kino.calls == 1
+    assert (second.items, second.etag, second.stale) == (first.items, first.etag, False)
+
+    TrailerFeed.objects.update(expires_at=timezone.now() - timedelta(minutes=1))
+    assert service.serve("trending").stale is True
+    assert refresher.keys == ["trailer-feed:trending:"]
+
+    # An empty (failed) upstream fetch keeps the stored snapshot.
+    kino.trending = []
+    assert service.refresh("trending").etag == first.etag
+    assert TrailerFeed.objects.get(feed="trending").items == first.items
+
+
+class CountingWatchmodeService:
+    def __init__(self) -> None:
+        self.lookups: List[str] = []
+        self.sources: List[int] = []
+
+    def lookup_title_id(self, imdb_id: str) -> Optional[int]:
+        self.lookups.append(imdb_id)
+        return 42
+
+    def get_streaming_sources(self, watchmode_id: int) -> List[Dict[str, Any]]:
+        self.sources.append(watchmode_id)
+        return [{"source": "test"}]
+
+
+@pytest.mark.django_db
+def test_aggregator_remembers_watchmode_ids_across_streaming_refreshes() -> None:
+    from films.models import WatchmodeTitle
+
+    watchmode = CountingWatchmodeService()
+    aggregator = FilmAggregatorService(
+        imdb_service=NoopService(),
+        kino_service=NoopService(),
+        watchmode_service=watchmode,
+        cache_service=FilmCacheService(),
+    )
+
+    assert aggregator._fetch_streaming("tt1") == [{"source": "test"}]
+    assert aggregator._fetch_streaming("tt1") == [{"source": "test"}]
+
+    assert watchmode.lookups == ["tt1"]
+    assert watchmode.sources == [42, 42]
+    assert WatchmodeTitle.objects.get(imdb_id="tt1").watchmode_id == 42
+
+
+SOURCE_IDS = {"Netflix": 203, "Hulu": 157, "MUBI": 250, "Ignored": 1}
+
+
+def _source(region: str, name: str, source_type: str = "sub", price: Any = None) -> Dict[str, Any]:
+    return {"source_id": SOURCE_IDS[name], "name": name, "type": source_type, "region": region, "format": "HD", "price": price, "web_url": f"https://{name}.example"}
+
+
+@pytest.mark.django_db
+def test_streaming_index_replaces_only_refreshed_regions() -> None:
+    Film.objects.create(imdb_id="tt1", title="Film")
+    index = StreamingIndex()
+
+    stored = index.record("tt1", [_source("TR", "Netflix"), _source("US", "Hulu"), _source("GB", "Ignored")], ["TR", "US"])
+    assert stored == 2
+    assert sorted(StreamingAvailability.objects.values_list("region", "service")) == [("TR", "Netflix"), ("US", "Hulu")]
+
+    # Netflix dropped the film in TR and MUBI picked it up; US was not refreshed.
+    index.record("tt1", [_source("TR", "MUBI", "rent", "3.99")], ["TR"])
+
+    assert sorted(StreamingAvailability.objects.values_list("region", "service")) == [("TR", "MUBI"), ("US", "Hulu")]
+    assert set(StreamingRefresh.objects.values_list("region", flat=True)) == {"TR", "US"}
+    availability = index.availability(["tt1", "tt2"], "TR")
+    assert [row["service"] for row in availability["tt1"]] == ["MUBI"]
+    assert str(availability["tt1"][0]["price"]) == "3.99"
+    assert availability["tt2"] == []
+
+
+class EmptyService:
+    def __getattr__(self, name: str) -> Any:
+        return lambda *args, **kwargs: None
+
+
+class RegionalWatchmodeService(CountingWatchmodeService):
+    def get_streaming_sources(self, watchmode_id: int) -> List[Dict[str, Any]]:
+        self.sources.append(watchmode_id)
+        return [_source("TR", "Netflix"), _source("US", "Hulu")]
+
+
+@pytest.mark.django_db
+def test_aggregator_indexes_streaming_sources_for_configured_regions(settings) -> None:
+    settings.STREAMING_REGIONS = ["TR", "US"]
+    aggregator = FilmAggregatorService(
+        imdb_service=PosterIMDbService(),
+        kino_service=EmptyService(),
+        watchmode_service=RegionalWatchmodeService(),
+        cache_service=FilmCacheService(),
+        concurrent=False,
+    )
+
+    aggregator.fetch_and_cache("tt1")
+
+    assert sorted(StreamingAvailability.objects.values_list("film__imdb_id", "region", "service")) == [
+        ("tt1", "TR", "Netflix"),
+        ("tt1", "US", "Hulu"),
+    ]
+
+
+class PagedIMDbService:
+    def __init__(self, pages: int = 3) -> None:
+        self.pages = pages
+        self.requested: List[Any] = []
+
+    def get_title_page(self, imdb_id: str, resource: str, page_token: Optional[str] = None) -> Dict[str, Any]:
+        self.requested.append((resource, page_token))
+        page = int(page_token or 0)
+        next_token = str(page + 1) if page + 1 < self.pages else None
+        return {"credits": [{"id": f"nm{page}{i}"} for i in range(2)], "totalCount": 2 * self.pages, "nextPageToken": next_token}
+
+
+@pytest.mark.django_db
+def test_imdb_section_walks_every_page_into_one_stored_copy(settings) -> None:
+    from films.models import IMDbSection
+    from films.services import IMDbSectionService
+
+    settings.EXTENDED_SECTION_MAX_PAGES = 20
+    imdb = PagedIMDbService(pages=3)
+    refresher = RecordingRefresher()
+    service = IMDbSectionService(imdb_service=imdb, refresher=refresher)
+
+    snapshot = service.serve("tt1", "credits")
+
+    assert imdb.requested == [("credits", None), ("credits", "1"), ("credits", "2")]
+    assert [item["id"] for item in snapshot.items] == ["nm00", "nm01", "nm10", "nm11", "nm20", "nm21"]
+    assert snapshot.data == {"totalCount": 6}
+    assert snapshot.complete is True
+
+    # Served from the stored copy while fresh, refetched in the background once expired.
+    assert service.serve("tt1", "credits").etag == snapshot.etag
+    assert len(imdb.requested) == 3 and refresher.keys == []
+    IMDbSection.objects.filter(imdb_id="tt1").update(expires_at=timezone.now())
+    assert service.serve("tt1", "credits").items == snapshot.items
+    assert refresher.keys == ["imdb-section:tt1:credits"]
+
+
+@pytest.mark.django_db
+def test_imdb_section_page_walk_is_capped(settings) -> None:
+    from films.services import IMDbSectionService
+
+    settings.EXTENDED_SECTION_MAX_PAGES = 2
+    imdb = PagedIMDbService(pages=5)
+
+    snapshot = IMDbSectionService(imdb_service=imdb).refresh("tt1", "credits")
+
+    assert len(imdb.requested) == 2
+    assert len(snapshot.items) == 4
+    assert snapshot.complete is False
+
+
+@pytest.mark.django_db
+def test_film_search_index_folds_diacritics_and_ranks_titles_first() -> None:
+    from films.services import IMDbSectionService, film_search_index
+
+    Film.objects.create(imdb_id="tt1", title="Le Fabuleux Destin d'Amélie Poulain", year=2001)
+    Film.objects.create(imdb_id="tt2", title="Amelie Returns", year=2010)
+    Film.objects.create(imdb_id="tt3", title="Ağır Roman", year=1997)
+    IMDbSectionService().store("tt1", "akas", [{"akas": [{"text": "Amélie"}, {"text": "Die fabelhafte Welt der Amélie"}]}])
+
+    assert film_search_index.backend == "fts5"
+    assert [r["imdb_id"] for r in film_search_index.search("AMELIE")] == ["tt2", "tt1"]
+    # The year ranks the 2001 film first; the last word matches as a prefix.
+    assert [r["imdb_id"] for r in film_search_index.search("amelie 2001")] == ["tt1", "tt2"]
+    assert [r["imdb_id"] for r in film_search_index.search("fabelhafte we")] == ["tt1"]
+    assert [r["imdb_id"] for r in film_search_index.search("agir roman")] == ["tt3"]
+    assert film_search_index.search("?!") == []
+
+    # Saving a film reindexes it; deleting drops it.
+    Film.objects.filter(imdb_id="tt3").first().delete()
+    film = Film.objects.get(imdb_id="tt2")
+    film.title = "Something Else"
+    film.save()
+    assert [r["imdb_id"] for r in film_search_index.search("amelie")] == ["tt1"]
+    assert film_search_index.search("roman") == []
+
+
+@pytest.mark.django_db
+def test_search_films_asks_imdb_only_to_fill_gaps(settings) -> None:
+    from films.services import search_films
+
+    settings.SEARCH_LOCAL_MIN_RESULTS = 1
+    Film.objects.create(imdb_id="tt1", title="Inception", year=2010)
+
+    class RemoteSearch:
+        queries: List[str] = []
+
+        def search(self, query: str) -> List[Dict[str, Any]]:
+            self.queries.append(query)
+            return [{"imdb_id": "tt1", "title": "Inception"}, {"imdb_id": "tt9", "title": "Inception: The Cobol Job"}]
+
+    remote = RemoteSearch()
+    results, searched = search_films("incep", remote)
+    assert (results[0]["imdb_id"], searched, remote.queries) == ("tt1", False, [])
+
+    results, searched = search_films("incep", remote, more=True)
+    assert [r["imdb_id"] for r in results] == ["tt1", "tt9"]
+    assert searched is True
+
+
+def test_prefix_index_ranks_by_popularity_and_matches_word_prefixes() -> None:
+    from films.services import PrefixIndex
+    from films.services.title_suggest import parse_query
+
+    index = PrefixIndex(
+        [
+            ("tt1", "Star Wars", 1977, 5),
+            ("tt2", "Star Trek", 1979, 9),
+            ("tt3", "A Star Is Born", 2018, 1),
+            ("tt4", "Şahin", 2001, 0),
+            ("tt5", "The Stars at Noon", 2022, 3),
+        ],
+        table_min_tokens=1,
+    )
+
+    def suggest(query: str, limit: int = 8) -> List[str]:
+        words, prefix = parse_query(query)
+        return [index.imdb_id(position) for position in index.search(words, prefix, limit)]
+
+    assert suggest("s") == ["tt2", "tt1", "tt5", "tt3", "tt4"]
+    assert suggest("STAR", limit=2) == ["tt2", "tt1"]
+    assert suggest("star w") == ["tt1"]
+    assert suggest("the star") == ["tt5"]
+    assert suggest("sahi") == ["tt4"]
+    assert suggest("star x") == suggest("nothing") == suggest("?!") == []
+    assert index.entry(index.position_of("tt3")) == ("tt3", "A Star Is Born", 2018, 1.0)
+    assert index.position_of("tt9") is None
+
+
+@pytest.mark.django_db
+def test_title_suggest_index_follows_film_saves_and_other_workers(monkeypatch) -> None:
+    from django.contrib.auth.models import User
+
+    from films.models import List as FilmList, ListItem, WatchedFilm
+    from films.services import TitleSuggestIndex
+
+    index = TitleSuggestIndex()
+    monkeypatch.setattr("films.signals.title_suggest_index", index)
+    user = User.objects.create_user(username="fan", password="pw")
+    star_wars = Film.objects.create(imdb_id="tt1", title="Star Wars", year=1977)
+    star_trek = Film.objects.create(imdb_id="tt2", title="Star Trek", year=1979)
+    WatchedFilm.objects.create(user=user, film=star_trek)
+    ListItem.objects.create(list=FilmList.objects.create(user=user, title="Sci-fi"), film=star_trek, order=0)
+    WatchedFilm.objects.create(user=user, film=star_wars)
+
+    index.rebuild()
+    assert index.suggest("sta") == [
+        {"imdb_id": "tt2", "title": "Star Trek", "year": 1979},
+        {"imdb_id": "tt1", "title": "Star Wars", "year": 1977},
+    ]
+
+    # Saves in this process show up at once; renamed and deleted films drop out.
+    Film.objects.create(imdb_id="tt3", title="Stardust", year=2007)
+    star_wars.title = "The Empire Strikes Back"
+    star_wars.save()
+    star_trek.delete()
+    assert [r["imdb_id"] for r in index.suggest("star")] == ["tt3"]
+    assert [r["imdb_id"] for r in index.suggest("empire s")] == ["tt1"]
+
+    # Rows written by another worker (no signal here) are picked up by ``sync``,
+    # along with everything else saved since the rebuild.
+    Film.objects.filter(imdb_id="tt3").update(title="Starship Troopers", updated_at=timezone.now())
+    assert index.sync() == 2
+    assert index.sync() == 0
+    assert [r["title"] for r in index.suggest("starship")] == ["Starship Troopers"]
+
+
+@pytest.mark.django_db
+def test_imdb_search_cache_normalises_queries_and_reuses_complete_prefixes() -> None:
+    from core.services import SearchResultCache
+
+    class SearchClient:
+        def __init__(self) -> None:
+            self.queries: List[str] = []
+
+        def get(self, url: str, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+            self.queries.append(params["query"])
+            if params["query"] == "boom":
+                raise httpx.ConnectError("down")
+            if params["query"].startswith("the"):
+                return {"titles": [{"id": f"tt{i}", "primaryTitle": f"The Film {i}"} for i in range(10)]}
+            return {"titles": [
+                {"id": "tt1375666", "primaryTitle": "Inception", "startYear": 2010},
+                {"id": "tt5295894", "primaryTitle": "Inception: The Cobol Job", "startYear": 2010},
+                {"id": "tt0816692", "primaryTitle": "Interstellar", "startYear": 2014},
+            ]}
+
+    client = SearchClient()
+    service = IMDbService(http_client=client, search_cache=SearchResultCache())
+
+    assert len(service.search("Inception")) == 3
+    assert len(service.search("  inCEPtion ")) == 3
+    assert client.queries == ["Inception"]
+
+    # "inc" returned fewer titles than a page, so longer queries filter its answer.
+    client.queries.clear()
+    service.search("inc")
+    assert [r["imdb_id"] for r in service.search("Incep the")] == ["tt5295894"]
+    assert client.queries == ["inc"]
+
+    # A full page may be missing matches, and failures are not cached at all.
+    service.search("the")
+    service.search("the film")
+    service.search("boom")
+    service.search("boom")
+    assert client.queries == ["inc", "the", "the film", "boom", "boom"]
+
+
+@pytest.mark.django_db
+def test_film_rating_stats_follow_rating_writes() -> None:
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from films.models import Rating
+
+    film = Film.objects.create(imdb_id="tt1", title="Film")
+    alice = User.objects.create_user(username="alice", password="pw")
+    bob = User.objects.create_user(username="bob", password="pw")
+    assert film.get_average_ratings()["total_ratings"] == 0
+
+    Rating.objects.create(user=alice, film=film, overall_rating=4)
+    rating = Rating.objects.create(user=bob, film=film, overall_rating=1, plot_rating=2, acting_rating=3)
+    with CaptureQueriesContext(connection) as queries:
+        stats = film.get_average_ratings()
+    assert len(queries.captured_queries) == 1
+    # Bob's overall is derived from his aspects: round((2 + 3) / 2) == 2.
+    assert (stats["overall"], stats["plot"], stats["acting"], stats["direction"], stats["total_ratings"]) == (3.0, 2.0, 3.0, None, 2)
+    assert stats["histogram"] == {"1": 0, "2": 1, "3": 0, "4": 1, "5": 0}
+
+    rating.plot_rating = None
+    rating.overall_rating = 5
+    rating.acting_rating = None
+    rating.save()
+    stats = film.get_average_ratings()
+    assert (stats["overall"], stats["plot"], stats["acting"], stats["histogram"]["5"]) == (4.5, None, None, 1)
+
+    # Cascaded deletes are counted too, and deleting the film takes its stats with it.
+    bob.delete()
+    assert (film.get_average_ratings()["overall"], film.get_average_ratings()["total_ratings"]) == (4.0, 1)
+    film.delete()
+    assert not Film.objects.exists()
@@ -114,3 +114,264 @@ def test_film_streaming_view(monkeypatch) -> None:
     assert response.json()["streaming"] == [{"source": "test"}]
 
 
+@pytest.mark.django_db
+def test_film_streaming_view_reads_fresh_section_row(monkeypatch) -> None:
+    from films.services import FilmCacheService
+
+    FilmCacheService().save_sections("tt1375666", {"streaming": [{"source": "cached"}]})
+
+    class FailingAggregator:
+        def __init__(self, *args: Any, **kwargs: Any) -> None:
+            pass
+
+        def fetch_and_cache(self, imdb_id: str) -> Dict[str, Any]:
+            raise AssertionError("Fresh section should be served from its row")
+
+    monkeypatch.setattr(film_views, "FilmAggregatorService", FailingAggregator)
+    client = APIClient()
+
+    response = client.get("/api/films/tt1375666/streaming")
+    assert response.status_code == 200
+    assert response.json()["streaming"] == [{"source": "cached"}]
+
+
+@pytest.mark.django_db
+def test_list_endpoints_never_load_film_full_json() -> None:
+    from django.contrib.auth.models import User
+    from django.db import connection
+    from django.test.utils import CaptureQueriesContext
+
+    from films.models import Film, List, ListItem, Review, WatchedFilm
+
+    user = User.objects.create_user(username="viewer", password="pw")
+    films = [
+        Film.objects.create(
+            imdb_id=f"tt{i}",
+            title=f"Film {i}",
+            year=2000 + i,
+            poster_url=f"https://img/{i}.jpg",
+            full_json={"metadata": {"plot": "x" * 1000}},
+        )
+        for i in range(3)
+    ]
+    film_list = List.objects.create(user=user, title="Favourites", is_public=True)
+    for order, film in enumerate(films):
+        WatchedFilm.objects.create(user=user, film=film)
+        ListItem.objects.create(list=film_list, film=film, order=order)
+    Review.objects.create(user=user, film=films[0], title="t", content="c")
+    client = APIClient()
+    client.force_authenticate(user)
+
+    with CaptureQueriesContext(connection) as queries:
+        watched = client.get(f"/api/users/{user.username}/watched")
+        detail = client.get(f"/api/lists/{film_list.id}")
+        review = Review.objects.get(user=user)
+        assert review.film.title == "Film 0"
+
+    assert watched.status_code == 200
+    assert detail.status_code == 200
+    assert {item["film_poster_url"] for item in watched.json()} == {f"https://img/{i}.jpg" for i in range(3)}
+    assert not [q["sql"] for q in queries.captured_queries if "full_json" in q["sql"]]
+
+
+@pytest.mark.django_db
+def test_trending_trailers_serve_snapshot_with_etag() -> None:
+    from datetime import timedelta
+
+    from django.utils import timezone
+
+    from films.models import TrailerFeed
+
+    now = timezone.now()
+    TrailerFeed.objects.create(
+        feed="trending",
+        items=[{"title": "A", "thumbnail": "https://img/tt1.jpg"}],
+        etag="v1",
+        refreshed_at=now,
+        expires_at=now + timedelta(hours=1),
+    )
+    client = APIClient()
+
+    response = client.get("/api/kinocheck/trailers/trending")
+    assert response.status_code == 200
+    assert response["ETag"] == '"v1"'
+    assert response.json() == [{"title": "A", "thumbnail": "https://img/tt1.jpg"}]
+
+    response = client.get("/api/kinocheck/trailers/trending", HTTP_IF_NONE_MATCH='"v1"')
+    assert response.status_code == 304
+
+
+@pytest.mark.django_db
+def test_streaming_browse_and_availability_endpoints() -> None:
+    from films.models import Film
+    from films.services import film_streaming_index
+
+    Film.objects.create(imdb_id="tt1", title="Alpha", year=2001, poster_url="https://img/tt1.jpg")
+    Film.objects.create(imdb_id="tt2", title="Beta", year=2002)
+    sources = [
+        {"source_id": 203, "name": "Netflix", "type": "sub", "region": "TR"},
+        {"source_id": 157, "name": "Hulu", "type": "sub", "region": "US"},
+    ]
+    film_streaming_index.record("tt1", sources, ["TR", "US"])
+    film_streaming_index.record("tt2", sources[:1], ["TR"])
+    client = APIClient()
+
+    response = client.get("/api/streaming/", {"region": "tr", "service": "Netflix", "limit": 1, "offset": 1})
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["region"], body["count"]) == ("TR", 2)
+    assert [(row["imdb_id"], row["title"]) for row in body["results"]] == [("tt2", "Beta")]
+
+    response = client.get("/api/streaming/services", {"region": "TR"})
+    assert response.json()["services"] == [{"service": "Netflix", "films": 2}]
+
+    response = client.get("/api/streaming/availability", {"region": "US", "ids": "tt1,tt2"})
+    availability = response.json()["availability"]
+    assert [row["service"] for row in availability["tt1"]] == ["Hulu"]
+    assert availability["tt2"] == []
+
+    assert client.get("/api/streaming/", {"region": "Turkey"}).status_code == 400
+    assert client.get("/api/streaming/availability", {"ids": "nope"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_extended_section_is_cursor_paginated_with_etags() -> None:
+    from films.services import IMDbSectionService
+
+    pages = [
+        {"credits": [{"id": "nm1"}, {"id": "nm2"}], "totalCount": 3, "nextPageToken": "p2"},
+        {"credits": [{"id": "nm3"}], "totalCount": 3},
+    ]
+    IMDbSectionService().store("tt1", "credits", pages)
+    client = APIClient()
+
+    first = client.get("/api/films/tt1/credits", {"limit": 2})
+    assert first.status_code == 200
+    body = first.json()
+    assert [item["id"] for item in body["credits"]] == ["nm1", "nm2"]
+    assert (body["totalCount"], body["count"]) == (3, 3)
+    assert "nextPageToken" not in body
+
+    second = client.get("/api/films/tt1/credits", {"limit": 2, "cursor": body["nextCursor"]})
+    assert [item["id"] for item in second.json()["credits"]] == ["nm3"]
+    assert second.json()["nextCursor"] is None
+    assert second["ETag"] != first["ETag"]
+
+    repeat = client.get("/api/films/tt1/credits", {"limit": 2}, HTTP_IF_NONE_MATCH=first["ETag"])
+    assert repeat.status_code == 304
+    assert client.get("/api/films/tt1/credits", {"cursor": "bogus"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_search_view_answers_from_local_index_first(monkeypatch, settings) -> None:
+    from films.models import Film
+
+    settings.SEARCH_LOCAL_MIN_RESULTS = 1
+    imdb = DummyIMDbService()
+    monkeypatch.setattr(film_views, "IMDbService", lambda: imdb)
+    Film.objects.create(imdb_id="tt7", title="Amélie", year=2001, poster_url="https://img/tt7.jpg")
+    client = APIClient()
+
+    local = client.get("/api/search/imdb/", {"q": "amelie"}).json()
+    assert [(r["imdb_id"], r["image"]) for r in local["results"]] == [("tt7", "https://img/tt7.jpg")]
+    assert local["searched_imdb"] is False and imdb.queries == []
+
+    more = client.get("/api/search/imdb/", {"q": "amelie", "more": "1"}).json()
+    assert [r["imdb_id"] for r in more["results"]] == ["tt7", "tt1"]
+    assert imdb.queries == ["amelie"]
+
+
+@pytest.mark.django_db
+def test_admin_films_search_combines_substring_and_index_matches() -> None:
+    from django.contrib.auth.models import User
+
+    from films.models import Film
+
+    admin = User.objects.create_user(username="admin", password="pw", is_staff=True)
+    Film.objects.create(imdb_id="tt7", title="Amélie", year=2001)
+    Film.objects.create(imdb_id="tt8", title="The Dark Knight", year=2008)
+    Film.objects.create(imdb_id="tt9", title="Heat", year=1995)
+    client = APIClient()
+    client.force_authenticate(admin)
+
+    def search(term: str) -> List[str]:
+        return sorted(film["imdb_id"] for film in client.get("/api/admin/films/", {"search": term}).json())
+
+    assert search("ark") == ["tt8"]  # mid-word substring the index does not match
+    assert search("amelie") == ["tt7"]  # accent-folded index match
+    assert search("tt9") == ["tt9"]
+
+
+@pytest.mark.django_db
+def test_search_suggest_view_completes_titles(monkeypatch) -> None:
+    from films.models import Film
+    from films.services import TitleSuggestIndex
+
+    index = TitleSuggestIndex()
+    monkeypatch.setattr(film_views, "title_suggest_index", index)
+    Film.objects.create(imdb_id="tt0133093", title="The Matrix", year=1999)
+    Film.objects.create(imdb_id="tt0234215", title="The Matrix Reloaded", year=2003)
+    client = APIClient()
+
+    response = client.get("/api/search/suggest", {"q": "matr", "limit": 1})
+
+    assert response.status_code == 200
+    assert response.json() == {"query": "matr", "results": [{"imdb_id": "tt0133093", "title": "The Matrix", "year": 1999}]}
+    assert len(client.get("/api/search/suggest", {"q": "the matrix r"}).json()["results"]) == 1
+    assert client.get("/api/search/suggest").json()["results"] == []
+    assert client.get("/api/search/suggest", {"q": "x", "limit": "many"}).status_code == 400
+
+
+@pytest.mark.django_db
+def test_federated_search_ranks_by_signals_and_defers_slow_imdb_results(monkeypatch, settings) -> None:
+    import threading
+
+    from django.contrib.auth.models import User
+
+    from films.models import Film, Rating, WatchedFilm
+    from films.services import FederatedSearchService, SingleFlight
+    from users.models import Follow
+
+    class SlowIMDbService:
+        def __init__(self) -> None:
+            self.release = threading.Event()
+            self.calls = 0
+
+        def search(self, query: str) -> List[Dict[str, Any]]:
+            self.calls += 1
+            self.release.wait(5)
+            return [
+                {"imdb_id": "tt2", "title": "Inception Two", "year": 2030, "image": "img2", "type": "movie"},
+                {"imdb_id": "tt9", "title": "Inception Stories", "year": 2012, "image": "img9", "type": "movie"},
+            ]
+
+    settings.FEDERATED_SEARCH_BUDGET = 0.05
+    imdb = SlowIMDbService()
+    service = FederatedSearchService(imdb_service=imdb, single_flight=SingleFlight())
+    monkeypatch.setattr(film_views, "FederatedSearchService", lambda **kwargs: service)
+    viewer = User.objects.create_user(username="viewer", password="pw")
+    friend = User.objects.create_user(username="inceptionfan", password="pw")
+    User.objects.create_user(username="inception", password="pw")
+    Follow.objects.create(follower=viewer, following=friend)
+    Film.objects.create(imdb_id="tt1", title="Inception", year=2010)
+    sequel = Film.objects.create(imdb_id="tt2", title="Inception Two", year=2030)
+    WatchedFilm.objects.create(user=friend, film=sequel)
+    Rating.objects.create(user=friend, film=sequel, overall_rating=5)
+    client = APIClient()
+    client.force_authenticate(viewer)
+
+    first = client.get("/api/search", {"q": "incep"}).json()
+
+    # IMDb missed the budget: local films come back ranked by signals, IMDb follows via the token.
+    assert [(f["imdb_id"], f["friends_watched"], f["ratings_count"]) for f in first["results"]] == [("tt2", 1, 1), ("tt1", 0, 0)]
+    assert [u["username"] for u in first["users"]] == ["inceptionfan", "inception"]
+    assert first["users"][0]["is_following"] is True
+    assert first["pending"] == ["imdb"] and first["next_page_token"]
+
+    imdb.release.set()
+    follow_up = client.get("/api/search", {"page_token": first["next_page_token"]}).json()
+    assert [f["imdb_id"] for f in follow_up["results"]] == ["tt9"]
+    assert follow_up["next_page_token"] is None
+    assert imdb.calls <= 2
+    assert client.get("/api/search", {"page_token": "nope"}).status_code == 400
+    assert client.get("/api/search").status_code == 400
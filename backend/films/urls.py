@@ -1,7 +1,11 @@
+from django.conf import settings
 from django.urls import path
 from .views import (
     SearchView,
+    FederatedSearchView,
+    SearchSuggestView,
     AdminBadgeStatsView,
+    AdminCacheMetricsView,
     AdminFilmCreateView,
     AdminFilmDeleteView,
     AdminFilmsView,
@@ -40,6 +44,9 @@ from .views import (
     FilmSearchGraphQLView,
     FilmSeasonsView,
     FilmStreamingView,
+    StreamingAvailabilityView,
+    StreamingBrowseView,
+    StreamingServicesView,
     FilmTrailerView,
     FilmVideosView,
     FlagCommentView,
@@ -71,11 +78,43 @@ from .views import (
     UserWatchedFilmsView,
 )
 
+if getattr(settings, "ASYNC_UPSTREAM_VIEWS", False):
+    # Upstream-bound endpoints await upstream HTTP instead of holding a
+    # worker thread; requires an ASGI server.
+    from .async_views import (  # noqa: F811
+        AsyncSearchView as SearchView,
+        AsyncFilmDetailView as FilmDetailView,
+        AsyncFilmTrailerView as FilmTrailerView,
+        AsyncFilmStreamingView as FilmStreamingView,
+        AsyncFilmCreditsView as FilmCreditsView,
+        AsyncFilmReleaseDatesView as FilmReleaseDatesView,
+        AsyncFilmAKAsView as FilmAKAsView,
+        AsyncFilmSeasonsView as FilmSeasonsView,
+        AsyncFilmEpisodesView as FilmEpisodesView,
+        AsyncFilmImagesView as FilmImagesView,
+        AsyncFilmVideosView as FilmVideosView,
+        AsyncFilmAwardNominationsView as FilmAwardNominationsView,
+        AsyncFilmParentsGuideView as FilmParentsGuideView,
+        AsyncFilmCertificatesView as FilmCertificatesView,
+        AsyncFilmCompanyCreditsView as FilmCompanyCreditsView,
+        AsyncFilmBoxOfficeView as FilmBoxOfficeView,
+        AsyncKinoCheckLatestTrailersView as KinoCheckLatestTrailersView,
+        AsyncKinoCheckTrendingTrailersView as KinoCheckTrendingTrailersView,
+        AsyncKinoCheckTrailersByGenreView as KinoCheckTrailersByGenreView,
+        AsyncKinoCheckMovieByIdView as KinoCheckMovieByIdView,
+        AsyncMovieUrlView as MovieUrlView,
+    )
+
 urlpatterns = [
     path("search/imdb/", SearchView.as_view(), name="search-imdb"),
+    path("search", FederatedSearchView.as_view(), name="search"),
+    path("search/suggest", SearchSuggestView.as_view(), name="search-suggest"),
     path("films/<str:imdb_id>", FilmDetailView.as_view(), name="film-detail"),
     path("films/<str:imdb_id>/trailer", FilmTrailerView.as_view(), name="film-trailer"),
     path("films/<str:imdb_id>/streaming", FilmStreamingView.as_view(), name="film-streaming"),
+    path("streaming/", StreamingBrowseView.as_view(), name="streaming-browse"),
+    path("streaming/services", StreamingServicesView.as_view(), name="streaming-services"),
+    path("streaming/availability", StreamingAvailabilityView.as_view(), name="streaming-availability"),
     path("films/<str:imdb_id>/rate", FilmRatingView.as_view(), name="film-rate"),
     path("films/<str:imdb_id>/ratings", FilmRatingsListView.as_view(), name="film-ratings-list"),
     path("films/<str:imdb_id>/mood", FilmMoodView.as_view(), name="film-mood"),
@@ -127,6 +166,7 @@ urlpatterns = [
     path("admin/reviews/flagged", AdminFlaggedCommentsView.as_view(), name="admin-flagged-comments"),
     # Admin dashboard endpoints
     path("admin/stats/", AdminStatsView.as_view(), name="admin-stats"),
+    path("admin/metrics/", AdminCacheMetricsView.as_view(), name="admin-cache-metrics"),
     path("admin/users/", AdminUsersView.as_view(), name="admin-users"),
     path("admin/users/<int:user_id>/ban", AdminUserBanView.as_view(), name="admin-user-ban"),
     path("admin/users/<int:user_id>/delete", AdminUserDeleteView.as_view(), name="admin-user-delete"),
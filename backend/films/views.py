@@ -2,8 +2,9 @@ from __future__ import annotations
 
 import logging
 import re
-from typing import Any, Dict
+from typing import Any, Dict, Tuple
 
+from django.conf import settings
 from django.contrib.auth.models import User
 from django.db import models
 from django.http import Http404
@@ -18,8 +19,8 @@ from rest_framework.request import Request
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from core.services import IMDbService, KinoCheckService
-from films.models import Badge, CommentFlag, Film, List, ListItem, Mood, ModerationLog, Rating, RecommendationLog, Review, ReviewLike, UserBadge, WatchedFilm
+from core.services import IMDbService, KinoCheckService, http_cache, is_not_found, negative_cache, rate_limiter_registry, resilience_registry, search_result_cache, streaming_regions
+from films.models import Badge, CommentFlag, Film, List, ListItem, Mood, ModerationLog, Rating, RecommendationLog, Review, ReviewLike, StreamingAvailability, UserBadge, WatchedFilm
 from films.serializers import (
     BadgeSerializer,
     FollowSerializer,
@@ -38,16 +39,115 @@ from films.serializers import (
     UserBadgeSerializer,
     WatchedFilmSerializer,
 )
-from films.services import BadgeService, FilmAggregatorService
+from films.services import (
+    BadgeService,
+    FederatedSearchService,
+    FilmAggregatorService,
+    FilmCacheService,
+    FeedSnapshot,
+    IMDB_SECTIONS,
+    IMDbSectionService,
+    SectionSnapshot,
+    TrailerFeedService,
+    film_fetch_flight,
+    film_payload_cache,
+    film_refresher,
+    film_search_index,
+    film_streaming_index,
+    imdb_search_flight,
+    search_films,
+    title_suggest_index,
+)
+from films.services.imdb_sections import decode_cursor, section_page
 from users.models import Follow
 
 IMDB_ID_PATTERN = re.compile(r"^tt\d+$")
+REGION_PATTERN = re.compile(r"^[A-Z]{2}$")
+MAX_SECTION_PAGE_SIZE = 200
+MAX_AVAILABILITY_IDS = 100
+MAX_SUGGESTIONS = 20
+
+
+def get_film_section(aggregator: FilmAggregatorService, imdb_id: str, name: str, default: Any = None) -> Any:
+    """Return one cached payload section, reading only its row while it is fresh.
+
+    Missing or expired sections go through the aggregator, which refreshes
+    just the expired sections of the film.
+    """
+    cached = FilmCacheService().get_section(imdb_id, name)
+    if cached is not None and cached[1]:
+        return cached[0]
+    return aggregator.fetch_and_cache(imdb_id).get(name, default)
+
+
+def film_rating_fields(user: Any, imdb_id: str) -> Dict[str, Any]:
+    """Return the ``rating_statistics`` and ``user_rating`` keys of a film detail payload."""
+    try:
+        film = Film.objects.get(imdb_id=imdb_id)
+    except Film.DoesNotExist:
+        return {"rating_statistics": None, "user_rating": None}
+
+    fields: Dict[str, Any] = {"rating_statistics": film.get_average_ratings()}
+    # Add user's personal rating if authenticated
+    if user.is_authenticated:
+        try:
+            user_rating = Rating.objects.get(user=user, film=film)
+            fields["user_rating"] = RatingSerializer(user_rating).data
+        except Rating.DoesNotExist:
+            fields["user_rating"] = None
+    return fields
+
+
+def etag_response(request: Request, etag: str, data: Any) -> Response:
+    """Serve ``data`` with ``etag``; a matching If-None-Match gets a 304 instead."""
+    etag = f'"{etag}"'
+    sent = [tag.strip().removeprefix("W/") for tag in request.headers.get("If-None-Match", "").split(",")]
+    if etag in sent:
+        response = Response(status=status.HTTP_304_NOT_MODIFIED)
+    else:
+        response = Response(data, status=status.HTTP_200_OK)
+    response["ETag"] = etag
+    return response
+
+
+def feed_response(request: Request, snapshot: FeedSnapshot) -> Response:
+    """Serve a trailer feed snapshot with its ETag; a matching If-None-Match gets a 304."""
+    return etag_response(request, snapshot.etag, snapshot.items)
+
+
+def section_page_params(request: Request) -> Tuple[int, int]:
+    """Return the ``(offset, limit)`` of an extended section request; ValueError if malformed."""
+    default = int(getattr(settings, "EXTENDED_SECTION_PAGE_SIZE", 50))
+    limit = int(request.query_params.get("limit", default))
+    if limit < 1:
+        raise ValueError("limit must be positive")
+    return decode_cursor(request.query_params.get("cursor")), min(limit, MAX_SECTION_PAGE_SIZE)
+
+
+def section_response(request: Request, name: str, snapshot: SectionSnapshot, offset: int, limit: int) -> Response:
+    """Serve one page of a stored extended section; every page has its own ETag."""
+    spec = IMDB_SECTIONS[name]
+    etag = f"{snapshot.etag}-{offset}-{limit}" if spec.items_key else snapshot.etag
+    return etag_response(request, etag, section_page(spec, snapshot, offset, limit))
+
+
+def section_error_response(imdb_id: str, resource: str, exc: Exception) -> Response:
+    if is_not_found(exc):
+        return Response({"detail": "Film not found in IMDb"}, status=status.HTTP_404_NOT_FOUND)
+    logger.error(f"Error fetching {resource} for {imdb_id}: {exc}")
+    return Response(
+        {"detail": f"Failed to fetch {resource}"},
+        status=status.HTTP_500_INTERNAL_SERVER_ERROR,
+    )
 
 
 class SearchView(APIView):
     """
-    Search films via IMDbService and return normalized results.
-    Frontend endpoint: GET /api/search/imdb/?q=<query>
+    Search films and return normalized results.
+    Frontend endpoint: GET /api/search/imdb/?q=<query>[&more=1]
+
+    Cached films are found in the local search index; IMDb is only asked
+    when too few of them match or the client asks for more.
     """
 
     def __init__(self, imdb_service: IMDbService | None = None, **kwargs: Any) -> None:
@@ -63,15 +163,72 @@ class SearchView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        results_raw = self.imdb_service.search(query)
+        more = request.query_params.get("more", "").lower() in ("1", "true", "yes")
+        results_raw, searched_imdb = search_films(query, self.imdb_service, more=more)
         
         serializer = SearchResultSerializer(results_raw, many=True)
         return Response({
             "query": query, 
-            "results": serializer.data
+            "results": serializer.data,
+            "searched_imdb": searched_imdb,
         })
 
 
+class FederatedSearchView(APIView):
+    """
+    One search over cached films, users and IMDb.
+    Frontend endpoint: GET /api/search?q=<query>, then GET /api/search?page_token=<token>
+
+    IMDb results that miss the latency budget are left out and announced
+    with ``next_page_token``; requesting that token returns them.
+    """
+
+    permission_classes = []
+
+    def __init__(self, search_service: FederatedSearchService | None = None, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self.search_service = search_service or FederatedSearchService(imdb_service=IMDbService())
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        token = request.query_params.get("page_token")
+        if token:
+            try:
+                return Response(self.search_service.follow_up(token, request.user))
+            except ValueError:
+                return Response({"detail": "Invalid page_token."}, status=status.HTTP_400_BAD_REQUEST)
+
+        query = request.query_params.get("q", "").strip()
+        if not query:
+            return Response(
+                {"detail": "Query parameter 'q' is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response(self.search_service.search(query, request.user))
+
+
+class SearchSuggestView(APIView):
+    """
+    Typeahead over cached film titles, most popular first.
+    Frontend endpoint: GET /api/search/suggest?q=<prefix>[&limit=8]
+
+    Answered from the in-process title index without touching the
+    database; the last word of ``q`` is matched as a prefix.
+    """
+
+    permission_classes = []
+    # Anonymous and cheap: skipping authentication keeps the session/token lookup off every keystroke.
+    authentication_classes = []
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        query = request.query_params.get("q", "")
+        try:
+            limit = int(request.query_params.get("limit", 8))
+        except (TypeError, ValueError):
+            return Response({"detail": "limit must be an integer."}, status=status.HTTP_400_BAD_REQUEST)
+        limit = max(1, min(limit, MAX_SUGGESTIONS))
+        return Response({"query": query, "results": title_suggest_index.suggest(query, limit)})
+
+
 class FilmDetailView(APIView):
     """Return full aggregated film payload for a given IMDb id."""
 
@@ -88,25 +245,7 @@ class FilmDetailView(APIView):
         if not IMDB_ID_PATTERN.match(imdb_id):
             raise Http404("Invalid IMDb id")
         payload: Dict[str, Any] = self.aggregator.fetch_and_cache(imdb_id)
-        
-        # Add rating statistics if film exists in database
-        try:
-            film = Film.objects.get(imdb_id=imdb_id)
-            avg_ratings = film.get_average_ratings()
-            payload["rating_statistics"] = avg_ratings
-            
-            # Add user's personal rating if authenticated
-            if request.user.is_authenticated:
-                try:
-                    user_rating = Rating.objects.get(user=request.user, film=film)
-                    rating_serializer = RatingSerializer(user_rating)
-                    payload["user_rating"] = rating_serializer.data
-                except Rating.DoesNotExist:
-                    payload["user_rating"] = None
-        except Film.DoesNotExist:
-            payload["rating_statistics"] = None
-            payload["user_rating"] = None
-        
+        payload.update(film_rating_fields(request.user, imdb_id))
         return Response(payload)
 
 
@@ -125,8 +264,8 @@ class FilmTrailerView(APIView):
         """Handle GET /api/films/{imdb_id}/trailer."""
         if not IMDB_ID_PATTERN.match(imdb_id):
             raise Http404("Invalid IMDb id")
-        payload = self.aggregator.fetch_and_cache(imdb_id)
-        return Response({"imdb_id": imdb_id, "trailer": payload.get("trailer")})
+        trailer = get_film_section(self.aggregator, imdb_id, "trailer")
+        return Response({"imdb_id": imdb_id, "trailer": trailer})
 
 
 class FilmStreamingView(APIView):
@@ -144,8 +283,103 @@ class FilmStreamingView(APIView):
         """Handle GET /api/films/{imdb_id}/streaming."""
         if not IMDB_ID_PATTERN.match(imdb_id):
             raise Http404("Invalid IMDb id")
-        payload = self.aggregator.fetch_and_cache(imdb_id)
-        return Response({"imdb_id": imdb_id, "streaming": payload.get("streaming", [])})
+        streaming = get_film_section(self.aggregator, imdb_id, "streaming", [])
+        return Response({"imdb_id": imdb_id, "streaming": streaming})
+
+
+def streaming_region(request: Request) -> str | None:
+    """Return the ``region`` query parameter (default: the first STREAMING_REGIONS entry), or None if invalid."""
+    region = (request.query_params.get("region") or streaming_regions()[0]).strip().upper()
+    return region if REGION_PATTERN.match(region) else None
+
+
+def invalid_region_response() -> Response:
+    return Response({"error": "region must be a two-letter country code"}, status=status.HTTP_400_BAD_REQUEST)
+
+
+class StreamingBrowseView(APIView):
+    """Browse the films available in a region, optionally on one service and of one type."""
+
+    permission_classes = []
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Handle GET /api/streaming/?region=TR&service=Netflix&type=sub&limit=50&offset=0."""
+        region = streaming_region(request)
+        if region is None:
+            return invalid_region_response()
+        try:
+            limit = min(max(int(request.query_params.get("limit", 50)), 1), 200)
+            offset = max(int(request.query_params.get("offset", 0)), 0)
+        except ValueError:
+            return Response({"error": "limit and offset must be integers"}, status=status.HTTP_400_BAD_REQUEST)
+
+        queryset = StreamingAvailability.objects.filter(region=region)
+        service = request.query_params.get("service", "").strip()
+        if service:
+            queryset = queryset.filter(service=service)
+        source_type = request.query_params.get("type", "").strip()
+        if source_type:
+            queryset = queryset.filter(type=source_type)
+
+        count = queryset.count()
+        rows = queryset.order_by("service", "film__title", "type").values(
+            "film__imdb_id", "film__title", "film__year", "film__poster_url",
+            "service", "type", "format", "price", "web_url", "last_seen",
+        )[offset:offset + limit]
+        results = [
+            {
+                "imdb_id": row["film__imdb_id"],
+                "title": row["film__title"],
+                "year": row["film__year"],
+                "poster_url": row["film__poster_url"],
+                "service": row["service"],
+                "type": row["type"],
+                "format": row["format"],
+                "price": row["price"],
+                "web_url": row["web_url"],
+                "last_seen": row["last_seen"],
+            }
+            for row in rows
+        ]
+        return Response({"region": region, "service": service or None, "count": count, "results": results})
+
+
+class StreamingServicesView(APIView):
+    """List the services indexed in a region with how many films each carries."""
+
+    permission_classes = []
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Handle GET /api/streaming/services?region=TR."""
+        region = streaming_region(request)
+        if region is None:
+            return invalid_region_response()
+        services = (
+            StreamingAvailability.objects.filter(region=region)
+            .values("service")
+            .annotate(films=models.Count("film", distinct=True))
+            .order_by("-films", "service")
+        )
+        return Response({"region": region, "services": list(services)})
+
+
+class StreamingAvailabilityView(APIView):
+    """Return the indexed availability of several films in a region at once."""
+
+    permission_classes = []
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Handle GET /api/streaming/availability?region=TR&ids=tt0111161,tt0068646."""
+        region = streaming_region(request)
+        if region is None:
+            return invalid_region_response()
+        imdb_ids = list(dict.fromkeys(i.strip() for i in request.query_params.get("ids", "").split(",") if i.strip()))
+        if not imdb_ids or len(imdb_ids) > MAX_AVAILABILITY_IDS or not all(IMDB_ID_PATTERN.match(i) for i in imdb_ids):
+            return Response(
+                {"error": f"ids must be 1 to {MAX_AVAILABILITY_IDS} comma separated IMDb ids"},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        return Response({"region": region, "availability": film_streaming_index.availability(imdb_ids, region)})
 
 
 class FilmRatingView(APIView):
@@ -1090,268 +1324,117 @@ class UserReviewsView(ListAPIView):
 
 
 # IMDb Extended API Views
-class FilmCreditsView(APIView):
-    """Get full cast and credits for a film."""
+class IMDbSectionView(APIView):
+    """Base for the extended IMDb endpoints, served from a stored copy (see ``IMDbSectionService``).
+
+    Paginated sections are returned in IMDbAPI's shape, one cursor page at
+    a time: ``?limit=`` items (default ``EXTENDED_SECTION_PAGE_SIZE``) from
+    ``?cursor=``, the ``nextCursor`` of the previous page. Subclasses name
+    the section and what it is, which is used in the error log and response.
+    """
+
+    section = ""
+    resource = ""
 
     def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/credits."""
         if not IMDB_ID_PATTERN.match(imdb_id):
             return Response(
                 {"detail": "Invalid IMDb id"},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        service = IMDbService()
         try:
-            data = service.get_credits(imdb_id)
-            return Response(data)
+            offset, limit = section_page_params(request)
+        except ValueError:
+            return Response({"detail": "Invalid cursor or limit"}, status=status.HTTP_400_BAD_REQUEST)
+        try:
+            snapshot = IMDbSectionService().serve(imdb_id, self.section)
         except Exception as e:
-            logger.error(f"Error fetching credits for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch credits"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+            return section_error_response(imdb_id, self.resource, e)
+        return section_response(request, self.section, snapshot, offset, limit)
 
 
-class FilmReleaseDatesView(APIView):
-    """Get release dates for a film."""
+class FilmCreditsView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/credits: full cast and credits of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/release-dates."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_release_dates(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching release dates for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch release dates"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "credits"
+    resource = "credits"
 
 
-class FilmAKAsView(APIView):
-    """Get alternate titles (AKAs) for a film."""
+class FilmReleaseDatesView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/release-dates: release dates of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/akas."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_akas(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching AKAs for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch AKAs"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "release_dates"
+    resource = "release dates"
 
 
-class FilmSeasonsView(APIView):
-    """Get season count for a TV series."""
+class FilmAKAsView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/akas: alternate titles (AKAs) of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/seasons."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_seasons(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching seasons for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch seasons"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "akas"
+    resource = "AKAs"
 
 
-class FilmEpisodesView(APIView):
-    """Get episodes for a TV series."""
+class FilmSeasonsView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/seasons: seasons of a TV series."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/episodes."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_episodes(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching episodes for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch episodes"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "seasons"
+    resource = "seasons"
 
 
-class FilmImagesView(APIView):
-    """Get images for a film."""
+class FilmEpisodesView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/episodes: episodes of a TV series."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/images."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_images(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching images for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch images"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "episodes"
+    resource = "episodes"
 
 
-class FilmVideosView(APIView):
-    """Get videos for a film."""
+class FilmImagesView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/images: images of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/videos."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_videos(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching videos for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch videos"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "images"
+    resource = "images"
 
 
-class FilmAwardNominationsView(APIView):
-    """Get award nominations for a film."""
+class FilmVideosView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/videos: videos of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/award-nominations."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_award_nominations(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching award nominations for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch award nominations"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "videos"
+    resource = "videos"
 
 
-class FilmParentsGuideView(APIView):
-    """Get parents guide for a film."""
+class FilmAwardNominationsView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/award-nominations: award nominations of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/parents-guide."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_parents_guide(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching parents guide for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch parents guide"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "award_nominations"
+    resource = "award nominations"
 
 
-class FilmCertificatesView(APIView):
-    """Get certificates for a film."""
+class FilmParentsGuideView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/parents-guide: parents guide of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/certificates."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_certificates(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching certificates for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch certificates"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "parents_guide"
+    resource = "parents guide"
 
 
-class FilmCompanyCreditsView(APIView):
-    """Get company credits for a film."""
+class FilmCertificatesView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/certificates: certificates of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/company-credits."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_company_credits(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching company credits for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch company credits"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "certificates"
+    resource = "certificates"
 
 
-class FilmBoxOfficeView(APIView):
-    """Get box office data for a film."""
+class FilmCompanyCreditsView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/company-credits: company credits of a film."""
 
-    def get(self, request: Request, imdb_id: str, *args: Any, **kwargs: Any) -> Response:
-        """Handle GET /api/films/{imdb_id}/box-office."""
-        if not IMDB_ID_PATTERN.match(imdb_id):
-            return Response(
-                {"detail": "Invalid IMDb id"},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-        service = IMDbService()
-        try:
-            data = service.get_box_office(imdb_id)
-            return Response(data)
-        except Exception as e:
-            logger.error(f"Error fetching box office data for {imdb_id}: {e}")
-            return Response(
-                {"detail": "Failed to fetch box office data"},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+    section = "company_credits"
+    resource = "company credits"
+
+
+class FilmBoxOfficeView(IMDbSectionView):
+    """GET /api/films/{imdb_id}/box-office: box office data of a film."""
+
+    section = "box_office"
+    resource = "box office data"
 
 
 class FilmSearchGraphQLView(APIView):
@@ -1379,14 +1462,12 @@ class FilmSearchGraphQLView(APIView):
 
 # KinoCheck Extended API Views
 class KinoCheckLatestTrailersView(APIView):
-    """Get latest trailers from KinoCheck."""
+    """Get latest trailers from KinoCheck, served from the materialised feed."""
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
         """Handle GET /api/kinocheck/trailers/latest."""
-        service = KinoCheckService()
         try:
-            data = service.get_latest_trailers()
-            return Response(data)
+            return feed_response(request, TrailerFeedService().serve("latest"))
         except Exception as e:
             logger.error(f"Error fetching latest trailers: {e}")
             return Response(
@@ -1397,74 +1478,20 @@ class KinoCheckLatestTrailersView(APIView):
 
 class KinoCheckTrendingTrailersView(APIView):
     """
-    Retrieves trending trailers from KinoCheck and enriches them with IMDb posters.
-    Implements a fallback mechanism to preserve original thumbnails if enrichment fails.
+    Retrieves trending trailers from KinoCheck enriched with IMDb posters.
+    Served from the materialised feed (see ``TrailerFeedService``); thumbnails
+    fall back to KinoCheck's own when a film has no IMDb poster.
     """
 
     def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
-        service = KinoCheckService()
-        aggregator = FilmAggregatorService()
-
-        # Retrieve the initial trailer list from the service layer
-        raw_trailers = service.get_trending_trailers()
-
-        if not isinstance(raw_trailers, list):
-            return Response(
-                {"detail": "Invalid trailer data format received from upstream service."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
-        enriched_trailers = []
-
-        for item in raw_trailers:
-            # OPTIMIZATION: Skip corrupted entries with no title to prevent empty UI boxes
-            if not item.get("title"):
-                continue
-
-            # Preserve the original KinoCheck thumbnail as a fallback
-            original_thumbnail = item.get("thumbnail", "")
-            resource = item.get("resource") or {}
-            imdb_id = resource.get("imdb_id")
-
-            if imdb_id and IMDB_ID_PATTERN.match(imdb_id):
-                try:
-                    # Attempt to fetch high-resolution metadata from the aggregator
-                    full_data = aggregator.fetch_and_cache(imdb_id)
-                    metadata = full_data.get("metadata", {})
-                    raw_image = metadata.get("primaryImage")
-
-                    # Extract the URL from the metadata object if it exists
-                    if isinstance(raw_image, dict):
-                        poster_url = raw_image.get("url")
-                        item["thumbnail"] = poster_url if poster_url else original_thumbnail
-                    elif isinstance(raw_image, str) and raw_image:
-                        item["thumbnail"] = raw_image
-                    else:
-                        # Fallback to original KinoCheck image if IMDb has no primary image
-                        item["thumbnail"] = original_thumbnail
-
-                except Exception as e:
-                    # Log enrichment failure but preserve the original data for UI stability
-                    logger.warning(f"Metadata enrichment failed for {imdb_id}: {e}")
-                    item["thumbnail"] = original_thumbnail
-            else:
-                # If no valid IMDb ID is present, retain the original thumbnail
-                item["thumbnail"] = original_thumbnail
-            
-            # Ensure the thumbnail key is never None for frontend compatibility
-            if not item.get("thumbnail"):
-                item["thumbnail"] = ""
-                
-            enriched_trailers.append(item)
-
-        return Response(enriched_trailers, status=status.HTTP_200_OK)
-
+        return feed_response(request, TrailerFeedService().serve("trending"))
 
 
 class KinoCheckTrailersByGenreView(APIView):
     """
     Returns trailers filtered by genre from KinoCheck and enriches them with IMDb posters.
-    Filters out corrupted entries and provides fallback thumbnails for stability.
+    Genres in ``TRAILER_FEED_GENRES`` are served from their materialised feed;
+    others are fetched live.
     Endpoint: GET /api/kinocheck/trailers?genres=Action
     """
 
@@ -1477,61 +1504,11 @@ class KinoCheckTrailersByGenreView(APIView):
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        service = KinoCheckService()
-        aggregator = FilmAggregatorService()
-
-        # Fetch trailers for the specific genre
-        raw_trailers = service.get_trailers_by_genre(genre)
-
-        # Defensive check for list format
-        if not isinstance(raw_trailers, list):
-            return Response(
-                {"detail": "Invalid trailer data format received from service."},
-                status=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
-
-        enriched_trailers = []
-
-        for item in raw_trailers:
-            # 1. PREVENT EMPTY BOXES: Skip corrupted entries with no title
-            if not item.get("title"):
-                continue
-
-            # 2. FALLBACK MECHANISM: Store the original KinoCheck thumbnail
-            original_thumbnail = item.get("thumbnail", "")
-            resource = item.get("resource") or {}
-            imdb_id = resource.get("imdb_id")
-
-            if imdb_id and IMDB_ID_PATTERN.match(imdb_id):
-                try:
-                    # 3. METADATA ENRICHMENT: Attempt to fetch high-quality IMDb poster
-                    full_data = aggregator.fetch_and_cache(imdb_id)
-                    metadata = full_data.get("metadata", {})
-                    raw_image = metadata.get("primaryImage")
-
-                    if isinstance(raw_image, dict):
-                        poster_url = raw_image.get("url")
-                        item["thumbnail"] = poster_url if poster_url else original_thumbnail
-                    elif isinstance(raw_image, str) and raw_image:
-                        item["thumbnail"] = raw_image
-                    else:
-                        item["thumbnail"] = original_thumbnail
-
-                except Exception as e:
-                    # Log failure but retain original KinoCheck image to avoid empty UI
-                    logger.warning(f"Genre metadata enrichment failed for {imdb_id}: {e}")
-                    item["thumbnail"] = original_thumbnail
-            else:
-                item["thumbnail"] = original_thumbnail
-            
-            # Final safety check for the thumbnail field
-            if not item.get("thumbnail"):
-                item["thumbnail"] = ""
-                
-            enriched_trailers.append(item)
-
-        return Response(enriched_trailers, status=status.HTTP_200_OK)
-
+        service = TrailerFeedService()
+        materialised = service.materialised_genre(genre)
+        if materialised:
+            return feed_response(request, service.serve("genre", materialised))
+        return Response(service.build("genre", genre), status=status.HTTP_200_OK)
 
 
 class KinoCheckMovieByIdView(APIView):
@@ -2283,6 +2260,34 @@ class AdminStatsView(APIView):
         return Response(stats, status=status.HTTP_200_OK)
 
 
+class AdminCacheMetricsView(APIView):
+    """Get film cache and upstream fetch metrics for this worker process."""
+
+    permission_classes = [IsAuthenticated]
+
+    def get(self, request: Request, *args: Any, **kwargs: Any) -> Response:
+        """Get cache metrics."""
+        if not request.user.is_staff:
+            return Response(
+                {"detail": "Only staff members can access cache metrics."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        metrics = {
+            "film_fetch": film_fetch_flight.stats(),
+            "imdb_search": imdb_search_flight.stats(),
+            "film_refresh": film_refresher.stats(),
+            "film_payload_cache": film_payload_cache.stats(),
+            "negative_cache": negative_cache.stats(),
+            "upstreams": resilience_registry.stats(),
+            "rate_limits": rate_limiter_registry.stats(),
+            "http_cache": http_cache.stats(),
+            "search_cache": search_result_cache.stats(),
+        }
+
+        return Response(metrics, status=status.HTTP_200_OK)
+
+
 class AdminUsersView(ListAPIView):
     """Get all users for admin management."""
 
@@ -2416,11 +2421,14 @@ class AdminFilmsView(ListAPIView):
         queryset = Film.objects.all().order_by("-created_at")
         
         # Search functionality
-        search_term = self.request.query_params.get("search", "")
+        search_term = self.request.query_params.get("search", "").strip()
         if search_term:
+            # The index adds accent-insensitive and alternative-title matches.
+            matches = film_search_index.search(search_term, limit=None)
             queryset = queryset.filter(
                 models.Q(title__icontains=search_term) |
-                models.Q(imdb_id__icontains=search_term)
+                models.Q(imdb_id__icontains=search_term) |
+                models.Q(imdb_id__in=[match["imdb_id"] for match in matches])
             )
         
         return queryset
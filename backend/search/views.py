@@ -1,44 +1,26 @@
-import requests
 from django.http import JsonResponse
 from django.views.decorators.http import require_GET
 
+from films.services import search_films
+
 
 @require_GET
 def imdb_search(request):
     """
-    Proxy endpoint for IMDbAPI.dev search:
-    https://api.imdbapi.dev/search/titles?query=xxx&limit=10
+    Film search for the legacy /api/search/imdb/?q=xxx endpoint.
+
+    Answers from the local film search index and falls back to IMDbAPI.dev
+    (through the shared, pooled IMDbService client) only to fill the gaps,
+    or always with &more=1.
     """
-    query = request.GET.get("q", "")
+    query = request.GET.get("q", "").strip()
     if not query:
         return JsonResponse({"results": []})
 
-    url = "https://api.imdbapi.dev/search/titles"
-    params = {
-        "query": query,
-        "limit": 10
-    }
-
+    more = request.GET.get("more", "").lower() in ("1", "true", "yes")
     try:
-        response = requests.get(url, params=params)
-        data = response.json()
-
-        # Normalize for frontend
-        titles = data.get("titles", []) or []
-
-        results = []
-        for item in titles:
-            primary_image = item.get("primaryImage") or {}
-
-            results.append({
-                "imdb_id": item.get("id"),
-                "title": item.get("primaryTitle"),
-                "year": item.get("startYear"),
-                "image": primary_image.get("url"),
-                "type": item.get("titleType")
-            })
-
-        return JsonResponse({"results": results})
+        results, searched_imdb = search_films(query, more=more)
+        return JsonResponse({"results": results, "searched_imdb": searched_imdb})
 
     except Exception as e:
         return JsonResponse({"error": str(e)}, status=500)